@@ -24,46 +24,49 @@ from .exceptions import (
 )
 from .logging_config import setup_logging, get_request_logger
 
-# Conditional imports to avoid dependency issues during structure validation
-try:
+# Subsystems are imported on first attribute access so that entry points only
+# pay for what they use (PEP 562)
+_LAZY_EXPORTS = {
     # Main API components
-    from .api import TTSAPIRouter, RequestValidator, ErrorHandler, ResponseFormatter
-    _API_AVAILABLE = True
-except ImportError:
-    _API_AVAILABLE = False
-
-try:
+    "TTSAPIRouter": ".api",
+    "RequestValidator": ".api",
+    "ErrorHandler": ".api",
+    "ResponseFormatter": ".api",
     # Core processing engines
-    from .tts import KokoroTTSEngine, EmotionController, ChunkProcessor, TTSSynthesizer
-    _TTS_AVAILABLE = True
-except ImportError:
-    _TTS_AVAILABLE = False
-
-try:
-    from .nlp import NLPProcessor, TextNormalizer, HomographResolver, PhoneticProcessor
-    _NLP_AVAILABLE = True
-except ImportError:
-    _NLP_AVAILABLE = False
-
-try:
-    from .voice import VoiceManager, VoiceDownloader, VoiceValidator, VoiceMetadataManager
-    _VOICE_AVAILABLE = True
-except ImportError:
-    _VOICE_AVAILABLE = False
+    "KokoroTTSEngine": ".tts",
+    "EmotionController": ".tts",
+    "ChunkProcessor": ".tts",
+    "TTSSynthesizer": ".tts",
+    "NLPProcessor": ".nlp",
+    "TextNormalizer": ".nlp",
+    "HomographResolver": ".nlp",
+    "PhoneticProcessor": ".nlp",
+    "VoiceManager": ".voice",
+    "VoiceDownloader": ".voice",
+    "VoiceValidator": ".voice",
+    "VoiceMetadataManager": ".voice",
+    "AudioProcessor": ".audio",
+    "AudioSegment": ".audio",
+    "AudioFormatConverter": ".audio",
+    "AudioStreamer": ".audio",
+    "EnhancedCacheManager": ".cache",
+    "AudioCache": ".cache",
+    "TextCache": ".cache",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-try:
-    from .audio import AudioProcessor, AudioSegment, AudioFormatConverter, AudioStreamer
-    _AUDIO_AVAILABLE = True
-except ImportError:
-    _AUDIO_AVAILABLE = False
-
-try:
-    from .cache import EnhancedCacheManager, AudioCache, TextCache
-    _CACHE_AVAILABLE = True
-except ImportError:
-    _CACHE_AVAILABLE = False
-
-# Build __all__ dynamically based on available imports
 __all__ = [
     # Version and metadata
     "__version__",
@@ -85,52 +88,29 @@ __all__ = [
     "CacheError",
     "ConfigurationError",
     "DownloadError",
-]
 
-# Add conditional exports
-if _API_AVAILABLE:
-    __all__.extend([
-        "TTSAPIRouter",
-        "RequestValidator", 
-        "ErrorHandler",
-        "ResponseFormatter",
-    ])
-
-if _TTS_AVAILABLE:
-    __all__.extend([
-        "KokoroTTSEngine",
-        "EmotionController",
-        "ChunkProcessor",
-        "TTSSynthesizer",
-    ])
-
-if _NLP_AVAILABLE:
-    __all__.extend([
-        "NLPProcessor",
-        "TextNormalizer",
-        "HomographResolver",
-        "PhoneticProcessor",
-    ])
-
-if _VOICE_AVAILABLE:
-    __all__.extend([
-        "VoiceManager",
-        "VoiceDownloader",
-        "VoiceValidator",
-        "VoiceMetadataManager",
-    ])
-
-if _AUDIO_AVAILABLE:
-    __all__.extend([
-        "AudioProcessor",
-        "AudioSegment", 
-        "AudioFormatConverter",
-        "AudioStreamer",
-    ])
-
-if _CACHE_AVAILABLE:
-    __all__.extend([
-        "EnhancedCacheManager",
-        "AudioCache",
-        "TextCache",
-    ])
\ No newline at end of file
+    # Lazily imported subsystems (keep in step with _LAZY_EXPORTS)
+    "TTSAPIRouter",
+    "RequestValidator",
+    "ErrorHandler",
+    "ResponseFormatter",
+    "KokoroTTSEngine",
+    "EmotionController",
+    "ChunkProcessor",
+    "TTSSynthesizer",
+    "NLPProcessor",
+    "TextNormalizer",
+    "HomographResolver",
+    "PhoneticProcessor",
+    "VoiceManager",
+    "VoiceDownloader",
+    "VoiceValidator",
+    "VoiceMetadataManager",
+    "AudioProcessor",
+    "AudioSegment",
+    "AudioFormatConverter",
+    "AudioStreamer",
+    "EnhancedCacheManager",
+    "AudioCache",
+    "TextCache",
+]
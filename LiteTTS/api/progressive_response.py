@@ -14,6 +14,7 @@ from fastapi.responses import StreamingResponse
 import io
 
 from ..audio.progressive_generator import ProgressiveAudioGenerator, ChunkResult, GenerationMode
+from ..audio.cancellation import CancellationToken, watch_for_disconnect
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class ProgressiveResponseHandler:
     def __init__(self, progressive_generator: ProgressiveAudioGenerator):
         self.progressive_generator = progressive_generator
         self.active_streams = {}
+        self.cancellation_tokens: Dict[str, CancellationToken] = {}
     
     async def create_progressive_response(
         self,
@@ -31,7 +33,8 @@ class ProgressiveResponseHandler:
         response_format: str = "mp3",
         speed: float = 1.0,
         streaming: bool = True,
-        generation_id: Optional[str] = None
+        generation_id: Optional[str] = None,
+        http_request=None
     ) -> StreamingResponse:
         """
         Create a progressive streaming response
@@ -43,6 +46,7 @@ class ProgressiveResponseHandler:
             speed: Speech speed
             streaming: Whether to use streaming mode
             generation_id: Optional generation ID
+            http_request: Optional incoming Request; its disconnect cancels synthesis
             
         Returns:
             StreamingResponse with progressive audio
@@ -56,13 +60,15 @@ class ProgressiveResponseHandler:
             "voice": voice,
             "format": response_format
         }
+        token = CancellationToken(generation_id)
+        self.cancellation_tokens[generation_id] = token
         
         try:
             if streaming:
                 # Create streaming response with chunked audio
                 return StreamingResponse(
                     self._stream_chunked_audio(
-                        text, voice, response_format, speed, generation_id
+                        text, voice, response_format, speed, generation_id, http_request
                     ),
                     media_type=f"audio/{response_format}",
                     headers={
@@ -80,7 +86,7 @@ class ProgressiveResponseHandler:
                 # Create response with complete audio (but still chunked internally)
                 return StreamingResponse(
                     self._stream_complete_audio(
-                        text, voice, response_format, speed, generation_id
+                        text, voice, response_format, speed, generation_id, http_request
                     ),
                     media_type=f"audio/{response_format}",
                     headers={
@@ -99,7 +105,24 @@ class ProgressiveResponseHandler:
             # Cleanup
             if generation_id in self.active_streams:
                 del self.active_streams[generation_id]
+            self.cancellation_tokens.pop(generation_id, None)
             raise
+
+    def _start_disconnect_watcher(self, http_request, token: CancellationToken) -> Optional[asyncio.Task]:
+        """Cancel the generation token when the HTTP client goes away"""
+        if http_request is None:
+            return None
+        return asyncio.create_task(watch_for_disconnect(http_request, token))
+
+    def _finish_stream(self, generation_id: str, watcher: Optional[asyncio.Task], completed: bool):
+        """Release per-stream state, cancelling the generation if it did not complete"""
+        token = self.cancellation_tokens.pop(generation_id, None)
+        if token is not None and not completed:
+            token.cancel(token.reason or "client_disconnected")
+        if watcher is not None:
+            watcher.cancel()
+        if generation_id in self.active_streams:
+            del self.active_streams[generation_id]
     
     async def _stream_chunked_audio(
         self,
@@ -107,10 +130,15 @@ class ProgressiveResponseHandler:
         voice: str,
         response_format: str,
         speed: float,
-        generation_id: str
+        generation_id: str,
+        http_request=None
     ) -> AsyncIterator[bytes]:
         """Stream audio chunks as they become available"""
         
+        token = self.cancellation_tokens.get(generation_id) or CancellationToken(generation_id)
+        watcher = self._start_disconnect_watcher(http_request, token)
+        completed = False
+
         try:
             chunk_count = 0
             total_bytes = 0
@@ -120,7 +148,8 @@ class ProgressiveResponseHandler:
                 voice=voice,
                 response_format=response_format,
                 speed=speed,
-                generation_id=generation_id
+                generation_id=generation_id,
+                cancellation_token=token
             ):
                 # Yield the audio data
                 yield chunk_result.audio_data
@@ -150,14 +179,16 @@ class ProgressiveResponseHandler:
                         f"{chunk_count} chunks, {total_bytes} bytes in {elapsed_time:.2f}s"
                     )
                     break
+
+            completed = not token.cancelled
                     
         except Exception as e:
             logger.error(f"Streaming failed for generation {generation_id}: {e}")
             raise
         finally:
-            # Cleanup
-            if generation_id in self.active_streams:
-                del self.active_streams[generation_id]
+            # Cleanup; reached via GeneratorExit/CancelledError when the ASGI
+            # server drops the response on client disconnect
+            self._finish_stream(generation_id, watcher, completed)
     
     async def _stream_complete_audio(
         self,
@@ -165,10 +196,15 @@ class ProgressiveResponseHandler:
         voice: str,
         response_format: str,
         speed: float,
-        generation_id: str
+        generation_id: str,
+        http_request=None
     ) -> AsyncIterator[bytes]:
         """Generate complete audio using chunked processing but return as single stream"""
         
+        token = self.cancellation_tokens.get(generation_id) or CancellationToken(generation_id)
+        watcher = self._start_disconnect_watcher(http_request, token)
+        completed = False
+
         try:
             audio_chunks = []
             chunk_count = 0
@@ -179,7 +215,8 @@ class ProgressiveResponseHandler:
                 voice=voice,
                 response_format=response_format,
                 speed=speed,
-                generation_id=generation_id
+                generation_id=generation_id,
+                cancellation_token=token
             ):
                 audio_chunks.append(chunk_result.audio_data)
                 chunk_count += 1
@@ -193,6 +230,11 @@ class ProgressiveResponseHandler:
                 if chunk_result.is_final:
                     break
             
+            if token.cancelled:
+                return
+
+            completed = True
+
             # Combine all chunks and yield as single response
             if audio_chunks:
                 combined_audio = b''.join(audio_chunks)
@@ -213,8 +255,7 @@ class ProgressiveResponseHandler:
             raise
         finally:
             # Cleanup
-            if generation_id in self.active_streams:
-                del self.active_streams[generation_id]
+            self._finish_stream(generation_id, watcher, completed)
     
     async def create_server_sent_events_response(
         self,
@@ -351,6 +392,9 @@ class ProgressiveResponseHandler:
     
     def cancel_stream(self, generation_id: str) -> bool:
         """Cancel an active stream"""
+        token = self.cancellation_tokens.pop(generation_id, None)
+        if token is not None:
+            token.cancel("stream_cancelled")
         if generation_id in self.active_streams:
             del self.active_streams[generation_id]
             # Also cancel the underlying generation
@@ -5,7 +5,8 @@ Voice cloning API endpoints for LiteTTS
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Request
 from fastapi.responses import JSONResponse, Response
-from typing import Dict, List, Any, Optional
+from starlette.concurrency import run_in_threadpool
+from typing import Callable, Dict, List, Any, Optional
 import logging
 import tempfile
 import os
@@ -60,6 +61,7 @@ class VoiceCloningRouter:
         self.router = APIRouter()
         self.voice_cloner = VoiceCloner()
         self.metadata_manager = VoiceMetadataManager()
+        self._enhanced_cloner = None  # EnhancedVoiceCloner, created on first multi-clip request
 
         # Supported audio formats
         self.supported_formats = {'.wav', '.mp3', '.m4a', '.flac', '.ogg'}
@@ -370,28 +372,18 @@ class VoiceCloningRouter:
                             detail=f"Total audio duration too long: {total_duration:.1f}s (max: {max_total_duration}s)"
                         )
 
-                    # Enhanced voice cloning with multiple files
+                    # Enhanced voice cloning with multiple files, off the event loop
+                    # (POST /v1/voices/clone-jobs runs the same work as a pollable job)
                     if len(temp_files) == 1:
                         # Single file - use standard cloning
-                        clone_result = self.voice_cloner.clone_voice(temp_files[0], voice_name, description)
+                        clone_result = await run_in_threadpool(self.voice_cloner.clone_voice, temp_files[0], voice_name, description)
                     else:
-                        # Multiple files - use enhanced cloning (if available)
+                        # Multiple files - clips are processed in parallel worker processes
                         try:
-                            # Try to use enhanced cloning method
-                            if hasattr(self.voice_cloner, 'clone_voice_enhanced'):
-                                clone_result = self.voice_cloner.clone_voice_enhanced(
-                                    temp_files,
-                                    voice_name,
-                                    description,
-                                    enable_segmentation=enable_segmentation
-                                )
-                            else:
-                                # Fallback: use first file for now
-                                logger.warning("Enhanced cloning not available, using first file only")
-                                clone_result = self.voice_cloner.clone_voice(temp_files[0], voice_name, description)
+                            clone_result = await run_in_threadpool(self._clone_multiple, temp_files, voice_name, description)
                         except Exception as e:
                             logger.error(f"Enhanced cloning failed, falling back to single file: {e}")
-                            clone_result = self.voice_cloner.clone_voice(temp_files[0], voice_name, description)
+                            clone_result = await run_in_threadpool(self.voice_cloner.clone_voice, temp_files[0], voice_name, description)
 
                     if not clone_result.success:
                         raise HTTPException(
@@ -476,6 +468,85 @@ class VoiceCloningRouter:
                     content={"error": "Enhanced voice creation failed", "detail": str(e)}
                 )
 
+        @self.router.post("/v1/voices/clone-jobs", status_code=202)
+        async def create_clone_job(
+            audio_files: List[UploadFile] = File(..., description="Audio files for voice cloning (up to 5 files, 120s each)"),
+            voice_name: str = Form(..., description="Name for the custom voice"),
+            description: str = Form("", description="Optional description for the voice"),
+            temporary: bool = Form(True, description="Create as temporary voice (default: true)"),
+            session_id: str = Form(None, description="Session ID for temporary voice grouping")
+        ):
+            """
+            Start voice cloning as a background job
+
+            Returns at once with a job id; poll GET /v1/voices/clone-jobs/{job_id}
+            for progress and the created voice. Clips are analyzed in a single
+            streaming pass each and processed in parallel worker processes.
+            """
+            from ..voice.clone_jobs import get_clone_job_manager
+
+            if not audio_files:
+                raise HTTPException(status_code=400, detail="At least one audio file is required")
+            if len(audio_files) > 5:
+                raise HTTPException(status_code=400, detail=f"Too many audio files: {len(audio_files)} (max: 5)")
+
+            voice_name_error = self._validate_voice_name(voice_name)
+            if voice_name_error:
+                raise HTTPException(status_code=400, detail=voice_name_error)
+
+            for i, audio_file in enumerate(audio_files):
+                validation_error = self._validate_audio_file_extended(audio_file)
+                if validation_error:
+                    raise HTTPException(status_code=400, detail=f"File {i+1} validation failed: {validation_error}")
+
+            temp_files = await run_in_threadpool(self._save_uploads, audio_files)
+
+            def work(progress: Callable[[float, str], None]) -> Dict[str, Any]:
+                return self._run_clone_job(temp_files, voice_name, description, temporary, session_id, progress)
+
+            try:
+                job = get_clone_job_manager().submit(voice_name, work, cleanup=lambda: self._remove_files(temp_files))
+            except ValueError as e:
+                self._remove_files(temp_files)
+                raise HTTPException(status_code=409, detail=str(e))
+
+            return {
+                'status': 'accepted',
+                'job': job.to_dict(),
+                'status_url': f"/v1/voices/clone-jobs/{job.job_id}"
+            }
+
+        @self.router.get("/v1/voices/clone-jobs")
+        async def list_clone_jobs():
+            """List recent voice cloning jobs"""
+            from ..voice.clone_jobs import get_clone_job_manager
+
+            jobs = get_clone_job_manager().list_jobs()
+            return {'status': 'success', 'jobs': [job.to_dict() for job in jobs], 'total_count': len(jobs)}
+
+        @self.router.get("/v1/voices/clone-jobs/{job_id}")
+        async def get_clone_job(job_id: str):
+            """Status, progress and (once completed) result of a voice cloning job"""
+            from ..voice.clone_jobs import get_clone_job_manager
+
+            job = get_clone_job_manager().get(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Cloning job '{job_id}' not found")
+            return job.to_dict()
+
+        @self.router.delete("/v1/voices/clone-jobs/{job_id}")
+        async def cancel_clone_job(job_id: str):
+            """Cancel a voice cloning job that has not started yet"""
+            from ..voice.clone_jobs import get_clone_job_manager
+
+            manager = get_clone_job_manager()
+            job = manager.get(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Cloning job '{job_id}' not found")
+            if not manager.cancel(job_id):
+                raise HTTPException(status_code=409, detail=f"Cloning job '{job_id}' is {job.status} and cannot be cancelled")
+            return job.to_dict()
+
         @self.router.get("/v1/voices/custom")
         async def list_custom_voices():
             """
@@ -706,6 +777,128 @@ class VoiceCloningRouter:
                     content={"error": "Cloned voice synthesis failed", "detail": str(e)}
                 )
     
+    def _save_uploads(self, audio_files: List[UploadFile]) -> List[str]:
+        """Copy uploads to temporary files, returning their paths"""
+        temp_files = []
+        try:
+            for i, audio_file in enumerate(audio_files):
+                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio_file.filename or "").suffix,
+                                                 prefix=f"voice_clone_{i+1}_") as temp_file:
+                    shutil.copyfileobj(audio_file.file, temp_file)
+                    temp_files.append(temp_file.name)
+        except Exception:
+            self._remove_files(temp_files)
+            raise
+        return temp_files
+
+    def _remove_files(self, paths: List[str]):
+        """Delete temporary files, ignoring ones already gone"""
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    os.unlink(path)
+            except Exception as e:
+                logger.warning(f"Failed to clean up temp file {path}: {e}")
+
+    def _clone_multiple(self, audio_files: List[str], voice_name: str, description: str,
+                        progress: Optional[Callable[[float, str], None]] = None) -> VoiceCloneResult:
+        """Clone one voice from several clips, processing the clips in parallel"""
+        from ..voice.enhanced_cloning import EnhancedVoiceCloner
+
+        if self._enhanced_cloner is None:
+            self._enhanced_cloner = EnhancedVoiceCloner(str(self.voice_cloner.voices_dir))
+        profile = self._enhanced_cloner.clone_voice_from_multiple_clips(audio_files, voice_name, description,
+                                                                         progress=progress)
+        quality = float(profile.quality_metrics.get('overall_quality_score', 0.5))
+        return VoiceCloneResult(
+            success=True,
+            voice_name=voice_name,
+            voice_file_path=str(self.voice_cloner.voices_dir / f"{voice_name}.bin"),
+            embedding_data=profile.combined_embedding,
+            metadata={
+                'voice_name': voice_name,
+                'description': description,
+                'created_at': profile.created_at,
+                'total_duration': float(profile.total_duration),
+                'clip_count': profile.clip_count,
+                'quality_score': quality,
+                'cloning_method': 'multi_clip_stft_embedding'
+            },
+            similarity_score=min(quality + 0.2, 1.0)
+        )
+
+    def _run_clone_job(self, audio_files: List[str], voice_name: str, description: str, temporary: bool,
+                       session_id: Optional[str], progress: Callable[[float, str], None]) -> Dict[str, Any]:
+        """Body of a cloning job: analyze, clone and register the voice"""
+        analyses = []
+        for i, path in enumerate(audio_files):
+            progress(0.1 * i / len(audio_files), f"Analyzing file {i+1} of {len(audio_files)}")
+            analysis = self.voice_cloner.analyze_audio(path)
+            if not analysis.success:
+                raise ValueError(f"Audio analysis failed for file {i+1}: {analysis.error_message}")
+            if analysis.duration > self.voice_cloner.max_audio_duration:
+                raise ValueError(f"File {i+1} too long: {analysis.duration:.1f}s (max: {self.voice_cloner.max_audio_duration}s)")
+            analyses.append(analysis)
+
+        if len(audio_files) == 1:
+            progress(0.1, "Extracting voice embedding")
+            clone_result = self.voice_cloner.clone_voice(audio_files[0], voice_name, description)
+        else:
+            clone_result = self._clone_multiple(audio_files, voice_name, description,
+                                                progress=lambda fraction, message: progress(0.1 + 0.8 * fraction, message))
+        if not clone_result.success:
+            raise ValueError(f"Voice cloning failed: {clone_result.error_message}")
+
+        progress(0.95, "Registering voice")
+        voice = {
+            'name': clone_result.voice_name,
+            'file_path': clone_result.voice_file_path,
+            'similarity_score': clone_result.similarity_score,
+            'metadata': clone_result.metadata,
+            'temporary': temporary,
+            'total_duration': sum(analysis.duration for analysis in analyses),
+            'file_count': len(audio_files)
+        }
+
+        if temporary:
+            from ..voice.temporary_storage import TemporaryVoiceManager
+
+            # Move the created voice file to temporary storage
+            voice_file_path = Path(clone_result.voice_file_path)
+            voice_data = voice_file_path.read_bytes()
+            voice_file_path.unlink()
+            metadata_path = voice_file_path.with_name(f"{voice_name}_metadata.json")
+            if metadata_path.exists():
+                metadata_path.unlink()
+            voice['file_path'] = TemporaryVoiceManager().create_temporary_voice(voice_name, voice_data, session_id)
+            voice['session_id'] = session_id
+            return voice
+
+        try:
+            avg_quality = sum(analysis.quality_score for analysis in analyses) / len(analyses)
+            self.metadata_manager.add_custom_voice(voice_name, VoiceMetadata(
+                name=voice_name,
+                gender="unknown",
+                accent="custom",
+                voice_type="cloned" if len(audio_files) == 1 else "enhanced_cloned",
+                quality_rating=avg_quality * 5.0,
+                language="en-us",
+                description=description or f"Custom cloned voice: {voice_name}"
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to register voice metadata for {voice_name}: {e}")
+
+        # Refresh the main app's voice list so the new voice is available for synthesis
+        try:
+            import app
+            app_instance = getattr(app, 'app_instance', None)
+            if app_instance and hasattr(app_instance, 'refresh_available_voices'):
+                app_instance.refresh_available_voices()
+        except Exception as e:
+            logger.warning(f"Failed to refresh main app voice list: {e}")
+
+        return voice
+
     def _validate_audio_file(self, audio_file: UploadFile) -> Optional[str]:
         """Validate uploaded audio file"""
         
@@ -4,7 +4,24 @@ from .audio_segment import AudioSegment
 from .format_converter import AudioFormatConverter
 from .streaming import AudioStreamer
 from .processor import AudioProcessor
-from .watermarking import AudioWatermarker, get_audio_watermarker, WatermarkResult, WatermarkDetectionResult
+
+# Watermarking pulls in optional dependencies; import it on first access
+_LAZY_EXPORTS = {
+    'AudioWatermarker': '.watermarking',
+    'get_audio_watermarker': '.watermarking',
+    'WatermarkResult': '.watermarking',
+    'WatermarkDetectionResult': '.watermarking',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'AudioSegment',
@@ -15,4 +32,4 @@ __all__ = [
     'get_audio_watermarker',
     'WatermarkResult',
     'WatermarkDetectionResult'
-]
\ No newline at end of file
+]
@@ -9,6 +9,8 @@ from typing import Dict, Any, Optional, Union, Iterator
 from dataclasses import dataclass, field
 import logging
 
+from .postprocess import PostProcessSpec, process_audio
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -95,52 +97,27 @@ class AudioSegment:
 
     def fade_in(self, duration: float) -> 'AudioSegment':
         """Apply fade-in effect"""
-        fade_samples = int(duration * self.sample_rate)
-        fade_samples = min(fade_samples, len(self.audio_data))
-        
-        audio_copy = self.audio_data.copy()
-        fade_curve = np.linspace(0, 1, fade_samples)
-        audio_copy[:fade_samples] *= fade_curve
-        
-        return AudioSegment(
-            audio_data=audio_copy,
-            sample_rate=self.sample_rate,
-            duration=self.duration,
-            format=self.format,
-            metadata=self.metadata.copy()
-        )
+        fade_samples = min(int(duration * self.sample_rate), len(self.audio_data))
+        return self._post_processed(PostProcessSpec(fade_in=max(fade_samples, 0)))
     
     def fade_out(self, duration: float) -> 'AudioSegment':
         """Apply fade-out effect"""
-        fade_samples = int(duration * self.sample_rate)
-        fade_samples = min(fade_samples, len(self.audio_data))
-        
-        audio_copy = self.audio_data.copy()
-        fade_curve = np.linspace(1, 0, fade_samples)
-        audio_copy[-fade_samples:] *= fade_curve
-        
-        return AudioSegment(
-            audio_data=audio_copy,
-            sample_rate=self.sample_rate,
-            duration=self.duration,
-            format=self.format,
-            metadata=self.metadata.copy()
-        )
+        fade_samples = min(int(duration * self.sample_rate), len(self.audio_data))
+        return self._post_processed(PostProcessSpec(fade_out=max(fade_samples, 0)))
     
     def adjust_volume(self, volume_multiplier: float) -> 'AudioSegment':
         """Adjust volume by multiplier"""
         # Clamp volume multiplier to reasonable range
         volume_multiplier = max(0.0, min(5.0, volume_multiplier))
         
-        adjusted_audio = self.audio_data * volume_multiplier
-        
-        # Prevent clipping
-        max_val = np.max(np.abs(adjusted_audio))
-        if max_val > 1.0:
-            adjusted_audio = adjusted_audio / max_val
-        
+        # Prevent clipping by scaling the peak down to 1.0
+        return self._post_processed(PostProcessSpec(gain=volume_multiplier, gain_peak_limit=1.0))
+    
+    def _post_processed(self, spec: PostProcessSpec) -> 'AudioSegment':
+        """New segment with the spec applied by the fused kernel (one copy, one pass)"""
+        processed_audio, _ = process_audio(self.audio_data, spec)
         return AudioSegment(
-            audio_data=adjusted_audio,
+            audio_data=processed_audio,
             sample_rate=self.sample_rate,
             duration=self.duration,
             format=self.format,
@@ -196,8 +173,9 @@ class AudioSegment:
             if self.sample_rate <= 0:
                 return False
             
-            # Check for NaN or infinite values
-            if np.any(np.isnan(self.audio_data)) or np.any(np.isinf(self.audio_data)):
+            # Check for NaN or infinite values; max/min propagate both without
+            # allocating boolean masks
+            if not (np.isfinite(self.audio_data.max()) and np.isfinite(self.audio_data.min())):
                 return False
             
             # Check duration consistency
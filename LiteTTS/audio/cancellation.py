@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Cooperative cancellation for in-flight synthesis
+Propagates client disconnects from the ASGI layer down to chunk-level work
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationCancelled(Exception):
+    """Raised inside synthesis work when its cancellation token has fired"""
+
+    def __init__(self, reason: str = "cancelled"):
+        self.reason = reason
+        super().__init__(f"Generation cancelled: {reason}")
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag shared by the request handler, the chunk
+    scheduler and executor threads running inference.
+
+    The token is checked cooperatively: chunks that have not started are
+    dropped, chunks already inside ONNX Runtime run to completion and their
+    time is accounted as wasted inference.
+    """
+
+    def __init__(self, generation_id: Optional[str] = None):
+        self.generation_id = generation_id
+        self.reason: Optional[str] = None
+        self.cancelled_at: Optional[float] = None
+        self._event = threading.Event()
+        self._callbacks: List[Callable[["CancellationToken"], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested"""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """
+        Request cancellation
+
+        Returns:
+            True if this call cancelled the token, False if it was already cancelled
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self.cancelled_at = time.time()
+            self._event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+
+        get_cancellation_metrics().record_cancellation(reason)
+        logger.debug(f"Cancellation requested for {self.generation_id}: {reason}")
+
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+        return True
+
+    def add_callback(self, callback: Callable[["CancellationToken"], None]):
+        """Register a callback invoked once when the token is cancelled"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def raise_if_cancelled(self):
+        """Raise GenerationCancelled if cancellation has been requested"""
+        if self._event.is_set():
+            raise GenerationCancelled(self.reason or "cancelled")
+
+
+class CancellationMetrics:
+    """Counters for cancelled generations and the inference time they wasted"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cancelled_generations = 0
+        self.dropped_chunks = 0
+        self.wasted_inference_seconds = 0.0
+        self.reasons: Dict[str, int] = {}
+
+    def record_cancellation(self, reason: str):
+        with self._lock:
+            self.cancelled_generations += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_dropped_chunks(self, count: int = 1):
+        with self._lock:
+            self.dropped_chunks += count
+
+    def record_wasted_inference(self, seconds: float):
+        with self._lock:
+            self.wasted_inference_seconds += max(seconds, 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cancelled_generations": self.cancelled_generations,
+                "dropped_chunks": self.dropped_chunks,
+                "wasted_inference_seconds": self.wasted_inference_seconds,
+                "reasons": dict(self.reasons)
+            }
+
+    def reset(self):
+        with self._lock:
+            self.cancelled_generations = 0
+            self.dropped_chunks = 0
+            self.wasted_inference_seconds = 0.0
+            self.reasons.clear()
+
+
+async def watch_for_disconnect(request, token: CancellationToken, poll_interval: float = 0.1):
+    """
+    Cancel the token when the ASGI client disconnects
+
+    Args:
+        request: Starlette/FastAPI Request for the in-flight HTTP call
+        token: Token to cancel on disconnect
+        poll_interval: Seconds between disconnect checks
+    """
+    try:
+        while not token.cancelled:
+            if await request.is_disconnected():
+                token.cancel("client_disconnected")
+                return
+            await asyncio.sleep(poll_interval)
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.debug(f"Disconnect watcher stopped: {e}")
+
+
+# Global cancellation metrics instance
+_cancellation_metrics: Optional[CancellationMetrics] = None
+
+def get_cancellation_metrics() -> CancellationMetrics:
+    """Get or create global cancellation metrics instance"""
+    global _cancellation_metrics
+    if _cancellation_metrics is None:
+        _cancellation_metrics = CancellationMetrics()
+    return _cancellation_metrics
@@ -11,6 +11,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def encode_audio(audio: np.ndarray, sample_rate: int, response_format: str) -> bytes:
+    """
+    Encode mono samples (float or int16) as an API response body
+
+    This is the encoder behind /v1/audio/speech: soundfile with the
+    format's default subtype. The audio cache transcodes cached PCM through
+    it too, so cached and freshly synthesized responses match.
+    """
+    import soundfile as sf
+
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format=response_format.upper())
+    return buffer.getvalue()
+
 class AudioFormatConverter:
     """Handles conversion between different audio formats"""
     
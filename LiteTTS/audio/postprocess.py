@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Fused audio post-processing kernel
+
+The post-processing chain (sanitize NaN/Inf, volume, compression, peak
+normalization, clipping, fades) used to run as separate full passes that
+each allocated a copy of the audio. Every stage is a per-sample function of
+the input peak, so the kernel scans once for the peak and non-finite
+samples, derives the gains from that single number and then applies all
+stages in place in one more pass.
+
+Backends:
+- numpy: blocked in-place pass, blocks stay cache resident between stages
+- numexpr: one multi-threaded expression evaluated in place (optional)
+- numba: one compiled loop for the scan and one for the apply (optional,
+  compiled on first use and cached on disk)
+
+``auto`` picks numba when it is installed and numpy otherwise. numexpr only
+pays off with several idle cores, so it has to be selected explicitly via
+``audio.postprocess_backend``.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+import logging
+import math
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("auto", "numpy", "numexpr", "numba")
+
+# Samples per block for the numpy backend (256 KiB of float32)
+_BLOCK_SIZE = 65536
+
+@dataclass
+class PostProcessSpec:
+    """
+    Stages applied by the fused kernel, in this order
+
+    Attributes:
+        gain: Volume multiplier
+        gain_peak_limit: If gain would push the peak above this level, scale
+            to this level instead (``AudioSegment.adjust_volume`` semantics)
+        compress_threshold: Level above which the compressor acts, None disables
+        compress_ratio: Compression ratio above the threshold
+        peak_ceiling: Scale down so the final peak does not exceed this level
+        clip: Hard clip level, None disables
+        fade_in: Linear fade-in length in samples
+        fade_out: Linear fade-out length in samples
+    """
+    gain: float = 1.0
+    gain_peak_limit: Optional[float] = None
+    compress_threshold: Optional[float] = None
+    compress_ratio: float = 4.0
+    peak_ceiling: Optional[float] = None
+    clip: Optional[float] = None
+    fade_in: int = 0
+    fade_out: int = 0
+
+@dataclass
+class PostProcessResult:
+    """What the kernel found and applied"""
+    peak: float
+    non_finite: bool
+    pre_gain: float
+    post_gain: float
+    backend: str
+
+    @property
+    def output_peak_estimate(self) -> float:
+        return self.peak * self.pre_gain * self.post_gain
+
+def _compressed_level(level: float, threshold: Optional[float], ratio: float) -> float:
+    if threshold is None or level <= threshold:
+        return level
+    return threshold + (level - threshold) / ratio
+
+def plan_gains(peak: float, spec: PostProcessSpec) -> Tuple[float, float]:
+    """Gains before and after the compressor, derived from the input peak"""
+    pre_gain = spec.gain
+    if spec.gain_peak_limit is not None and peak * pre_gain > spec.gain_peak_limit:
+        pre_gain = spec.gain_peak_limit / peak
+
+    post_gain = 1.0
+    if spec.peak_ceiling is not None:
+        level = _compressed_level(peak * pre_gain, spec.compress_threshold, spec.compress_ratio)
+        if level > spec.peak_ceiling:
+            post_gain = spec.peak_ceiling / level
+    return pre_gain, post_gain
+
+def _fade_gain(index: np.ndarray, n_samples: int, spec: PostProcessSpec) -> np.ndarray:
+    """Combined fade gain for sample indices (matches ``np.linspace`` ramps)"""
+    gain = np.ones(len(index), dtype=np.float32)
+    if spec.fade_in > 0:
+        inside = index < spec.fade_in
+        denominator = max(spec.fade_in - 1, 1)
+        gain[inside] *= (index[inside] / denominator).astype(np.float32) if spec.fade_in > 1 else 0.0
+    if spec.fade_out > 0:
+        start = n_samples - spec.fade_out
+        inside = index >= start
+        denominator = max(spec.fade_out - 1, 1)
+        if spec.fade_out > 1:
+            gain[inside] *= (1.0 - (index[inside] - start) / denominator).astype(np.float32)
+    return gain
+
+# numpy backend
+
+def _scan_numpy(audio: np.ndarray) -> Tuple[float, bool]:
+    # max/min propagate NaN and Inf, so the peak doubles as the finite check
+    # without allocating an np.abs() or np.isfinite() temporary
+    peak = max(float(audio.max()), -float(audio.min()))
+    return peak, bool(np.isfinite(peak))
+
+def _apply_numpy(audio: np.ndarray, pre_gain: float, post_gain: float, spec: PostProcessSpec):
+    n_samples = len(audio)
+    block_size = min(_BLOCK_SIZE, n_samples)
+    compress = spec.compress_threshold is not None
+    if compress:
+        magnitude = np.empty(block_size, dtype=np.float32)
+        above = np.empty(block_size, dtype=bool)
+        threshold = np.float32(spec.compress_threshold)
+        inv_ratio = np.float32(1.0 / spec.compress_ratio)
+
+    fade_in_end = spec.fade_in
+    fade_out_start = n_samples - spec.fade_out
+    for start in range(0, n_samples, block_size):
+        end = min(start + block_size, n_samples)
+        block = audio[start:end]
+
+        if compress:
+            if pre_gain != 1.0:
+                block *= np.float32(pre_gain)
+            mag = np.abs(block, out=magnitude[:end - start])
+            mask = np.greater(mag, threshold, out=above[:end - start])
+            if mask.any():
+                mag -= threshold
+                mag *= inv_ratio
+                mag += threshold
+                np.copysign(mag, block, out=mag)
+                np.copyto(block, mag, where=mask)
+            if post_gain != 1.0:
+                block *= np.float32(post_gain)
+        elif pre_gain * post_gain != 1.0:
+            block *= np.float32(pre_gain * post_gain)
+
+        if spec.clip is not None:
+            np.clip(block, -spec.clip, spec.clip, out=block)
+
+        if start < fade_in_end or end > fade_out_start:
+            block *= _fade_gain(np.arange(start, end), n_samples, spec)
+
+# numexpr backend
+
+_numexpr = None
+
+def _load_numexpr():
+    global _numexpr
+    if _numexpr is None:
+        import numexpr
+        _numexpr = numexpr
+    return _numexpr
+
+def _apply_numexpr(audio: np.ndarray, pre_gain: float, post_gain: float, spec: PostProcessSpec):
+    ne = _load_numexpr()
+    local_dict = {"x": audio, "pre": np.float32(pre_gain), "post": np.float32(post_gain)}
+
+    if spec.compress_threshold is not None:
+        local_dict["t"] = np.float32(spec.compress_threshold)
+        local_dict["inv_r"] = np.float32(1.0 / spec.compress_ratio)
+        expression = ("where(abs(x * pre) > t, where(x < 0, -1, 1) * (t + (abs(x * pre) - t) * inv_r), "
+                      "x * pre) * post")
+    else:
+        expression = "x * (pre * post)"
+    ne.evaluate(expression, local_dict=local_dict, out=audio, casting="same_kind")
+
+    if spec.clip is not None:
+        np.clip(audio, -spec.clip, spec.clip, out=audio)
+
+    # Fades only touch the edges
+    n_samples = len(audio)
+    if spec.fade_in > 0:
+        head = np.arange(0, min(spec.fade_in, n_samples))
+        audio[head] *= _fade_gain(head, n_samples, spec)
+    if spec.fade_out > 0:
+        tail = np.arange(max(n_samples - spec.fade_out, min(spec.fade_in, n_samples)), n_samples)
+        audio[tail] *= _fade_gain(tail, n_samples, spec)
+
+# numba backend; plain Python loops compiled on first use
+
+def _scan_loop(x):
+    peak = 0.0
+    finite = True
+    for i in range(x.shape[0]):
+        value = x[i]
+        if not math.isfinite(value):
+            finite = False
+            continue
+        magnitude = abs(value)
+        if magnitude > peak:
+            peak = magnitude
+    return peak, finite
+
+def _apply_loop(x, pre_gain, compress, threshold, inv_ratio, post_gain, clip, fade_in, fade_out):
+    n = x.shape[0]
+    fade_out_start = n - fade_out
+    for i in range(n):
+        value = x[i] * pre_gain
+        if compress:
+            magnitude = abs(value)
+            if magnitude > threshold:
+                value = math.copysign(threshold + (magnitude - threshold) * inv_ratio, value)
+        value *= post_gain
+        if clip > 0.0:
+            if value > clip:
+                value = clip
+            elif value < -clip:
+                value = -clip
+        if i < fade_in:
+            value *= i / (fade_in - 1) if fade_in > 1 else 0.0
+        if i >= fade_out_start and fade_out > 1:
+            value *= 1.0 - (i - fade_out_start) / (fade_out - 1)
+        x[i] = value
+
+_numba_kernels: Optional[Tuple[Callable, Callable]] = None
+_numba_lock = threading.Lock()
+
+def _load_numba():
+    global _numba_kernels
+    if _numba_kernels is None:
+        with _numba_lock:
+            if _numba_kernels is None:
+                from numba import njit
+                _numba_kernels = (njit(cache=True, nogil=True)(_scan_loop),
+                                  njit(cache=True, nogil=True)(_apply_loop))
+    return _numba_kernels
+
+def _scan_numba(audio: np.ndarray) -> Tuple[float, bool]:
+    scan, _ = _load_numba()
+    peak, finite = scan(audio)
+    return float(peak), bool(finite)
+
+def _apply_numba(audio: np.ndarray, pre_gain: float, post_gain: float, spec: PostProcessSpec):
+    _, apply = _load_numba()
+    compress = spec.compress_threshold is not None
+    apply(audio, np.float32(pre_gain), compress,
+          np.float32(spec.compress_threshold if compress else 0.0),
+          np.float32(1.0 / spec.compress_ratio if compress else 1.0),
+          np.float32(post_gain), np.float32(spec.clip or 0.0), spec.fade_in, spec.fade_out)
+
+_SCANNERS = {"numpy": _scan_numpy, "numexpr": _scan_numpy, "numba": _scan_numba}
+_APPLIERS = {"numpy": _apply_numpy, "numexpr": _apply_numexpr, "numba": _apply_numba}
+_LOADERS = {"numexpr": _load_numexpr, "numba": _load_numba}
+
+_resolved_auto: Optional[str] = None
+_default_backend: Optional[str] = None
+
+def get_default_backend() -> str:
+    """Backend configured in ``audio.postprocess_backend``"""
+    global _default_backend
+    if _default_backend is None:
+        try:
+            from ..config import config
+            backend = getattr(config.audio, "postprocess_backend", "auto")
+        except Exception:
+            backend = "auto"
+        if backend not in BACKENDS:
+            logger.warning(f"Unknown post-processing backend '{backend}', using auto")
+            backend = "auto"
+        _default_backend = backend
+    return _default_backend
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """Concrete backend name, falling back to numpy when an optional one is missing"""
+    global _resolved_auto
+    if backend is None:
+        backend = get_default_backend()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown post-processing backend '{backend}'. Available: {BACKENDS}")
+
+    if backend == "auto":
+        if _resolved_auto is None:
+            try:
+                _load_numba()
+                _resolved_auto = "numba"
+            except ImportError:
+                _resolved_auto = "numpy"
+        return _resolved_auto
+
+    if backend in _LOADERS:
+        try:
+            _LOADERS[backend]()
+        except ImportError:
+            logger.warning(f"{backend} is not installed, using the numpy post-processing kernel")
+            return "numpy"
+    return backend
+
+def process_audio_inplace(audio: np.ndarray, spec: PostProcessSpec,
+                          backend: Optional[str] = None) -> PostProcessResult:
+    """
+    Apply a post-processing spec to float32 audio in place
+
+    NaN samples become 0 and infinite samples are clipped to +-1 before
+    any other stage runs.
+
+    Args:
+        audio: 1-D, C-contiguous float32 array; modified in place
+        spec: Stages to apply
+        backend: Kernel backend, one of BACKENDS; None uses the configured default
+
+    Returns:
+        PostProcessResult with the input peak and the applied gains
+    """
+    if audio.dtype != np.float32 or audio.ndim != 1 or not audio.flags.c_contiguous:
+        raise ValueError("process_audio_inplace expects a 1-D C-contiguous float32 array")
+
+    backend = resolve_backend(backend)
+    if audio.size == 0:
+        return PostProcessResult(peak=0.0, non_finite=False, pre_gain=1.0, post_gain=1.0, backend=backend)
+
+    peak, finite = _SCANNERS[backend](audio)
+    if not finite:
+        np.nan_to_num(audio, copy=False, nan=0.0, posinf=1.0, neginf=-1.0)
+        peak, _ = _scan_numpy(audio)
+
+    pre_gain, post_gain = plan_gains(peak, spec)
+    needs_apply = (pre_gain != 1.0 or post_gain != 1.0 or spec.fade_in > 0 or spec.fade_out > 0
+                   or (spec.clip is not None and peak * pre_gain > spec.clip)
+                   or (spec.compress_threshold is not None and peak * pre_gain > spec.compress_threshold))
+    if needs_apply:
+        _APPLIERS[backend](audio, pre_gain, post_gain, spec)
+
+    return PostProcessResult(peak=peak, non_finite=not finite, pre_gain=pre_gain,
+                             post_gain=post_gain, backend=backend)
+
+def process_audio(audio: np.ndarray, spec: PostProcessSpec,
+                  backend: Optional[str] = None) -> Tuple[np.ndarray, PostProcessResult]:
+    """Copying variant of process_audio_inplace for callers that must keep their input"""
+    output = np.array(audio, dtype=np.float32, copy=True).reshape(-1)
+    return output, process_audio_inplace(output, spec, backend)
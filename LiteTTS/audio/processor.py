@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
 import logging
 
 from .audio_segment import AudioSegment
+from .postprocess import PostProcessSpec, process_audio
 from .format_converter import AudioFormatConverter
 from .streaming import AudioStreamer, StreamChunk
 
@@ -167,30 +168,69 @@ class AudioProcessor:
         
         return validation_result
     
-    def optimize_for_streaming(self, audio_segment: AudioSegment) -> AudioSegment:
-        """Optimize audio segment for streaming"""
-        # Get configurable values
-        from ..config import config
-        if hasattr(config, 'audio'):
-            normalization_threshold = config.audio.normalization_threshold
-        else:
-            normalization_threshold = 0.95
+    def optimize_for_streaming(self, audio_segment: AudioSegment,
+                               volume_multiplier: float = 1.0) -> AudioSegment:
+        """
+        Optimize audio segment for streaming
+
+        Volume, compression and peak normalization run as one fused pass
+        over a single copy of the audio. A volume multiplier other than 1.0
+        behaves like ``AudioSegment.adjust_volume`` applied first.
+        """
+        processed_audio, _ = process_audio(audio_segment.audio_data,
+                                           self._streaming_spec(volume_multiplier))
+
+        return AudioSegment(
+            audio_data=processed_audio,
+            sample_rate=audio_segment.sample_rate,
+            duration=audio_segment.duration,
+            format=audio_segment.format,
+            metadata={**audio_segment.metadata, 'optimized_for_streaming': True}
+        )
 
-        # Apply gentle compression to reduce dynamic range
-        compressed_audio = self._apply_compression(audio_segment.audio_data)
+    def optimize_chunk_for_streaming(self, audio_segment: AudioSegment,
+                                     volume_multiplier: float = 1.0) -> AudioSegment:
+        """
+        Streaming optimization for one chunk of a longer stream
 
-        # Normalize to prevent clipping
-        max_val = np.max(np.abs(compressed_audio))
-        if max_val > normalization_threshold:
-            compressed_audio = compressed_audio * (normalization_threshold / max_val)
+        Peak-dependent stages would change the level from chunk to chunk, so
+        only per-sample stages run here: volume, compression and a hard clip
+        at full scale.
+        """
+        spec = self._streaming_spec(volume_multiplier)
+        spec.gain_peak_limit = None
+        spec.peak_ceiling = None
+        spec.clip = 1.0
+        processed_audio, _ = process_audio(audio_segment.audio_data, spec)
 
         return AudioSegment(
-            audio_data=compressed_audio,
+            audio_data=processed_audio,
             sample_rate=audio_segment.sample_rate,
             duration=audio_segment.duration,
             format=audio_segment.format,
             metadata={**audio_segment.metadata, 'optimized_for_streaming': True}
         )
+
+    def _streaming_spec(self, volume_multiplier: float = 1.0) -> PostProcessSpec:
+        """Kernel spec for streaming optimization from the audio config"""
+        # Get configurable values
+        from ..config import config
+        if hasattr(config, 'audio'):
+            threshold = config.audio.compression_threshold
+            ratio = config.audio.compression_ratio
+            normalization_threshold = config.audio.normalization_threshold
+        else:
+            threshold, ratio, normalization_threshold = 0.7, 4.0, 0.95
+
+        # Same clamp and clipping protection as AudioSegment.adjust_volume
+        volume_multiplier = max(0.0, min(5.0, volume_multiplier))
+        return PostProcessSpec(
+            gain=volume_multiplier,
+            gain_peak_limit=1.0 if volume_multiplier != 1.0 else None,
+            compress_threshold=threshold,
+            compress_ratio=ratio,
+            peak_ceiling=normalization_threshold
+        )
     
     def _apply_compression(self, audio_data: np.ndarray,
                           threshold: float = None, ratio: float = None) -> np.ndarray:
@@ -204,16 +244,8 @@ class AudioProcessor:
             threshold = threshold or 0.7
             ratio = ratio or 4.0
 
-        compressed = audio_data.copy()
-
-        # Find samples above threshold
-        above_threshold = np.abs(compressed) > threshold
-
-        # Apply compression to samples above threshold
-        compressed[above_threshold] = np.sign(compressed[above_threshold]) * (
-            threshold + (np.abs(compressed[above_threshold]) - threshold) / ratio
-        )
-
+        compressed, _ = process_audio(audio_data, PostProcessSpec(compress_threshold=threshold,
+                                                                 compress_ratio=ratio))
         return compressed
     
     def get_supported_formats(self) -> List[str]:
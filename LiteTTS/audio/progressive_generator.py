@@ -5,14 +5,22 @@ Implements chunked audio synthesis for real-time streaming
 """
 
 import asyncio
+import functools
 import logging
+import math
 import time
 import io
+from pathlib import Path
+from types import SimpleNamespace
 from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from .chunking import TextChunker, TextChunk, ChunkingConfig, ChunkingStrategy
+from .cancellation import CancellationToken, GenerationCancelled, get_cancellation_metrics
+from .format_converter import encode_audio
+from ..cache.cache_utils import CacheKeyGenerator
+from ..cache.manager import EnhancedCacheManager
 # from ..audio.streaming import AudioStreamer  # Will be implemented separately
 
 logger = logging.getLogger(__name__)
@@ -45,11 +53,51 @@ class ProgressiveGenerationConfig:
     enable_prosody_continuity: bool = True
     buffer_size: int = 8192
     streaming_delay: float = 0.1  # Delay between chunk deliveries
+    # Streaming look-ahead: chunks scheduled or buffered ahead of the playback cursor
+    min_lookahead_chunks: int = 1
+    max_lookahead_chunks: int = 4
+    lookahead_safety_factor: float = 1.5  # Headroom over measured RTF
+    rtf_smoothing: float = 0.3  # EMA weight of the newest RTF sample
+    # Chunk cache: byte-budgeted LRU, shared across workers through the disk tier
+    chunk_cache_memory_mb: int = 32
+    chunk_cache_disk_mb: int = 256
+    chunk_cache_dir: Optional[str] = None  # None keeps the chunk cache in memory only
+
+def config_from_chunked_generation(chunked_config, cache_root: Optional[str] = None) -> ProgressiveGenerationConfig:
+    """
+    Progressive generation settings from the audio.chunked_generation config section
+
+    A relative chunk_cache_dir is taken under cache_root (paths.cache_dir), so
+    every worker finds the same directory whatever it was started from.
+    """
+    chunk_cache_dir = getattr(chunked_config, 'chunk_cache_dir', None)
+    if chunk_cache_dir and cache_root and not Path(chunk_cache_dir).is_absolute():
+        chunk_cache_dir = str(Path(cache_root) / chunk_cache_dir)
+    chunking_config = ChunkingConfig(
+        enabled=chunked_config.enabled,
+        strategy=ChunkingStrategy(chunked_config.strategy),
+        max_chunk_size=chunked_config.max_chunk_size,
+        min_chunk_size=chunked_config.min_chunk_size,
+        overlap_size=chunked_config.overlap_size,
+        respect_sentence_boundaries=chunked_config.respect_sentence_boundaries,
+        respect_paragraph_boundaries=chunked_config.respect_paragraph_boundaries,
+        preserve_punctuation=chunked_config.preserve_punctuation
+    )
+    return ProgressiveGenerationConfig(
+        mode=GenerationMode.CHUNKED,
+        chunking_config=chunking_config,
+        enable_voice_consistency=True,
+        enable_prosody_continuity=True,
+        max_lookahead_chunks=getattr(chunked_config, 'max_lookahead_chunks', 4),
+        chunk_cache_memory_mb=getattr(chunked_config, 'chunk_cache_memory_mb', 32),
+        chunk_cache_dir=chunk_cache_dir
+    )
 
 class ProgressiveAudioGenerator:
     """Progressive audio generation system for real-time TTS"""
     
-    def __init__(self, tts_engine, config: ProgressiveGenerationConfig):
+    def __init__(self, tts_engine, config: ProgressiveGenerationConfig,
+                 chunk_cache: Optional[EnhancedCacheManager] = None):
         self.tts_engine = tts_engine
         self.config = config
         self.text_chunker = TextChunker(config.chunking_config or ChunkingConfig())
@@ -57,7 +105,16 @@ class ProgressiveAudioGenerator:
         
         # Generation state
         self.active_generations = {}
-        self.chunk_cache = {}
+        self.cancellation_tokens: Dict[str, CancellationToken] = {}
+        self.chunk_cache = chunk_cache or EnhancedCacheManager(
+            cache_dir=config.chunk_cache_dir,
+            max_memory_size=config.chunk_cache_memory_mb * 1024 * 1024,
+            max_disk_size=config.chunk_cache_disk_mb * 1024 * 1024
+        )
+        self.model_id = self._resolve_model_id()
+
+        # Measured real-time factor of chunk synthesis (None until first sample)
+        self.rtf_estimate: Optional[float] = None
         
         logger.info(f"ProgressiveAudioGenerator initialized with mode: {config.mode.value}")
     
@@ -67,7 +124,8 @@ class ProgressiveAudioGenerator:
         voice: str, 
         response_format: str = "mp3",
         speed: float = 1.0,
-        generation_id: Optional[str] = None
+        generation_id: Optional[str] = None,
+        cancellation_token: Optional[CancellationToken] = None
     ) -> AsyncIterator[ChunkResult]:
         """
         Generate audio progressively in chunks
@@ -78,20 +136,26 @@ class ProgressiveAudioGenerator:
             response_format: Audio format (mp3, wav, etc.)
             speed: Speech speed multiplier
             generation_id: Optional ID for tracking this generation
+            cancellation_token: Optional token that stops unstarted chunk work when cancelled
             
         Yields:
             ChunkResult objects as they become available
         """
         generation_id = generation_id or f"gen_{int(time.time() * 1000)}"
+        token = cancellation_token or CancellationToken(generation_id)
+        self.cancellation_tokens[generation_id] = token
+        completed = False
         
         try:
             # Check if chunking should be used
             if not self._should_use_chunking(text):
                 # Generate as single chunk
                 async for result in self._generate_single_chunk(
-                    text, voice, response_format, speed, generation_id
+                    text, voice, response_format, speed, generation_id, token
                 ):
+                    completed = completed or result.is_final
                     yield result
+                completed = True
                 return
             
             # Chunk the text
@@ -106,25 +170,37 @@ class ProgressiveAudioGenerator:
                 "start_time": time.time()
             }
             
-            # Generate chunks progressively
-            if self.config.mode == GenerationMode.STREAMING:
-                async for result in self._generate_streaming(
-                    chunks, voice, response_format, speed, generation_id
+            # Generate chunks progressively; chunked and streaming modes both
+            # keep a look-ahead window of chunks synthesizing ahead of the consumer
+            if self.config.mode in (GenerationMode.CHUNKED, GenerationMode.STREAMING):
+                async for result in self._generate_with_lookahead(
+                    chunks, voice, response_format, speed, generation_id, token
                 ):
+                    completed = completed or result.is_final
                     yield result
             else:
                 async for result in self._generate_chunked(
-                    chunks, voice, response_format, speed, generation_id
+                    chunks, voice, response_format, speed, generation_id, token
                 ):
+                    completed = completed or result.is_final
                     yield result
+            completed = True
                     
+        except GenerationCancelled as e:
+            logger.info(f"Progressive generation {generation_id} stopped: {e.reason}")
         except Exception as e:
             logger.error(f"Progressive generation failed for {generation_id}: {e}")
             raise
         finally:
+            # A consumer that stops iterating early (client disconnect) closes
+            # this generator; cancel so executor work still queued is dropped
+            if not completed:
+                token.cancel(token.reason or "consumer_closed")
             # Cleanup generation state
             if generation_id in self.active_generations:
                 del self.active_generations[generation_id]
+            if self.cancellation_tokens.get(generation_id) is token:
+                del self.cancellation_tokens[generation_id]
     
     async def _generate_single_chunk(
         self, 
@@ -132,18 +208,19 @@ class ProgressiveAudioGenerator:
         voice: str, 
         response_format: str, 
         speed: float,
-        generation_id: str
+        generation_id: str,
+        token: Optional[CancellationToken] = None
     ) -> AsyncIterator[ChunkResult]:
         """Generate audio as a single chunk"""
         start_time = time.time()
         
         try:
             # Generate audio using the TTS engine
-            audio_data = await self._synthesize_chunk(text, voice, response_format, speed)
+            audio_data, duration = await self._synthesize_chunk(text, voice, response_format, speed, token)
             generation_time = time.time() - start_time
             
-            # Estimate duration (rough calculation)
-            duration = len(text) * 0.05  # ~50ms per character
+            if duration is None:
+                duration = len(text) * 0.05  # Engine gave no samples; ~50ms per character
             
             yield ChunkResult(
                 chunk_id=0,
@@ -159,6 +236,8 @@ class ProgressiveAudioGenerator:
                 }
             )
             
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Single chunk generation failed: {e}")
             raise
@@ -169,11 +248,16 @@ class ProgressiveAudioGenerator:
         voice: str, 
         response_format: str, 
         speed: float,
-        generation_id: str
+        generation_id: str,
+        token: Optional[CancellationToken] = None
     ) -> AsyncIterator[ChunkResult]:
-        """Generate audio chunks sequentially"""
+        """Generate audio chunks sequentially (standard mode)"""
         
         for i, chunk in enumerate(chunks):
+            if token is not None and token.cancelled:
+                get_cancellation_metrics().record_dropped_chunks(len(chunks) - i)
+                raise GenerationCancelled(token.reason or "cancelled")
+
             start_time = time.time()
             
             try:
@@ -181,14 +265,14 @@ class ProgressiveAudioGenerator:
                 chunk_text = self._prepare_chunk_text(chunk)
                 
                 # Generate audio for this chunk
-                audio_data = await self._synthesize_chunk(
-                    chunk_text, voice, response_format, speed
+                audio_data, duration = await self._synthesize_chunk(
+                    chunk_text, voice, response_format, speed, token
                 )
                 
                 generation_time = time.time() - start_time
                 
-                # Estimate duration
-                duration = len(chunk_text) * 0.05
+                if duration is None:
+                    duration = len(chunk_text) * 0.05  # Engine gave no samples
                 
                 # Update generation state
                 if generation_id in self.active_generations:
@@ -215,36 +299,45 @@ class ProgressiveAudioGenerator:
                 if self.config.streaming_delay > 0:
                     await asyncio.sleep(self.config.streaming_delay)
                     
+            except (GenerationCancelled, GeneratorExit):
+                # Cancelled mid-chunk or the consumer stopped listening
+                get_cancellation_metrics().record_dropped_chunks(len(chunks) - i - 1)
+                raise
             except Exception as e:
                 logger.error(f"Chunk {chunk.chunk_id} generation failed: {e}")
                 # Continue with next chunk instead of failing completely
                 continue
     
-    async def _generate_streaming(
+    async def _generate_with_lookahead(
         self, 
         chunks: List[TextChunk], 
         voice: str, 
         response_format: str, 
         speed: float,
-        generation_id: str
+        generation_id: str,
+        token: Optional[CancellationToken] = None
     ) -> AsyncIterator[ChunkResult]:
-        """Generate audio chunks with concurrent processing"""
+        """Generate audio chunks concurrently within an RTF-sized look-ahead window"""
         
+        token = token or CancellationToken(generation_id)
+
         # Create semaphore to limit concurrent generations
         semaphore = asyncio.Semaphore(self.config.max_concurrent_chunks)
         
         async def generate_chunk_async(chunk: TextChunk, index: int) -> ChunkResult:
             async with semaphore:
+                token.raise_if_cancelled()
                 start_time = time.time()
                 
                 try:
                     chunk_text = self._prepare_chunk_text(chunk)
-                    audio_data = await self._synthesize_chunk(
-                        chunk_text, voice, response_format, speed
+                    audio_data, duration = await self._synthesize_chunk(
+                        chunk_text, voice, response_format, speed, token
                     )
                     
                     generation_time = time.time() - start_time
-                    duration = len(chunk_text) * 0.05
+                    if duration is None:
+                        duration = len(chunk_text) * 0.05  # Engine gave no samples
                     
                     return ChunkResult(
                         chunk_id=chunk.chunk_id,
@@ -254,115 +347,222 @@ class ProgressiveAudioGenerator:
                         chunk_text=chunk_text,
                         is_final=(index == len(chunks) - 1),
                         metadata={
-                            "mode": "streaming",
+                            "mode": self.config.mode.value,
                             "generation_id": generation_id,
                             "chunk_position": index + 1,
-                            "total_chunks": len(chunks)
+                            "total_chunks": len(chunks),
+                            "is_sentence_boundary": chunk.is_sentence_boundary,
+                            "is_paragraph_boundary": chunk.is_paragraph_boundary
                         }
                     )
                     
+                except GenerationCancelled:
+                    raise
                 except Exception as e:
                     logger.error(f"Streaming chunk {chunk.chunk_id} failed: {e}")
                     raise
         
-        # Start all chunk generations concurrently
-        tasks = [
-            asyncio.create_task(generate_chunk_async(chunk, i))
-            for i, chunk in enumerate(chunks)
-        ]
-        
-        # Yield results as they complete, but maintain order
-        completed_chunks = {}
-        next_chunk_id = 0
+        # Only a bounded window of chunks ahead of the playback cursor is ever
+        # scheduled; the window slides when the consumer pulls the next chunk,
+        # so a slow client back-pressures synthesis instead of growing a buffer
+        window: Dict[int, asyncio.Task] = {}
+        next_to_schedule = 0
+
+        def cancel_pending(_token: CancellationToken):
+            # Tasks still waiting on the semaphore or the executor queue are
+            # dropped; work already inside the engine finishes on its thread
+            dropped = sum(1 for task in window.values() if not task.done())
+            dropped += len(chunks) - next_to_schedule
+            for task in window.values():
+                task.cancel()
+            get_cancellation_metrics().record_dropped_chunks(dropped)
+
+        loop = asyncio.get_running_loop()
+        token.add_callback(
+            lambda t: loop.is_closed() or loop.call_soon_threadsafe(cancel_pending, t)
+        )
         
-        while tasks:
-            # Wait for next completion
-            done, pending = await asyncio.wait(
-                tasks, 
-                return_when=asyncio.FIRST_COMPLETED,
-                timeout=self.config.chunk_timeout
-            )
-            
-            # Process completed tasks
-            for task in done:
+        try:
+            for cursor in range(len(chunks)):
+                if token.cancelled:
+                    raise GenerationCancelled(token.reason or "cancelled")
+
+                # Top up the look-ahead window
+                lookahead = self._compute_lookahead()
+                while next_to_schedule < len(chunks) and next_to_schedule - cursor < lookahead:
+                    window[next_to_schedule] = asyncio.create_task(
+                        generate_chunk_async(chunks[next_to_schedule], next_to_schedule)
+                    )
+                    next_to_schedule += 1
+
+                if generation_id in self.active_generations:
+                    self.active_generations[generation_id]["lookahead"] = lookahead
+
+                # Wait for the chunk at the playback cursor
+                task = window[cursor]
+                while not task.done():
+                    done, _ = await asyncio.wait({task}, timeout=self.config.chunk_timeout)
+                    if not done:
+                        logger.warning(
+                            f"Streaming chunk {cursor} exceeded {self.config.chunk_timeout}s "
+                            f"for generation {generation_id}"
+                        )
+                del window[cursor]
+
+                if task.cancelled():
+                    continue
                 try:
-                    result = await task
-                    completed_chunks[result.chunk_id] = result
-                    tasks.remove(task)
-                    
-                    # Update generation state
-                    if generation_id in self.active_generations:
-                        self.active_generations[generation_id]["completed"] += 1
-                        
+                    result = task.result()
+                except GenerationCancelled:
+                    continue
                 except Exception as e:
                     logger.error(f"Streaming task failed: {e}")
-                    tasks.remove(task)
                     continue
-            
-            # Yield chunks in order
-            while next_chunk_id in completed_chunks:
-                yield completed_chunks[next_chunk_id]
-                del completed_chunks[next_chunk_id]
-                next_chunk_id += 1
-                
+
+                # Update generation state
+                if generation_id in self.active_generations:
+                    self.active_generations[generation_id]["completed"] += 1
+
+                yield result
+
                 # Add streaming delay
                 if self.config.streaming_delay > 0:
                     await asyncio.sleep(self.config.streaming_delay)
+        finally:
+            if next_to_schedule < len(chunks) or any(not task.done() for task in window.values()):
+                token.cancel(token.reason or "consumer_closed")
+
+    def _record_chunk_rtf(self, generation_time: float, audio_duration: float):
+        """Fold one chunk's real-time factor into the smoothed estimate"""
+        if audio_duration <= 0:
+            return
+        rtf = generation_time / audio_duration
+        if self.rtf_estimate is None:
+            self.rtf_estimate = rtf
+        else:
+            alpha = self.config.rtf_smoothing
+            self.rtf_estimate = alpha * rtf + (1 - alpha) * self.rtf_estimate
+
+    def _compute_lookahead(self) -> int:
+        """
+        Number of chunks to keep scheduled or buffered ahead of the playback cursor
+
+        With RTF r a chunk takes r times its own duration to synthesize, so
+        ceil(r) chunks must be in flight to keep pace with playback; one extra
+        chunk plus the safety factor absorbs jitter so the buffer never underruns.
+        """
+        upper = max(self.config.min_lookahead_chunks, self.config.max_lookahead_chunks)
+        if self.rtf_estimate is None:
+            return max(self.config.min_lookahead_chunks, min(self.config.max_concurrent_chunks, upper))
+
+        lookahead = math.ceil(self.rtf_estimate * self.config.lookahead_safety_factor) + 1
+        return max(self.config.min_lookahead_chunks, min(lookahead, upper))
     
     async def _synthesize_chunk(
         self, 
         text: str, 
         voice: str, 
         response_format: str, 
-        speed: float
-    ) -> bytes:
-        """Synthesize audio for a single chunk"""
+        speed: float,
+        token: Optional[CancellationToken] = None
+    ) -> Tuple[bytes, Optional[float]]:
+        """Synthesize audio for a single chunk, returning it with its duration in seconds"""
         
+        if token is not None:
+            token.raise_if_cancelled()
+
         # Check cache first
-        cache_key = f"{hash(text)}:{voice}:{response_format}:{speed}"
-        if cache_key in self.chunk_cache:
+        cache_key = CacheKeyGenerator.generate_audio_cache_key(
+            text=text,
+            voice=voice,
+            speed=speed,
+            format=response_format,
+            model_id=self.model_id
+        )
+        cached_audio = await self._run_cache_op(self.chunk_cache.get, cache_key)
+        if cached_audio is not None:
             logger.debug(f"Using cached audio for chunk: {text[:50]}...")
-            return self.chunk_cache[cache_key]
+            if isinstance(cached_audio, tuple):
+                return cached_audio
+            return cached_audio, None
         
         try:
-            # Use the TTS engine to generate audio
-            # This is a placeholder - actual implementation depends on TTS engine interface
-            audio_data = await asyncio.get_event_loop().run_in_executor(
+            start_time = time.time()
+            audio_data, duration = await asyncio.get_event_loop().run_in_executor(
                 None,
                 self._sync_synthesize,
-                text, voice, response_format, speed
+                text, voice, response_format, speed, token
             )
+            # Only fresh synthesis measures the RTF; cache hits would drag it to zero
+            if duration is not None:
+                self._record_chunk_rtf(time.time() - start_time, duration)
             
-            # Cache the result
-            self.chunk_cache[cache_key] = audio_data
-            
-            # Limit cache size
-            if len(self.chunk_cache) > 100:
-                # Remove oldest entries
-                oldest_key = next(iter(self.chunk_cache))
-                del self.chunk_cache[oldest_key]
+            # Cache the result; eviction is LRU within the byte budget
+            await self._run_cache_op(
+                self.chunk_cache.put, cache_key, (audio_data, duration), tags=['chunk', f'voice:{voice}']
+            )
             
-            return audio_data
+            return audio_data, duration
             
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Chunk synthesis failed: {e}")
             raise
     
-    def _sync_synthesize(self, text: str, voice: str, response_format: str, speed: float) -> bytes:
-        """Synchronous synthesis wrapper"""
-        # This would call the actual TTS engine
-        # Placeholder implementation
+    def _sync_synthesize(self, text: str, voice: str, response_format: str, speed: float,
+                         token: Optional[CancellationToken] = None) -> Tuple[bytes, Optional[float]]:
+        """
+        Synchronous synthesis wrapper
+
+        Engines exposing ``synthesize_samples`` report the real audio duration,
+        len(samples) / sample_rate; for engines that only return encoded bytes
+        the duration is None.
+        """
+        # The executor may pick this job up after the client has gone away
+        if token is not None:
+            token.raise_if_cancelled()
+
+        start_time = time.time()
+        duration = None
         try:
             # Call the TTS engine's synthesis method
-            if hasattr(self.tts_engine, 'synthesize'):
-                return self.tts_engine.synthesize(text, voice, response_format, speed)
+            if hasattr(self.tts_engine, 'synthesize_samples'):
+                samples, sample_rate = self.tts_engine.synthesize_samples(text, voice, speed)
+                audio_data = encode_audio(samples, sample_rate, response_format)
+                duration = len(samples) / sample_rate
+            elif hasattr(self.tts_engine, 'synthesize'):
+                audio_data = self.tts_engine.synthesize(text, voice, response_format, speed)
             else:
                 # Fallback for different engine interfaces
-                return self.tts_engine.generate_audio(text, voice)
+                audio_data = self.tts_engine.generate_audio(text, voice)
         except Exception as e:
             logger.error(f"Synchronous synthesis failed: {e}")
             raise
+
+        if token is not None and token.cancelled:
+            # Nobody will hear this chunk
+            get_cancellation_metrics().record_wasted_inference(time.time() - start_time)
+            raise GenerationCancelled(token.reason or "cancelled")
+
+        return audio_data, duration
     
+    async def _run_cache_op(self, operation, *args, **kwargs):
+        """Run a chunk cache operation, off the event loop when it may touch disk"""
+        if self.chunk_cache.cache_dir is None:
+            return operation(*args, **kwargs)
+        return await asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(operation, *args, **kwargs)
+        )
+
+    def _resolve_model_id(self) -> str:
+        """Identify the model so cached chunks never cross model variants"""
+        engine_config = getattr(self.tts_engine, 'config', None)
+        model_path = getattr(engine_config, 'model_path', None)
+        if model_path:
+            return Path(str(model_path)).name
+        return type(self.tts_engine).__name__
+
     def _prepare_chunk_text(self, chunk: TextChunk) -> str:
         """Prepare chunk text with overlap for prosody continuity"""
         text = chunk.text
@@ -381,7 +581,7 @@ class ProgressiveAudioGenerator:
             return False
         
         # Check minimum text length
-        min_length = self.text_chunker.config.min_text_length_for_chunking or 100
+        min_length = getattr(self.text_chunker.config, 'min_text_length_for_chunking', None) or 100
         if len(text) < min_length:
             return False
         
@@ -406,26 +606,55 @@ class ProgressiveAudioGenerator:
             "total_chunks": state["total"],
             "progress_percentage": (state["completed"] / state["total"]) * 100,
             "elapsed_time": elapsed_time,
-            "estimated_remaining": (elapsed_time / max(state["completed"], 1)) * (state["total"] - state["completed"])
+            "estimated_remaining": (elapsed_time / max(state["completed"], 1)) * (state["total"] - state["completed"]),
+            "lookahead": state.get("lookahead"),
+            "rtf_estimate": self.rtf_estimate
         }
     
-    def cancel_generation(self, generation_id: str) -> bool:
-        """Cancel an active generation"""
+    def cancel_generation(self, generation_id: str, reason: str = "cancelled") -> bool:
+        """Cancel an active generation and stop its unstarted chunk work"""
+        token = self.cancellation_tokens.get(generation_id)
+        if token is not None:
+            token.cancel(reason)
+
         if generation_id in self.active_generations:
             del self.active_generations[generation_id]
             logger.info(f"Cancelled generation {generation_id}")
             return True
-        return False
+        return token is not None
     
     def clear_cache(self):
         """Clear the chunk cache"""
-        self.chunk_cache.clear()
+        self.chunk_cache.clear(tags=['chunk'])
         logger.info("Chunk cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        stats = self.chunk_cache.get_stats()
         return {
-            "cache_size": len(self.chunk_cache),
-            "cache_memory_estimate": sum(len(data) for data in self.chunk_cache.values()),
-            "active_generations": len(self.active_generations)
+            "cache_size": stats['memory_cache']['entries'],
+            "cache_memory_estimate": stats['memory_cache']['size_bytes'],
+            "cache_hit_rate": stats['performance']['hit_rate'],
+            "disk_entries": stats['disk_cache']['entries'],
+            "active_generations": len(self.active_generations),
+            "cancellation": get_cancellation_metrics().get_stats()
         }
+
+class BackendChunkEngine:
+    """
+    The ``synthesize`` a ProgressiveAudioGenerator calls, over a synthesis backend
+
+    The server synthesizes through its backends rather than a KokoroTTSEngine;
+    this lets it stream chunked generation through the same backend.
+    """
+
+    def __init__(self, backend, model_path: str, lang: str = "en-us"):
+        self.backend = backend
+        self.config = SimpleNamespace(model_path=model_path)  # Read by _resolve_model_id
+        self.lang = lang
+
+    def synthesize_samples(self, text: str, voice: str, speed: float) -> Tuple[Any, int]:
+        return self.backend.create(text, voice=voice, speed=speed, lang=self.lang)
+
+    def synthesize(self, text: str, voice: str, response_format: str, speed: float) -> bytes:
+        return encode_audio(*self.synthesize_samples(text, voice, speed), response_format)
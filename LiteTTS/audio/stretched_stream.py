@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Time-stretched streaming synthesis
+
+Generating at a compressed speed and stretching back lowers RTF, but an
+offline stretch has to wait for the whole utterance. Here the text is split
+into chunks, each chunk is synthesized at the compressed speed and fed
+through a streaming WSOLA stretcher, and every block that comes out is
+encoded and sent, so time-to-first-audio only covers the first chunk.
+Like the progressive stream, each block is encoded as a self-contained
+piece of the response format.
+"""
+
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+import asyncio
+import logging
+import re
+
+import numpy as np
+
+from .format_converter import encode_audio
+from .time_stretcher import TimeStretcher
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+def split_sentences(text: str, max_chunk_length: int = 200) -> List[str]:
+    """
+    Split text at sentence ends, packing whole sentences up to max_chunk_length
+
+    Chunks never overlap: each one is synthesized and stretched once and
+    the stretcher joins them, so repeated text would be heard twice. A
+    sentence longer than the limit is kept whole.
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chunk_length:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+def synthesize_time_stretched(synthesize: Callable[[str, float], Tuple[np.ndarray, int]], text: str,
+                              speed: float, stretcher: TimeStretcher,
+                              max_chunk_length: int = 200) -> Tuple[np.ndarray, int]:
+    """The whole time-stretched synthesis of text as one ``(audio, sample_rate)``"""
+    blocks = list(stretcher.stream_synthesis(synthesize, split_sentences(text, max_chunk_length), speed))
+    if not blocks:
+        return np.zeros(0, dtype=np.float32), 0
+    return np.concatenate([audio for audio, _ in blocks]), blocks[0][1]
+
+async def stream_time_stretched(synthesize: Callable[[str, float], Tuple[np.ndarray, int]], text: str,
+                                speed: float, response_format: str, stretcher: TimeStretcher,
+                                http_request=None, max_chunk_length: int = 200) -> AsyncIterator[bytes]:
+    """
+    Encoded audio blocks of a time-stretched synthesis, as they are ready
+
+    Args:
+        synthesize: ``synthesize(text, speed) -> (audio, sample_rate)``; runs in a worker thread
+        stretcher: Time-stretcher resolved for the request
+        http_request: Request to watch for client disconnects between chunks
+    """
+    blocks = stretcher.stream_synthesis(synthesize, split_sentences(text, max_chunk_length), speed)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            block: Optional[Tuple[np.ndarray, int]] = await loop.run_in_executor(None, next, blocks, None)
+            if block is None:
+                return
+            if http_request is not None and await http_request.is_disconnected():
+                from .cancellation import get_cancellation_metrics
+                get_cancellation_metrics().record_cancellation("client_disconnected")
+                logger.info("🔌 Client disconnected, stopping time-stretched stream")
+                return
+            audio, sample_rate = block
+            yield encode_audio(audio, sample_rate, response_format)
+    finally:
+        try:
+            blocks.close()
+        except ValueError:
+            pass  # Still running in the worker thread after a cancellation; it ends on its own
@@ -5,9 +5,10 @@ Implements beta time-stretching feature for improved TTS latency
 """
 
 import logging
+import math
 import time
 import numpy as np
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, Tuple, List
 from dataclasses import dataclass
 from enum import Enum
 import os
@@ -56,6 +57,19 @@ class TimeStretchConfig:
         if self.auto_enable_threshold < 0:
             raise ValueError("auto_enable_threshold must be non-negative")
 
+def config_from_settings(settings) -> TimeStretchConfig:
+    """Time-stretch settings from the time_stretching config section"""
+    return TimeStretchConfig(
+        enabled=settings.enabled,
+        compress_playback_rate=settings.generation_speed_boost,
+        correction_quality=StretchQuality(settings.correction_quality),
+        max_rate=settings.max_speed_boost,
+        min_rate=settings.min_speed_boost,
+        auto_enable_threshold=settings.auto_enable_for_long_text,
+        quality_fallback=settings.quality_fallback,
+        benchmark_mode=settings.benchmark_mode
+    )
+
 @dataclass
 class StretchMetrics:
     """Metrics for time-stretching performance"""
@@ -68,6 +82,187 @@ class StretchMetrics:
     rtf_stretched: float
     quality_score: Optional[float] = None
 
+class StreamingTimeStretcher:
+    """
+    Block-based WSOLA time stretcher that works on a stream of chunks
+
+    Waveform-similarity overlap-add cuts Hann-windowed frames from the input
+    at a hop of synthesis_hop / stretch_ratio and overlap-adds them at the
+    synthesis hop. Each frame start is moved within +-tolerance samples to
+    the position whose waveform best matches the natural continuation of the
+    previous frame, which keeps pitch and avoids phasing artifacts.
+
+    State (input tail, previous frame position, pending overlap) is carried
+    across ``process`` calls, so feeding the audio in arbitrary chunks gives
+    the same output as feeding it at once. Output lags the input by at most
+    ``latency_samples``; ``flush`` drains it at the end of the stream.
+    """
+
+    def __init__(self, stretch_ratio: float, sample_rate: int = 24000,
+                 frame_ms: float = 25.0, tolerance_ms: Optional[float] = None):
+        """
+        Args:
+            stretch_ratio: Output duration / input duration (1.25 = 25% longer)
+            sample_rate: Audio sample rate
+            frame_ms: Analysis frame length
+            tolerance_ms: Search range around the nominal frame position,
+                defaults to a quarter frame
+        """
+        if stretch_ratio <= 0:
+            raise ValueError("stretch_ratio must be positive")
+
+        self.stretch_ratio = float(stretch_ratio)
+        self.sample_rate = sample_rate
+        self.synthesis_hop = max(int(sample_rate * frame_ms / 2000), 16)
+        self.frame_length = 2 * self.synthesis_hop
+        if tolerance_ms is None:
+            self.tolerance = self.frame_length // 4
+        else:
+            self.tolerance = int(sample_rate * tolerance_ms / 1000)
+        self.analysis_hop = self.synthesis_hop / self.stretch_ratio
+
+        # Periodic Hann windows at 50% overlap sum to exactly one
+        n = np.arange(self.frame_length)
+        self._window = (0.5 - 0.5 * np.cos(2 * np.pi * n / self.frame_length)).astype(np.float32)
+
+        # Bookkeeping for the time spent stretching and the stream length
+        self.samples_in = 0
+        self.samples_out = 0
+        self.processing_time = 0.0
+
+        self.reset()
+
+    @property
+    def latency_samples(self) -> int:
+        """Upper bound on input samples held back before they reach the output"""
+        return self.frame_length + self.tolerance + int(math.ceil(self.analysis_hop))
+
+    @property
+    def is_passthrough(self) -> bool:
+        return abs(self.stretch_ratio - 1.0) < 1e-6
+
+    def reset(self):
+        """Start a new stream (buffered audio is discarded, use flush to keep it)"""
+        # The input is conceptually prefixed with one synthesis hop of silence
+        # so the first real samples are not attenuated by the first window
+        self._buffer = np.zeros(self.synthesis_hop, dtype=np.float32)
+        self._buffer_start = 0
+        self._input_end = self.synthesis_hop
+        self._frame_index = 0
+        self._previous_position: Optional[int] = None
+        self._pending = np.zeros(self.synthesis_hop, dtype=np.float32)
+        self._skip = int(round(self.synthesis_hop * self.stretch_ratio))
+        self._stream_in = 0
+        self._stream_out = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Feed the next chunk and return the stretched audio that is ready"""
+        start_time = time.perf_counter()
+        chunk = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        self.samples_in += len(chunk)
+
+        if self.is_passthrough:
+            output = chunk.copy()
+        else:
+            self._stream_in += len(chunk)
+            self._append(chunk)
+            output = self._emit(self._run_frames(final=False))
+
+        self.samples_out += len(output)
+        self.processing_time += time.perf_counter() - start_time
+        return output
+
+    def flush(self) -> np.ndarray:
+        """Drain the held-back audio, trim the stream to its exact length and reset"""
+        if self.is_passthrough:
+            return np.zeros(0, dtype=np.float32)
+
+        start_time = time.perf_counter()
+        real_end = self._input_end
+        self._append(np.zeros(self.frame_length + self.tolerance + self.synthesis_hop + 1, dtype=np.float32))
+        blocks = self._run_frames(final=True, stop_at=real_end)
+        blocks.append(self._pending)
+        output = self._emit(blocks)
+
+        # Exactly stretch_ratio times the input, the tail is padding
+        target = int(round(self._stream_in * self.stretch_ratio))
+        remaining = max(target - self._stream_out + len(output), 0)
+        if len(output) >= remaining:
+            output = output[:remaining]
+        else:
+            output = np.concatenate([output, np.zeros(remaining - len(output), dtype=np.float32)])
+
+        self.samples_out += len(output)
+        self.processing_time += time.perf_counter() - start_time
+        self.reset()
+        return output
+
+    def stretch(self, audio: np.ndarray) -> np.ndarray:
+        """Stretch a complete signal (process followed by flush)"""
+        head = self.process(audio)
+        return np.concatenate([head, self.flush()])
+
+    def _append(self, chunk: np.ndarray):
+        # Drop input that no future frame can reach before growing the buffer
+        nominal = int(round(self._frame_index * self.analysis_hop))
+        needed_from = nominal - self.tolerance
+        if self._previous_position is not None:
+            needed_from = min(needed_from, self._previous_position + self.synthesis_hop)
+        drop = max(needed_from - self._buffer_start, 0)
+        self._buffer = np.concatenate([self._buffer[drop:], chunk])
+        self._buffer_start += drop
+        self._input_end += len(chunk)
+
+    def _run_frames(self, final: bool, stop_at: Optional[int] = None) -> List[np.ndarray]:
+        """Synthesize every frame whose search region is buffered"""
+        frame_length, hop, tolerance = self.frame_length, self.synthesis_hop, self.tolerance
+        buffer, offset = self._buffer, self._buffer_start
+        blocks = []
+
+        while True:
+            nominal = int(round(self._frame_index * self.analysis_hop))
+            if final and nominal >= stop_at:
+                break
+
+            low = max(nominal - tolerance, 0)
+            high = nominal + tolerance
+            natural = None if self._previous_position is None else self._previous_position + hop
+            needed = high + frame_length if natural is None else max(high, natural) + frame_length
+            if needed > self._input_end:
+                break
+
+            if natural is None:
+                position = nominal
+            else:
+                # Best match between the candidates and the natural continuation
+                template = buffer[natural - offset:natural - offset + frame_length]
+                region = buffer[low - offset:high - offset + frame_length]
+                position = low + int(np.argmax(np.correlate(region, template, mode="valid")))
+
+            frame = buffer[position - offset:position - offset + frame_length] * self._window
+            block = self._pending + frame[:hop]
+            self._pending = frame[hop:]
+            blocks.append(block)
+
+            self._previous_position = position
+            self._frame_index += 1
+
+        return blocks
+
+    def _emit(self, blocks: List[np.ndarray]) -> np.ndarray:
+        if not blocks:
+            return np.zeros(0, dtype=np.float32)
+        output = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+        # Drop the output of the silent prefix
+        if self._skip:
+            skipped = min(self._skip, len(output))
+            output = output[skipped:]
+            self._skip -= skipped
+
+        self._stream_out += len(output)
+        return output
+
 class TimeStretcher:
     """Time-stretching processor for TTS optimization"""
     
@@ -80,8 +275,7 @@ class TimeStretcher:
         self.use_librosa = LIBROSA_AVAILABLE
         
         if not self.use_librosa and not self.use_pyrubberband:
-            logger.warning("No time-stretching libraries available - feature disabled")
-            self.config.enabled = False
+            logger.info("No time-stretching libraries available - using the built-in WSOLA stretcher")
         
         logger.info(f"TimeStretcher initialized: enabled={self.config.enabled}, "
                    f"rate={self.config.compress_playback_rate}%, "
@@ -98,6 +292,33 @@ class TimeStretcher:
         
         return True
     
+    def for_request(self, enabled: Optional[bool], rate: Optional[int] = None,
+                    quality: Optional[str] = None, text_length: int = 0) -> Optional["TimeStretcher"]:
+        """
+        Time-stretcher for one request, or None if time-stretching does not apply
+
+        Request parameters override the configuration: ``enabled`` forces it
+        on or off, ``rate`` and ``quality`` replace the configured values.
+        """
+        if enabled is None:
+            enabled = self.should_apply_stretching(text_length)
+        if not enabled:
+            return None
+        if self.config.enabled and rate is None and quality is None:
+            return self
+
+        # Temporary time-stretcher with the request's overrides
+        return TimeStretcher(TimeStretchConfig(
+            enabled=True,
+            compress_playback_rate=rate or self.config.compress_playback_rate,
+            correction_quality=StretchQuality(quality) if quality else self.config.correction_quality,
+            max_rate=self.config.max_rate,
+            min_rate=self.config.min_rate,
+            auto_enable_threshold=self.config.auto_enable_threshold,
+            quality_fallback=self.config.quality_fallback,
+            benchmark_mode=self.config.benchmark_mode
+        ))
+
     def get_generation_speed_multiplier(self) -> float:
         """Get the speed multiplier for generation"""
         if not self.config.enabled:
@@ -170,11 +391,12 @@ class TimeStretcher:
         
         if self.use_pyrubberband and self.config.correction_quality == StretchQuality.HIGH:
             return self._stretch_with_pyrubberband(audio_data, sample_rate, stretch_ratio)
-        elif self.use_librosa:
+        elif self.use_librosa and self.config.correction_quality != StretchQuality.LOW:
             return self._stretch_with_librosa(audio_data, sample_rate, stretch_ratio)
         else:
-            # Fallback to basic interpolation (not recommended for production)
-            return self._stretch_basic(audio_data, stretch_ratio)
+            # WSOLA keeps the pitch, unlike plain interpolation, and is the
+            # same algorithm the streaming path uses
+            return self._stretch_with_wsola(audio_data, sample_rate, stretch_ratio)
     
     def _stretch_with_pyrubberband(self, audio_data: np.ndarray, sample_rate: int,
                                   stretch_ratio: float) -> np.ndarray:
@@ -205,8 +427,69 @@ class TimeStretcher:
             return stretched.astype(np.float32)
             
         except Exception as e:
-            logger.warning(f"librosa stretching failed: {e}, falling back to basic method")
-            return self._stretch_basic(audio_data, stretch_ratio)
+            logger.warning(f"librosa stretching failed: {e}, falling back to WSOLA")
+            return self._stretch_with_wsola(audio_data, sample_rate, stretch_ratio)
+
+    def _stretch_with_wsola(self, audio_data: np.ndarray, sample_rate: int,
+                            stretch_ratio: float) -> np.ndarray:
+        """Time-stretching with the built-in WSOLA stretcher (no dependencies)"""
+        return StreamingTimeStretcher(stretch_ratio, sample_rate).stretch(audio_data)
+
+    def create_stream(self, stretch_ratio: float, sample_rate: int) -> StreamingTimeStretcher:
+        """
+        Create a stateful stretcher for audio that arrives in chunks
+
+        Streaming always uses WSOLA: librosa and pyrubberband need the whole
+        signal, which would hold back the first audio until synthesis ends.
+        """
+        return StreamingTimeStretcher(stretch_ratio, sample_rate)
+
+    def stream_synthesis(self, synthesize: Callable[[str, float], Tuple[np.ndarray, int]],
+                         texts: Iterable[str], speed: float = 1.0) -> Iterator[Tuple[np.ndarray, int]]:
+        """
+        Synthesize texts one after another at the compressed speed and stretch back on the fly
+
+        ``synthesize(text, speed)`` returns ``(audio, sample_rate)``. Stretched
+        audio is yielded as soon as each text is synthesized, so the first
+        audio only waits for the first text plus the stretcher's look-ahead.
+        """
+        generation_speed = self.get_generation_speed_multiplier()
+        stream = None
+        generation_time = 0.0
+        for text in texts:
+            start_time = time.perf_counter()
+            audio, sample_rate = synthesize(text, speed * generation_speed)
+            generation_time += time.perf_counter() - start_time
+            if stream is None:
+                stream = self.create_stream(generation_speed, sample_rate)
+            stretched = stream.process(audio)
+            if len(stretched) > 0:
+                yield stretched, sample_rate
+
+        if stream is not None:
+            tail = stream.flush()
+            if len(tail) > 0:
+                yield tail, stream.sample_rate
+            metrics = self.record_stream_metrics(stream, generation_time)
+            logger.debug(f"Streaming time-stretching metrics: RTF {metrics.rtf_original:.3f} → {metrics.rtf_stretched:.3f}")
+
+    def record_stream_metrics(self, stream: StreamingTimeStretcher,
+                              generation_time: float) -> StretchMetrics:
+        """Record metrics for a finished stream created by create_stream"""
+        original_duration = stream.samples_in / stream.sample_rate
+        stretched_duration = stream.samples_out / stream.sample_rate
+        total_time = generation_time + stream.processing_time
+        metrics = StretchMetrics(
+            original_duration=original_duration,
+            stretched_duration=stretched_duration,
+            generation_time=generation_time,
+            stretch_time=stream.processing_time,
+            total_time=total_time,
+            rtf_original=generation_time / original_duration if original_duration > 0 else 0.0,
+            rtf_stretched=total_time / stretched_duration if stretched_duration > 0 else 0.0
+        )
+        self.metrics_history.append(metrics)
+        return metrics
     
     def _stretch_basic(self, audio_data: np.ndarray, stretch_ratio: float) -> np.ndarray:
         """Basic time-stretching using linear interpolation (low quality)"""
@@ -0,0 +1,51 @@
+#pragma once
+
+// Minimal C ABI over the TTS.cpp runners so the library can be loaded from
+// foreign function interfaces (ctypes, cffi) without a C++ toolchain.
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#if defined(_WIN32)
+#define TTS_C_API __declspec(dllexport)
+#else
+#define TTS_C_API __attribute__((visibility("default")))
+#endif
+
+typedef struct tts_c_runner tts_c_runner;
+
+// Bumped whenever a signature below changes.
+#define TTS_C_API_VERSION 1
+
+TTS_C_API int tts_c_api_version(void);
+
+// Loads a GGUF model. Returns NULL on failure (see tts_c_last_error).
+// `voice` and `espeak_voice_id` may be NULL or empty for model defaults.
+TTS_C_API tts_c_runner * tts_c_load(const char * model_path, int n_threads, const char * voice,
+                                    const char * espeak_voice_id, int cpu_only);
+
+// Generates audio for `text`. On success returns 0 and points `*samples` at
+// `*n_samples` float32 mono samples owned by the runner, valid until the next
+// call on the same runner. Runners are not thread safe.
+TTS_C_API int tts_c_generate(tts_c_runner * runner, const char * text, const char * voice,
+                             const float ** samples, size_t * n_samples);
+
+TTS_C_API float tts_c_sample_rate(const tts_c_runner * runner);
+
+// Writes a newline separated voice list into `buffer` (NUL terminated) and
+// returns the length needed excluding the terminator, or -1 if the model
+// architecture has no voices.
+TTS_C_API int tts_c_list_voices(tts_c_runner * runner, char * buffer, size_t buffer_size);
+
+TTS_C_API void tts_c_free(tts_c_runner * runner);
+
+// Message for the last failure on the calling thread, or "" if none.
+TTS_C_API const char * tts_c_last_error(void);
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,109 @@
+#include "tts_c_api.h"
+
+#include <algorithm>
+#include <cstring>
+#include <exception>
+#include <memory>
+#include <string>
+
+#include "common.h"
+#include "models/loaders.h"
+
+struct tts_c_runner {
+    unique_ptr<tts_generation_runner> runner;
+    generation_configuration config;
+    tts_response response;
+};
+
+static thread_local std::string last_error;
+
+static void set_error(const std::string & message) {
+    last_error = message;
+}
+
+int tts_c_api_version(void) {
+    return TTS_C_API_VERSION;
+}
+
+tts_c_runner * tts_c_load(const char * model_path, int n_threads, const char * voice,
+                          const char * espeak_voice_id, int cpu_only) {
+    last_error.clear();
+    if (!model_path || !*model_path) {
+        set_error("model_path is required");
+        return nullptr;
+    }
+    try {
+        auto * handle = new tts_c_runner{};
+        handle->config.voice = voice ? voice : "";
+        handle->config.espeak_voice_id = espeak_voice_id ? espeak_voice_id : "";
+        handle->runner = runner_from_file(model_path, n_threads > 0 ? n_threads : 1, handle->config, cpu_only != 0);
+        if (!handle->runner) {
+            delete handle;
+            set_error(std::string("failed to load model: ") + model_path);
+            return nullptr;
+        }
+        return handle;
+    } catch (const std::exception & e) {
+        set_error(e.what());
+        return nullptr;
+    }
+}
+
+int tts_c_generate(tts_c_runner * runner, const char * text, const char * voice,
+                   const float ** samples, size_t * n_samples) {
+    last_error.clear();
+    if (!runner || !text || !samples || !n_samples) {
+        set_error("invalid argument");
+        return -1;
+    }
+    try {
+        if (voice && *voice) {
+            runner->config.voice = voice;
+        }
+        runner->response = tts_response{};
+        runner->runner->generate(text, runner->response, runner->config);
+        *samples = runner->response.data;
+        *n_samples = runner->response.n_outputs;
+        return 0;
+    } catch (const std::exception & e) {
+        set_error(e.what());
+        return -1;
+    }
+}
+
+float tts_c_sample_rate(const tts_c_runner * runner) {
+    return runner ? runner->runner->sampling_rate : 0.0f;
+}
+
+int tts_c_list_voices(tts_c_runner * runner, char * buffer, size_t buffer_size) {
+    if (!runner || !runner->runner->supports_voices) {
+        return -1;
+    }
+    std::string joined;
+    for (const auto & voice : runner->runner->list_voices()) {
+        if (!joined.empty()) {
+            joined += '\n';
+        }
+        joined.append(voice.data(), voice.size());
+    }
+    if (buffer && buffer_size > 0) {
+        const size_t n = std::min(joined.size(), buffer_size - 1);
+        std::memcpy(buffer, joined.data(), n);
+        buffer[n] = '\0';
+    }
+    return static_cast<int>(joined.size());
+}
+
+void tts_c_free(tts_c_runner * runner) {
+    if (!runner) {
+        return;
+    }
+    // Runner destructors are not reliable yet (see examples/cli), so the model is
+    // intentionally leaked like the CLI does; only the wrapper is released.
+    static_cast<void>(!runner->runner.release());
+    delete runner;
+}
+
+const char * tts_c_last_error(void) {
+    return last_error.c_str();
+}
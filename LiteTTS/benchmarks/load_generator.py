@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""
+Open-loop HTTP load generator with latency-SLO reporting
+
+Requests are sent on a precomputed arrival schedule (Poisson, or replayed
+from the server's ``structured.jsonl`` request summaries) whether or not
+earlier requests have completed, so a server that falls behind builds a
+queue and its latency grows, instead of the client slowing down with it as
+a sequential (closed-loop) test does. Latency and time-to-first-byte are
+measured from each request's scheduled send time, so client-side dispatch
+delays are charged to the server rather than hidden.
+
+The offered load is stepped up until the service stops keeping up: achieved
+throughput falls short of the offered rate, p99 latency breaks the SLO or
+errors exceed their budget. Each step reports p50/p95/p99 latency and TTFB,
+throughput and error rates, overall and per endpoint.
+
+With ``--standin`` the target is a local server running the synthetic model
+(see synthetic_model.py) behind the same speech and streaming routes, so
+the whole loop runs without the real model.
+
+Usage:
+    python LiteTTS/benchmarks/load_generator.py run --standin --start-rate 2 --max-rate 64
+    python LiteTTS/benchmarks/load_generator.py run --url http://localhost:8354 --rates 1 2 4 8
+    python LiteTTS/benchmarks/load_generator.py run --url ... --trace docs/logs/structured.jsonl
+    python LiteTTS/benchmarks/load_generator.py serve --port 8399
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from LiteTTS.benchmarks.offline_benchmark import (
+    TEXTS, VOICE, BenchmarkContext, build_http_app, commit_info, machine_info
+)
+from LiteTTS.benchmarks.synthetic_model import DEFAULT_VOICES, SyntheticModelSpec
+
+SCHEMA_VERSION = 1
+
+# Routes of EndpointsConfig
+SPEECH_ENDPOINT = "/v1/audio/speech"
+STREAM_ENDPOINT = "/v1/audio/stream"
+SPEECH_PATHS = (SPEECH_ENDPOINT, STREAM_ENDPOINT, "/audio/speech")
+
+CORPUS = [
+    "Hello there!",
+    "Thanks for calling, how can I help you today?",
+    "Your order has shipped and should arrive on Thursday.",
+    "Turn left at the next intersection, then continue for two miles.",
+    "The meeting has been moved to 3:30pm in conference room B.",
+    "Please hold while I transfer you to the billing department.",
+    "It looks like rain this afternoon, so bring an umbrella.",
+    "Chapter one. The house stood at the end of a long gravel road.",
+    TEXTS["medium"],
+    "Dr. Smith paid $1,234.56 for 3 tickets on Jan. 5th, 2024.",
+    "In a hole in the ground there lived a hobbit.",
+    "Not a nasty, dirty, wet hole, filled with the ends of worms and an oozy smell.",
+    "Nor yet a dry, bare, sandy hole with nothing in it to sit down on or to eat.",
+    "It was a hobbit-hole, and that means comfort.",
+    "Reminder: your appointment is tomorrow at 9 a.m.",
+    "Sorry, I didn't catch that. Could you say it again?",
+]
+
+# Workload description
+
+@dataclass(frozen=True)
+class LengthBucket:
+    """Share of requests whose text length falls in [min_chars, max_chars]"""
+    name: str
+    weight: float
+    min_chars: int
+    max_chars: int
+
+# Mostly short interactive prompts, a tail of paragraph-sized requests
+DEFAULT_TEXT_MIX = (
+    LengthBucket("short", 0.55, 10, 60),
+    LengthBucket("medium", 0.35, 60, 250),
+    LengthBucket("long", 0.10, 250, 800),
+)
+
+class TextMix:
+    """Draws request texts with a length distribution from a sentence corpus"""
+
+    def __init__(self, buckets: Sequence[LengthBucket] = DEFAULT_TEXT_MIX,
+                 corpus: Sequence[str] = CORPUS, seed: int = 0):
+        if not buckets or not corpus:
+            raise ValueError("A text mix needs at least one bucket and one corpus sentence")
+        self.buckets = list(buckets)
+        self.corpus = list(corpus)
+        weights = np.array([bucket.weight for bucket in self.buckets], dtype=np.float64)
+        self.weights = weights / weights.sum()
+        self.rng = np.random.default_rng(seed)
+
+    def sample_length(self) -> int:
+        bucket = self.buckets[self.rng.choice(len(self.buckets), p=self.weights)]
+        return int(self.rng.integers(bucket.min_chars, bucket.max_chars + 1))
+
+    def text_of_length(self, length: int) -> str:
+        """Random corpus sentences joined and cut to about length characters at a word boundary"""
+        length = max(1, int(length))
+        parts, total = [], 0
+        while total < length:
+            sentence = self.corpus[self.rng.integers(len(self.corpus))]
+            parts.append(sentence)
+            total += len(sentence) + 1
+        text = " ".join(parts)
+        if len(text) > length:
+            cut = text.rfind(" ", 0, length + 1)
+            text = text[:cut if cut > 0 else length]
+        return text.strip() or self.corpus[0]
+
+    def sample(self) -> str:
+        return self.text_of_length(self.sample_length())
+
+@dataclass
+class PlannedRequest:
+    """One request of a step: when to send it (seconds after the step starts) and what"""
+    offset: float
+    endpoint: str
+    payload: Dict[str, Any]
+
+@dataclass
+class TraceRecord:
+    """A speech request read from structured.jsonl"""
+    arrival: float  # Seconds since the epoch
+    path: str
+    text_length: Optional[int] = None
+    voice: Optional[str] = None
+    response_format: Optional[str] = None
+
+def poisson_arrivals(rate: float, duration: float, rng: np.random.Generator) -> List[float]:
+    """Arrival offsets of a Poisson process with the given rate, within [0, duration)"""
+    if rate <= 0 or duration <= 0:
+        return []
+    arrivals = []
+    now = rng.exponential(1.0 / rate)
+    while now < duration:
+        arrivals.append(now)
+        now += rng.exponential(1.0 / rate)
+    return arrivals
+
+def load_trace(path: str, paths: Iterable[str] = SPEECH_PATHS) -> List[TraceRecord]:
+    """
+    Speech requests from the request summaries in a structured.jsonl log
+
+    A summary is logged when the response is returned, so the arrival time
+    is its timestamp minus the request duration. Lines that are not request
+    summaries for one of paths are skipped.
+    """
+    paths = tuple(paths)
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            request = entry.get("request")
+            if entry.get("event") != "request_summary" or not isinstance(request, dict):
+                continue
+            if request.get("method", "POST") != "POST" or request.get("path") not in paths:
+                continue
+            try:
+                finished = datetime.fromisoformat(entry["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                continue
+            records.append(TraceRecord(
+                arrival=finished - float(request.get("duration") or 0.0),
+                path=request["path"],
+                text_length=request.get("text_length"),
+                voice=request.get("voice"),
+                response_format=request.get("format"),
+            ))
+    records.sort(key=lambda record: record.arrival)
+    return records
+
+@dataclass
+class WorkloadSettings:
+    """What each request asks for"""
+    stream_fraction: float = 0.2  # Share of requests sent to the streaming endpoint
+    response_format: str = "mp3"
+    voices: Sequence[str] = (VOICE,)
+    speed: float = 1.0
+    unique: bool = False  # Make every text unique so the audio cache never hits
+    seed: int = 0
+
+class WorkloadPlanner:
+    """Builds the request schedule of each load step"""
+
+    def __init__(self, settings: WorkloadSettings = WorkloadSettings(), mix: Optional[TextMix] = None,
+                 trace: Optional[Sequence[TraceRecord]] = None):
+        if trace is not None and len(trace) < 2:
+            raise ValueError("A trace needs at least two requests to derive inter-arrival times")
+        self.settings = settings
+        self.mix = mix or TextMix(seed=settings.seed)
+        self.trace = list(trace) if trace is not None else None
+        self.rng = np.random.default_rng(settings.seed)
+        self._sequence = 0
+
+    @property
+    def trace_rate(self) -> Optional[float]:
+        """Average request rate of the trace"""
+        if self.trace is None:
+            return None
+        span = self.trace[-1].arrival - self.trace[0].arrival
+        return (len(self.trace) - 1) / span if span > 0 else math.inf
+
+    def plan(self, rate: float, duration: float) -> List[PlannedRequest]:
+        if self.trace is None:
+            return [self._request(offset) for offset in poisson_arrivals(rate, duration, self.rng)]
+        return self._replay(rate, duration)
+
+    def _replay(self, rate: float, duration: float) -> List[PlannedRequest]:
+        """The trace's arrival pattern time-scaled to rate, looped to fill duration"""
+        first = self.trace[0].arrival
+        offsets = [record.arrival - first for record in self.trace]
+        scale = self.trace_rate / rate if math.isfinite(self.trace_rate) and rate > 0 else 0.0
+        # One mean gap between the end of a pass and the start of the next
+        period = (offsets[-1] + offsets[-1] / (len(offsets) - 1)) * scale
+
+        planned, start = [], 0.0
+        while True:
+            for record, offset in zip(self.trace, offsets):
+                at = start + offset * scale
+                if at >= duration:
+                    return planned
+                planned.append(self._request(at, record))
+            if period <= 0:
+                return planned
+            start += period
+
+    def _request(self, offset: float, record: Optional[TraceRecord] = None) -> PlannedRequest:
+        settings = self.settings
+        self._sequence += 1
+        if record is not None and record.text_length:
+            text = self.mix.text_of_length(record.text_length)
+        else:
+            text = self.mix.sample()
+        if settings.unique:
+            text = f"{text} {self._sequence}"
+
+        if record is not None:
+            endpoint = STREAM_ENDPOINT if record.path == STREAM_ENDPOINT else SPEECH_ENDPOINT
+        else:
+            endpoint = STREAM_ENDPOINT if self.rng.random() < settings.stream_fraction else SPEECH_ENDPOINT
+        voice = record.voice if record is not None and record.voice in settings.voices else None
+        payload = {
+            "input": text,
+            "voice": voice or settings.voices[int(self.rng.integers(len(settings.voices)))],
+            "response_format": (record.response_format if record is not None and record.response_format
+                                else settings.response_format),
+            "speed": settings.speed,
+        }
+        return PlannedRequest(offset, endpoint, payload)
+
+# Execution
+
+@dataclass
+class RequestResult:
+    """Outcome of one request; times are seconds from its scheduled send time"""
+    endpoint: str
+    offset: float
+    chars: int
+    status: Optional[int] = None
+    latency: Optional[float] = None
+    ttfb: Optional[float] = None
+    bytes: int = 0
+    error: Optional[str] = None
+    send_lag: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+async def _send(client, base_url: str, request: PlannedRequest, scheduled: float,
+                loop: asyncio.AbstractEventLoop) -> RequestResult:
+    result = RequestResult(request.endpoint, request.offset, len(request.payload["input"]),
+                           send_lag=max(0.0, loop.time() - scheduled))
+    try:
+        async with client.stream("POST", base_url + request.endpoint, json=request.payload) as response:
+            result.status = response.status_code
+            async for chunk in response.aiter_bytes():
+                if chunk and result.ttfb is None:
+                    result.ttfb = loop.time() - scheduled
+                result.bytes += len(chunk)
+        result.latency = loop.time() - scheduled
+        if result.status >= 400:
+            result.error = f"HTTP {result.status}"
+        elif result.bytes == 0:
+            result.error = "empty response"
+    except Exception as e:
+        import httpx
+
+        result.latency = loop.time() - scheduled
+        result.error = "timeout" if isinstance(e, httpx.TimeoutException) else type(e).__name__
+    return result
+
+async def execute_plan(base_url: str, plan: Sequence[PlannedRequest], timeout: float = 60.0,
+                       max_in_flight: int = 1024, client=None):
+    """
+    Send plan open-loop and return (results, seconds until the last response finished)
+
+    Requests that would exceed max_in_flight are not sent and count as
+    "dropped" errors, which bounds the client without slowing the schedule.
+    """
+    import httpx
+
+    owns_client = client is None
+    if owns_client:
+        client = httpx.AsyncClient(timeout=timeout, limits=httpx.Limits(max_connections=None,
+                                                                       max_keepalive_connections=max_in_flight))
+    loop = asyncio.get_running_loop()
+    results: List[RequestResult] = []
+    tasks = set()
+    start = loop.time()
+    try:
+        for request in sorted(plan, key=lambda planned: planned.offset):
+            scheduled = start + request.offset
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(tasks) >= max_in_flight:
+                results.append(RequestResult(request.endpoint, request.offset, len(request.payload["input"]),
+                                             error="dropped"))
+                continue
+            task = asyncio.ensure_future(_send(client, base_url, request, scheduled, loop))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda done: results.append(done.result()))
+        if tasks:
+            await asyncio.gather(*list(tasks))
+        elapsed = loop.time() - start
+    finally:
+        if owns_client:
+            await client.aclose()
+    results.sort(key=lambda result: result.offset)
+    return results, elapsed
+
+# Statistics
+
+def percentiles(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "mean": None, "max": None}
+    data = np.asarray(values, dtype=np.float64)
+    p50, p95, p99 = np.percentile(data, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99),
+            "mean": float(data.mean()), "max": float(data.max())}
+
+def _summarize(results: Sequence[RequestResult], window: float) -> Dict[str, Any]:
+    ok = [result for result in results if result.ok]
+    errors: Dict[str, int] = {}
+    for result in results:
+        if not result.ok:
+            errors[result.error] = errors.get(result.error, 0) + 1
+    return {
+        "requests": len(results),
+        "ok": len(ok),
+        "errors": errors,
+        "error_rate": (len(results) - len(ok)) / len(results) if results else 0.0,
+        "throughput_rps": len(ok) / window if window > 0 else 0.0,
+        "latency": percentiles([result.latency for result in ok]),
+        "ttfb": percentiles([result.ttfb for result in ok if result.ttfb is not None]),
+    }
+
+def summarize_step(results: Sequence[RequestResult], offered_rate: float, duration: float,
+                   elapsed: float) -> Dict[str, Any]:
+    """
+    Statistics of one load step
+
+    Throughput is successful responses over the time until the last one
+    finished (at least the step duration), so a backlog that drains after
+    the schedule ends lowers it below the offered rate.
+    """
+    window = max(duration, elapsed)
+    summary = {
+        "offered_rps": offered_rate,
+        "duration": duration,
+        "elapsed": elapsed,
+        "sent_rps": len(results) / duration if duration > 0 else 0.0,
+        **_summarize(results, window),
+        "max_send_lag": max((result.send_lag for result in results), default=0.0),
+        "endpoints": {},
+    }
+    for endpoint in sorted({result.endpoint for result in results}):
+        summary["endpoints"][endpoint] = _summarize([r for r in results if r.endpoint == endpoint], window)
+    return summary
+
+@dataclass
+class SLO:
+    """What a step must achieve to count as sustainable"""
+    p99_latency: float = 5.0  # Seconds
+    max_error_rate: float = 0.01
+    min_throughput_ratio: float = 0.9  # Achieved over offered
+
+def slo_violations(step: Dict[str, Any], slo: SLO = SLO()) -> List[str]:
+    violations = []
+    if step["requests"] == 0:
+        return violations
+    if step["error_rate"] > slo.max_error_rate:
+        violations.append(f"error rate {step['error_rate']:.1%} > {slo.max_error_rate:.1%}")
+    p99 = step["latency"]["p99"]
+    if p99 is not None and p99 > slo.p99_latency:
+        violations.append(f"p99 {p99:.2f}s > {slo.p99_latency:.2f}s")
+    # Compare with what was actually sent; Poisson steps rarely hit the nominal rate exactly
+    if step["throughput_rps"] < slo.min_throughput_ratio * step["sent_rps"]:
+        violations.append(f"throughput {step['throughput_rps']:.2f}/s < "
+                          f"{slo.min_throughput_ratio:.0%} of {step['sent_rps']:.2f}/s sent")
+    return violations
+
+def find_saturation(steps: Sequence[Dict[str, Any]], slo: SLO = SLO()) -> Dict[str, Any]:
+    """First step that breaks the SLO and the highest offered load before it"""
+    sustainable = None
+    for step in steps:
+        violations = slo_violations(step, slo)
+        if violations:
+            return {"saturated": True, "saturation_rps": step["offered_rps"],
+                    "max_sustainable_rps": sustainable, "reasons": violations}
+        sustainable = step["offered_rps"]
+    return {"saturated": False, "saturation_rps": None, "max_sustainable_rps": sustainable, "reasons": []}
+
+def ramp_rates(start: float, stop: float, growth: float = 1.5) -> List[float]:
+    """Geometric ramp of offered rates from start up to stop"""
+    if start <= 0 or stop < start or growth <= 1:
+        raise ValueError("Need 0 < start <= stop and growth > 1")
+    rates, rate = [], start
+    while rate <= stop * (1 + 1e-9):
+        rates.append(round(rate, 3))
+        rate *= growth
+    return rates
+
+# Running
+
+async def run_load_test(base_url: str, rates: Sequence[float], planner: WorkloadPlanner,
+                        step_duration: float = 10.0, slo: SLO = SLO(), timeout: float = 60.0,
+                        max_in_flight: int = 1024, warmup_requests: int = 2, settle: float = 1.0,
+                        stop_at_saturation: bool = True, client=None,
+                        progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Step through rates and return the JSON-serializable report"""
+    if warmup_requests:
+        warmup = [PlannedRequest(0.0, SPEECH_ENDPOINT, {"input": TEXTS["short"], "voice": planner.settings.voices[0],
+                                                         "response_format": planner.settings.response_format,
+                                                         "speed": planner.settings.speed})]
+        for _ in range(warmup_requests):
+            await execute_plan(base_url, warmup, timeout, max_in_flight, client)
+
+    steps = []
+    for index, rate in enumerate(rates):
+        if index and settle > 0:
+            await asyncio.sleep(settle)
+        plan = planner.plan(rate, step_duration)
+        results, elapsed = await execute_plan(base_url, plan, timeout, max_in_flight, client)
+        step = summarize_step(results, rate, step_duration, elapsed)
+        step["violations"] = slo_violations(step, slo)
+        steps.append(step)
+        if progress is not None:
+            progress(step)
+        if stop_at_saturation and step["violations"]:
+            break
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "commit": commit_info(),
+        "machine": machine_info(),
+        "target": base_url,
+        "workload": {
+            **{key: value for key, value in asdict(planner.settings).items() if key != "voices"},
+            "voices": list(planner.settings.voices),
+            "arrivals": "trace" if planner.trace is not None else "poisson",
+            "trace_requests": len(planner.trace) if planner.trace is not None else None,
+            "text_mix": [asdict(bucket) for bucket in planner.mix.buckets],
+        },
+        "settings": {"step_duration": step_duration, "timeout": timeout,
+                     "max_in_flight": max_in_flight, "rates": list(rates)},
+        "slo": asdict(slo),
+        "steps": steps,
+        "saturation": find_saturation(steps, slo),
+    }
+
+# Stand-in server
+
+def build_standin_app(context: BenchmarkContext, cache):
+    """
+    The offline benchmark's speech app plus the streaming route and /health
+
+    The streaming route synthesizes sentence by sentence and sends each
+    encoded sentence as soon as it is ready, so TTFB tracks the first
+    sentence rather than the whole text.
+    """
+    from fastapi.responses import StreamingResponse
+    from starlette.concurrency import run_in_threadpool
+
+    from LiteTTS.audio.format_converter import encode_audio
+    from LiteTTS.models import TTSRequest
+
+    app = build_http_app(context, cache)
+
+    @app.post(STREAM_ENDPOINT)
+    async def stream(request: TTSRequest):
+        sentences = [s for s in re.split(r"(?<=[.!?])\s+", request.input.strip()) if s] or [request.input]
+
+        def synthesize(sentence: str) -> bytes:
+            audio, sample_rate = context.backend.create(sentence, voice=request.voice, speed=request.speed)
+            return encode_audio(np.asarray(audio, dtype=np.float32), sample_rate, request.response_format)
+
+        async def chunks():
+            for sentence in sentences:
+                yield await run_in_threadpool(synthesize, sentence)
+
+        return StreamingResponse(chunks(), media_type=f"audio/{request.response_format}")
+
+    @app.get("/health")
+    def health():
+        return {"status": "healthy", "model": "synthetic", "voices": context.model.get_voices()}
+
+    return app
+
+def serve_standin(host: str = "127.0.0.1", port: int = 8399, spec: SyntheticModelSpec = SyntheticModelSpec(),
+                  workdir: Optional[str] = None, cache_mb: int = 64) -> None:
+    """Run the stand-in server until interrupted"""
+    import uvicorn
+
+    from LiteTTS.cache.shared import SharedAudioCache
+
+    with tempfile.TemporaryDirectory(prefix="litetts-load-") as temporary:
+        context = BenchmarkContext(workdir or temporary, spec)
+        cache = SharedAudioCache(max_bytes=cache_mb * 1024 * 1024, shared=False)
+        uvicorn.run(build_standin_app(context, cache), host=host, port=port, log_level="warning")
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class StandinServer:
+    """Stand-in server in a child process, so it does not share the load generator's interpreter"""
+
+    def __init__(self, spec: SyntheticModelSpec = SyntheticModelSpec(), port: Optional[int] = None,
+                 workdir: Optional[str] = None, startup_timeout: float = 120.0):
+        self.spec = spec
+        self.port = port or _free_port()
+        self.workdir = workdir
+        self.startup_timeout = startup_timeout
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "StandinServer":
+        import httpx
+
+        command = [sys.executable, str(Path(__file__).resolve()), "serve", "--port", str(self.port),
+                   "--hidden", str(self.spec.hidden), "--depth", str(self.spec.depth),
+                   "--samples-per-token", str(self.spec.samples_per_token)]
+        if self.workdir:
+            command += ["--workdir", self.workdir]
+        self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                error = self.process.stderr.read().decode(errors="replace")[-2000:]
+                raise RuntimeError(f"Stand-in server exited with {self.process.returncode}: {error}")
+            try:
+                if httpx.get(self.url + "/health", timeout=1.0).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"Stand-in server did not become healthy within {self.startup_timeout:.0f}s")
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.process is not None and self.process.stderr is not None:
+            self.process.stderr.close()
+        self.process = None
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+# Reporting
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.0f}"
+
+def format_step(step: Dict[str, Any]) -> str:
+    latency, ttfb = step["latency"], step["ttfb"]
+    line = (f"{step['offered_rps']:>8.2f} {step['requests']:>6} {step['error_rate']:>6.1%} "
+            f"{step['throughput_rps']:>8.2f} {_ms(latency['p50']):>7} {_ms(latency['p95']):>7} "
+            f"{_ms(latency['p99']):>7} {_ms(ttfb['p50']):>7} {_ms(ttfb['p99']):>7}")
+    if step.get("violations"):
+        line += "  << " + "; ".join(step["violations"])
+    return line
+
+STEP_HEADER = (f"{'offered':>8} {'sent':>6} {'errors':>6} {'thr/s':>8} {'p50ms':>7} {'p95ms':>7} "
+               f"{'p99ms':>7} {'ttfb50':>7} {'ttfb99':>7}")
+
+def format_saturation(report: Dict[str, Any]) -> str:
+    saturation = report["saturation"]
+    if not saturation["saturated"]:
+        top = saturation["max_sustainable_rps"]
+        return f"No saturation up to {top} req/s" if top is not None else "No steps were run"
+    sustainable = saturation["max_sustainable_rps"]
+    prefix = (f"Sustainable up to {sustainable} req/s; " if sustainable is not None
+              else "Saturated at the first step; ")
+    return prefix + f"saturated at {saturation['saturation_rps']} req/s ({'; '.join(saturation['reasons'])})"
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [f"Target: {report['target']}  arrivals: {report['workload']['arrivals']}  "
+             f"step: {report['settings']['step_duration']}s  SLO p99: {report['slo']['p99_latency']}s",
+             STEP_HEADER]
+    lines += [format_step(step) for step in report["steps"]]
+    lines.append(format_saturation(report))
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop HTTP load generator with latency-SLO reporting")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Step up the offered load until saturation")
+    target = run.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running server")
+    target.add_argument("--standin", action="store_true", help="Start a local server on the synthetic model")
+    run.add_argument("--rates", type=float, nargs="+", help="Offered rates (req/s) to step through")
+    run.add_argument("--start-rate", type=float, default=1.0)
+    run.add_argument("--max-rate", type=float, default=64.0)
+    run.add_argument("--growth", type=float, default=1.5, help="Factor between consecutive ramp rates")
+    run.add_argument("--duration", type=float, default=10.0, help="Seconds of arrivals per step")
+    run.add_argument("--trace", help="Replay arrivals and text lengths from a structured.jsonl log")
+    run.add_argument("--stream-fraction", type=float, default=WorkloadSettings.stream_fraction)
+    run.add_argument("--format", default=WorkloadSettings.response_format, dest="response_format")
+    run.add_argument("--voices", nargs="+", default=list(WorkloadSettings.voices))
+    run.add_argument("--unique", action="store_true", help="Make every text unique (no audio cache hits)")
+    run.add_argument("--slo-p99", type=float, default=SLO.p99_latency, help="p99 latency SLO in seconds")
+    run.add_argument("--max-error-rate", type=float, default=SLO.max_error_rate)
+    run.add_argument("--min-throughput-ratio", type=float, default=SLO.min_throughput_ratio)
+    run.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    run.add_argument("--max-in-flight", type=int, default=1024)
+    run.add_argument("--no-stop", action="store_true", help="Run every step even after saturation")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--hidden", type=int, default=SyntheticModelSpec.hidden, help="Stand-in model width")
+    run.add_argument("--depth", type=int, default=SyntheticModelSpec.depth, help="Stand-in model layers")
+    run.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    run.add_argument("--output", help="Write the JSON report to this file")
+
+    serve = commands.add_parser("serve", help="Run the stand-in server on the synthetic model")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8399)
+    serve.add_argument("--hidden", type=int, default=SyntheticModelSpec.hidden)
+    serve.add_argument("--depth", type=int, default=SyntheticModelSpec.depth)
+    serve.add_argument("--samples-per-token", type=int, default=SyntheticModelSpec.samples_per_token)
+    serve.add_argument("--workdir", help="Keep the generated model here instead of a temp dir")
+    serve.add_argument("--cache-mb", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        spec = SyntheticModelSpec(hidden=args.hidden, depth=args.depth, samples_per_token=args.samples_per_token)
+        serve_standin(args.host, args.port, spec, args.workdir, args.cache_mb)
+        return 0
+
+    rates = args.rates or ramp_rates(args.start_rate, args.max_rate, args.growth)
+    voices = args.voices
+    if args.standin:
+        voices = [voice for voice in voices if voice in DEFAULT_VOICES] or [DEFAULT_VOICES[0]]
+    settings = WorkloadSettings(stream_fraction=args.stream_fraction, response_format=args.response_format,
+                                voices=tuple(voices), unique=args.unique, seed=args.seed)
+    planner = WorkloadPlanner(settings, trace=load_trace(args.trace) if args.trace else None)
+    slo = SLO(args.slo_p99, args.max_error_rate, args.min_throughput_ratio)
+
+    def progress(step: Dict[str, Any]) -> None:
+        if not args.json:
+            print(format_step(step), flush=True)
+
+    def run_against(url: str) -> Dict[str, Any]:
+        if not args.json:
+            print(STEP_HEADER, flush=True)
+        return asyncio.run(run_load_test(url, rates, planner, args.duration, slo, args.timeout,
+                                         args.max_in_flight, stop_at_saturation=not args.no_stop,
+                                         progress=progress))
+
+    if args.standin:
+        with StandinServer(SyntheticModelSpec(hidden=args.hidden, depth=args.depth)) as server:
+            report = run_against(server.url)
+    else:
+        report = run_against(args.url.rstrip("/"))
+
+    print(json.dumps(report, indent=2) if args.json else format_saturation(report))
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Offline, per-layer benchmark suite that runs without the real model
+
+Generates the synthetic stand-in model and voices (see synthetic_model.py)
+and times each layer of a request on its own: NLP, tokenization, the ONNX
+session and the backend wrapper around it, post-processing, encoding, the
+audio cache and the HTTP layer (an in-process FastAPI app built from the
+same components as /v1/audio/speech). Timings are reported with
+pytest-benchmark style statistics and written as JSON, which can be saved
+as a baseline and compared against on a later commit.
+
+Absolute numbers only mean something on the machine that produced them;
+compare runs from the same host (or CI runner class).
+
+Usage:
+    python LiteTTS/benchmarks/offline_benchmark.py [--layers nlp tokenize ...] [--quick]
+    python LiteTTS/benchmarks/offline_benchmark.py --save-baseline LiteTTS/benchmarks/baselines/offline.json
+    python LiteTTS/benchmarks/offline_benchmark.py --compare LiteTTS/benchmarks/baselines/offline.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from LiteTTS.benchmarks.synthetic_model import (
+    CHARACTER_SET, SyntheticKokoro, SyntheticModelSpec, create_synthetic_assets
+)
+
+SCHEMA_VERSION = 1
+VOICE = "af_heart"
+
+TEXTS = {
+    "short": "Hello there!",
+    "medium": "The quick brown fox jumps over the lazy dog, and then it takes a short nap in the sun.",
+    "long": (
+        "Dr. Smith paid $1,234.56 for 3 tickets on Jan. 5th, 2024 at 3:30pm. "
+        "In a hole in the ground there lived a hobbit. Not a nasty, dirty, wet hole, "
+        "filled with the ends of worms and an oozy smell, nor yet a dry, bare, sandy hole "
+        "with nothing in it to sit down on or to eat: it was a hobbit-hole, and that means comfort."
+    ),
+}
+
+LAYERS = ["nlp", "tokenize", "inference", "postprocess", "encode", "cache", "http"]
+
+@dataclass
+class BenchmarkCase:
+    """One timed callable"""
+    name: str
+    layer: str
+    func: Callable[[], Any]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class TimingSettings:
+    """How long and how often each case is timed"""
+    min_rounds: int = 5
+    max_rounds: int = 1000
+    max_time: float = 1.0  # Seconds of timed rounds per case
+    min_round_time: float = 0.001  # Iterations per round are calibrated up to this
+    warmup_rounds: int = 1
+
+QUICK_SETTINGS = TimingSettings(min_rounds=3, max_rounds=50, max_time=0.1, min_round_time=0.0005)
+
+# Statistics
+
+def compute_stats(round_times: List[float], iterations: int) -> Dict[str, Any]:
+    """pytest-benchmark style statistics of per-iteration times (seconds)"""
+    data = sorted(round_times)
+    rounds = len(data)
+    mean = statistics.fmean(data)
+    stddev = statistics.stdev(data) if rounds > 1 else 0.0
+    if rounds > 1:
+        q1, _, q3 = statistics.quantiles(data, n=4, method="inclusive")
+    else:
+        q1 = q3 = data[0]
+    iqr = q3 - q1
+    iqr_outliers = sum(1 for x in data if x < q1 - 1.5 * iqr or x > q3 + 1.5 * iqr)
+    stddev_outliers = sum(1 for x in data if abs(x - mean) > stddev) if stddev > 0 else 0
+    return {
+        "min": data[0],
+        "max": data[-1],
+        "mean": mean,
+        "stddev": stddev,
+        "median": statistics.median(data),
+        "q1": q1,
+        "q3": q3,
+        "iqr": iqr,
+        "ops": 1.0 / mean if mean > 0 else math.inf,
+        "rounds": rounds,
+        "iterations": iterations,
+        "outliers": f"{stddev_outliers};{iqr_outliers}",
+        "total": sum(data) * iterations,
+    }
+
+def measure(func: Callable[[], Any], settings: TimingSettings = TimingSettings(),
+            timer: Callable[[], float] = time.perf_counter) -> Dict[str, Any]:
+    """Time func: calibrate iterations per round, then run rounds until max_time"""
+    for _ in range(settings.warmup_rounds):
+        func()
+
+    iterations = 1
+    while True:
+        start = timer()
+        for _ in range(iterations):
+            func()
+        duration = timer() - start
+        if duration >= settings.min_round_time or iterations >= 1 << 20:
+            break
+        iterations *= 2 if duration <= 0 else max(2, min(10, math.ceil(settings.min_round_time / duration)))
+
+    rounds = int(settings.max_time / duration) if duration > 0 else settings.max_rounds
+    rounds = max(settings.min_rounds, min(settings.max_rounds, rounds))
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        round_times = []
+        for _ in range(rounds):
+            start = timer()
+            for _ in range(iterations):
+                func()
+            round_times.append((timer() - start) / iterations)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return compute_stats(round_times, iterations)
+
+# Fixtures
+
+class BenchmarkContext:
+    """Synthetic model, voices and the components under test, built once per run"""
+
+    def __init__(self, workdir: str, spec: SyntheticModelSpec = SyntheticModelSpec()):
+        self.workdir = Path(workdir)
+        self.spec = spec
+        self.model_path, self.voices_dir = create_synthetic_assets(str(self.workdir / "model"), spec)
+        self.model = SyntheticKokoro(str(self.model_path), str(self.voices_dir))
+
+        from LiteTTS.tts.backend import OnnxBackend
+        self.backend = OnnxBackend(self.model, sample_rate=self.model.sample_rate)
+
+        audio, self.sample_rate = self.backend.create(TEXTS["long"], voice=VOICE)
+        # Ten seconds of model output for the audio layers
+        repeats = math.ceil(10 * self.sample_rate / len(audio))
+        self.audio = np.tile(audio, repeats)[:10 * self.sample_rate].astype(np.float32)
+
+    def new_cache(self, name: str, **kwargs):
+        from LiteTTS.cache.shared import SharedAudioCache
+        return SharedAudioCache(max_bytes=32 * 1024 * 1024, path=str(self.workdir / f"{name}.cache"), **kwargs)
+
+# Layers
+
+def nlp_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    from LiteTTS.nlp.unified_text_processor import ProcessingMode, ProcessingOptions, UnifiedTextProcessor
+    from LiteTTS.text.phonemizer_preprocessor import phonemizer_preprocessor
+
+    processor = UnifiedTextProcessor()
+    # Options of the /v1/audio/speech endpoint
+    options = ProcessingOptions(
+        mode=ProcessingMode.ENHANCED, use_advanced_currency=True, use_ticker_symbol_processing=False,
+        use_advanced_symbols=False, use_enhanced_datetime=True, normalize_text=False,
+        resolve_homographs=False, process_phonetics=False, use_espeak_enhanced_symbols=False,
+        use_interjection_fixes=False
+    )
+    cases = []
+    for size in ("short", "long"):
+        text = TEXTS[size]
+        cases.append(BenchmarkCase(
+            f"nlp.preprocess[{size}]", "nlp",
+            lambda text=text: phonemizer_preprocessor.preprocess_text(text, aggressive=False, preserve_word_count=True),
+            {"chars": len(text)}))
+        cases.append(BenchmarkCase(
+            f"nlp.unified[{size}]", "nlp",
+            lambda text=text: processor.process_text(text, options),
+            {"chars": len(text)}))
+    return cases
+
+def tokenize_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    from LiteTTS.tts.tokenizer import CodepointTokenizer
+
+    tokenizer = CodepointTokenizer({c: i for i, c in enumerate(CHARACTER_SET)})
+    return [
+        BenchmarkCase(f"tokenize.codepoint[{size}]", "tokenize",
+                      lambda text=text: tokenizer.encode_to_input_ids(text), {"chars": len(text)})
+        for size, text in TEXTS.items()
+    ]
+
+def inference_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    cases = []
+    for size in ("short", "long"):
+        text = TEXTS[size]
+        inputs = context.model.prepare_inputs(text, VOICE)
+        cases.append(BenchmarkCase(
+            f"inference.session[{size}]", "inference",
+            lambda inputs=inputs: context.model.sess.run(None, inputs),
+            {"tokens": int(inputs["input_ids"].shape[1])}))
+        cases.append(BenchmarkCase(
+            f"inference.backend[{size}]", "inference",
+            lambda text=text: context.backend.create(text, voice=VOICE),
+            {"chars": len(text)}))
+    return cases
+
+def postprocess_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    from LiteTTS.audio.postprocess import PostProcessSpec, process_audio, resolve_backend
+
+    # The engine's fast path and the streaming chain
+    specs = {
+        "engine": PostProcessSpec(peak_ceiling=0.95),
+        "streaming": PostProcessSpec(gain=1.5, gain_peak_limit=1.0, compress_threshold=0.7,
+                                     compress_ratio=4.0, peak_ceiling=0.95, fade_in=240, fade_out=240),
+    }
+    backend = resolve_backend(None)
+    return [
+        BenchmarkCase(f"postprocess.{name}", "postprocess",
+                      lambda spec=spec: process_audio(context.audio, spec, backend),
+                      {"samples": len(context.audio), "backend": backend})
+        for name, spec in specs.items()
+    ]
+
+def encode_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    from LiteTTS.audio.format_converter import encode_audio
+
+    cases = []
+    for response_format in ("wav", "flac", "ogg", "mp3"):
+        try:
+            encode_audio(context.audio[:context.sample_rate], context.sample_rate, response_format)
+        except Exception as e:
+            print(f"Skipping encode.{response_format}: {e}", file=sys.stderr)
+            continue
+        cases.append(BenchmarkCase(
+            f"encode.{response_format}", "encode",
+            lambda response_format=response_format: encode_audio(context.audio, context.sample_rate, response_format),
+            {"samples": len(context.audio)}))
+    return cases
+
+def cache_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    audio = context.audio[:3 * context.sample_rate]
+    encoded_tier = context.new_cache("encoded")
+    transcoding = context.new_cache("transcoding", encoded_cache_bytes=0)
+    for cache in (encoded_tier, transcoding):
+        cache.put_pcm(TEXTS["medium"], VOICE, audio, context.sample_rate)
+    encoded_tier.get_audio(TEXTS["medium"], VOICE, 1.0, "wav")
+
+    counter = iter(range(1 << 62))
+    return [
+        BenchmarkCase("cache.hit_encoded", "cache",
+                      lambda: encoded_tier.get_audio(TEXTS["medium"], VOICE, 1.0, "wav"),
+                      {"audio_seconds": 3}),
+        BenchmarkCase("cache.hit_transcode_wav", "cache",
+                      lambda: transcoding.get_audio(TEXTS["medium"], VOICE, 1.0, "wav"),
+                      {"audio_seconds": 3}),
+        BenchmarkCase("cache.miss", "cache",
+                      lambda: transcoding.get_audio(TEXTS["short"], VOICE, 1.0, "wav")),
+        BenchmarkCase("cache.put_pcm", "cache",
+                      lambda: transcoding.put_pcm(f"text {next(counter)}", VOICE, audio, context.sample_rate),
+                      {"audio_seconds": 3}),
+    ]
+
+def build_http_app(context: BenchmarkContext, cache):
+    """FastAPI app running /v1/audio/speech's stages on the synthetic backend"""
+    from fastapi import FastAPI, Response
+
+    from LiteTTS.audio.format_converter import encode_audio
+    from LiteTTS.audio.postprocess import PostProcessSpec, process_audio_inplace
+    from LiteTTS.models import TTSRequest
+
+    app = FastAPI()
+    spec = PostProcessSpec(peak_ceiling=0.95)
+
+    @app.post("/v1/audio/speech")
+    def speech(request: TTSRequest):
+        cached = cache.get_audio(request.input, request.voice, request.speed, request.response_format)
+        if cached is not None:
+            return Response(content=cached, media_type=f"audio/{request.response_format}")
+
+        audio, sample_rate = context.backend.create(request.input, voice=request.voice, speed=request.speed)
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        process_audio_inplace(audio, spec)
+        audio_data = encode_audio(audio, sample_rate, request.response_format)
+        cache.put_pcm(request.input, request.voice, audio, sample_rate, request.speed,
+                      encoded={request.response_format: audio_data})
+        return Response(content=audio_data, media_type=f"audio/{request.response_format}")
+
+    return app
+
+def http_cases(context: BenchmarkContext) -> List[BenchmarkCase]:
+    from fastapi.testclient import TestClient
+
+    cache = context.new_cache("http")
+    client = TestClient(build_http_app(context, cache))
+    counter = iter(range(1 << 62))
+
+    def post(text: str, response_format: str = "wav"):
+        response = client.post("/v1/audio/speech", json={
+            "input": text, "voice": VOICE, "response_format": response_format, "speed": 1.0})
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+        return response.content
+
+    post(TEXTS["medium"])
+    return [
+        BenchmarkCase("http.speech_cached", "http", lambda: post(TEXTS["medium"])),
+        BenchmarkCase("http.speech_uncached", "http",
+                      lambda: post(f"{TEXTS['medium']} {next(counter)}"), {"chars": len(TEXTS["medium"])}),
+    ]
+
+LAYER_CASES: Dict[str, Callable[[BenchmarkContext], List[BenchmarkCase]]] = {
+    "nlp": nlp_cases,
+    "tokenize": tokenize_cases,
+    "inference": inference_cases,
+    "postprocess": postprocess_cases,
+    "encode": encode_cases,
+    "cache": cache_cases,
+    "http": http_cases,
+}
+
+# Running and reporting
+
+def machine_info() -> Dict[str, Any]:
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+    try:
+        import onnxruntime
+        info["onnxruntime"] = onnxruntime.__version__
+    except ImportError:
+        pass
+    return info
+
+def commit_info() -> Dict[str, Any]:
+    root = Path(__file__).resolve().parent.parent.parent
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                                    capture_output=True, text=True, timeout=30).stdout.strip())
+    except (OSError, subprocess.SubprocessError):
+        return {"id": None, "dirty": None}
+    return {"id": commit or None, "dirty": dirty}
+
+def run_benchmarks(layers: List[str], settings: TimingSettings = TimingSettings(),
+                   spec: SyntheticModelSpec = SyntheticModelSpec(), workdir: Optional[str] = None,
+                   select: Optional[str] = None, progress: bool = False) -> Dict[str, Any]:
+    """Run the selected layers and return the JSON-serializable report"""
+    unknown = sorted(set(layers) - set(LAYER_CASES))
+    if unknown:
+        raise ValueError(f"Unknown layers: {', '.join(unknown)} (available: {', '.join(LAYER_CASES)})")
+
+    with tempfile.TemporaryDirectory(prefix="litetts-bench-") as temporary:
+        context = BenchmarkContext(workdir or temporary, spec)
+        benchmarks = []
+        for layer in layers:
+            for case in LAYER_CASES[layer](context):
+                if select and select not in case.name:
+                    continue
+                if progress:
+                    print(f"  {case.name} ...", file=sys.stderr, flush=True)
+                benchmarks.append({
+                    "name": case.name,
+                    "layer": case.layer,
+                    "params": case.params,
+                    "stats": measure(case.func, settings),
+                })
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "commit": commit_info(),
+        "machine": machine_info(),
+        "model": {"hidden": spec.hidden, "depth": spec.depth,
+                  "samples_per_token": spec.samples_per_token, "seed": spec.seed},
+        "layers": list(layers),
+        "settings": {"min_rounds": settings.min_rounds, "max_rounds": settings.max_rounds,
+                     "max_time": settings.max_time, "min_round_time": settings.min_round_time},
+        "benchmarks": benchmarks,
+    }
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = 0.2, metric: str = "median") -> Dict[str, Any]:
+    """Per-benchmark ratio current/baseline of metric; above 1 + threshold is a regression"""
+    baseline_by_name = {b["name"]: b for b in baseline.get("benchmarks", [])}
+    rows, regressions = [], []
+    for benchmark in current.get("benchmarks", []):
+        reference = baseline_by_name.get(benchmark["name"])
+        if reference is None:
+            rows.append({"name": benchmark["name"], "status": "new", "current": benchmark["stats"][metric]})
+            continue
+        before, after = reference["stats"][metric], benchmark["stats"][metric]
+        ratio = after / before if before > 0 else math.inf
+        status = "regressed" if ratio > 1 + threshold else "improved" if ratio < 1 / (1 + threshold) else "ok"
+        row = {"name": benchmark["name"], "status": status, "baseline": before, "current": after, "ratio": ratio}
+        rows.append(row)
+        if status == "regressed":
+            regressions.append(row)
+
+    # Benchmarks of layers this run skipped are not missing
+    current_names = {b["name"] for b in current.get("benchmarks", [])}
+    layers = set(current.get("layers", LAYERS))
+    missing = sorted(name for name, b in baseline_by_name.items()
+                     if name not in current_names and b["layer"] in layers)
+    mismatched = [key for key in ("model", "machine")
+                  if key in baseline and baseline.get(key) != current.get(key)]
+    return {"metric": metric, "threshold": threshold, "rows": rows, "regressions": regressions,
+            "missing": missing, "mismatched": mismatched}
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<32} {'min':>10} {'median':>10} {'mean':>10} {'stddev':>10} {'ops/s':>10} {'rounds':>7}"]
+    for benchmark in results["benchmarks"]:
+        s = benchmark["stats"]
+        lines.append(f"{benchmark['name']:<32} {_format_time(s['min']):>10} {_format_time(s['median']):>10} "
+                     f"{_format_time(s['mean']):>10} {_format_time(s['stddev']):>10} "
+                     f"{s['ops']:>10.1f} {s['rounds']:>7}")
+    return "\n".join(lines)
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<32} {'baseline':>10} {'current':>10} {'ratio':>7}  status"]
+    for row in comparison["rows"]:
+        if row["status"] == "new":
+            lines.append(f"{row['name']:<32} {'-':>10} {_format_time(row['current']):>10} {'-':>7}  new")
+            continue
+        lines.append(f"{row['name']:<32} {_format_time(row['baseline']):>10} {_format_time(row['current']):>10} "
+                     f"{row['ratio']:>6.2f}x  {row['status']}")
+    for name in comparison["missing"]:
+        lines.append(f"{name:<32} {'':>10} {'-':>10} {'-':>7}  missing")
+    if comparison["mismatched"]:
+        lines.append(f"Note: baseline differs in {', '.join(comparison['mismatched'])}; ratios may not be comparable")
+    lines.append(f"{len(comparison['regressions'])} regression(s) beyond {comparison['threshold']:.0%} "
+                 f"on {comparison['metric']}")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline per-layer benchmarks on a synthetic model")
+    parser.add_argument("--layers", nargs="+", default=LAYERS, choices=LAYERS)
+    parser.add_argument("-k", "--select", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--quick", action="store_true", help="Few short rounds (smoke test)")
+    parser.add_argument("--max-time", type=float, help="Seconds of timed rounds per benchmark")
+    parser.add_argument("--hidden", type=int, default=SyntheticModelSpec.hidden, help="Synthetic model width")
+    parser.add_argument("--depth", type=int, default=SyntheticModelSpec.depth, help="Synthetic model layers")
+    parser.add_argument("--workdir", help="Keep the generated model and caches here instead of a temp dir")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the JSON results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before a regression (0.2 = 20%%)")
+    parser.add_argument("--metric", default="median", choices=["min", "median", "mean"])
+    args = parser.parse_args(argv)
+
+    settings = QUICK_SETTINGS if args.quick else TimingSettings()
+    if args.max_time is not None:
+        settings = TimingSettings(min_rounds=settings.min_rounds, max_rounds=settings.max_rounds,
+                                  max_time=args.max_time, min_round_time=settings.min_round_time)
+    spec = SyntheticModelSpec(hidden=args.hidden, depth=args.depth)
+
+    results = run_benchmarks(args.layers, settings, spec, args.workdir, args.select, progress=not args.json)
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {path}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        comparison = compare_results(results, baseline, args.threshold, args.metric)
+        print(format_comparison(comparison), file=sys.stderr if args.json else sys.stdout)
+        return 1 if comparison["regressions"] else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
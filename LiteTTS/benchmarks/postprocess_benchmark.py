@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fused post-processing kernel against the multi-pass chain
+
+The reference chain reproduces what a streamed request with a volume change
+went through before the fused kernel: NaN/Inf scans and repairs in the
+engine, AudioSegment.adjust_volume, AudioProcessor._apply_compression and
+the streaming peak normalization, plus 10 ms fades. Each fused backend runs
+the same stages and is checked against the reference output.
+
+Usage:
+    python LiteTTS/benchmarks/postprocess_benchmark.py [--durations 5 30 120] [--repeats 20] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from LiteTTS.audio.postprocess import BACKENDS, PostProcessSpec, process_audio_inplace, resolve_backend
+
+SAMPLE_RATE = 24000
+VOLUME = 1.5
+FADE_SAMPLES = SAMPLE_RATE // 100
+COMPRESS_THRESHOLD = 0.7
+COMPRESS_RATIO = 4.0
+PEAK_CEILING = 0.95
+
+def reference_chain(audio: np.ndarray) -> np.ndarray:
+    """The separate-pass chain: every stage scans and most copy the audio"""
+    if np.any(np.isnan(audio)):
+        audio = np.nan_to_num(audio, nan=0.0)
+    if np.any(np.isinf(audio)):
+        audio = np.clip(audio, -1.0, 1.0)
+
+    # AudioSegment.adjust_volume
+    audio = audio * VOLUME
+    max_val = np.max(np.abs(audio))
+    if max_val > 1.0:
+        audio = audio / max_val
+
+    # AudioProcessor._apply_compression
+    compressed = audio.copy()
+    above = np.abs(compressed) > COMPRESS_THRESHOLD
+    compressed[above] = np.sign(compressed[above]) * (
+        COMPRESS_THRESHOLD + (np.abs(compressed[above]) - COMPRESS_THRESHOLD) / COMPRESS_RATIO
+    )
+
+    # AudioProcessor.optimize_for_streaming normalization
+    max_val = np.max(np.abs(compressed))
+    if max_val > PEAK_CEILING:
+        compressed = compressed * (PEAK_CEILING / max_val)
+
+    # AudioSegment.fade_in / fade_out
+    faded = compressed.copy()
+    faded[:FADE_SAMPLES] *= np.linspace(0, 1, FADE_SAMPLES)
+    faded = faded.copy()
+    faded[-FADE_SAMPLES:] *= np.linspace(1, 0, FADE_SAMPLES)
+    return faded.astype(np.float32)
+
+FUSED_SPEC = PostProcessSpec(
+    gain=VOLUME, gain_peak_limit=1.0,
+    compress_threshold=COMPRESS_THRESHOLD, compress_ratio=COMPRESS_RATIO,
+    peak_ceiling=PEAK_CEILING, fade_in=FADE_SAMPLES, fade_out=FADE_SAMPLES
+)
+
+def synthetic_speech(seconds: float, seed: int = 0) -> np.ndarray:
+    """Noise shaped by a syllable-rate envelope, peaking around 1.2 like raw model output"""
+    rng = np.random.default_rng(seed)
+    n_samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(n_samples) / SAMPLE_RATE
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4.0 * t)
+    return (rng.standard_normal(n_samples) * 0.3 * envelope).astype(np.float32)
+
+def time_call(func: Callable[[], Any], repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def run_benchmark(durations: List[float], repeats: int, backends: List[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"sample_rate": SAMPLE_RATE, "repeats": repeats, "cases": []}
+
+    for seconds in durations:
+        source = synthetic_speech(seconds)
+        expected = reference_chain(source.copy())
+        case = {"audio_seconds": seconds, "samples": len(source), "results": {}}
+
+        timings = time_call(lambda: reference_chain(source.copy()), repeats)
+        case["results"]["reference_chain"] = {"median_ms": statistics.median(timings), "min_ms": min(timings)}
+
+        for backend in backends:
+            # Warm up (numba compiles on first use) and verify
+            output = source.copy()
+            process_audio_inplace(output, FUSED_SPEC, backend)
+            max_error = float(np.max(np.abs(output - expected)))
+
+            buffers = [source.copy() for _ in range(repeats)]
+            iterator = iter(buffers)
+            timings = time_call(lambda: process_audio_inplace(next(iterator), FUSED_SPEC, backend), repeats)
+            case["results"][f"fused_{backend}"] = {
+                "median_ms": statistics.median(timings),
+                "min_ms": min(timings),
+                "max_abs_error": max_error,
+            }
+
+        baseline = case["results"]["reference_chain"]["median_ms"]
+        for name, result in case["results"].items():
+            result["speedup"] = baseline / result["median_ms"] if result["median_ms"] > 0 else float("inf")
+        results["cases"].append(case)
+
+    return results
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'audio':>8}  {'variant':<18} {'median ms':>10} {'speedup':>8} {'max err':>9}"]
+    for case in results["cases"]:
+        for name, result in case["results"].items():
+            error = result.get("max_abs_error")
+            lines.append(f"{case['audio_seconds']:>7.0f}s  {name:<18} {result['median_ms']:>10.2f} "
+                         f"{result['speedup']:>7.1f}x {'' if error is None else f'{error:.1e}':>9}")
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fused post-processing kernel benchmark")
+    parser.add_argument("--durations", type=float, nargs="+", default=[5, 30, 120], help="Audio lengths in seconds")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=["numpy", "numexpr", "numba"],
+                        choices=[b for b in BACKENDS if b != "auto"])
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    # Skip optional backends that are not installed instead of silently timing numpy twice
+    backends = [b for b in args.backends if b == "numpy" or resolve_backend(b) == b]
+    results = run_benchmark(args.durations, args.repeats, backends)
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tiny synthetic stand-in for the Kokoro ONNX model and voice packs
+
+The generated model has Kokoro's graph interface (``input_ids`` int64
+[1, tokens], ``style`` float32 [1, 256], ``speed`` float32 [1] -> float32
+waveform) and a fixed, configurable amount of compute: an embedding, a
+stack of tanh layers conditioned on the style vector, a projection to
+``samples_per_token`` samples per token and a linear resample by 1/speed.
+Weights come from a seeded generator, so two runs on the same versions of
+onnx/onnxruntime produce the same model and the same audio.
+
+Voice packs are written in the ``<voice>.bin`` layout used by the voice
+loaders (510 style vectors of 256 float32 each).
+
+Usage:
+    python LiteTTS/benchmarks/synthetic_model.py OUTPUT_DIR [--hidden 128] [--depth 4]
+"""
+
+import argparse
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from LiteTTS.tts.tokenizer import CodepointTokenizer
+
+STYLE_DIM = 256
+STYLE_VECTORS = 510
+MAX_TOKENS = 510
+SAMPLE_RATE = 24000
+DEFAULT_VOICES = ("af_heart", "am_puck")
+
+# Character vocabulary of the engine's fallback tokenizer (TokenizerConfig.character_set)
+CHARACTER_SET = " abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.,!?;:-'"
+
+@dataclass(frozen=True)
+class SyntheticModelSpec:
+    """Shape and cost of the synthetic model"""
+    hidden: int = 128
+    depth: int = 4
+    samples_per_token: int = 1200  # About 20 tokens per second of audio at 24 kHz
+    vocab_size: int = len(CHARACTER_SET) + 1
+    seed: int = 0
+    opset: int = 17
+
+def build_synthetic_model(path: str, spec: SyntheticModelSpec = SyntheticModelSpec()) -> Path:
+    """Write the synthetic ONNX model to path and return the path"""
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(spec.seed)
+
+    def weight(name: str, shape: Tuple[int, ...], scale: float) -> onnx.TensorProto:
+        return numpy_helper.from_array((rng.standard_normal(shape) * scale).astype(np.float32), name)
+
+    hidden = spec.hidden
+    initializers = [
+        weight("embedding", (spec.vocab_size, hidden), 1.0),
+        weight("style_projection", (STYLE_DIM, hidden), 1.0 / np.sqrt(STYLE_DIM)),
+        weight("output_projection", (hidden, spec.samples_per_token), 1.0 / np.sqrt(hidden)),
+        numpy_helper.from_array(np.array([1], dtype=np.int64), "axis_1"),
+        numpy_helper.from_array(np.array([1, 1, 1, -1], dtype=np.int64), "waveform_4d"),
+        numpy_helper.from_array(np.array([-1], dtype=np.int64), "flat"),
+        numpy_helper.from_array(np.array([1.0, 1.0, 1.0], dtype=np.float32), "unit_scales"),
+        numpy_helper.from_array(np.array([1.0], dtype=np.float32), "one"),
+        numpy_helper.from_array(np.array([0.5], dtype=np.float32), "amplitude"),
+    ]
+    nodes = [
+        helper.make_node("Gather", ["embedding", "input_ids"], ["embedded"]),
+        helper.make_node("MatMul", ["style", "style_projection"], ["style_hidden"]),
+        helper.make_node("Unsqueeze", ["style_hidden", "axis_1"], ["style_bias"]),
+        helper.make_node("Add", ["embedded", "style_bias"], ["hidden_0"]),
+    ]
+    for layer in range(spec.depth):
+        initializers.append(weight(f"layer_{layer}", (hidden, hidden), 1.0 / np.sqrt(hidden)))
+        nodes += [
+            helper.make_node("MatMul", [f"hidden_{layer}", f"layer_{layer}"], [f"projected_{layer}"]),
+            helper.make_node("Add", [f"projected_{layer}", "style_bias"], [f"biased_{layer}"]),
+            helper.make_node("Tanh", [f"biased_{layer}"], [f"hidden_{layer + 1}"]),
+        ]
+    nodes += [
+        helper.make_node("MatMul", [f"hidden_{spec.depth}", "output_projection"], ["frames"]),
+        helper.make_node("Tanh", ["frames"], ["bounded"]),
+        helper.make_node("Mul", ["bounded", "amplitude"], ["scaled"]),
+        helper.make_node("Reshape", ["scaled", "waveform_4d"], ["waveform_full"]),
+        # Faster speech is shorter: resample the time axis by 1/speed
+        helper.make_node("Div", ["one", "speed"], ["time_scale"]),
+        helper.make_node("Concat", ["unit_scales", "time_scale"], ["scales"], axis=0),
+        helper.make_node("Resize", ["waveform_full", "", "scales"], ["waveform_resized"], mode="linear"),
+        helper.make_node("Reshape", ["waveform_resized", "flat"], ["waveform"]),
+    ]
+
+    graph = helper.make_graph(
+        nodes, "synthetic_kokoro",
+        inputs=[
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, [1, "tokens"]),
+            helper.make_tensor_value_info("style", TensorProto.FLOAT, [1, STYLE_DIM]),
+            helper.make_tensor_value_info("speed", TensorProto.FLOAT, [1]),
+        ],
+        outputs=[helper.make_tensor_value_info("waveform", TensorProto.FLOAT, ["samples"])],
+        initializer=initializers,
+    )
+    model = helper.make_model(graph, producer_name="LiteTTS synthetic benchmark model",
+                              opset_imports=[helper.make_opsetid("", spec.opset)])
+    model.ir_version = min(model.ir_version, 8)
+    for key, value in asdict(spec).items():
+        model.metadata_props.add(key=key, value=str(value))
+    onnx.checker.check_model(model)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return path
+
+def write_synthetic_voices(voices_dir: str, names: Iterable[str] = DEFAULT_VOICES, seed: int = 0) -> List[Path]:
+    """Write one voice pack per name in the individual ``.bin`` layout"""
+    voices_dir = Path(voices_dir)
+    voices_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index, name in enumerate(names):
+        rng = np.random.default_rng(seed + index)
+        pack = (rng.standard_normal((STYLE_VECTORS, STYLE_DIM)) * 0.1).astype(np.float32)
+        path = voices_dir / f"{name}.bin"
+        pack.tofile(path)
+        paths.append(path)
+    return paths
+
+class SyntheticKokoro:
+    """
+    ``kokoro_onnx.Kokoro`` stand-in running the synthetic model
+
+    Implements the parts of the Kokoro interface LiteTTS calls (``create``,
+    ``get_voices``, ``sess``) with Kokoro's token handling: token ids
+    padded with 0 on both ends and the style vector picked by token count.
+    Text is tokenized per character since there is no phonemizer.
+    """
+
+    def __init__(self, model_path: str, voices_dir: str, sample_rate: int = SAMPLE_RATE,
+                 session_options=None):
+        import onnxruntime as ort
+
+        if session_options is None:
+            session_options = ort.SessionOptions()
+            session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.sess = ort.InferenceSession(str(model_path), sess_options=session_options,
+                                         providers=["CPUExecutionProvider"])
+        self.sample_rate = sample_rate
+        self.voices: Dict[str, np.ndarray] = {
+            path.stem: np.fromfile(path, dtype=np.float32).reshape(-1, STYLE_DIM)
+            for path in sorted(Path(voices_dir).glob("*.bin"))
+        }
+        self.tokenizer_table = CodepointTokenizer({c: i + 1 for i, c in enumerate(CHARACTER_SET)})
+
+    def get_voices(self) -> List[str]:
+        return sorted(self.voices)
+
+    def prepare_inputs(self, text: str, voice: str, speed: float = 1.0) -> Dict[str, np.ndarray]:
+        """Model inputs for one chunk of at most MAX_TOKENS tokens"""
+        tokens = self.tokenizer_table.encode(text)[:MAX_TOKENS - 2]
+        pack = self.voices[voice]
+        style = pack[min(len(tokens), len(pack) - 1)].reshape(1, STYLE_DIM)
+        input_ids = np.zeros((1, len(tokens) + 2), dtype=np.int64)
+        input_ids[0, 1:-1] = tokens
+        return {"input_ids": input_ids, "style": style, "speed": np.array([speed], dtype=np.float32)}
+
+    def create(self, text: str, voice: str, speed: float = 1.0, lang: str = "en-us",
+               is_phonemes: bool = False) -> Tuple[np.ndarray, int]:
+        if voice not in self.voices:
+            raise ValueError(f"Voice {voice} not found in synthetic voices")
+
+        chunks = [text[start:start + MAX_TOKENS - 2] for start in range(0, max(len(text), 1), MAX_TOKENS - 2)]
+        audio = [self.sess.run(None, self.prepare_inputs(chunk, voice, speed))[0] for chunk in chunks]
+        return np.concatenate(audio), self.sample_rate
+
+def create_synthetic_assets(directory: str, spec: SyntheticModelSpec = SyntheticModelSpec(),
+                            voices: Iterable[str] = DEFAULT_VOICES) -> Tuple[Path, Path]:
+    """Model and voices directory under directory, generated when missing"""
+    directory = Path(directory)
+    model_path = directory / f"synthetic_h{spec.hidden}_d{spec.depth}_s{spec.seed}.onnx"
+    voices_dir = directory / "voices"
+    if not model_path.exists():
+        build_synthetic_model(str(model_path), spec)
+    if not all((voices_dir / f"{name}.bin").exists() for name in voices):
+        write_synthetic_voices(str(voices_dir), voices, spec.seed)
+    return model_path, voices_dir
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the synthetic benchmark model and voices")
+    parser.add_argument("output_dir")
+    parser.add_argument("--hidden", type=int, default=SyntheticModelSpec.hidden)
+    parser.add_argument("--depth", type=int, default=SyntheticModelSpec.depth)
+    parser.add_argument("--samples-per-token", type=int, default=SyntheticModelSpec.samples_per_token)
+    parser.add_argument("--seed", type=int, default=SyntheticModelSpec.seed)
+    parser.add_argument("--voices", nargs="+", default=list(DEFAULT_VOICES))
+    args = parser.parse_args(argv)
+
+    spec = SyntheticModelSpec(hidden=args.hidden, depth=args.depth,
+                              samples_per_token=args.samples_per_token, seed=args.seed)
+    model_path, voices_dir = create_synthetic_assets(args.output_dir, spec, args.voices)
+    print(f"Model:  {model_path}")
+    print(f"Voices: {voices_dir} ({', '.join(args.voices)})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
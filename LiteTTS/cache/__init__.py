@@ -2,6 +2,7 @@
 
 # Import legacy cache manager for backward compatibility (always available)
 from .legacy import cache_manager
+from .shared import SharedAudioCache
 
 # Conditional imports for enhanced components
 try:
@@ -13,7 +14,7 @@ except ImportError:
     _ENHANCED_AVAILABLE = False
 
 # Build exports list
-__all__ = ['cache_manager']
+__all__ = ['cache_manager', 'SharedAudioCache']
 
 if _ENHANCED_AVAILABLE:
     __all__.extend([
@@ -87,12 +87,17 @@ class AudioCache:
     def _generate_audio_cache_key(self, text: str, voice: str, speed: float,
                                  format: str, emotion: str = None,
                                  emotion_strength: float = 1.0) -> str:
-        """Generate standardized cache key for audio using CacheKeyGenerator"""
-        return CacheKeyGenerator.generate_audio_cache_key(
+        """
+        Generate standardized cache key for audio using CacheKeyGenerator
+
+        Entries are AudioSegments that the response formatter encodes per
+        request, so the format is not part of the key and a WAV request
+        reuses audio synthesized for an MP3 one.
+        """
+        return CacheKeyGenerator.generate_pcm_cache_key(
             text=text,
             voice=voice,
             speed=speed,
-            format=format,
             emotion=emotion,
             emotion_strength=emotion_strength
         )
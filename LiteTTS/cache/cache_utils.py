@@ -19,21 +19,24 @@ class CacheKeyGenerator:
         text: str,
         voice: str,
         speed: float = 1.0,
-        format: str = "mp3",
+        format: Optional[str] = "mp3",
         language: str = "en-us",
         emotion: Optional[str] = None,
-        emotion_strength: float = 1.0
+        emotion_strength: float = 1.0,
+        model_id: Optional[str] = None
     ) -> str:
         """
         Generate standardized cache key for audio generation
         
         This is the canonical cache key format used throughout the application.
         All other cache key generation should use this method to ensure consistency.
+        The key is a content hash, so it is stable across processes and restarts.
+        A format of None leaves the format out, for entries holding PCM that
+        serve every response format (see generate_pcm_cache_key).
         """
         # Normalize inputs to ensure consistent keys
         text = text.strip()
         voice = voice.lower().strip()
-        format = format.lower().strip()
         language = language.lower().strip()
         
         # Round speed to 2 decimal places to avoid floating point precision issues
@@ -45,14 +48,17 @@ class CacheKeyGenerator:
             "text": text,
             "voice": voice,
             "speed": speed,
-            "format": format,
             "language": language
         }
+        if format is not None:
+            key_components["format"] = format.lower().strip()
         
         # Add optional components if present
         if emotion:
             key_components["emotion"] = emotion.lower().strip()
             key_components["emotion_strength"] = emotion_strength
+        if model_id:
+            key_components["model_id"] = model_id.strip()
         
         # Create deterministic JSON string (sorted keys)
         key_string = json.dumps(key_components, sort_keys=True, separators=(',', ':'))
@@ -63,6 +69,21 @@ class CacheKeyGenerator:
         logger.debug(f"Generated cache key: {cache_key[:16]}... for text: '{text[:50]}...'")
         return cache_key
     
+    @staticmethod
+    def generate_pcm_cache_key(
+        text: str,
+        voice: str,
+        speed: float = 1.0,
+        language: str = "en-us",
+        emotion: Optional[str] = None,
+        emotion_strength: float = 1.0,
+        model_id: Optional[str] = None
+    ) -> str:
+        """Generate the format-independent cache key for synthesized PCM"""
+        return CacheKeyGenerator.generate_audio_cache_key(
+            text, voice, speed, None, language, emotion, emotion_strength, model_id
+        )
+    
     @staticmethod
     def generate_voice_cache_key(voice: str) -> str:
         """Generate cache key for voice data"""
@@ -12,6 +12,8 @@ from collections import OrderedDict
 import logging
 
 from ..exceptions import CacheError
+from .pcm import TranscodingAudioCache
+from .shared import SharedAudioCache, default_cache_path
 
 logger = logging.getLogger(__name__)
 
@@ -116,27 +118,29 @@ class LRUCache:
                 "total_requests": total_requests
             }
 
-class AudioCache(LRUCache):
-    """Specialized cache for audio data"""
-    
-    def __init__(self, max_size: int = 50, default_ttl: float = 3600):
-        super().__init__(max_size, default_ttl)
-    
-    def get_audio(self, text: str, voice: str, speed: float = 1.0, 
-                  response_format: str = "mp3") -> Optional[bytes]:
-        """Get cached audio data"""
-        key = self._generate_key(text, voice, speed, response_format)
-        return self.get(key)
-    
-    def put_audio(self, text: str, voice: str, audio_data: bytes, 
-                  speed: float = 1.0, response_format: str = "mp3", 
-                  ttl: Optional[float] = None) -> None:
-        """Cache audio data"""
-        key = self._generate_key(text, voice, speed, response_format)
-        self.put(key, audio_data, ttl)
-        
-        logger.debug(f"Cached audio: text_len={len(text)}, voice={voice}, "
-                    f"audio_size={len(audio_data)}, key={key[:8]}...")
+class AudioCache(TranscodingAudioCache, LRUCache):
+    """Per-process cache of synthesized PCM, served in any response format"""
+    
+    def __init__(self, max_size: int = 50, default_ttl: float = 3600,
+                 encoded_cache_bytes: int = 16 * 1024 * 1024, pcm_codec: str = "raw",
+                 model_id: Optional[str] = None):
+        LRUCache.__init__(self, max_size, default_ttl)
+        TranscodingAudioCache.__init__(self, encoded_cache_bytes, pcm_codec, model_id)
+    
+    def _get_record(self, digest: bytes) -> Optional[bytes]:
+        return self.get(digest)
+    
+    def _put_record(self, digest: bytes, record: bytes, ttl: Optional[float]) -> bool:
+        self.put(digest, record, ttl)
+        logger.debug(f"Cached PCM audio: record_size={len(record)}, key={digest.hex()[:8]}...")
+        return True
+    
+    def _clear_records(self) -> None:
+        LRUCache.clear(self)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {**LRUCache.stats(self), "pcm_codec": self.pcm_codec, "encoded": self.encoded_stats()}
 
 class VoiceCache(LRUCache):
     """Specialized cache for voice embeddings"""
@@ -157,8 +161,25 @@ class CacheManager:
     """Central cache management"""
     
     def __init__(self, audio_cache_size: int = 50, voice_cache_size: int = 10,
-                 audio_ttl: float = 3600):
-        self.audio_cache = AudioCache(audio_cache_size, audio_ttl)
+                 audio_ttl: float = 3600, audio_cache_mb: Optional[int] = None,
+                 shared_audio_cache: bool = True, shared_cache_path: Optional[str] = None,
+                 namespace: str = "", encoded_cache_mb: int = 16, pcm_codec: str = "raw"):
+        # With a byte budget the audio cache is shared by all workers of the
+        # server; otherwise it is the per-process LRU bounded by entry count
+        if audio_cache_mb is not None:
+            self.audio_cache = SharedAudioCache(
+                max_bytes=audio_cache_mb * 1024 * 1024,
+                default_ttl=audio_ttl,
+                path=shared_cache_path,
+                shared=shared_audio_cache,
+                namespace=namespace,
+                encoded_cache_bytes=encoded_cache_mb * 1024 * 1024,
+                pcm_codec=pcm_codec
+            )
+        else:
+            self.audio_cache = AudioCache(audio_cache_size, audio_ttl,
+                                          encoded_cache_bytes=encoded_cache_mb * 1024 * 1024,
+                                          pcm_codec=pcm_codec, model_id=namespace or None)
         self.voice_cache = VoiceCache(voice_cache_size)
         self._enabled = True
     
@@ -190,5 +211,30 @@ class CacheManager:
             "voice_cache": self.voice_cache.stats()
         }
 
+def _create_cache_manager() -> CacheManager:
+    """Build the global cache manager from the cache configuration"""
+    try:
+        from ..config import config
+    except Exception as e:
+        logger.warning(f"Cache configuration unavailable ({e}), using defaults")
+        return CacheManager()
+
+    cache_config = config.cache
+    shared_cache_path = cache_config.shared_cache_path
+    if shared_cache_path is None:
+        # One arena per server port, so separate instances on one host stay apart
+        shared_cache_path = default_cache_path(f"litetts-audio-{config.server.port}.cache")
+
+    return CacheManager(
+        voice_cache_size=cache_config.voice_cache_size,
+        audio_ttl=cache_config.ttl,
+        audio_cache_mb=cache_config.audio_cache_mb,
+        shared_audio_cache=cache_config.shared_audio_cache,
+        shared_cache_path=shared_cache_path,
+        namespace=config.model.default_variant or "",
+        encoded_cache_mb=cache_config.encoded_cache_mb,
+        pcm_codec=cache_config.pcm_codec
+    )
+
 # Global cache manager instance
-cache_manager = CacheManager()
\ No newline at end of file
+cache_manager = _create_cache_manager()
\ No newline at end of file
@@ -4,14 +4,23 @@ Enhanced multi-level cache manager for TTS system
 """
 
 import hashlib
+import json
+import os
 import pickle
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from ..models import AudioSegment, VoiceEmbedding
 
 logger = logging.getLogger(__name__)
@@ -40,14 +49,25 @@ class CacheEntry:
         self.access_count += 1
 
 class EnhancedCacheManager:
-    """Multi-level cache manager with LRU eviction and persistence"""
+    """
+    Multi-level cache manager with LRU eviction and persistence
+
+    Memory entries are kept in recency order and evicted by byte budget. Disk
+    entries are content addressed (file name derived from the key), so a key
+    written by one worker process is found by every other worker sharing the
+    same cache_dir. The index in cache_index.json is shared too: each process
+    merges its changes into it under a file lock, so the disk budget and the
+    least-recently-accessed eviction order cover all workers. Pass
+    cache_dir=None for a memory-only cache.
+    """
     
-    def __init__(self, cache_dir: str = "LiteTTS/cache",
+    def __init__(self, cache_dir: Optional[str] = "LiteTTS/cache",
                  max_memory_size: int = None,  # Will use config default
                  max_disk_size: int = None,    # Will use config default
                  config=None):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Use config values or fallback to defaults
         if config and hasattr(config, 'cache'):
@@ -58,13 +78,16 @@ class EnhancedCacheManager:
             self.max_memory_size = max_memory_size or (100 * 1024 * 1024)  # 100MB
             self.max_disk_size = max_disk_size or (1024 * 1024 * 1024)     # 1GB
         
-        # Memory cache
-        self.memory_cache: Dict[str, CacheEntry] = {}
+        # Memory cache, least recently used first
+        self.memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.memory_size = 0
         
         # Disk cache tracking
         self.disk_cache_index: Dict[str, Dict[str, Any]] = {}
         self.disk_size = 0
+        # Changes not yet merged into the shared index file
+        self._index_updates: Dict[str, Dict[str, Any]] = {}
+        self._removed_keys: set = set()
         
         # Thread safety
         self.cache_lock = threading.RLock()
@@ -97,10 +120,16 @@ class EnhancedCacheManager:
                     return None
                 
                 entry.touch()
+                self.memory_cache.move_to_end(key)
+                self._touch_disk_entry(key)
                 self.stats['memory_hits'] += 1
                 logger.debug(f"Memory cache hit: {key}")
                 return entry.data
             
+            # Entries written by another worker are not in our index yet
+            if key not in self.disk_cache_index:
+                self._adopt_disk_entry(key)
+
             # Check disk cache
             if key in self.disk_cache_index:
                 disk_entry_info = self.disk_cache_index[key]
@@ -119,6 +148,7 @@ class EnhancedCacheManager:
                     self._add_to_memory(key, data, 
                                       ttl_seconds=disk_entry_info.get('ttl_seconds'),
                                       tags=disk_entry_info.get('tags', []))
+                    self._touch_disk_entry(key)
                     
                     self.stats['disk_hits'] += 1
                     logger.debug(f"Disk cache hit: {key}")
@@ -147,7 +177,7 @@ class EnhancedCacheManager:
             success = self._add_to_memory(key, data, ttl_seconds, tags, data_size)
             
             # Persist to disk if requested and successful
-            if success and persist_to_disk:
+            if success and persist_to_disk and self.cache_dir is not None:
                 self._save_to_disk(key, data, ttl_seconds, tags, data_size)
             
             return success
@@ -164,6 +194,15 @@ class EnhancedCacheManager:
             except Exception:
                 data_size = 1024  # Default size estimate
         
+        # Entries larger than the whole budget are never admitted
+        if data_size > self.max_memory_size:
+            logger.debug(f"Not caching {key} in memory: {data_size} bytes exceeds budget")
+            return False
+
+        # Remove existing entry first so its bytes are not double counted
+        if key in self.memory_cache:
+            self._remove_from_memory(key)
+
         # Check if we need to evict items
         while (self.memory_size + data_size > self.max_memory_size and 
                len(self.memory_cache) > 0):
@@ -181,10 +220,6 @@ class EnhancedCacheManager:
             tags=tags
         )
         
-        # Remove existing entry if present
-        if key in self.memory_cache:
-            self._remove_from_memory(key)
-        
         # Add new entry
         self.memory_cache[key] = entry
         self.memory_size += data_size
@@ -204,9 +239,8 @@ class EnhancedCacheManager:
         if not self.memory_cache:
             return
         
-        # Find LRU entry
-        lru_key = min(self.memory_cache.keys(), 
-                     key=lambda k: self.memory_cache[k].last_accessed)
+        # Least recently used entry is at the front
+        lru_key = next(iter(self.memory_cache))
         
         self._remove_from_memory(lru_key)
         self.stats['evictions'] += 1
@@ -216,37 +250,86 @@ class EnhancedCacheManager:
                      tags: List[str] = None, data_size: int = None):
         """Save item to disk cache"""
         try:
-            # Check disk space
-            while self.disk_size + data_size > self.max_disk_size and len(self.disk_cache_index) > 0:
-                self._evict_lru_disk()
-            
-            # Create file path
-            safe_key = hashlib.md5(key.encode()).hexdigest()
-            cache_file = self.cache_dir / f"{safe_key}.cache"
-            
-            # Save data
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            # Entries larger than the whole budget are never admitted
+            if data_size > self.max_disk_size:
+                logger.debug(f"Not caching {key} on disk: {data_size} bytes exceeds budget")
+                return
+
+            cache_file = self._disk_path(key)
+            
+            # Write to a temp file and rename so concurrent readers in other
+            # workers never see a partially written entry
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+
+            if key in self.disk_cache_index:
+                self.disk_size -= self.disk_cache_index[key]['size_bytes']
             
             # Update index
+            now = datetime.now().isoformat()
             self.disk_cache_index[key] = {
                 'file_path': str(cache_file),
-                'created_at': datetime.now().isoformat(),
+                'created_at': now,
+                'last_accessed': now,
                 'size_bytes': data_size or cache_file.stat().st_size,
                 'ttl_seconds': ttl_seconds,
                 'tags': tags or []
             }
+            self._index_updates[key] = self.disk_cache_index[key]
+            self._removed_keys.discard(key)
             
             self.disk_size += self.disk_cache_index[key]['size_bytes']
             self.stats['disk_writes'] += 1
             
-            # Save index
+            # Save index, evicting down to the budget across all workers
             self._save_disk_index()
             
             logger.debug(f"Saved to disk cache: {key}")
             
         except Exception as e:
             logger.error(f"Failed to save to disk cache {key}: {e}")
+
+    def _disk_path(self, key: str) -> Path:
+        """Content-addressed file path for a key, identical across processes"""
+        safe_key = hashlib.md5(key.encode()).hexdigest()
+        return self.cache_dir / f"{safe_key}.cache"
+
+    def _adopt_disk_entry(self, key: str) -> bool:
+        """Index a disk entry written by another process sharing cache_dir"""
+        if self.cache_dir is None:
+            return False
+
+        cache_file = self._disk_path(key)
+        try:
+            stat = cache_file.stat()
+        except OSError:
+            return False
+
+        modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        self.disk_cache_index[key] = {
+            'file_path': str(cache_file),
+            'created_at': modified,
+            'last_accessed': modified,
+            'size_bytes': stat.st_size,
+            'ttl_seconds': None,
+            'tags': []
+        }
+        self.disk_size += stat.st_size
+        return True
+
+    def _touch_disk_entry(self, key: str):
+        """Record an access for the disk tier's LRU order, merged with the next index write"""
+        entry_info = self.disk_cache_index.get(key)
+        if entry_info is not None:
+            entry_info['last_accessed'] = datetime.now().isoformat()
+            self._index_updates[key] = entry_info
+
+    @staticmethod
+    def _last_access(entry_info: Dict[str, Any]) -> str:
+        """When an indexed entry was last read or written (ISO timestamp)"""
+        return entry_info.get('last_accessed') or entry_info['created_at']
     
     def _load_from_disk(self, key: str) -> Optional[Any]:
         """Load item from disk cache"""
@@ -274,18 +357,21 @@ class EnhancedCacheManager:
             self._remove_from_disk(key)
             return None
     
-    def _remove_from_disk(self, key: str):
+    def _remove_from_disk(self, key: str, save_index: bool = True):
         """Remove item from disk cache"""
         try:
             if key in self.disk_cache_index:
                 entry_info = self.disk_cache_index.pop(key)
+                self._index_updates.pop(key, None)
+                self._removed_keys.add(key)
                 file_path = Path(entry_info['file_path'])
                 
                 if file_path.exists():
                     file_path.unlink()
                 
                 self.disk_size -= entry_info['size_bytes']
-                self._save_disk_index()
+                if save_index:
+                    self._save_disk_index()
                 
                 logger.debug(f"Removed from disk cache: {key}")
                 
@@ -297,36 +383,83 @@ class EnhancedCacheManager:
         if not self.disk_cache_index:
             return
         
-        # Find LRU entry (based on creation time since we don't track access for disk)
         lru_key = min(self.disk_cache_index.keys(),
-                     key=lambda k: self.disk_cache_index[k]['created_at'])
+                     key=lambda k: self._last_access(self.disk_cache_index[k]))
         
-        self._remove_from_disk(lru_key)
+        self._remove_from_disk(lru_key, save_index=False)
         self.stats['evictions'] += 1
         logger.debug(f"Evicted from disk cache: {lru_key}")
     
     def _load_disk_index(self):
         """Load disk cache index"""
+        if self.cache_dir is None:
+            return
+
+        self.disk_cache_index = self._read_index_file()
+        logger.debug(f"Loaded disk cache index: {len(self.disk_cache_index)} entries")
+
+    def _read_index_file(self) -> Dict[str, Dict[str, Any]]:
+        """The shared index as last written by any worker"""
         index_file = self.cache_dir / "cache_index.json"
-        
         try:
             if index_file.exists():
-                import json
                 with open(index_file, 'r') as f:
-                    self.disk_cache_index = json.load(f)
-                logger.debug(f"Loaded disk cache index: {len(self.disk_cache_index)} entries")
+                    return json.load(f)
         except Exception as e:
             logger.error(f"Failed to load disk cache index: {e}")
-            self.disk_cache_index = {}
+        return {}
+
+    @contextmanager
+    def _index_lock(self):
+        """Serialize index updates across the processes sharing cache_dir"""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.cache_dir / "cache_index.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # Releases the lock
     
     def _save_disk_index(self):
-        """Save disk cache index"""
+        """
+        Merge this process's index changes into the shared index and save it
+
+        Another worker may have written the index since this one last read it,
+        so the file is re-read under the lock and only the entries this process
+        wrote, read or removed are applied on top. Eviction then runs over the
+        merged index, which keeps the disk budget global rather than per worker.
+        """
+        if self.cache_dir is None:
+            return
+
         index_file = self.cache_dir / "cache_index.json"
         
         try:
-            import json
-            with open(index_file, 'w') as f:
-                json.dump(self.disk_cache_index, f, indent=2)
+            with self._index_lock():
+                merged = self._read_index_file()
+                for key in self._removed_keys:
+                    merged.pop(key, None)
+                for key, entry_info in self._index_updates.items():
+                    current = merged.get(key)
+                    if current is not None and current['created_at'] > entry_info['created_at']:
+                        # Rewritten by another worker since; keep its entry but not an older access time
+                        entry_info = dict(current, last_accessed=max(self._last_access(current),
+                                                                     self._last_access(entry_info)))
+                    merged[key] = entry_info
+                self.disk_cache_index = merged
+                self._index_updates.clear()
+                self._calculate_disk_size()
+
+                while self.disk_size > self.max_disk_size and self.disk_cache_index:
+                    self._evict_lru_disk()
+                self._removed_keys.clear()
+
+                tmp_file = index_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.disk_cache_index, f, indent=2)
+                os.replace(tmp_file, index_file)
         except Exception as e:
             logger.error(f"Failed to save disk cache index: {e}")
     
@@ -339,7 +472,9 @@ class EnhancedCacheManager:
     def _calculate_size(self, data: Any) -> int:
         """Calculate approximate size of data"""
         try:
-            if isinstance(data, AudioSegment):
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                return len(data)
+            elif isinstance(data, AudioSegment):
                 return data.audio_data.nbytes + 1024  # Add overhead
             elif isinstance(data, VoiceEmbedding):
                 if data.embedding_data is not None:
@@ -368,6 +503,15 @@ class EnhancedCacheManager:
             
             return deleted
     
+    def resize_memory(self, max_bytes: int) -> int:
+        """Change the memory tier's byte budget, returning the previous one"""
+        with self.cache_lock:
+            previous = self.max_memory_size
+            self.max_memory_size = int(max_bytes)
+            while self.memory_size > self.max_memory_size and self.memory_cache:
+                self._evict_lru_memory()
+            return previous
+
     def clear(self, tags: List[str] = None):
         """Clear cache (optionally by tags)"""
         with self.cache_lock:
@@ -378,7 +522,8 @@ class EnhancedCacheManager:
                 
                 # Clear disk cache
                 for key in list(self.disk_cache_index.keys()):
-                    self._remove_from_disk(key)
+                    self._remove_from_disk(key, save_index=False)
+                self._save_disk_index()
                 
                 logger.info("Cleared entire cache")
             else:
@@ -486,6 +631,8 @@ class EnhancedCacheManager:
             
             for key in invalid_keys:
                 del self.disk_cache_index[key]
+                self._index_updates.pop(key, None)
+                self._removed_keys.add(key)
             
             if invalid_keys:
                 self._save_disk_index()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Format-independent audio cache entries
+
+The audio cache stores what inference produced, 16-bit mono PCM, once per
+text, voice, speed and model. mp3/wav/ogg/flac responses are derived from
+it on a hit through the API's encoder, so a WAV client and an MP3 client
+asking for the same sentence share one inference. A small per-process tier
+keeps recently served encodings so hot (entry, format) pairs skip the
+encoder as well.
+
+PCM records are raw little-endian int16 or, to fit about twice as much
+speech in the same budget, FLAC (lossless, at the cost of roughly a
+millisecond per second of audio on each hit that misses the encoded tier).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+import io
+import logging
+import struct
+
+import numpy as np
+
+from .cache_utils import CacheKeyGenerator
+
+logger = logging.getLogger(__name__)
+
+PCM_CODECS = {"raw": 0, "flac": 1}
+_PCM_CODEC_NAMES = {value: name for name, value in PCM_CODECS.items()}
+
+# Record header: magic, sample rate, codec, sample count
+_PCM_MAGIC = b"LTPC"
+_PCM_HEADER = struct.Struct("<4sIII")
+
+def quantize_pcm16(audio: np.ndarray) -> np.ndarray:
+    """
+    16-bit samples for float audio, converted exactly as the encoder converts them
+
+    Uses libsndfile's own float-to-short conversion, so a WAV encoded from
+    the cached samples is byte-identical to one encoded from the float audio.
+    """
+    if audio.dtype == np.int16:
+        return audio
+    import soundfile as sf
+
+    buffer = io.BytesIO()
+    sf.write(buffer, np.asarray(audio, dtype=np.float32), 8000, format="RAW", subtype="PCM_16", endian="LITTLE")
+    return np.frombuffer(buffer.getvalue(), dtype="<i2")
+
+def pack_pcm(samples: np.ndarray, sample_rate: int, codec: str = "raw") -> bytes:
+    """Serialize int16 (or float, which is quantized first) samples into a cache record"""
+    if codec not in PCM_CODECS:
+        raise ValueError(f"Unknown PCM codec: {codec} (expected one of {', '.join(PCM_CODECS)})")
+    samples = quantize_pcm16(np.asarray(samples).reshape(-1))
+
+    if codec == "flac":
+        import soundfile as sf
+
+        buffer = io.BytesIO()
+        sf.write(buffer, samples, sample_rate, format="FLAC", subtype="PCM_16")
+        payload = buffer.getvalue()
+    else:
+        payload = samples.astype("<i2", copy=False).tobytes()
+    return _PCM_HEADER.pack(_PCM_MAGIC, int(sample_rate), PCM_CODECS[codec], len(samples)) + payload
+
+def unpack_pcm(record: bytes) -> Tuple[np.ndarray, int]:
+    """Samples (int16) and sample rate of a cache record"""
+    magic, sample_rate, codec, n_samples = _PCM_HEADER.unpack_from(record, 0)
+    if magic != _PCM_MAGIC or codec not in _PCM_CODEC_NAMES:
+        raise ValueError("Not a PCM cache record")
+
+    payload = memoryview(record)[_PCM_HEADER.size:]
+    if _PCM_CODEC_NAMES[codec] == "flac":
+        import soundfile as sf
+
+        samples, _ = sf.read(io.BytesIO(payload), dtype="int16")
+    else:
+        samples = np.frombuffer(payload, dtype="<i2")
+    if len(samples) != n_samples:
+        raise ValueError(f"PCM cache record has {len(samples)} samples, expected {n_samples}")
+    return samples, sample_rate
+
+def pcm_cache_digest(text: str, voice: str, speed: float, model_id: Optional[str] = None) -> bytes:
+    """16-byte store key of the PCM entry for a request, independent of the response format"""
+    key = CacheKeyGenerator.generate_pcm_cache_key(text=text, voice=voice, speed=speed, model_id=model_id or None)
+    return bytes.fromhex(key)[:16]
+
+class PcmRecordStore(ABC):
+    """Storage of PCM records by digest, the tier a TranscodingAudioCache sits on"""
+
+    @abstractmethod
+    def _get_record(self, digest: bytes) -> Optional[bytes]:
+        """The record stored under digest, or None"""
+
+    @abstractmethod
+    def _put_record(self, digest: bytes, record: bytes, ttl: Optional[float]) -> bool:
+        """Store a record, returning whether it was kept"""
+
+    @abstractmethod
+    def _clear_records(self) -> None:
+        """Remove every record"""
+
+class TranscodingAudioCache(PcmRecordStore):
+    """
+    get_audio/put_pcm front end over a PCM record store
+
+    Subclasses implement the PcmRecordStore methods for the PCM tier; this
+    class adds the per-process tier of encoded variants and the on-hit
+    transcoding.
+
+    Args:
+        encoded_cache_bytes: Budget of the encoded-variant tier, 0 disables it
+        pcm_codec: "raw" or "flac" for new PCM records
+        model_id: Mixed into every key so entries from a different model are never served
+    """
+
+    def __init__(self, encoded_cache_bytes: int = 16 * 1024 * 1024, pcm_codec: str = "raw",
+                 model_id: Optional[str] = None):
+        if pcm_codec not in PCM_CODECS:
+            raise ValueError(f"Unknown PCM codec: {pcm_codec} (expected one of {', '.join(PCM_CODECS)})")
+        from .shared import LocalAudioStore
+
+        self.pcm_codec = pcm_codec
+        self.model_id = model_id
+        self.encoded_cache_bytes = int(encoded_cache_bytes)
+        self._encoded = LocalAudioStore(self.encoded_cache_bytes) if self.encoded_cache_bytes > 0 else None
+        self._transcodes = 0
+
+    # Public interface
+
+    def _digest(self, text: str, voice: str, speed: float) -> bytes:
+        return pcm_cache_digest(text, voice, speed, self.model_id)
+
+    def get_pcm(self, text: str, voice: str, speed: float = 1.0) -> Optional[Tuple[np.ndarray, int]]:
+        """Cached int16 samples and sample rate, or None"""
+        record = self._get_record(self._digest(text, voice, speed))
+        if record is None:
+            return None
+        try:
+            return unpack_pcm(record)
+        except (ValueError, RuntimeError, struct.error) as e:
+            logger.warning(f"Discarding unreadable PCM cache entry: {e}")
+            return None
+
+    def put_pcm(self, text: str, voice: str, audio: np.ndarray, sample_rate: int,
+                speed: float = 1.0, ttl: Optional[float] = None,
+                encoded: Optional[Dict[str, bytes]] = None) -> bool:
+        """
+        Cache synthesized audio for every response format
+
+        Args:
+            audio: Float or int16 samples
+            encoded: Encodings already produced for this request, by format,
+                added to the encoded tier so the next identical request skips the encoder
+        """
+        digest = self._digest(text, voice, speed)
+        stored = self._put_record(digest, pack_pcm(audio, sample_rate, self.pcm_codec), ttl)
+        for response_format, audio_data in (encoded or {}).items():
+            self._put_encoded(digest, response_format, audio_data)
+        return stored
+
+    def get_audio(self, text: str, voice: str, speed: float = 1.0,
+                  response_format: str = "mp3") -> Optional[bytes]:
+        """Cached audio encoded as response_format, transcoding from PCM when needed"""
+        digest = self._digest(text, voice, speed)
+        if self._encoded is not None:
+            audio_data = self._encoded.get(self._encoded_key(digest, response_format))
+            if audio_data is not None:
+                return audio_data
+
+        pcm = self.get_pcm(text, voice, speed)
+        if pcm is None:
+            return None
+
+        from ..audio.format_converter import encode_audio
+
+        samples, sample_rate = pcm
+        audio_data = encode_audio(samples, sample_rate, response_format)
+        self._transcodes += 1
+        self._put_encoded(digest, response_format, audio_data)
+        return audio_data
+
+    def put_audio(self, text: str, voice: str, audio_data: bytes,
+                  speed: float = 1.0, response_format: str = "mp3",
+                  ttl: Optional[float] = None) -> None:
+        """Cache one already-encoded response (encoded tier only; prefer put_pcm)"""
+        self._put_encoded(self._digest(text, voice, speed), response_format, audio_data)
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        self._clear_records()
+        if self._encoded is not None:
+            self._encoded.clear()
+
+    # Encoded tier
+
+    @staticmethod
+    def _encoded_key(digest: bytes, response_format: str) -> bytes:
+        return digest[:12] + response_format.lower().encode("ascii", "replace")[:4].ljust(4, b"\0")
+
+    def _put_encoded(self, digest: bytes, response_format: str, audio_data: bytes):
+        if self._encoded is not None:
+            self._encoded.put(self._encoded_key(digest, response_format), bytes(audio_data))
+
+    def resize_encoded(self, max_bytes: int) -> int:
+        """Change the encoded tier's byte budget, returning the previous one"""
+        previous = self._encoded.capacity if self._encoded is not None else 0
+        if self._encoded is not None:
+            self._encoded.resize(max_bytes)
+        return previous
+
+    def encoded_stats(self) -> Dict[str, Any]:
+        """Statistics of the encoded-variant tier"""
+        if self._encoded is None:
+            return {"enabled": False, "transcodes": self._transcodes}
+        stats = self._encoded.stats()
+        return {
+            "enabled": True,
+            "entries": stats["entries"],
+            "bytes_used": stats["bytes_used"],
+            "max_bytes": stats["max_bytes"],
+            "hits": stats["worker"]["hits"],
+            "misses": stats["worker"]["misses"],
+            "transcodes": self._transcodes,
+        }
@@ -78,6 +78,7 @@ class IntelligentPreloader:
         
         # State tracking
         self.is_warming = False
+        self.paused = False  # Set under memory pressure to shed warming work
         self.last_request_time = datetime.now()
         self.warming_queue: List[WarmingTask] = []
         self.warmed_cache: Set[str] = set()
@@ -253,7 +254,7 @@ class IntelligentPreloader:
     
     def _should_warm(self) -> bool:
         """Determine if we should perform cache warming now"""
-        if self.is_warming:
+        if self.is_warming or self.paused:
             return False
         
         # Check if we're in idle period
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""
+Host-wide audio cache shared by all worker processes
+
+Every uvicorn worker maps the same file (in /dev/shm where available) and
+uses it as one byte-bounded cache, so scaling out workers no longer splits
+the hit rate or duplicates the cached audio.
+
+Layout of the mapped file:
+
+    header        magic, geometry, logical write head, per-worker counters
+    index         open-addressing hash table of (digest, offset, length, crc)
+    data ring     append-only log of records, overwritten oldest-first
+
+Writes append a record at the write head and point an index slot at it; they
+are serialized across processes with flock. Reads take no lock: they copy
+the record and then validate it (record digest and CRC, and that the write
+head has not lapped the record while it was copied), treating anything
+inconsistent as a miss. Eviction is FIFO by bytes, with hits on records in
+the oldest quarter of the ring copied forward (second chance) so hot entries
+survive.
+
+When the shared tier is unavailable (no fcntl, unwritable directory) the
+cache degrades to a per-process byte-bounded LRU with the same interface.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .pcm import TranscodingAudioCache
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"LTTSAC01"
+_RECORD_MAGIC = b"LTAE"
+
+# Header: magic, capacity, slot count, write head, generation
+_HEADER = struct.Struct("<8sQQQQ")
+_HEADER_SIZE = 4096
+_HEAD_OFFSET = 24
+
+# Worker counter records: pid, hits, misses, puts, last update
+_WORKER = struct.Struct("<QQQQd")
+_WORKER_TABLE_OFFSET = 512
+_MAX_WORKERS = 64
+
+# Index slot: digest, logical offset, payload length, payload crc
+_SLOT = struct.Struct("<16sQII")
+_PROBES = 8
+
+# Record header: magic, payload length, digest, crc, ttl seconds, created
+_RECORD = struct.Struct("<4sI16sIId")
+_EMPTY_DIGEST = bytes(16)
+
+def cache_digest(*parts: Any) -> bytes:
+    """16-byte key digest for the arguments"""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).digest()
+
+def default_cache_path(name: str) -> str:
+    """Path of a shared cache file, in /dev/shm when it exists"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else tempfile.gettempdir()
+    return os.path.join(base, name)
+
+class _WorkerCounters:
+    """Hit accounting of this process"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "pid": os.getpid(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "puts": self.puts,
+            "hit_rate": self.hits / total if total > 0 else 0,
+            "total_requests": total,
+        }
+
+class MmapAudioArena:
+    """
+    Byte-bounded key/value store in a memory-mapped ring shared across processes
+
+    Args:
+        path: File backing the arena; processes using the same path share it
+        capacity_bytes: Size of the data ring
+        max_entry_bytes: Largest value accepted, defaults to an eighth of the ring
+    """
+
+    def __init__(self, path: str, capacity_bytes: int, max_entry_bytes: Optional[int] = None):
+        if fcntl is None:
+            raise OSError("The shared audio cache needs fcntl (POSIX)")
+        if capacity_bytes < 64 * 1024:
+            raise ValueError("capacity_bytes must be at least 64 KiB")
+
+        self.path = str(path)
+        self.capacity = int(capacity_bytes)
+        self.max_entry_bytes = max_entry_bytes or self.capacity // 8
+        # Roughly one slot per 4 KiB of ring, rounded to a power of two
+        self.n_slots = 1 << max(10, (self.capacity // 4096 - 1).bit_length())
+        self._index_offset = _HEADER_SIZE
+        self._data_offset = _HEADER_SIZE + self.n_slots * _SLOT.size
+        self._size = self._data_offset + self.capacity
+
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._worker_index: Optional[int] = None
+        self.counters = _WorkerCounters()
+
+    # Attachment
+
+    def _attach(self):
+        """Map the file, initializing it if this is the first process"""
+        if self._pid == os.getpid() and self._map is not None:
+            return
+
+        # After a fork the inherited mapping and lock belong to the parent
+        self._map = None
+        self._fd = None
+        self.counters = _WorkerCounters()
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                resized = os.fstat(fd).st_size != self._size
+                if resized:
+                    os.ftruncate(fd, self._size)
+                # Reserve the pages up front: a sparse tmpfs file that later runs out of
+                # space (Docker's /dev/shm is 64 MB) raises SIGBUS on a page fault instead
+                # of an error here that falls back to the per-process cache
+                if hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, self._size)
+                    except OSError:
+                        if resized:
+                            os.ftruncate(fd, 0)
+                        raise
+                mapping = mmap.mmap(fd, self._size)
+                magic, capacity, n_slots, _, _ = _HEADER.unpack_from(mapping, 0)
+                if magic != _MAGIC or capacity != self.capacity or n_slots != self.n_slots:
+                    mapping[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+                    mapping[self._index_offset:self._data_offset] = bytes(self._data_offset - self._index_offset)
+                    _HEADER.pack_into(mapping, 0, _MAGIC, self.capacity, self.n_slots, 0, 0)
+                self._map = mapping
+                self._fd = fd
+                self._pid = os.getpid()
+                self._worker_index = self._claim_worker_record()
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except Exception:
+            if self._fd is None:
+                os.close(fd)
+            raise
+
+    def _claim_worker_record(self) -> Optional[int]:
+        """Reserve a counter record for this pid (caller holds the file lock)"""
+        pid = os.getpid()
+        free = None
+        for index in range(_MAX_WORKERS):
+            record_pid = _WORKER.unpack_from(self._map, _WORKER_TABLE_OFFSET + index * _WORKER.size)[0]
+            if record_pid == pid:
+                free = index
+                break
+            if free is None and (record_pid == 0 or not _pid_alive(record_pid)):
+                free = index
+        if free is not None:
+            _WORKER.pack_into(self._map, _WORKER_TABLE_OFFSET + free * _WORKER.size, pid, 0, 0, 0, time.time())
+        return free
+
+    def _publish_counters(self):
+        if self._worker_index is None:
+            return
+        _WORKER.pack_into(self._map, _WORKER_TABLE_OFFSET + self._worker_index * _WORKER.size,
+                          os.getpid(), self.counters.hits, self.counters.misses, self.counters.puts, time.time())
+
+    def close(self):
+        with self._lock:
+            if self._map is not None and self._pid == os.getpid():
+                self._map.close()
+                os.close(self._fd)
+            self._map = None
+            self._fd = None
+            self._pid = None
+
+    # Helpers
+
+    def _write_head(self) -> int:
+        return struct.unpack_from("<Q", self._map, _HEAD_OFFSET)[0]
+
+    def _slot_offset(self, slot: int) -> int:
+        return self._index_offset + slot * _SLOT.size
+
+    def _probe(self, digest: bytes):
+        start = int.from_bytes(digest[:8], "little") & (self.n_slots - 1)
+        for step in range(_PROBES):
+            slot = (start + step) & (self.n_slots - 1)
+            yield slot, _SLOT.unpack_from(self._map, self._slot_offset(slot))
+
+    def _is_live(self, offset: int, length: int, head: int) -> bool:
+        return offset >= head - self.capacity and offset + _RECORD.size + length <= head
+
+    # Operations
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        """Value for a digest or None; does not take the file lock"""
+        with self._lock:
+            self._attach()
+            value, offset, ttl, created = self._read(digest)
+            if value is None:
+                self.counters.misses += 1
+            else:
+                self.counters.hits += 1
+            self._publish_counters()
+
+        # Second chance: copy hot records out of the oldest quarter of the ring
+        if value is not None and offset < self._write_head() - (self.capacity * 3) // 4:
+            # The copy keeps the original expiry, so hot entries still honor their ttl
+            self._append(digest, value, ttl=ttl, blocking=False, refresh=True, created=created)
+        return value
+
+    def _read(self, digest: bytes) -> Tuple[Optional[bytes], int, float, float]:
+        """Payload, ring offset, ttl and creation time of a live record"""
+        head = self._write_head()
+        for _, (slot_digest, offset, length, crc) in self._probe(digest):
+            if slot_digest != digest or not self._is_live(offset, length, head):
+                continue
+
+            position = self._data_offset + offset % self.capacity
+            record = _RECORD.unpack_from(self._map, position)
+            payload = self._map[position + _RECORD.size:position + _RECORD.size + length]
+
+            # The copy is only trusted if no writer lapped it meanwhile
+            if not self._is_live(offset, length, self._write_head()):
+                return None, 0, 0, 0
+            magic, record_length, record_digest, record_crc, ttl, created = record
+            if (magic != _RECORD_MAGIC or record_length != length or record_digest != digest
+                    or record_crc != crc or zlib.crc32(payload) != crc):
+                return None, 0, 0, 0
+            if ttl and time.time() - created > ttl:
+                return None, 0, 0, 0
+            return payload, offset, ttl, created
+        return None, 0, 0, 0
+
+    def put(self, digest: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Store a value; returns False if it is too large for the ring"""
+        if len(value) > self.max_entry_bytes:
+            return False
+        with self._lock:
+            self._attach()
+            self.counters.puts += 1
+            self._publish_counters()
+        return self._append(digest, value, ttl, blocking=True)
+
+    def _append(self, digest: bytes, value: bytes, ttl: Optional[float], blocking: bool,
+                refresh: bool = False, created: Optional[float] = None) -> bool:
+        with self._lock:
+            self._attach()
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(self._fd, flags)
+            except BlockingIOError:
+                return False
+            try:
+                head = self._write_head()
+                if refresh and self._read(digest)[1] >= head - (self.capacity * 3) // 4:
+                    return True  # Another process already refreshed it
+
+                record_size = _RECORD.size + len(value)
+                position = head % self.capacity
+                if position + record_size > self.capacity:
+                    head += self.capacity - position  # Records never wrap; skip to the ring start
+                    position = 0
+
+                # Publish the new head before overwriting, so concurrent
+                # readers of the overwritten records detect the lap
+                struct.pack_into("<Q", self._map, _HEAD_OFFSET, head + record_size)
+
+                crc = zlib.crc32(value)
+                start = self._data_offset + position
+                _RECORD.pack_into(self._map, start, _RECORD_MAGIC, len(value), digest, crc,
+                                  int(ttl or 0), created or time.time())
+                self._map[start + _RECORD.size:start + record_size] = value
+
+                slot = self._choose_slot(digest, head + record_size)
+                _SLOT.pack_into(self._map, self._slot_offset(slot), digest, head, len(value), crc)
+                return True
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _choose_slot(self, digest: bytes, head: int) -> int:
+        """Slot holding this digest, else a free or dead slot, else the oldest probed"""
+        oldest_slot, oldest_offset = None, None
+        for slot, (slot_digest, offset, length, _) in self._probe(digest):
+            if slot_digest in (digest, _EMPTY_DIGEST) or not self._is_live(offset, length, head):
+                return slot
+            if oldest_offset is None or offset < oldest_offset:
+                oldest_slot, oldest_offset = slot, offset
+        return oldest_slot
+
+    def clear(self):
+        """Drop every entry (for all processes)"""
+        with self._lock:
+            self._attach()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self._map[self._index_offset:self._data_offset] = bytes(self._data_offset - self._index_offset)
+                generation = struct.unpack_from("<Q", self._map, 32)[0]
+                struct.pack_into("<Q", self._map, 32, generation + 1)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self.counters = _WorkerCounters()
+            self._publish_counters()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._attach()
+            head = self._write_head()
+            entries, live_bytes = 0, 0
+            for slot in range(self.n_slots):
+                _, offset, length, _ = _SLOT.unpack_from(self._map, self._slot_offset(slot))
+                if length and self._is_live(offset, length, head):
+                    entries += 1
+                    live_bytes += length
+
+            workers = []
+            for index in range(_MAX_WORKERS):
+                pid, hits, misses, puts, updated = _WORKER.unpack_from(
+                    self._map, _WORKER_TABLE_OFFSET + index * _WORKER.size)
+                if pid and _pid_alive(pid):
+                    total = hits + misses
+                    workers.append({"pid": pid, "hits": hits, "misses": misses, "puts": puts,
+                                    "hit_rate": hits / total if total > 0 else 0, "total_requests": total})
+
+        hits = sum(worker["hits"] for worker in workers)
+        misses = sum(worker["misses"] for worker in workers)
+        return {
+            "backend": "mmap",
+            "path": self.path,
+            "entries": entries,
+            "bytes_used": live_bytes,
+            "max_bytes": self.capacity,
+            "slots": self.n_slots,
+            "worker": self.counters.as_dict(),
+            "aggregate": {
+                "workers": len(workers),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses > 0 else 0,
+                "total_requests": hits + misses,
+            },
+            "workers": workers,
+        }
+
+class LocalAudioStore:
+    """Per-process byte-bounded LRU with the arena interface (fallback and test stand-in)"""
+
+    def __init__(self, capacity_bytes: int, max_entry_bytes: Optional[int] = None):
+        self.capacity = int(capacity_bytes)
+        self.max_entry_bytes = max_entry_bytes or self.capacity // 8
+        self._entries: "OrderedDict[bytes, Tuple[bytes, float, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = _WorkerCounters()
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[2] and time.time() - entry[1] > entry[2]:
+                self._bytes -= len(self._entries.pop(digest)[0])
+                entry = None
+            if entry is None:
+                self.counters.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.counters.hits += 1
+            return entry[0]
+
+    def put(self, digest: bytes, value: bytes, ttl: Optional[float] = None) -> bool:
+        if len(value) > self.max_entry_bytes:
+            return False
+        with self._lock:
+            self.counters.puts += 1
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._bytes -= len(previous[0])
+            self._entries[digest] = (value, time.time(), ttl or 0)
+            self._bytes += len(value)
+            while self._bytes > self.capacity:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+        return True
+
+    def resize(self, capacity_bytes: int):
+        """Change the byte budget, evicting least recently used entries to fit"""
+        with self._lock:
+            self.capacity = int(capacity_bytes)
+            while self._bytes > self.capacity:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.counters = _WorkerCounters()
+
+    def close(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            worker = self.counters.as_dict()
+            return {
+                "backend": "local",
+                "entries": len(self._entries),
+                "bytes_used": self._bytes,
+                "max_bytes": self.capacity,
+                "worker": worker,
+                "aggregate": {**{k: worker[k] for k in ("hits", "misses", "hit_rate", "total_requests")},
+                              "workers": 1},
+                "workers": [worker],
+            }
+
+class SharedAudioCache(TranscodingAudioCache):
+    """
+    Audio cache shared by the workers of one server
+
+    Drop-in replacement for the legacy per-process ``AudioCache``: the same
+    ``get_audio`` call, but bounded in bytes and backed by ``MmapAudioArena``
+    so all workers see each other's entries. Entries are PCM keyed without
+    the response format (see ``TranscodingAudioCache``).
+
+    Args:
+        max_bytes: Byte budget of the cache
+        default_ttl: Seconds an entry stays valid, None keeps it until evicted
+        path: Arena file; None uses a file in /dev/shm named after the size
+        shared: False keeps the cache in this process only
+        namespace: Model identifier mixed into every key so entries from a
+            different model are never served
+        encoded_cache_bytes: Per-process budget for hot encoded variants
+        pcm_codec: "raw" or "flac" for the PCM records
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, default_ttl: Optional[float] = 3600,
+                 path: Optional[str] = None, shared: bool = True, namespace: str = "",
+                 encoded_cache_bytes: int = 16 * 1024 * 1024, pcm_codec: str = "raw"):
+        super().__init__(encoded_cache_bytes, pcm_codec, model_id=namespace or None)
+        self.max_bytes = int(max_bytes)
+        self.default_ttl = default_ttl
+        self.namespace = namespace
+        self.path = path
+        self.shared = shared
+        self._store = None
+        self._store_lock = threading.Lock()
+
+    @property
+    def store(self):
+        """Backing store, created on first use so forked workers attach separately"""
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = self._create_store()
+        return self._store
+
+    def _create_store(self):
+        if self.shared:
+            try:
+                path = self.path or default_cache_path(f"litetts-audio-{self.max_bytes >> 20}m.cache")
+                arena = MmapAudioArena(path, self.max_bytes)
+                arena._attach()
+                logger.info(f"Shared audio cache attached: {path} ({self.max_bytes >> 20} MB)")
+                return arena
+            except (OSError, ValueError) as e:
+                logger.warning(f"Shared audio cache unavailable ({e}), using a per-process cache")
+        return LocalAudioStore(self.max_bytes)
+
+    def _get_record(self, digest: bytes) -> Optional[bytes]:
+        return self.store.get(digest)
+
+    def _put_record(self, digest: bytes, record: bytes, ttl: Optional[float]) -> bool:
+        if not self.store.put(digest, record, ttl or self.default_ttl):
+            logger.debug(f"Audio too large to cache: {len(record)} bytes")
+            return False
+        logger.debug(f"Cached PCM audio: record_size={len(record)}, key={digest.hex()[:8]}...")
+        return True
+
+    def _clear_records(self) -> None:
+        self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics (this worker's hit rate plus the aggregate)"""
+        stats = self.store.stats()
+        worker = stats["worker"]
+        # Keys of the legacy LRU stats, for existing dashboards
+        return {
+            "size": stats["entries"],
+            "max_size_bytes": stats["max_bytes"],
+            "hits": worker["hits"],
+            "misses": worker["misses"],
+            "hit_rate": worker["hit_rate"],
+            "total_requests": worker["total_requests"],
+            **stats,
+            "pcm_codec": self.pcm_codec,
+            "encoded": self.encoded_stats(),
+        }
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
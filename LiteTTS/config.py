@@ -5,7 +5,7 @@ Configuration management for Kokoro ONNX TTS API
 
 import os
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
@@ -25,6 +25,10 @@ class ModelConfig:
     owner: str = "TaskWizer"
     performance_mode: str = "balanced"
     preload_models: bool = True  # Enable model preloading for faster startup
+    backend: str = "onnx"  # Default synthesis backend: "onnx" or "ttscpp"
+    gguf_model_path: Optional[str] = None  # Kokoro GGUF weights for the TTS.cpp backend
+    ttscpp_library_path: Optional[str] = None  # tts_c shared library, searched in-tree if unset
+    ttscpp_threads: int = 0  # 0 uses all cores
 
     def __post_init__(self):
         if self.available_variants is None:
@@ -74,6 +78,9 @@ class ChunkedGenerationConfig:
     preserve_punctuation: bool = True
     enable_for_streaming: bool = True
     min_text_length_for_chunking: int = 100
+    max_lookahead_chunks: int = 4  # Chunks synthesized ahead of the playback cursor
+    chunk_cache_memory_mb: int = 32
+    chunk_cache_dir: Optional[str] = "chunks"  # Under paths.cache_dir unless absolute; shared by all workers
 
 @dataclass
 class AudioConfig:
@@ -96,6 +103,7 @@ class AudioConfig:
     compression_ratio: float = 4.0
     normalization_threshold: float = 0.95
     streaming_chunk_duration: float = 1.0
+    postprocess_backend: str = "auto"  # auto, numpy, numexpr or numba
 
     # Watermarking configuration
     watermarking_enabled: bool = True
@@ -125,6 +133,8 @@ class ServerConfig:
     environment: str = "production"
     cors_origins: List[str] = None
     request_timeout: int = 30
+    enable_dashboard: bool = True  # Disabled features are never imported
+    enable_websocket: bool = True
 
     def __post_init__(self):
         if self.cors_origins is None:
@@ -256,6 +266,14 @@ class CacheConfig:
     text_disk_cache_mb: int = 50
     text_cache_ttl: int = 86400  # 24 hours for text cache
 
+    # Encoded-audio cache shared by all workers through a memory-mapped file
+    shared_audio_cache: bool = True
+    audio_cache_mb: int = 256
+    shared_cache_path: Optional[str] = None  # None: /dev/shm (or the temp dir), one file per port
+    # Entries hold PCM for every response format; encodings are derived on a hit
+    pcm_codec: str = "raw"  # raw or flac (lossless, about half the bytes for speech)
+    encoded_cache_mb: int = 16  # Per-worker cache of hot encoded variants
+
 @dataclass
 class MonitoringConfig:
     """Performance monitoring configuration"""
@@ -282,6 +300,101 @@ class LoggingConfig:
     file_path: Optional[str] = None
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
+    queue_size: int = 10000  # Async log queue capacity, 0 = synchronous handlers
+    default_info_sample_rate: float = 1.0
+    info_sample_rates: Dict[str, float] = field(default_factory=dict)  # Route prefix -> INFO sampling rate
+
+@dataclass
+class TracingConfig:
+    """Per-request span tracing configuration"""
+    enabled: bool = False
+    sample_rate: float = 1.0  # Fraction of requests traced; a sampled traceparent header always is
+    export_path: Optional[str] = "docs/logs/traces.jsonl"  # OTLP/JSON lines, None disables the file exporter
+    otlp_endpoint: Optional[str] = None  # OTLP/HTTP JSON collector, e.g. http://localhost:4318/v1/traces
+    service_name: str = "litetts"
+    batch_size: int = 64
+    flush_interval: float = 2.0  # seconds
+    max_queue_size: int = 2048
+
+@dataclass
+class ProfilingConfig:
+    """Statistical sampling profiler configuration"""
+    enabled: bool = False  # Sample continuously from startup
+    endpoint_enabled: bool = False  # Serve /debug/profile (exposes code stacks, so opt in)
+    sample_hz: float = 49.0
+    window_seconds: int = 300  # Continuous samples retained, in one-second buckets
+    max_stacks: int = 2000  # Distinct stacks per bucket
+    max_depth: int = 64
+    max_capture_seconds: float = 60.0
+    include_idle: bool = False
+
+@dataclass
+class PipelineConfig:
+    """Cross-request staged synthesis pipeline (NLP -> inference -> encode)"""
+    enabled: bool = False
+    nlp_executor: str = "process"  # "process" runs text processing outside the GIL, "thread" in-process
+    nlp_workers: int = 2
+    inference_workers: int = 2  # Concurrent session runs, each using the session's intra-op threads
+    encode_workers: int = 2
+    queue_size: int = 8  # Per stage
+    submit_timeout: float = 5.0  # Seconds to wait for room in the first queue before answering 503
+
+@dataclass
+class NLPPoolConfig:
+    """Worker-process pool for text normalization, returning results through shared memory"""
+    enabled: bool = False
+    workers: int = 0  # 0 = one per core, minus one
+    slots: int = 0  # Results in flight; 0 = two per worker
+    slot_bytes: int = 65536  # Processed text plus int32 token ids must fit, larger results are pickled
+    timeout: float = 10.0  # Seconds to wait for a slot or a result before processing inline
+
+@dataclass
+class BatchJobsConfig:
+    """Offline bulk synthesis jobs submitted as JSONL manifests to /v1/audio/batch"""
+    enabled: bool = True
+    output_dir: str = "cache/batch"  # One directory per job: manifest, journal and audio files
+    window: int = 4  # Items in flight per job; enough to keep every pipeline stage busy
+    max_items: int = 10000  # Per manifest
+    yield_threshold: int = 0  # Start batch items only while at most this many interactive requests run
+    resume_on_startup: bool = True  # Continue jobs interrupted by a restart
+
+@dataclass
+class DegradationConfig:
+    """Memory-pressure-aware degradation: what to give up, in order, before the OOM killer steps in"""
+    enabled: bool = True
+    interval: float = 1.0  # Seconds between pressure samples
+    memory_limit_mb: int = 0  # RSS counted as full pressure; 0 = cgroup limit (or RAM) per worker
+    queue_limit: int = 64  # Requests queued or in flight counted as full pressure
+    # Pressure entering shrink_caches, cap_lookahead, reduce_batch, small_model, shed_low_priority
+    thresholds: List[float] = field(default_factory=lambda: [0.70, 0.80, 0.85, 0.90, 0.95])
+    hysteresis: float = 0.10  # A level is left below its threshold minus this
+    recovery_seconds: float = 30.0  # Low pressure needed before each step back up
+    cache_shrink_factor: float = 0.25  # In-process cache budgets while shrunk
+    lookahead_chunks: int = 1  # Streaming look-ahead cap
+    batch_window: int = 1  # Batch items in flight
+    small_model_variant: Optional[str] = None  # e.g. "model_q4.onnx"; None skips the model switch
+
+@dataclass
+class OnnxMemoryConfig:
+    """ONNX Runtime arena and memory-pattern policy, by input-length bucket"""
+    enabled: bool = True
+    bucket_boundaries: List[int] = field(default_factory=lambda: [64, 128, 256, 512])  # Upper token bounds
+    shrink_above_tokens: int = 256  # Runs in buckets above this return unused arena memory afterwards
+    arena_extend_strategy: str = "same_as_requested"  # or "next_power_of_two" (ONNX Runtime's default)
+    initial_chunk_mb: int = 0  # First arena chunk; 0 = ONNX Runtime default
+    enable_mem_pattern: bool = False  # Only pays off when input shapes repeat exactly
+
+@dataclass
+class TimeStretchingConfig:
+    """Compressed-speed synthesis stretched back to duration (beta_features.time_stretching_optimization)"""
+    enabled: bool = False  # Requests may still opt in with time_stretching_enabled
+    generation_speed_boost: int = 30  # Percent faster than requested during synthesis
+    correction_quality: str = "medium"  # low, medium or high
+    max_speed_boost: int = 100
+    min_speed_boost: int = 10
+    auto_enable_for_long_text: int = 50
+    quality_fallback: bool = True
+    benchmark_mode: bool = False
 
 @dataclass
 class MetricsConfig:
@@ -334,8 +447,46 @@ class ConfigManager:
         # Legacy configurations for backward compatibility
         self.tts = TTSConfig()
         self.api = APIConfig()
-        self.cache = CacheConfig()
-        self.logging = LoggingConfig()
+        self.cache = CacheConfig(**{
+            k: v for k, v in getattr(self, "_cache_data", {}).items()
+            if k in CacheConfig.__dataclass_fields__
+        })
+        self.logging = LoggingConfig(**{
+            k: v for k, v in getattr(self, "_logging_data", {}).items()
+            if k in LoggingConfig.__dataclass_fields__
+        })
+        self.tracing = TracingConfig(**{
+            k: v for k, v in getattr(self, "_tracing_data", {}).items()
+            if k in TracingConfig.__dataclass_fields__
+        })
+        self.profiling = ProfilingConfig(**{
+            k: v for k, v in getattr(self, "_profiling_data", {}).items()
+            if k in ProfilingConfig.__dataclass_fields__
+        })
+        self.pipeline = PipelineConfig(**{
+            k: v for k, v in getattr(self, "_pipeline_data", {}).items()
+            if k in PipelineConfig.__dataclass_fields__
+        })
+        self.nlp_pool = NLPPoolConfig(**{
+            k: v for k, v in getattr(self, "_nlp_pool_data", {}).items()
+            if k in NLPPoolConfig.__dataclass_fields__
+        })
+        self.batch_jobs = BatchJobsConfig(**{
+            k: v for k, v in getattr(self, "_batch_jobs_data", {}).items()
+            if k in BatchJobsConfig.__dataclass_fields__
+        })
+        self.degradation = DegradationConfig(**{
+            k: v for k, v in getattr(self, "_degradation_data", {}).items()
+            if k in DegradationConfig.__dataclass_fields__
+        })
+        self.onnx_memory = OnnxMemoryConfig(**{
+            k: v for k, v in getattr(self, "_onnx_memory_data", {}).items()
+            if k in OnnxMemoryConfig.__dataclass_fields__
+        })
+        self.time_stretching = TimeStretchingConfig(**{
+            k: v for k, v in getattr(self, "_time_stretching_data", {}).items()
+            if k in TimeStretchingConfig.__dataclass_fields__
+        })
         self.monitoring = MonitoringConfig()
         self.metrics = MetricsConfig()
         self.security = SecurityConfig()
@@ -412,6 +563,16 @@ class ConfigManager:
             self.tokenizer = TokenizerConfig(**config_data.get("tokenizer", {}))
             self.endpoints = EndpointsConfig(**config_data.get("endpoints", {}))
             self.application = ApplicationConfig(**config_data.get("application", {}))
+            self._logging_data = config_data.get("logging", {})
+            self._tracing_data = config_data.get("tracing", {})
+            self._profiling_data = config_data.get("profiling", {})
+            self._cache_data = config_data.get("cache", {})
+            self._pipeline_data = config_data.get("pipeline", {})
+            self._nlp_pool_data = config_data.get("nlp_pool", {})
+            self._batch_jobs_data = config_data.get("batch_jobs", {})
+            self._degradation_data = config_data.get("degradation", {})
+            self._onnx_memory_data = config_data.get("onnx_memory", {})
+            self._time_stretching_data = config_data.get("beta_features", {}).get("time_stretching_optimization", {})
 
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
@@ -484,6 +645,9 @@ class ConfigManager:
             self.model.default_variant = os.getenv("KOKORO_MODEL_VARIANT", self.model.default_variant)
             self.model.auto_discovery = os.getenv("KOKORO_MODEL_AUTO_DISCOVERY", str(self.model.auto_discovery)).lower() == "true"
             self.model.cache_models = os.getenv("KOKORO_CACHE_MODELS", str(self.model.cache_models)).lower() == "true"
+            self.model.backend = os.getenv("KOKORO_BACKEND", self.model.backend)
+            self.model.gguf_model_path = os.getenv("KOKORO_GGUF_MODEL_PATH", self.model.gguf_model_path)
+            self.model.ttscpp_library_path = os.getenv("LITETTS_TTSCPP_LIBRARY", self.model.ttscpp_library_path)
 
             # Voice Configuration
             self.voice.default_voice = os.getenv("KOKORO_DEFAULT_VOICE", self.voice.default_voice)
@@ -495,6 +659,7 @@ class ConfigManager:
             # Audio Configuration
             self.audio.default_format = os.getenv("KOKORO_DEFAULT_FORMAT", self.audio.default_format)
             self.audio.sample_rate = int(os.getenv("KOKORO_SAMPLE_RATE", str(self.audio.sample_rate)))
+            self.audio.postprocess_backend = os.getenv("LITETTS_POSTPROCESS_BACKEND", self.audio.postprocess_backend)
 
             # Server Configuration
             self.server.port = int(os.getenv("PORT", str(self.server.port)))
@@ -546,12 +711,73 @@ class ConfigManager:
             self.cache.ttl = int(os.getenv("CACHE_TTL", str(self.cache.ttl)))
             self.cache.voice_cache_size = int(os.getenv("VOICE_CACHE_SIZE", str(self.cache.voice_cache_size)))
             self.cache.audio_cache_size = int(os.getenv("AUDIO_CACHE_SIZE", str(self.cache.audio_cache_size)))
+            self.cache.shared_audio_cache = os.getenv("LITETTS_SHARED_CACHE", str(self.cache.shared_audio_cache)).lower() == "true"
+            self.cache.audio_cache_mb = int(os.getenv("LITETTS_AUDIO_CACHE_MB", str(self.cache.audio_cache_mb)))
+            self.cache.shared_cache_path = os.getenv("LITETTS_SHARED_CACHE_PATH", self.cache.shared_cache_path)
+            self.cache.pcm_codec = os.getenv("LITETTS_PCM_CACHE_CODEC", self.cache.pcm_codec)
+            self.cache.encoded_cache_mb = int(os.getenv("LITETTS_ENCODED_CACHE_MB", str(self.cache.encoded_cache_mb)))
             
             # Logging Configuration
             self.logging.level = os.getenv("LOG_LEVEL", self.logging.level)
             self.logging.file_path = os.getenv("LOG_FILE_PATH")
             self.logging.max_file_size = int(os.getenv("LOG_MAX_FILE_SIZE", str(self.logging.max_file_size)))
             self.logging.backup_count = int(os.getenv("LOG_BACKUP_COUNT", str(self.logging.backup_count)))
+            self.logging.queue_size = int(os.getenv("LOG_QUEUE_SIZE", str(self.logging.queue_size)))
+            self.logging.default_info_sample_rate = float(
+                os.getenv("LOG_INFO_SAMPLE_RATE", str(self.logging.default_info_sample_rate))
+            )
+
+            # Tracing Configuration
+            self.tracing.enabled = os.getenv("LITETTS_TRACING_ENABLED", str(self.tracing.enabled)).lower() == "true"
+            self.tracing.sample_rate = float(os.getenv("LITETTS_TRACE_SAMPLE_RATE", str(self.tracing.sample_rate)))
+            self.tracing.export_path = os.getenv("LITETTS_TRACE_EXPORT_PATH", self.tracing.export_path)
+            self.tracing.otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", self.tracing.otlp_endpoint)
+
+            # Profiling Configuration
+            self.profiling.enabled = os.getenv("LITETTS_PROFILING_ENABLED", str(self.profiling.enabled)).lower() == "true"
+            self.profiling.endpoint_enabled = os.getenv(
+                "LITETTS_PROFILING_ENDPOINT", str(self.profiling.endpoint_enabled)
+            ).lower() == "true"
+            self.profiling.sample_hz = float(os.getenv("LITETTS_PROFILING_HZ", str(self.profiling.sample_hz)))
+
+            # Staged Pipeline Configuration
+            self.pipeline.enabled = os.getenv("LITETTS_PIPELINE", str(self.pipeline.enabled)).lower() == "true"
+            self.pipeline.nlp_executor = os.getenv("LITETTS_PIPELINE_NLP_EXECUTOR", self.pipeline.nlp_executor)
+            self.pipeline.nlp_workers = int(os.getenv("LITETTS_PIPELINE_NLP_WORKERS", str(self.pipeline.nlp_workers)))
+            self.pipeline.inference_workers = int(
+                os.getenv("LITETTS_PIPELINE_INFERENCE_WORKERS", str(self.pipeline.inference_workers))
+            )
+            self.pipeline.encode_workers = int(os.getenv("LITETTS_PIPELINE_ENCODE_WORKERS", str(self.pipeline.encode_workers)))
+            self.pipeline.queue_size = int(os.getenv("LITETTS_PIPELINE_QUEUE_SIZE", str(self.pipeline.queue_size)))
+
+            # NLP Process Pool Configuration
+            self.nlp_pool.enabled = os.getenv("LITETTS_NLP_POOL", str(self.nlp_pool.enabled)).lower() == "true"
+            self.nlp_pool.workers = int(os.getenv("LITETTS_NLP_POOL_WORKERS", str(self.nlp_pool.workers)))
+
+            # Batch Jobs Configuration
+            self.batch_jobs.enabled = os.getenv("LITETTS_BATCH_JOBS", str(self.batch_jobs.enabled)).lower() == "true"
+            self.batch_jobs.output_dir = os.getenv("LITETTS_BATCH_OUTPUT_DIR", self.batch_jobs.output_dir)
+            self.batch_jobs.window = int(os.getenv("LITETTS_BATCH_WINDOW", str(self.batch_jobs.window)))
+
+            # Degradation Configuration
+            self.degradation.enabled = os.getenv("LITETTS_DEGRADATION", str(self.degradation.enabled)).lower() == "true"
+            self.degradation.memory_limit_mb = int(
+                os.getenv("LITETTS_MEMORY_LIMIT_MB", str(self.degradation.memory_limit_mb))
+            )
+            self.degradation.small_model_variant = os.getenv(
+                "LITETTS_SMALL_MODEL_VARIANT", self.degradation.small_model_variant or ""
+            ) or None
+
+            # ONNX Memory Configuration
+            self.onnx_memory.enabled = os.getenv("LITETTS_ONNX_MEMORY", str(self.onnx_memory.enabled)).lower() == "true"
+            self.onnx_memory.shrink_above_tokens = int(
+                os.getenv("LITETTS_ARENA_SHRINK_ABOVE_TOKENS", str(self.onnx_memory.shrink_above_tokens))
+            )
+
+            # Time-Stretching Configuration
+            self.time_stretching.enabled = os.getenv(
+                "LITETTS_TIME_STRETCHING", str(self.time_stretching.enabled)
+            ).lower() == "true"
             
             # Monitoring Configuration
             self.monitoring.enabled = os.getenv("MONITORING_ENABLED", str(self.monitoring.enabled)).lower() == "true"
@@ -632,6 +858,59 @@ class ConfigManager:
         
         if self.cache.ttl < 0:
             errors.append(f"Invalid cache TTL: {self.cache.ttl}")
+
+        if self.cache.audio_cache_mb < 1:
+            errors.append(f"Invalid audio cache size: {self.cache.audio_cache_mb} MB")
+
+        if self.cache.pcm_codec not in ("raw", "flac"):
+            errors.append(f"Invalid PCM cache codec: {self.cache.pcm_codec}")
+
+        # Validate pipeline config
+        if self.pipeline.nlp_executor not in ("process", "thread"):
+            errors.append(f"Invalid pipeline NLP executor: {self.pipeline.nlp_executor}")
+
+        for name in ("nlp_workers", "inference_workers", "encode_workers", "queue_size"):
+            if getattr(self.pipeline, name) < 1:
+                errors.append(f"Invalid pipeline {name.replace('_', ' ')}: {getattr(self.pipeline, name)}")
+
+        # Validate NLP pool config
+        if self.nlp_pool.workers < 0 or self.nlp_pool.slots < 0:
+            errors.append(f"Invalid NLP pool size: {self.nlp_pool.workers} workers, {self.nlp_pool.slots} slots")
+
+        if self.nlp_pool.slot_bytes < 1024:
+            errors.append(f"NLP pool slot bytes must be at least 1024: {self.nlp_pool.slot_bytes}")
+
+        # Validate batch jobs config
+        if self.batch_jobs.window < 1 or self.batch_jobs.max_items < 1:
+            errors.append(f"Invalid batch job limits: window {self.batch_jobs.window}, max items {self.batch_jobs.max_items}")
+
+        if self.batch_jobs.yield_threshold < 0:
+            errors.append(f"Invalid batch yield threshold: {self.batch_jobs.yield_threshold}")
+
+        # Validate degradation config
+        thresholds = self.degradation.thresholds
+        if len(thresholds) != 5 or thresholds != sorted(thresholds) or not all(t > 0 for t in thresholds):
+            errors.append(f"Degradation thresholds must be 5 increasing positive values: {thresholds}")
+
+        if not 0 < self.degradation.cache_shrink_factor <= 1:
+            errors.append(f"Invalid degradation cache shrink factor: {self.degradation.cache_shrink_factor}")
+
+        # Validate ONNX memory config
+        boundaries = self.onnx_memory.bucket_boundaries
+        if not boundaries or boundaries != sorted(set(boundaries)) or boundaries[0] < 1:
+            errors.append(f"ONNX memory bucket boundaries must be increasing positive token counts: {boundaries}")
+
+        if self.onnx_memory.arena_extend_strategy not in ("same_as_requested", "next_power_of_two"):
+            errors.append(f"Invalid ONNX arena extend strategy: {self.onnx_memory.arena_extend_strategy}")
+
+        # Validate time-stretching config
+        stretching = self.time_stretching
+        if not stretching.min_speed_boost <= stretching.generation_speed_boost <= stretching.max_speed_boost:
+            errors.append(f"Time-stretching speed boost {stretching.generation_speed_boost} is outside "
+                          f"{stretching.min_speed_boost}-{stretching.max_speed_boost}")
+
+        if stretching.correction_quality not in ("low", "medium", "high"):
+            errors.append(f"Invalid time-stretching correction quality: {stretching.correction_quality}")
         
         if errors:
             for error in errors:
@@ -650,6 +929,10 @@ class ConfigManager:
                 "available_variants": self.model.available_variants,
                 "auto_discovery": self.model.auto_discovery,
                 "cache_models": self.model.cache_models,
+                "backend": self.model.backend,
+                "gguf_model_path": self.model.gguf_model_path,
+                "ttscpp_library_path": self.model.ttscpp_library_path,
+                "ttscpp_threads": self.model.ttscpp_threads,
             },
             "voice": {
                 "default_voice": self.voice.default_voice,
@@ -712,12 +995,95 @@ class ConfigManager:
                 "ttl": self.cache.ttl,
                 "voice_cache_size": self.cache.voice_cache_size,
                 "audio_cache_size": self.cache.audio_cache_size,
+                "shared_audio_cache": self.cache.shared_audio_cache,
+                "audio_cache_mb": self.cache.audio_cache_mb,
+                "shared_cache_path": self.cache.shared_cache_path,
+                "pcm_codec": self.cache.pcm_codec,
+                "encoded_cache_mb": self.cache.encoded_cache_mb,
             },
             "logging": {
                 "level": self.logging.level,
                 "file_path": self.logging.file_path,
                 "max_file_size": self.logging.max_file_size,
                 "backup_count": self.logging.backup_count,
+                "queue_size": self.logging.queue_size,
+                "default_info_sample_rate": self.logging.default_info_sample_rate,
+                "info_sample_rates": self.logging.info_sample_rates,
+            },
+            "tracing": {
+                "enabled": self.tracing.enabled,
+                "sample_rate": self.tracing.sample_rate,
+                "export_path": self.tracing.export_path,
+                "otlp_endpoint": self.tracing.otlp_endpoint,
+                "service_name": self.tracing.service_name,
+                "batch_size": self.tracing.batch_size,
+                "flush_interval": self.tracing.flush_interval,
+                "max_queue_size": self.tracing.max_queue_size,
+            },
+            "profiling": {
+                "enabled": self.profiling.enabled,
+                "endpoint_enabled": self.profiling.endpoint_enabled,
+                "sample_hz": self.profiling.sample_hz,
+                "window_seconds": self.profiling.window_seconds,
+                "max_stacks": self.profiling.max_stacks,
+                "max_depth": self.profiling.max_depth,
+                "max_capture_seconds": self.profiling.max_capture_seconds,
+                "include_idle": self.profiling.include_idle,
+            },
+            "pipeline": {
+                "enabled": self.pipeline.enabled,
+                "nlp_executor": self.pipeline.nlp_executor,
+                "nlp_workers": self.pipeline.nlp_workers,
+                "inference_workers": self.pipeline.inference_workers,
+                "encode_workers": self.pipeline.encode_workers,
+                "queue_size": self.pipeline.queue_size,
+                "submit_timeout": self.pipeline.submit_timeout,
+            },
+            "nlp_pool": {
+                "enabled": self.nlp_pool.enabled,
+                "workers": self.nlp_pool.workers,
+                "slots": self.nlp_pool.slots,
+                "slot_bytes": self.nlp_pool.slot_bytes,
+                "timeout": self.nlp_pool.timeout,
+            },
+            "batch_jobs": {
+                "enabled": self.batch_jobs.enabled,
+                "output_dir": self.batch_jobs.output_dir,
+                "window": self.batch_jobs.window,
+                "max_items": self.batch_jobs.max_items,
+                "yield_threshold": self.batch_jobs.yield_threshold,
+                "resume_on_startup": self.batch_jobs.resume_on_startup,
+            },
+            "degradation": {
+                "enabled": self.degradation.enabled,
+                "interval": self.degradation.interval,
+                "memory_limit_mb": self.degradation.memory_limit_mb,
+                "queue_limit": self.degradation.queue_limit,
+                "thresholds": self.degradation.thresholds,
+                "hysteresis": self.degradation.hysteresis,
+                "recovery_seconds": self.degradation.recovery_seconds,
+                "cache_shrink_factor": self.degradation.cache_shrink_factor,
+                "lookahead_chunks": self.degradation.lookahead_chunks,
+                "batch_window": self.degradation.batch_window,
+                "small_model_variant": self.degradation.small_model_variant,
+            },
+            "onnx_memory": {
+                "enabled": self.onnx_memory.enabled,
+                "bucket_boundaries": self.onnx_memory.bucket_boundaries,
+                "shrink_above_tokens": self.onnx_memory.shrink_above_tokens,
+                "arena_extend_strategy": self.onnx_memory.arena_extend_strategy,
+                "initial_chunk_mb": self.onnx_memory.initial_chunk_mb,
+                "enable_mem_pattern": self.onnx_memory.enable_mem_pattern,
+            },
+            "time_stretching": {
+                "enabled": self.time_stretching.enabled,
+                "generation_speed_boost": self.time_stretching.generation_speed_boost,
+                "correction_quality": self.time_stretching.correction_quality,
+                "max_speed_boost": self.time_stretching.max_speed_boost,
+                "min_speed_boost": self.time_stretching.min_speed_boost,
+                "auto_enable_for_long_text": self.time_stretching.auto_enable_for_long_text,
+                "quality_fallback": self.time_stretching.quality_fallback,
+                "benchmark_mode": self.time_stretching.benchmark_mode,
             },
             "monitoring": {
                 "enabled": self.monitoring.enabled,
@@ -3,11 +3,16 @@
 Logging configuration for Kokoro ONNX TTS API
 """
 
+import atexit
+import contextvars
 import logging
 import logging.handlers
+import queue
+import random
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Import platform-safe emoji utilities
 try:
@@ -36,6 +41,145 @@ class CacheFilter(logging.Filter):
         return ('cache' in message.lower() or 'Cache' in message or
                 hasattr(record, 'cache_stats'))
 
+# Per-request logging state, set by the HTTP middleware
+_request_sampled: contextvars.ContextVar[bool] = contextvars.ContextVar("log_request_sampled", default=True)
+_request_fields: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("log_request_fields", default=None)
+
+class InfoSamplingFilter(logging.Filter):
+    """
+    Drops INFO and below for requests that were not sampled
+
+    The sampling decision is made once per request (see begin_request_logging)
+    so a sampled request keeps all of its lines. WARNING and above, and records
+    marked with ``always_log``, always pass.
+    """
+    def __init__(self):
+        super().__init__()
+        self.sampled_out = 0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or _request_sampled.get() or getattr(record, 'always_log', False):
+            return True
+        self.sampled_out += 1
+        return False
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking queue handler that drops records when the queue is full
+
+    Records are enqueued unformatted; message interpolation and formatting
+    happen on the listener thread, off the request path.
+    """
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: Dict[str, int] = {}
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Defer formatting to the listener; the record never leaves the process
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    def total_dropped(self) -> int:
+        with self._dropped_lock:
+            return sum(self.dropped.values())
+
+class LoggingSampler:
+    """Per-route INFO sampling rates"""
+    def __init__(self, route_rates: Optional[Dict[str, float]] = None, default_rate: float = 1.0):
+        # Longest prefix wins
+        self.route_rates = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.default_rate = default_rate
+
+    def rate_for(self, path: str) -> float:
+        for prefix, rate in self.route_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def should_sample(self, path: str) -> bool:
+        rate = self.rate_for(path)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+_queue_handler: Optional[BoundedQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_sampling_filter: Optional[InfoSamplingFilter] = None
+_sampler = LoggingSampler()
+
+def begin_request_logging(path: str, **fields) -> Dict[str, Any]:
+    """
+    Start per-request logging state for the current context
+
+    Decides whether INFO lines for this request are sampled and returns the
+    field dict that annotate_request fills and log_request_summary emits.
+    """
+    _request_sampled.set(_sampler.should_sample(path))
+    request_fields = {"path": path, **fields}
+    _request_fields.set(request_fields)
+    return request_fields
+
+def annotate_request(**fields) -> None:
+    """Attach fields to the current request's summary record"""
+    request_fields = _request_fields.get()
+    if request_fields is not None:
+        request_fields.update(fields)
+
+def log_request_summary(logger: logging.Logger, request_fields: Dict[str, Any]) -> None:
+    """Emit the single structured summary record for a request"""
+    logger.info(
+        "%s %s %s %.3fs",
+        request_fields.get("method"), request_fields.get("path"),
+        request_fields.get("status"), request_fields.get("duration", 0.0),
+        extra={"event": "request_summary", "request": request_fields, "always_log": True}
+    )
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Queue depth, drop and sampling counters for the async logging pipeline"""
+    if _queue_handler is None:
+        return {"async": False}
+    return {
+        "async": True,
+        "queue_size": _queue_handler.queue.qsize(),
+        "queue_capacity": _queue_handler.queue.maxsize,
+        "dropped": dict(_queue_handler.dropped),
+        "dropped_total": _queue_handler.total_dropped(),
+        "sampled_out": _sampling_filter.sampled_out if _sampling_filter else 0
+    }
+
+def shutdown_logging() -> None:
+    """Stop the listener thread after draining queued records"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+def reset_logging_in_worker() -> None:
+    """
+    Give a forked worker process logging of its own
+
+    A forked child inherits the parent's root handlers. The queue handler
+    feeds a queue whose listener thread only runs in the parent, so the
+    child's records would fill it and be dropped, and the file handlers
+    would rotate the parent's log files from a second process. Workers
+    write to stderr instead, tagged with their pid.
+    """
+    global _queue_handler, _queue_listener
+    _queue_handler = None
+    _queue_listener = None
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | pid %(process)d | %(name)s | %(message)s"))
+    root_logger.addHandler(handler)
+
 def setup_logging(
     level: str = "INFO",
     format_string: Optional[str] = None,
@@ -43,7 +187,10 @@ def setup_logging(
     max_file_size: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
     json_format: bool = False,
-    include_trace_id: bool = True
+    include_trace_id: bool = True,
+    queue_size: int = 10000,
+    info_sample_rates: Optional[Dict[str, float]] = None,
+    default_info_sample_rate: float = 1.0
 ) -> None:
     """
     Set up structured logging for the application with enhanced features
@@ -56,7 +203,12 @@ def setup_logging(
         backup_count: Number of backup files to keep
         json_format: Use JSON format for structured logging
         include_trace_id: Include trace ID in log messages
+        queue_size: Capacity of the log queue; records are dropped when full.
+            0 disables the queue and handlers write synchronously
+        info_sample_rates: Per-route-prefix sampling rates for INFO records
+        default_info_sample_rate: INFO sampling rate for routes not listed
     """
+    global _queue_handler, _queue_listener, _sampling_filter, _sampler
     
     # Default format with better structure
     if format_string is None:
@@ -69,8 +221,10 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear existing handlers
+    # Clear existing handlers and stop a previous listener
+    shutdown_logging()
     root_logger.handlers.clear()
+    handlers = []
     
     # Create formatter
     if json_format:
@@ -103,7 +257,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Set up comprehensive logging to docs/logs directory
     log_dir = Path("docs/logs")
@@ -118,7 +272,7 @@ def setup_logging(
     )
     main_handler.setFormatter(logging.Formatter(format_string))
     main_handler.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(main_handler)
+    handlers.append(main_handler)
 
     # Performance metrics log
     performance_log_path = log_dir / "performance.log"
@@ -130,7 +284,7 @@ def setup_logging(
     performance_handler.setFormatter(logging.Formatter(format_string))
     performance_handler.setLevel(logging.INFO)
     performance_handler.addFilter(PerformanceFilter())
-    root_logger.addHandler(performance_handler)
+    handlers.append(performance_handler)
 
     # Cache statistics log
     cache_log_path = log_dir / "cache.log"
@@ -142,7 +296,7 @@ def setup_logging(
     cache_handler.setFormatter(logging.Formatter(format_string))
     cache_handler.setLevel(logging.INFO)
     cache_handler.addFilter(CacheFilter())
-    root_logger.addHandler(cache_handler)
+    handlers.append(cache_handler)
 
     # Error log
     error_log_path = log_dir / "errors.log"
@@ -153,7 +307,7 @@ def setup_logging(
     )
     error_handler.setFormatter(logging.Formatter(format_string))
     error_handler.setLevel(logging.WARNING)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
 
     # Structured JSON log
     json_log_path = log_dir / "structured.jsonl"
@@ -164,7 +318,7 @@ def setup_logging(
     )
     json_handler.setFormatter(JSONFormatter())
     json_handler.setLevel(logging.INFO)
-    root_logger.addHandler(json_handler)
+    handlers.append(json_handler)
 
     # Custom file handler (if file path provided)
     if file_path:
@@ -181,8 +335,26 @@ def setup_logging(
         )
         file_handler.setFormatter(file_formatter)
         file_handler.setLevel(getattr(logging, level.upper()))
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
+    # Hand records to a listener thread so request threads never block on I/O
+    _sampler = LoggingSampler(info_sample_rates, default_info_sample_rate)
+    _sampling_filter = InfoSamplingFilter()
+    if queue_size > 0:
+        _queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size))
+        _queue_handler.addFilter(_sampling_filter)
+        root_logger.addHandler(_queue_handler)
+        _queue_listener = logging.handlers.QueueListener(
+            _queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        _queue_handler = None
+        for handler in handlers:
+            handler.addFilter(_sampling_filter)
+            root_logger.addHandler(handler)
+
     # Set specific logger levels for external libraries
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -214,8 +386,10 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
-        # Add color to level name
+        # Add color to level name on a copy; the record is shared with file handlers
         if record.levelname in self.COLORS:
+            import copy
+            record = copy.copy(record)
             record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
         
         return super().format(record)
@@ -247,10 +421,11 @@ class JSONFormatter(logging.Formatter):
             if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
                           'filename', 'module', 'lineno', 'funcName', 'created', 
                           'msecs', 'relativeCreated', 'thread', 'threadName', 
-                          'processName', 'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info']:
+                          'processName', 'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info',
+                          'always_log', 'taskName', 'message']:
                 log_entry[key] = value
         
-        return json.dumps(log_entry)
+        return json.dumps(log_entry, default=str)
 
 class RequestLogger:
     """Enhanced context manager for request-specific logging with metrics"""
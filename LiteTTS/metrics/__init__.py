@@ -1,9 +1,15 @@
 # Metrics package for Kokoro TTS
 
 from .performance_logger import PerformanceLogger, PerformanceMetrics, performance_logger
+from .tracing import Span, Tracer, configure_tracing, get_tracer, trace_span
 
 __all__ = [
     'PerformanceLogger',
     'PerformanceMetrics', 
-    'performance_logger'
+    'performance_logger',
+    'Span',
+    'Tracer',
+    'configure_tracing',
+    'get_tracer',
+    'trace_span'
 ]
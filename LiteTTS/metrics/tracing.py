@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Per-request stage tracing
+
+Records spans for the stages of a request (admission, cache lookup, text
+processing, phonemization, inference, post-processing, encoding, first byte)
+and exports them as OpenTelemetry-compatible OTLP/JSON, either to a local
+JSON-lines file or to an OTLP/HTTP collector. Spans are batched and written
+on a background thread so tracing stays off the request path.
+
+Usage:
+    tracer = get_tracer()
+    root = tracer.start_trace("POST /v1/audio/speech", request_id=request_id)
+    with trace_span("cache.lookup", voice=voice_name):
+        ...
+    tracer.end_span(root)
+"""
+
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Wakes the export thread to check its flush deadline
+_TICK = object()
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("litetts_current_span", default=None)
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+@dataclass
+class Span:
+    """A timed operation within a trace"""
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: _new_id(8))
+    parent_span_id: Optional[str] = None
+    kind: int = SPAN_KIND_INTERNAL
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: int = STATUS_OK
+    status_message: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException):
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self, end_ns: Optional[int] = None):
+        if self.end_ns is None:
+            self.end_ns = end_ns if end_ns is not None else time.time_ns()
+
+    def traceparent(self) -> str:
+        """W3C traceparent header value pointing at this span"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns if self.end_ns is not None else self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items() if v is not None],
+            "status": {"code": self.status},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+def parse_traceparent(header: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a W3C traceparent header, None if absent or malformed"""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if not match:
+        return None
+    version, trace_id, span_id, flags = match.groups()
+    if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return {"trace_id": trace_id, "span_id": span_id, "sampled": bool(int(flags, 16) & 0x01)}
+
+def to_otlp_json(spans: List[Span], service_name: str = "litetts") -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest body for a batch of spans"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                _otlp_attribute("service.name", service_name),
+                _otlp_attribute("process.pid", os.getpid()),
+            ]},
+            "scopeSpans": [{
+                "scope": {"name": "LiteTTS.metrics.tracing"},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }]
+    }
+
+class SpanExporter(ABC):
+    """Receives finished spans in batches"""
+
+    @abstractmethod
+    def export(self, spans: List[Span], service_name: str):
+        """Send one batch of finished spans"""
+
+    def shutdown(self):
+        pass
+
+class FileSpanExporter(SpanExporter):
+    """Appends one OTLP/JSON export request per line to a local file"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: List[Span], service_name: str):
+        line = json.dumps(to_otlp_json(spans, service_name), separators=(",", ":"))
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """POSTs OTLP/JSON to a collector's /v1/traces endpoint"""
+
+    def __init__(self, endpoint: str, timeout: float = 2.0, headers: Optional[Dict[str, str]] = None):
+        if not endpoint.rstrip("/").endswith("/v1/traces"):
+            endpoint = endpoint.rstrip("/") + "/v1/traces"
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def export(self, spans: List[Span], service_name: str):
+        body = json.dumps(to_otlp_json(spans, service_name)).encode("utf-8")
+        request = urllib.request.Request(self.endpoint, data=body, headers=self.headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps exported spans in memory, for tests and debugging"""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span], service_name: str):
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+class Tracer:
+    """Creates spans for sampled requests and exports them in the background
+
+    The active span lives in a context variable, so spans opened in handlers,
+    threads started with ``asyncio.to_thread``/``run_in_threadpool`` and
+    library code nest under the request's root span without passing it around.
+    Outside a sampled request ``span()`` is a no-op.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None, sample_rate: float = 1.0,
+                 service_name: str = "litetts", enabled: bool = True, batch_size: int = 64,
+                 flush_interval: float = 2.0, max_queue_size: int = 2048):
+        self.exporters = list(exporters or [])
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self.enabled = enabled and bool(self.exporters)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.dropped_spans = 0
+        self.exported_spans = 0
+        self.export_errors = 0
+
+    def start_trace(self, name: str, request_id: Optional[str] = None,
+                    traceparent: Optional[str] = None, **attributes) -> Optional[Span]:
+        """
+        Open the root span of a request in the current context
+
+        An incoming traceparent joins the caller's trace and its sampled flag
+        wins over the local sample rate, so a request can be traced on demand.
+
+        Returns:
+            The root span, or None when the request is not sampled
+        """
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            sampled = parent["sampled"]
+        else:
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+        if not self.enabled or not sampled:
+            _current_span.set(None)
+            return None
+
+        span = Span(
+            name=name,
+            trace_id=parent["trace_id"] if parent else _new_id(16),
+            parent_span_id=parent["span_id"] if parent else None,
+            kind=SPAN_KIND_SERVER,
+        )
+        if request_id:
+            span.set_attribute("litetts.request_id", request_id)
+        span.set_attributes(**attributes)
+        _current_span.set(span)
+        return span
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """Child span of the current span for the duration of the block"""
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+
+        span = Span(name=name, trace_id=parent.trace_id, parent_span_id=parent.span_id,
+                    attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def record_span(self, name: str, start_ns: int, end_ns: Optional[int] = None,
+                    parent: Optional[Span] = None, **attributes) -> Optional[Span]:
+        """Record an already finished operation as a child span"""
+        parent = parent or _current_span.get()
+        if parent is None:
+            return None
+        span = Span(name=name, trace_id=parent.trace_id, parent_span_id=parent.span_id,
+                    start_ns=start_ns, attributes=attributes)
+        self.end_span(span, end_ns)
+        return span
+
+    def end_span(self, span: Optional[Span], end_ns: Optional[int] = None):
+        """Finish a span and queue it for export"""
+        if span is None:
+            return
+        span.end(end_ns)
+        if _current_span.get() is span:
+            # A finished root span must not parent later work in this context
+            _current_span.set(None)
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped_spans += 1
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="litetts-span-exporter", daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = _TICK
+
+            if item is None:
+                self._export(batch)
+                return
+            if isinstance(item, threading.Event):
+                self._export(batch)
+                batch = []
+                item.set()
+            elif item is not _TICK:
+                batch.append(item)
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._export(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _export(self, batch: List[Span]):
+        if not batch:
+            return
+        for exporter in self.exporters:
+            try:
+                exporter.export(batch, self.service_name)
+            except Exception as e:
+                self.export_errors += 1
+                logger.debug(f"Span export to {type(exporter).__name__} failed: {e}")
+        self.exported_spans += len(batch)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Export everything queued so far, waiting up to timeout seconds"""
+        if self._worker is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done, timeout=timeout)
+        return done.wait(timeout)
+
+    def shutdown(self):
+        """Export pending spans and stop the export thread"""
+        worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout=5.0)
+            self._worker = None
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "exporters": [type(exporter).__name__ for exporter in self.exporters],
+            "queued_spans": self._queue.qsize(),
+            "exported_spans": self.exported_spans,
+            "dropped_spans": self.dropped_spans,
+            "export_errors": self.export_errors,
+        }
+
+_tracer: Optional[Tracer] = None
+
+def configure_tracing(tracing_config=None) -> Tracer:
+    """Build the global tracer from a TracingConfig (or the loaded config)"""
+    global _tracer
+    if tracing_config is None:
+        from ..config import config
+        tracing_config = config.tracing
+
+    exporters: List[SpanExporter] = []
+    if tracing_config.enabled:
+        if tracing_config.export_path:
+            exporters.append(FileSpanExporter(tracing_config.export_path))
+        if tracing_config.otlp_endpoint:
+            exporters.append(OTLPHttpSpanExporter(tracing_config.otlp_endpoint))
+
+    if _tracer is not None:
+        _tracer.shutdown()
+    _tracer = Tracer(
+        exporters=exporters,
+        sample_rate=tracing_config.sample_rate,
+        service_name=tracing_config.service_name,
+        enabled=tracing_config.enabled,
+        batch_size=tracing_config.batch_size,
+        flush_interval=tracing_config.flush_interval,
+        max_queue_size=tracing_config.max_queue_size,
+    )
+    return _tracer
+
+def get_tracer() -> Tracer:
+    """Get the global tracer, disabled until configure_tracing is called"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(enabled=False)
+    return _tracer
+
+def trace_span(name: str, **attributes):
+    """Child span of the current request, no-op when it is not traced"""
+    return get_tracer().span(name, **attributes)
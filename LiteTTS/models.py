@@ -23,6 +23,11 @@ class TTSConfiguration:
     cache_size: int = 1000
     max_text_length: int = 1000
     default_voice: str = "af_heart"
+    use_io_binding: bool = True
+    io_binding_retry_seconds: float = 60.0  # session.run fallback period after an IOBinding failure
+    emotion_style_cache_size: int = 64  # On-demand emotion styles; preloaded voices get room on top
+    blend_cache_size: int = 32
+    blend_pack_dir: Optional[str] = None
 
 # Voice and Audio Models
 @dataclass
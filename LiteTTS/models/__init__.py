@@ -18,10 +18,29 @@ Available modules:
 
 from .manager import ModelManager, ModelInfo, DownloadProgress
 
-# Import TTS models from the parent models.py file
+# Import TTS models from the parent models.py file. It is loaded by path because
+# with LiteTTS/ on sys.path a plain "import models" resolves to this package
+# itself, which only worked when something else had imported models.py first.
+import importlib.util
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def _load_models_module():
+    module = sys.modules.get("models")
+    if module is not None and hasattr(module, "TTSRequest"):
+        return module
+    spec = importlib.util.spec_from_file_location("models", Path(__file__).parent.parent / "models.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["models"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop("models", None)
+        raise
+    return module
+
+_load_models_module()
 from models import TTSRequest, TTSResponse, TTSConfiguration, AudioSegment, VoiceEmbedding, validate_tts_request, generate_cache_key, TTSError, VoiceNotFoundError, ModelLoadError, AudioGenerationError
 
 __all__ = [
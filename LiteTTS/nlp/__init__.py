@@ -1,32 +1,43 @@
 # NLP processing package
+#
+# Processors are imported on first access so that disabled features (emotion
+# detection, context adaptation, naturalness enhancement) cost nothing at startup
 
-from .processor import NLPProcessor
-from .text_normalizer import TextNormalizer
-from .homograph_resolver import HomographResolver
-from .phonetic_processor import PhoneticProcessor
-from .spell_processor import SpellProcessor
-from .prosody_analyzer import ProsodyAnalyzer
-from .emotion_detector import EmotionDetector, EmotionProfile, EmotionCategory
-from .context_adapter import ContextAdapter, SpeechContext, SpeechRegister, ContentType, AudienceType
-from .naturalness_enhancer import NaturalnessEnhancer, NaturalnessProfile, DisfluencyType, BreathType
+_LAZY_EXPORTS = {
+    'NLPProcessor': '.processor',
+    'TextNormalizer': '.text_normalizer',
+    'HomographResolver': '.homograph_resolver',
+    'PhoneticProcessor': '.phonetic_processor',
+    'SpellProcessor': '.spell_processor',
+    'ProsodyAnalyzer': '.prosody_analyzer',
+    'EmotionDetector': '.emotion_detector',
+    'EmotionProfile': '.emotion_detector',
+    'EmotionCategory': '.emotion_detector',
+    'ContextAdapter': '.context_adapter',
+    'SpeechContext': '.context_adapter',
+    'SpeechRegister': '.context_adapter',
+    'ContentType': '.context_adapter',
+    'AudienceType': '.context_adapter',
+    'NaturalnessEnhancer': '.naturalness_enhancer',
+    'NaturalnessProfile': '.naturalness_enhancer',
+    'DisfluencyType': '.naturalness_enhancer',
+    'BreathType': '.naturalness_enhancer',
+    'NLPProcessPool': '.frontend_pool',
+    'FrontEndProcessor': '.frontend_pool',
+    'FrontEndResult': '.frontend_pool',
+}
 
-__all__ = [
-    'NLPProcessor',
-    'TextNormalizer',
-    'HomographResolver',
-    'PhoneticProcessor',
-    'SpellProcessor',
-    'ProsodyAnalyzer',
-    'EmotionDetector',
-    'EmotionProfile',
-    'EmotionCategory',
-    'ContextAdapter',
-    'SpeechContext',
-    'SpeechRegister',
-    'ContentType',
-    'AudienceType',
-    'NaturalnessEnhancer',
-    'NaturalnessProfile',
-    'DisfluencyType',
-    'BreathType'
-]
\ No newline at end of file
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+__all__ = list(_LAZY_EXPORTS)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Process-pool NLP front-end
+
+Text normalization (phonemizer preprocessing, UnifiedTextProcessor with its
+currency, date/time, homograph and pronunciation processors) is pure-Python
+regex work that holds the GIL for its whole run. NLPProcessPool moves it to
+worker processes so front-end throughput scales with cores independently of
+inference threads.
+
+Each worker builds its processors once (in the pool initializer) and keeps
+them warm. Results come back through a SharedMemory block split into fixed
+slots instead of pickled objects: the worker writes the processed text as
+UTF-8 followed by the token ids as int32 and only two integers travel over
+the pipe. A result that does not fit its slot is returned pickled and
+counted as an overflow.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from ..utils.worker_processes import init_worker_process, worker_context
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_DTYPE = np.dtype(np.int32)
+
+class FrontEndProcessor:
+    """
+    The API's first-attempt text processing for a request
+
+    Conservative phonemizer preprocessing (word count preserved) followed,
+    when options are given, by UnifiedTextProcessor with those options. With
+    a vocabulary (``char_to_id`` and ``unk_token_id``, as in the model's
+    tokenizer.json) ``encode`` also maps the processed text to token ids.
+    """
+
+    def __init__(self, options: Any = None, vocabulary: Optional[Dict[str, Any]] = None):
+        from ..text.phonemizer_preprocessor import phonemizer_preprocessor
+
+        self.preprocessor = phonemizer_preprocessor
+        self.options = options
+        self.processor = None
+        if options is not None:
+            from .unified_text_processor import UnifiedTextProcessor
+            self.processor = UnifiedTextProcessor()
+
+        self.tokenizer = None
+        if vocabulary:
+            from ..tts.tokenizer import CodepointTokenizer
+            self.tokenizer = CodepointTokenizer(vocabulary["char_to_id"], vocabulary.get("unk_token_id", 0))
+
+    def __call__(self, text: str) -> str:
+        processed = self.preprocessor.preprocess_text(text, aggressive=False, preserve_word_count=True).processed_text
+        if self.processor is not None:
+            try:
+                processed = self.processor.process_text(processed, self.options).processed_text
+            except Exception as e:
+                logger.warning(f"Advanced text processing failed, using preprocessed text: {e}")
+        return processed
+
+    def encode(self, text: str) -> Optional[np.ndarray]:
+        """Token ids for already processed text, None without a vocabulary"""
+        if self.tokenizer is None:
+            return None
+        return self.tokenizer.encode(text)
+
+@dataclass
+class FrontEndResult:
+    """Processed text and, when the pool has a vocabulary, its int64 token ids"""
+    text: str
+    token_ids: Optional[np.ndarray] = None
+
+class ResultArena:
+    """
+    Fixed-size result slots in one SharedMemory block
+
+    A slot holds the UTF-8 text at offset 0 and the int32 token ids at the
+    next aligned offset. The parent hands out slot indices, so a worker only
+    ever writes the slot of the task it is running.
+    """
+
+    def __init__(self, slots: int, slot_bytes: int, name: Optional[str] = None):
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=slots * slot_bytes)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @staticmethod
+    def _token_offset(text_bytes: int) -> int:
+        return -(-text_bytes // _TOKEN_DTYPE.itemsize) * _TOKEN_DTYPE.itemsize
+
+    def write(self, slot: int, encoded_text: bytes, token_ids: Optional[np.ndarray]) -> Optional[Tuple[int, int]]:
+        """Write a result into slot; returns (text bytes, token count), or None when it does not fit"""
+        token_count = -1 if token_ids is None else len(token_ids)
+        token_offset = self._token_offset(len(encoded_text))
+        if token_offset + max(token_count, 0) * _TOKEN_DTYPE.itemsize > self.slot_bytes:
+            return None
+
+        start = slot * self.slot_bytes
+        self.memory.buf[start:start + len(encoded_text)] = encoded_text
+        if token_count > 0:
+            view = np.ndarray(token_count, dtype=_TOKEN_DTYPE, buffer=self.memory.buf, offset=start + token_offset)
+            view[:] = token_ids
+            del view  # Release the export so the block can be closed
+        return len(encoded_text), token_count
+
+    def read(self, slot: int, text_bytes: int, token_count: int) -> FrontEndResult:
+        """Copy a result out of slot, after which the slot can be reused"""
+        start = slot * self.slot_bytes
+        text = bytes(self.memory.buf[start:start + text_bytes]).decode("utf-8")
+        token_ids = None
+        if token_count >= 0:
+            view = np.ndarray(token_count, dtype=_TOKEN_DTYPE, buffer=self.memory.buf,
+                              offset=start + self._token_offset(text_bytes))
+            token_ids = view.astype(np.int64)
+            del view
+        return FrontEndResult(text, token_ids)
+
+    def close(self):
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+# Per-process worker state, set up once by the pool initializer
+_worker_processor: Optional[FrontEndProcessor] = None
+_worker_arena: Optional[ResultArena] = None
+
+def _init_worker(arena_name: str, slots: int, slot_bytes: int, options: Any, vocabulary: Optional[Dict[str, Any]]):
+    global _worker_processor, _worker_arena
+    init_worker_process()
+    _worker_arena = ResultArena(slots, slot_bytes, name=arena_name)
+    _worker_processor = FrontEndProcessor(options, vocabulary)
+    # Run every processor once so lazily built regexes and tables are ready
+    _worker_processor.encode(_worker_processor("Warm up on Jan. 5th for $5."))
+
+def _process_in_worker(slot: int, text: str):
+    processed = _worker_processor(text)
+    token_ids = _worker_processor.encode(processed)
+    encoded = processed.encode("utf-8")
+    written = _worker_arena.write(slot, encoded, token_ids)
+    if written is None:
+        return "overflow", processed, token_ids
+    return written
+
+def _warm_in_worker(_: int) -> bool:
+    return _worker_processor is not None
+
+def default_worker_count() -> int:
+    """One worker per core, leaving a core for the event loop and inference dispatch"""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+class NLPProcessPool:
+    """
+    Text normalization (and optional tokenization) in warm worker processes
+
+    ``submit`` returns a ``concurrent.futures.Future`` of a FrontEndResult
+    (``asyncio.wrap_future`` it from a coroutine); ``process`` waits for it.
+    At most ``slots`` requests are in flight; ``submit`` waits up to timeout
+    for a free slot and raises TimeoutError otherwise.
+    """
+
+    def __init__(self, workers: int = 0, options: Any = None, vocabulary: Optional[Dict[str, Any]] = None,
+                 slots: int = 0, slot_bytes: int = 64 * 1024):
+        self.workers = workers if workers > 0 else default_worker_count()
+        slots = slots if slots > 0 else 2 * self.workers
+        self.arena = ResultArena(slots, slot_bytes)
+        self._free_slots: "queue.Queue[int]" = queue.Queue()
+        for slot in range(slots):
+            self._free_slots.put(slot)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=worker_context(), initializer=_init_worker,
+            initargs=(self.arena.name, slots, slot_bytes, options, vocabulary)
+        )
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._overflows = 0
+        self._busy_seconds = 0.0
+
+    def warm(self, timeout: Optional[float] = None):
+        """Start the workers and build their processors now rather than on the first requests"""
+        list(self._executor.map(_warm_in_worker, range(self.workers), timeout=timeout))
+
+    def submit(self, text: str, timeout: Optional[float] = None) -> Future:
+        if self._closed:
+            raise RuntimeError("NLP process pool is shut down")
+        try:
+            slot = self._free_slots.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free NLP result slot within {timeout}s") from None
+
+        started = time.perf_counter()
+        result: Future = Future()
+        try:
+            task = self._executor.submit(_process_in_worker, slot, text)
+        except Exception:
+            self._free_slots.put(slot)
+            raise
+        with self._lock:
+            self._submitted += 1
+        # A caller that gives up (asyncio.wait_for timing out) cancels the result; drop the work if not started
+        result.add_done_callback(lambda done: task.cancel() if done.cancelled() else None)
+        task.add_done_callback(lambda done: self._collect(done, slot, started, result))
+        return result
+
+    def process(self, text: str, timeout: Optional[float] = None) -> FrontEndResult:
+        return self.submit(text, timeout).result(timeout)
+
+    def _collect(self, task: Future, slot: int, started: float, result: Future):
+        try:
+            outcome = task.result()
+            if outcome[0] == "overflow":
+                value = FrontEndResult(outcome[1], None if outcome[2] is None else outcome[2].astype(np.int64))
+            else:
+                value = self.arena.read(slot, *outcome)
+        except BaseException as e:
+            self._free_slots.put(slot)
+            with self._lock:
+                self._failed += 1
+            if result.set_running_or_notify_cancel():
+                result.set_exception(e)
+            return
+
+        self._free_slots.put(slot)
+        with self._lock:
+            self._completed += 1
+            self._overflows += outcome[0] == "overflow"
+            self._busy_seconds += time.perf_counter() - started
+        # Nobody is waiting for a cancelled result
+        if result.set_running_or_notify_cancel():
+            result.set_result(value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "slots": self.arena.slots,
+                "slot_bytes": self.arena.slot_bytes,
+                "slots_in_use": self.arena.slots - self._free_slots.qsize(),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "overflows": self._overflows,
+                "avg_latency_ms": self._busy_seconds / self._completed * 1000 if self._completed else 0.0,
+            }
+
+    def shutdown(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.arena.close()
+
+    def __enter__(self) -> "NLPProcessPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -12,16 +12,18 @@ from .phonetic_processor import PhoneticProcessor
 from .spell_processor import SpellProcessor
 from .prosody_analyzer import ProsodyAnalyzer
 from .advanced_abbreviation_handler import AdvancedAbbreviationHandler
-from .emotion_detector import EmotionDetector, EmotionProfile
-from .context_adapter import ContextAdapter, SpeechContext
-from .naturalness_enhancer import NaturalnessEnhancer, NaturalnessProfile
 from ..text.phonemizer_preprocessor import phonemizer_preprocessor
 from .unified_pronunciation_fix import unified_pronunciation_fix
 from .audio_quality_enhancer import audio_quality_enhancer, AudioQualityProfile
 from .interjection_processor import InterjectionProcessor
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from .emotion_detector import EmotionProfile
+    from .context_adapter import SpeechContext
+    from .naturalness_enhancer import NaturalnessProfile
+
 # Local model definitions for NLP processing
 @dataclass
 class ProsodyInfo:
@@ -61,6 +63,10 @@ class NLPProcessor:
         # Advanced human-likeness features
         self.enable_advanced_features = enable_advanced_features
         if enable_advanced_features:
+            # Imported here so the advanced features cost nothing when disabled
+            from .emotion_detector import EmotionDetector
+            from .context_adapter import ContextAdapter
+            from .naturalness_enhancer import NaturalnessEnhancer
             self.emotion_detector = EmotionDetector()
             self.context_adapter = ContextAdapter()
             self.naturalness_enhancer = NaturalnessEnhancer()
@@ -220,7 +226,7 @@ class NLPProcessor:
             "naturalness_profile": naturalness_profile
         }
 
-    def detect_emotion(self, text: str, conversation_history: Optional[List] = None) -> Optional[EmotionProfile]:
+    def detect_emotion(self, text: str, conversation_history: Optional[List] = None) -> Optional['EmotionProfile']:
         """Detect emotional context in text
 
         Args:
@@ -235,7 +241,7 @@ class NLPProcessor:
 
         return self.emotion_detector.detect_emotional_context(text, conversation_history)
 
-    def adapt_for_context(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[SpeechContext]:
+    def adapt_for_context(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Optional['SpeechContext']:
         """Analyze and adapt for speech context
 
         Args:
@@ -250,7 +256,7 @@ class NLPProcessor:
 
         return self.context_adapter.analyze_context(text, metadata)
 
-    def enhance_naturalness(self, text: str, context: Optional[Dict[str, Any]] = None) -> Optional[NaturalnessProfile]:
+    def enhance_naturalness(self, text: str, context: Optional[Dict[str, Any]] = None) -> Optional['NaturalnessProfile']:
         """Apply naturalness enhancements to text
 
         Args:
@@ -6,10 +6,12 @@ Integrates all enhanced text processors for comprehensive TTS text processing
 
 import logging
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ..metrics.tracing import trace_span
+
 # Import existing processors
 from .text_normalizer import TextNormalizer
 from .clean_text_normalizer import CleanTextNormalizer
@@ -17,9 +19,6 @@ from .homograph_resolver import HomographResolver
 from .phonetic_processor import PhoneticProcessor
 from .spell_processor import SpellProcessor
 from .prosody_analyzer import ProsodyAnalyzer
-from .emotion_detector import EmotionDetector
-from .context_adapter import ContextAdapter
-from .naturalness_enhancer import NaturalnessEnhancer
 
 # Import our enhanced processors
 from .advanced_currency_processor import AdvancedCurrencyProcessor, FinancialContext
@@ -214,6 +213,10 @@ class UnifiedTextProcessor:
         self.prosody_analyzer = ProsodyAnalyzer()
         
         if self.enable_advanced_features:
+            # Imported here so the advanced features cost nothing when disabled
+            from .emotion_detector import EmotionDetector
+            from .context_adapter import ContextAdapter
+            from .naturalness_enhancer import NaturalnessEnhancer
             self.emotion_detector = EmotionDetector()
             self.context_adapter = ContextAdapter()
             self.naturalness_enhancer = NaturalnessEnhancer()
@@ -292,14 +295,18 @@ class UnifiedTextProcessor:
         
         try:
             # Route to appropriate processing pipeline
-            if options.mode == ProcessingMode.BASIC:
-                text = self._process_basic(text, options, result)
-            elif options.mode == ProcessingMode.STANDARD:
-                text = self._process_standard(text, options, result)
-            elif options.mode == ProcessingMode.ENHANCED:
-                text = self._process_enhanced(text, options, result)
-            elif options.mode == ProcessingMode.PREMIUM:
-                text = self._process_premium(text, options, result)
+            with trace_span("nlp", mode=options.mode.value, text_length=len(text)) as nlp_span:
+                if options.mode == ProcessingMode.BASIC:
+                    text = self._process_basic(text, options, result)
+                elif options.mode == ProcessingMode.STANDARD:
+                    text = self._process_standard(text, options, result)
+                elif options.mode == ProcessingMode.ENHANCED:
+                    text = self._process_enhanced(text, options, result)
+                elif options.mode == ProcessingMode.PREMIUM:
+                    text = self._process_premium(text, options, result)
+                if nlp_span is not None:
+                    nlp_span.set_attributes(**{f"stage_ms.{stage}": round(seconds * 1000, 3)
+                                               for stage, seconds in result.stage_timings.items()})
             
             result.processed_text = text
             result.processing_time = time.perf_counter() - start_time
@@ -320,6 +327,11 @@ class UnifiedTextProcessor:
             
             return result
     
+    def _traced(self, stage: str, processor: Callable, *args, **kwargs):
+        """Run one processor under a trace span named after its stage"""
+        with trace_span(f"nlp.{stage}"):
+            return processor(*args, **kwargs)
+
     def _process_basic(self, text: str, options: ProcessingOptions, result: ProcessingResult) -> str:
         """Basic processing pipeline"""
         stage_start = time.perf_counter()
@@ -339,7 +351,8 @@ class UnifiedTextProcessor:
         stage_start = time.perf_counter()
         
         # Phonemizer preprocessing
-        preprocessing_result = phonemizer_preprocessor.preprocess_text(text, preserve_word_count=True)
+        preprocessing_result = self._traced("phonemizer_preprocessing", phonemizer_preprocessor.preprocess_text,
+                                            text, preserve_word_count=True)
         text = preprocessing_result.processed_text
         if preprocessing_result.changes_made:
             result.changes_made.extend(preprocessing_result.changes_made)
@@ -347,7 +360,7 @@ class UnifiedTextProcessor:
         
         # Core processing steps
         if options.handle_spell_functions:
-            text = self.spell_processor.handle_spell_functions(text)
+            text = self._traced("spell_processing", self.spell_processor.handle_spell_functions, text)
             result.stages_completed.append("spell_processing")
         
         if options.process_phonetics:
@@ -355,7 +368,7 @@ class UnifiedTextProcessor:
             beta_features = self.config.get("beta_features", {})
             phonetic_config = beta_features.get("phonetic_processing", {})
             if phonetic_config.get("enabled", False):
-                text = self.phonetic_processor.process_phonetics(text)
+                text = self._traced("phonetic_processing", self.phonetic_processor.process_phonetics, text)
                 result.stages_completed.append("phonetic_processing")
                 logger.debug("Applied beta phonetic processing")
             else:
@@ -363,16 +376,16 @@ class UnifiedTextProcessor:
                 result.stages_completed.append("phonetic_processing_skipped")
         
         if options.resolve_homographs:
-            text = self.homograph_resolver.resolve_homographs(text)
+            text = self._traced("homograph_resolution", self.homograph_resolver.resolve_homographs, text)
             result.stages_completed.append("homograph_resolution")
         
         if options.normalize_text:
-            text = self.text_normalizer.normalize_text(text)
+            text = self._traced("text_normalization", self.text_normalizer.normalize_text, text)
             result.stages_completed.append("text_normalization")
         
         # Prosody processing
-        text = self.prosody_analyzer.process_conversational_features(text)
-        text = self.prosody_analyzer.enhance_intonation_markers(text)
+        text = self._traced("prosody_analysis", self.prosody_analyzer.process_conversational_features, text)
+        text = self._traced("prosody_intonation", self.prosody_analyzer.enhance_intonation_markers, text)
         result.stages_completed.append("prosody_analysis")
         
         result.stage_timings["standard"] = time.perf_counter() - stage_start
@@ -394,7 +407,7 @@ class UnifiedTextProcessor:
             self.phase6_processor and self._is_section_enabled("text_processing")):
             phase6_start = time.perf_counter()
             original_text = text
-            phase6_result = self.phase6_processor.process_text(text)
+            phase6_result = self._traced("phase6_processing", self.phase6_processor.process_text, text)
             text = phase6_result.processed_text
             result.phase6_result = phase6_result
             result.phase6_enhancements = phase6_result.total_changes
@@ -417,7 +430,7 @@ class UnifiedTextProcessor:
         if (hasattr(options, 'use_pronunciation_rules') and options.use_pronunciation_rules and
             self._is_feature_enabled("text_processing", "pronunciation_fixes")):
             original_text = text
-            text = self.pronunciation_rules_processor.process_pronunciation_rules(text)
+            text = self._traced("pronunciation_rules", self.pronunciation_rules_processor.process_pronunciation_rules, text)
             if text != original_text:
                 result.changes_made.append("Applied natural pronunciation rules")
                 result.stages_completed.append("pronunciation_rules")
@@ -427,7 +440,8 @@ class UnifiedTextProcessor:
         if (hasattr(options, 'use_phonetic_contractions') and options.use_phonetic_contractions and
             self._is_feature_enabled("text_processing", "expand_contractions")):
             original_text = text
-            text = self.phonetic_contraction_processor.process_contractions(text, mode="phonetic_expansion")
+            text = self._traced("phonetic_contractions", self.phonetic_contraction_processor.process_contractions,
+                                text, mode="phonetic_expansion")
             if text != original_text:
                 result.changes_made.append("Applied legacy contraction expansion")
                 result.stages_completed.append("phonetic_contractions")
@@ -437,7 +451,7 @@ class UnifiedTextProcessor:
         if (hasattr(options, 'use_interjection_fixes') and options.use_interjection_fixes and
             self._is_section_enabled("interjection_handling")):
             original_text = text
-            text = self.interjection_processor.fix_interjection_pronunciation(text)
+            text = self._traced("interjection_fixes", self.interjection_processor.fix_interjection_pronunciation, text)
             if text != original_text:
                 result.changes_made.append("Applied interjection pronunciation fixes")
                 result.stages_completed.append("interjection_fixes")
@@ -447,7 +461,7 @@ class UnifiedTextProcessor:
         if (hasattr(options, 'use_ticker_symbol_processing') and options.use_ticker_symbol_processing and
             self._is_section_enabled("pronunciation_dictionary")):
             original_text = text
-            ticker_result = self.ticker_symbol_processor.process_ticker_symbols(text)
+            ticker_result = self._traced("ticker_symbols", self.ticker_symbol_processor.process_ticker_symbols, text)
             text = ticker_result.processed_text
             if text != original_text:
                 result.changes_made.append(f"Applied ticker symbol processing: {', '.join(ticker_result.tickers_found)}")
@@ -458,7 +472,8 @@ class UnifiedTextProcessor:
         if (hasattr(options, 'use_proper_name_pronunciation') and options.use_proper_name_pronunciation and
             self._is_section_enabled("pronunciation_dictionary")):
             original_text = text
-            text = self.proper_name_processor.process_proper_name_pronunciation(text)
+            text = self._traced("proper_name_pronunciation",
+                                self.proper_name_processor.process_proper_name_pronunciation, text)
             if text != original_text:
                 result.changes_made.append("Applied proper name pronunciation fixes")
                 result.stages_completed.append("proper_name_pronunciation")
@@ -466,7 +481,8 @@ class UnifiedTextProcessor:
 
         # Phonemizer preprocessing (second step) - only if text processing enabled
         if self._is_section_enabled("text_processing"):
-            preprocessing_result = phonemizer_preprocessor.preprocess_text(text, preserve_word_count=True)
+            preprocessing_result = self._traced("phonemizer_preprocessing", phonemizer_preprocessor.preprocess_text,
+                                            text, preserve_word_count=True)
             text = preprocessing_result.processed_text
             if preprocessing_result.changes_made:
                 result.changes_made.extend(preprocessing_result.changes_made)
@@ -478,7 +494,7 @@ class UnifiedTextProcessor:
         if options.use_advanced_currency and self._is_section_enabled("symbol_processing"):
             original_text = text
             financial_context = options.financial_context or FinancialContext()
-            text = self.currency_processor.process_currency_text(text, financial_context)
+            text = self._traced("advanced_currency", self.currency_processor.process_currency_text, text, financial_context)
             if text != original_text:
                 result.currency_enhancements += 1
                 result.changes_made.append("Applied advanced currency processing")
@@ -487,7 +503,7 @@ class UnifiedTextProcessor:
         # Enhanced datetime processing (BEFORE standard normalization)
         if options.use_enhanced_datetime and self._is_section_enabled("text_processing"):
             original_text = text
-            text = self.datetime_processor.process_dates_and_times(text)
+            text = self._traced("enhanced_datetime", self.datetime_processor.process_dates_and_times, text)
             if text != original_text:
                 result.datetime_enhancements += 1
                 result.changes_made.append("Applied enhanced datetime processing")
@@ -496,7 +512,7 @@ class UnifiedTextProcessor:
         # Advanced symbol processing (BEFORE standard normalization)
         if options.use_advanced_symbols and self._is_section_enabled("symbol_processing"):
             original_text = text
-            text = self.symbol_processor.process_symbols(text)
+            text = self._traced("advanced_symbols", self.symbol_processor.process_symbols, text)
             if text != original_text:
                 result.changes_made.append("Applied advanced symbol processing")
                 result.stages_completed.append("advanced_symbols")
@@ -508,7 +524,7 @@ class UnifiedTextProcessor:
             espeak_config = self.config.get("symbol_processing", {}).get("espeak_enhanced_processing", {})
             if espeak_config.get("enabled", False):
                 original_text = text
-                espeak_result = self.espeak_symbol_processor.process_symbols(text)
+                espeak_result = self._traced("espeak_enhanced_symbols", self.espeak_symbol_processor.process_symbols, text)
                 text = espeak_result.processed_text
                 if text != original_text:
                     result.changes_made.append(f"Applied eSpeak-enhanced symbol processing: {', '.join(espeak_result.changes_made[:3])}")
@@ -519,7 +535,7 @@ class UnifiedTextProcessor:
 
         # Core processing steps (AFTER enhanced processors)
         if options.handle_spell_functions:
-            text = self.spell_processor.handle_spell_functions(text)
+            text = self._traced("spell_processing", self.spell_processor.handle_spell_functions, text)
             result.stages_completed.append("spell_processing")
 
         if options.process_phonetics:
@@ -527,7 +543,7 @@ class UnifiedTextProcessor:
             beta_features = self.config.get("beta_features", {})
             phonetic_config = beta_features.get("phonetic_processing", {})
             if phonetic_config.get("enabled", False):
-                text = self.phonetic_processor.process_phonetics(text)
+                text = self._traced("phonetic_processing", self.phonetic_processor.process_phonetics, text)
                 result.stages_completed.append("phonetic_processing")
                 logger.debug("Applied beta phonetic processing")
             else:
@@ -535,18 +551,18 @@ class UnifiedTextProcessor:
                 result.stages_completed.append("phonetic_processing_skipped")
 
         if options.resolve_homographs:
-            text = self.homograph_resolver.resolve_homographs(text)
+            text = self._traced("homograph_resolution", self.homograph_resolver.resolve_homographs, text)
             result.stages_completed.append("homograph_resolution")
 
         # Standard text normalization (AFTER enhanced processors)
         if options.normalize_text:
-            text = self.text_normalizer.normalize_text(text)
+            text = self._traced("text_normalization", self.text_normalizer.normalize_text, text)
             result.stages_completed.append("text_normalization")
 
         # Prosody processing - only if punctuation handling is enabled
         if self._is_section_enabled("punctuation_handling"):
-            text = self.prosody_analyzer.process_conversational_features(text)
-            text = self.prosody_analyzer.enhance_intonation_markers(text)
+            text = self._traced("prosody_analysis", self.prosody_analyzer.process_conversational_features, text)
+            text = self._traced("prosody_intonation", self.prosody_analyzer.enhance_intonation_markers, text)
             result.stages_completed.append("prosody_analysis")
         else:
             logger.debug("Prosody processing disabled - punctuation_handling section disabled")
@@ -554,7 +570,7 @@ class UnifiedTextProcessor:
 
         # Clean normalization (additional fixes)
         if options.use_clean_normalizer:
-            clean_result = self.clean_normalizer.normalize_text(text)
+            clean_result = self._traced("clean_normalization", self.clean_normalizer.normalize_text, text)
             if clean_result.changes_made:
                 text = clean_result.processed_text
                 result.changes_made.extend(clean_result.changes_made)
@@ -574,7 +590,8 @@ class UnifiedTextProcessor:
         if options.apply_voice_modulation and self.voice_modulation:
             try:
                 original_text = text
-                modulation_result, segments = self.voice_modulation.process_voice_modulation(text)
+                modulation_result, segments = self._traced("voice_modulation",
+                                                            self.voice_modulation.process_voice_modulation, text)
                 if modulation_result != original_text:
                     text = modulation_result
                     result.audio_enhancements += 1
@@ -588,7 +605,7 @@ class UnifiedTextProcessor:
         if options.enhance_audio_quality:
             try:
                 original_text = text
-                enhanced_text = audio_quality_enhancer.enhance_audio_quality(text)
+                enhanced_text = self._traced("audio_quality_enhancement", audio_quality_enhancer.enhance_audio_quality, text)
                 if enhanced_text != original_text:
                     text = enhanced_text
                     result.audio_enhancements += 1
@@ -602,7 +619,8 @@ class UnifiedTextProcessor:
         if options.use_dynamic_emotion and self.dynamic_emotion:
             try:
                 original_text = text
-                processed_text, intonation_markers = self.dynamic_emotion.process_emotion_intonation(text)
+                processed_text, intonation_markers = self._traced("dynamic_emotion_processing",
+                                                                   self.dynamic_emotion.process_emotion_intonation, text)
                 if processed_text != original_text:
                     text = processed_text
                     result.audio_enhancements += 1
@@ -6,8 +6,17 @@ Patches for kokoro_onnx library to fix tensor rank issues
 import numpy as np
 import logging
 
+from .metrics.tracing import trace_span
+
 logger = logging.getLogger(__name__)
 
+def _kokoro_providers():
+    """Execution providers kokoro_onnx would pick for its own session"""
+    import os
+
+    env_provider = os.getenv("ONNX_PROVIDER")
+    return [env_provider] if env_provider else ["CPUExecutionProvider"]
+
 def patch_kokoro_onnx():
     """Apply patches to kokoro_onnx library to fix tensor rank issues and optimize performance"""
     try:
@@ -110,9 +119,15 @@ def patch_kokoro_onnx():
                     session_options.inter_op_num_threads = min(3, cpu_count // 2)
                     session_options.intra_op_num_threads = min(6, cpu_count - 1)
 
-            # Enable memory pattern optimization
-            session_options.enable_mem_pattern = True
-            session_options.enable_cpu_mem_arena = True
+            # Arena and memory-pattern policy for variable-length inputs
+            from LiteTTS.config import config
+            memory_config = config.onnx_memory
+            if memory_config.enabled:
+                from LiteTTS.performance.onnx_memory import configure_session_options
+                configure_session_options(session_options, memory_config)
+            else:
+                session_options.enable_mem_pattern = True
+                session_options.enable_cpu_mem_arena = True
 
             # Disable memory growth for consistent performance
             session_options.enable_mem_reuse = True
@@ -120,8 +135,19 @@ def patch_kokoro_onnx():
             # Store session options for use in model loading
             self._session_options = session_options
 
-            # Call original init
-            original_init(self, model_path, voices_path)
+            if memory_config.enabled:
+                # kokoro_onnx's __init__ builds its session without options; build the
+                # only session here with ours and hand it over instead of loading twice
+                from LiteTTS.performance.onnx_memory import BucketedSession
+                session = BucketedSession(
+                    ort.InferenceSession(model_path, sess_options=session_options,
+                                         providers=_kokoro_providers()),
+                    memory_config.bucket_boundaries, memory_config.shrink_above_tokens
+                )
+                self.__dict__.update(kokoro_onnx.Kokoro.from_session(session, voices_path).__dict__)
+            else:
+                # Call original init
+                original_init(self, model_path, voices_path)
 
             # Perform model warm-up for optimal performance
             try:
@@ -202,7 +228,8 @@ def patch_kokoro_onnx():
                 }
 
             # Run inference with optimized session
-            audio = self.sess.run(None, inputs)[0]
+            with trace_span("inference", tokens=token_length, speed=float(speed)):
+                audio = self.sess.run(None, inputs)[0]
             
             # Ensure audio is properly flattened for quantized models
             if audio.ndim > 1:
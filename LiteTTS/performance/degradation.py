@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Memory-pressure-aware adaptive degradation
+
+The controller samples pressure signals (process RSS, ONNX Runtime arena
+size, queue depth), each as a fraction of its limit, and takes the highest
+fraction as the current pressure. Degradation levels are ordered and each
+has an entry threshold:
+
+    1 shrink_caches      shrink in-process caches and return freed heap to the OS
+    2 cap_lookahead      fewer streaming chunks synthesized ahead of playback
+    3 reduce_batch       fewer batch items in flight
+    4 small_model        serve from a smaller model variant
+    5 shed_low_priority  pause batch jobs and cache warming
+
+Rising pressure enters every level up to the highest threshold it crosses
+at once, applying each level's action in order. Recovery is gradual: a
+level is left only once pressure has stayed below its threshold minus the
+hysteresis for ``recovery_seconds``, one level at a time, reverting the
+actions in reverse order. Every transition is counted and kept in a short
+history for /metrics and /performance/degradation.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+import ctypes
+import gc
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+LEVEL_NAMES = ("normal", "shrink_caches", "cap_lookahead", "reduce_batch", "small_model", "shed_low_priority")
+
+@dataclass
+class DegradationLevel:
+    """One degradation step: entered at ``threshold`` pressure"""
+    name: str
+    threshold: float
+    apply: Optional[Callable[[], None]] = None
+    revert: Optional[Callable[[], None]] = None
+
+@dataclass
+class PressureSignal:
+    """A sampled quantity and the value that counts as full pressure"""
+    name: str
+    read: Callable[[], Optional[float]]  # None when the value is currently unavailable
+    limit: float
+    value: Optional[float] = None
+
+    @property
+    def ratio(self) -> float:
+        if self.value is None or self.limit <= 0:
+            return 0.0
+        return self.value / self.limit
+
+class DegradationController:
+    """
+    Steps through degradation levels as pressure rises and falls
+
+    Args:
+        thresholds: Entry pressure of each level after "normal", in order
+        hysteresis: A level is left below its threshold minus this
+        recovery_seconds: Pressure must stay low this long before each step down
+        interval: Seconds between samples when running in the background
+    """
+
+    def __init__(self, thresholds: Sequence[float] = (0.70, 0.80, 0.85, 0.90, 0.95),
+                 hysteresis: float = 0.10, recovery_seconds: float = 30.0, interval: float = 1.0,
+                 names: Sequence[str] = LEVEL_NAMES[1:]):
+        if len(thresholds) != len(names):
+            raise ValueError(f"Expected {len(names)} thresholds, got {len(thresholds)}")
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError(f"Degradation thresholds must be increasing: {list(thresholds)}")
+        self.levels: List[DegradationLevel] = [DegradationLevel(LEVEL_NAMES[0], 0.0)]
+        self.levels += [DegradationLevel(name, threshold) for name, threshold in zip(names, thresholds)]
+        self.hysteresis = hysteresis
+        self.recovery_seconds = recovery_seconds
+        self.interval = interval
+
+        self.level = 0
+        self.pressure = 0.0
+        self.driver: Optional[str] = None  # Signal with the highest pressure
+        self.signals: Dict[str, PressureSignal] = {}
+        self.transitions: Dict[Tuple[str, str], int] = {}
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self.seconds_in_level: Dict[str, float] = {level.name: 0.0 for level in self.levels}
+        self._level_since = time.monotonic()
+        self._low_since: Optional[float] = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # Configuration
+
+    def add_signal(self, name: str, read: Callable[[], Optional[float]], limit: float):
+        with self._lock:
+            self.signals[name] = PressureSignal(name, read, float(limit))
+
+    def set_action(self, name: str, apply: Optional[Callable[[], None]] = None,
+                   revert: Optional[Callable[[], None]] = None):
+        """Attach what entering and leaving a level does"""
+        level = self._level(name)
+        level.apply, level.revert = apply, revert
+
+    def _level(self, name: str) -> DegradationLevel:
+        for level in self.levels:
+            if level.name == name:
+                return level
+        raise ValueError(f"Unknown degradation level '{name}'")
+
+    @property
+    def level_name(self) -> str:
+        return self.levels[self.level].name
+
+    def is_active(self, name: str) -> bool:
+        """Whether a level's degradation is currently applied"""
+        return self.level >= self.levels.index(self._level(name))
+
+    # Evaluation
+
+    def sample(self) -> float:
+        """Read every signal; pressure is the highest value-to-limit ratio"""
+        pressure, driver = 0.0, None
+        for signal in list(self.signals.values()):
+            try:
+                signal.value = signal.read()
+            except Exception as e:
+                logger.debug(f"Pressure signal {signal.name} failed: {e}")
+                signal.value = None
+            if signal.ratio > pressure:
+                pressure, driver = signal.ratio, signal.name
+        self.pressure, self.driver = pressure, driver
+        return pressure
+
+    def evaluate(self, pressure: Optional[float] = None, now: Optional[float] = None) -> int:
+        """Sample (unless pressure is given) and move to the level it calls for"""
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            if pressure is None:
+                pressure = self.sample()
+            else:
+                self.pressure = pressure
+
+            target = max(i for i, level in enumerate(self.levels) if pressure >= level.threshold)
+            if target > self.level:
+                self._low_since = None
+                for level in range(self.level + 1, target + 1):
+                    self._transition(level, now)
+            elif self.level > 0 and pressure < self.levels[self.level].threshold - self.hysteresis:
+                if self._low_since is None:
+                    self._low_since = now
+                elif now - self._low_since >= self.recovery_seconds:
+                    self._transition(self.level - 1, now)
+                    self._low_since = now  # Each further step waits a full period again
+            else:
+                self._low_since = None
+            return self.level
+
+    def _transition(self, level: int, now: float):
+        previous = self.levels[self.level]
+        current = self.levels[level]
+        escalating = level > self.level
+        action = current.apply if escalating else previous.revert
+        if action is not None:
+            try:
+                action()
+            except Exception as e:
+                changed = current if escalating else previous
+                logger.error(f"Degradation action failed {'entering' if escalating else 'leaving'} '{changed.name}': {e}")
+
+        self.seconds_in_level[previous.name] += now - self._level_since
+        self._level_since = now
+        key = (previous.name, current.name)
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        self.history.append({
+            "time": time.time(), "from": previous.name, "to": current.name,
+            "pressure": round(self.pressure, 4), "signal": self.driver,
+        })
+        if escalating:
+            logger.warning(f"🧯 Memory pressure {self.pressure:.0%} ({self.driver}): degrading to '{current.name}'")
+        else:
+            logger.info(f"🧯 Memory pressure {self.pressure:.0%}: recovered to '{current.name}'")
+        self.level = level
+
+    # Background sampling
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="degradation-controller", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.evaluate()
+            except Exception as e:
+                logger.warning(f"Degradation controller check failed: {e}")
+
+    def stop(self, restore: bool = True):
+        """Stop sampling; with restore, revert every applied level"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5.0)
+            self._thread = None
+        if restore:
+            with self._lock:
+                while self.level > 0:
+                    self._transition(self.level - 1, time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_level = dict(self.seconds_in_level)
+            in_level[self.level_name] += time.monotonic() - self._level_since
+            return {
+                "level": self.level,
+                "level_name": self.level_name,
+                "pressure": round(self.pressure, 4),
+                "driver": self.driver,
+                "signals": {
+                    name: {"value": signal.value, "limit": signal.limit, "ratio": round(signal.ratio, 4)}
+                    for name, signal in self.signals.items()
+                },
+                "levels": [{"name": level.name, "threshold": level.threshold} for level in self.levels],
+                "transitions": [
+                    {"from": source, "to": target, "count": count}
+                    for (source, target), count in sorted(self.transitions.items())
+                ],
+                "seconds_in_level": {name: round(seconds, 3) for name, seconds in in_level.items()},
+                "history": list(self.history),
+            }
+
+def process_rss_bytes() -> float:
+    import psutil
+    return float(psutil.Process().memory_info().rss)
+
+def default_memory_limit_bytes(workers: int = 1) -> int:
+    """
+    Memory one worker may use: the container's cgroup limit when there is
+    one (that is what the OOM killer enforces), otherwise physical memory,
+    shared between the server's workers
+    """
+    limit = None
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:  # "max" or a huge sentinel means unlimited
+            limit = int(value)
+        break
+    if limit is None:
+        import psutil
+        limit = psutil.virtual_memory().total
+    return limit // max(1, workers)
+
+def release_free_memory() -> int:
+    """Collect garbage and hand freed heap pages back to the OS (glibc only)"""
+    collected = gc.collect()
+    if sys.platform.startswith("linux"):
+        try:
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
+    return collected
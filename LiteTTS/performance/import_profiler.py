@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Startup import-time profiler
+
+Runs an import statement in a fresh interpreter with ``-X importtime`` and
+reports which modules dominate startup, so lazy-loading regressions show up
+before they reach worker respawns and new replicas. The child runs with
+``LITETTS_IMPORT_ONLY=1``, so ``import app`` stops short of building the
+application and loading the model.
+
+Usage:
+    python -m LiteTTS.performance.import_profiler [--target "import app"] [--top 25] [--json]
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+IMPORT_ONLY_ENV = "LITETTS_IMPORT_ONLY"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+@dataclass
+class ImportTiming:
+    """Timing for a single imported module"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+@dataclass
+class ImportProfile:
+    """Result of profiling one import statement"""
+    target: str
+    wall_time_s: float
+    timings: List[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_us(self) -> int:
+        """Cumulative import time of all top-level imports"""
+        return sum(t.cumulative_us for t in self.timings if t.depth == 0)
+
+    def cumulative_us(self, module: str) -> int:
+        """Cumulative import time for a module, 0 if it was not imported"""
+        for timing in self.timings:
+            if timing.module == module:
+                return timing.cumulative_us
+        return 0
+
+    def imported(self, module: str) -> bool:
+        return any(t.module == module for t in self.timings)
+
+    def slowest(self, top: int = 25) -> List[ImportTiming]:
+        """Modules with the highest self time"""
+        return sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:top]
+
+    def by_package(self) -> Dict[str, int]:
+        """Self time summed per top-level package"""
+        totals: Dict[str, int] = {}
+        for timing in self.timings:
+            package = timing.module.split(".")[0]
+            totals[package] = totals.get(package, 0) + timing.self_us
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr output"""
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(ImportTiming(
+            module=module,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=max(len(indent) - 1, 0) // 2
+        ))
+    return timings
+
+def profile_imports(target: str = "import app", python: Optional[str] = None,
+                    cwd: Optional[str] = None, timeout: float = 300.0) -> ImportProfile:
+    """
+    Profile an import statement in a fresh interpreter
+
+    Args:
+        target: Python statement to run, e.g. "import LiteTTS"
+        python: Interpreter to use (defaults to the current one)
+        cwd: Working directory (defaults to the project root)
+        timeout: Seconds before the child is killed
+
+    Returns:
+        ImportProfile with per-module timings
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    env[IMPORT_ONLY_ENV] = "1"
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", target],
+        cwd=cwd or str(PROJECT_ROOT), env=env,
+        capture_output=True, text=True, timeout=timeout
+    )
+    wall_time = time.perf_counter() - start
+
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-5:])
+        raise RuntimeError(f"Profiling '{target}' failed with exit code {result.returncode}:\n{tail}")
+
+    return ImportProfile(target=target, wall_time_s=wall_time, timings=parse_importtime(result.stderr))
+
+def format_report(profile: ImportProfile, top: int = 25) -> str:
+    """Human-readable report of the slowest imports"""
+    lines = [
+        f"Import profile for: {profile.target}",
+        f"  Total import time: {profile.total_us / 1000:.1f} ms "
+        f"({len(profile.timings)} modules, process wall time {profile.wall_time_s:.2f}s)",
+        "",
+        f"  {'self ms':>9}  {'cumul ms':>9}  module",
+    ]
+    for timing in profile.slowest(top):
+        lines.append(f"  {timing.self_us / 1000:9.1f}  {timing.cumulative_us / 1000:9.1f}  {timing.module}")
+
+    lines.extend(["", "  Self time by top-level package:"])
+    for package, self_us in list(profile.by_package().items())[:top]:
+        lines.append(f"  {self_us / 1000:9.1f}  {package}")
+
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report per-module startup import time")
+    parser.add_argument("--target", default="import app", help='Statement to profile (default: "import app")')
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to list")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    profile = profile_imports(args.target)
+    if args.json:
+        print(json.dumps({
+            "target": profile.target,
+            "total_ms": profile.total_us / 1000,
+            "wall_time_s": profile.wall_time_s,
+            "slowest": [asdict(t) for t in profile.slowest(args.top)],
+            "by_package_ms": {k: v / 1000 for k, v in profile.by_package().items()},
+        }, indent=2))
+    else:
+        print(format_report(profile, args.top))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+ONNX Runtime arena and memory-pattern policy by input length
+
+ONNX Runtime's CPU arena keeps every chunk it has allocated, so a single
+pathological long request grows it to that request's peak and steady-state
+RSS never comes back down. Memory patterns are planned per exact input
+shape, and Kokoro's token counts vary freely, so they are rebuilt on almost
+every call instead of being reused.
+
+BucketedSession wraps an InferenceSession and routes each run by token
+count to a length bucket. Buckets up to ``shrink_above_tokens`` keep the
+arena warm for the common short requests; runs in longer buckets pass the
+``memory.enable_memory_arena_shrinkage`` run option, so the arena hands its
+unused chunks back as soon as the long request finishes. Inputs are never
+padded up to the bucket length: Kokoro predicts a duration for every token,
+so pad tokens would change the audio.
+
+configure_session_options applies the session-level part: memory patterns
+off unless configured, and the CPU arena registered process-wide with the
+configured extend strategy, so it grows by what is requested rather than
+doubling.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ARENA_EXTEND_STRATEGIES = {"next_power_of_two": 0, "same_as_requested": 1}
+SHRINK_RUN_OPTION = "memory.enable_memory_arena_shrinkage"
+
+_arena_lock = threading.Lock()
+_arena_registered: Optional[Dict[str, Any]] = None
+
+def register_cpu_arena(extend_strategy: str = "same_as_requested", initial_chunk_bytes: int = 0) -> bool:
+    """
+    Register the process-wide CPU arena sessions share
+
+    ONNX Runtime only exposes the CPU arena's extend strategy through an
+    environment allocator, and one can be registered per process; later
+    calls return whether the first one succeeded.
+    """
+    global _arena_registered
+    with _arena_lock:
+        if _arena_registered is not None:
+            return bool(_arena_registered)
+        try:
+            import onnxruntime as ort
+
+            arena_config = ort.OrtArenaCfg({
+                "max_mem": 0,
+                "arena_extend_strategy": ARENA_EXTEND_STRATEGIES[extend_strategy],
+                "initial_chunk_size_bytes": initial_chunk_bytes or -1,
+                "max_dead_bytes_per_chunk": -1,
+            })
+            memory_info = ort.OrtMemoryInfo("Cpu", ort.OrtAllocatorType.ORT_ARENA_ALLOCATOR, 0, ort.OrtMemType.DEFAULT)
+            ort.create_and_register_allocator(memory_info, arena_config)
+            _arena_registered = {"extend_strategy": extend_strategy, "initial_chunk_bytes": initial_chunk_bytes}
+            logger.info(f"Registered shared ONNX Runtime CPU arena ({extend_strategy})")
+        except Exception as e:
+            logger.warning(f"Could not register ONNX Runtime CPU arena, using per-session defaults: {e}")
+            _arena_registered = {}
+        return bool(_arena_registered)
+
+def arena_settings() -> Dict[str, Any]:
+    """The registered shared arena's settings, empty if there is none"""
+    return dict(_arena_registered or {})
+
+def configure_session_options(session_options: Any, memory_config: Any) -> Any:
+    """Apply the ONNX memory policy to SessionOptions before a session is created"""
+    session_options.enable_mem_pattern = memory_config.enable_mem_pattern
+    session_options.enable_cpu_mem_arena = True
+    if register_cpu_arena(memory_config.arena_extend_strategy, memory_config.initial_chunk_mb * 1024 * 1024):
+        session_options.add_session_config_entry("session.use_env_allocators", "1")
+    return session_options
+
+def _process_rss() -> int:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return 0
+
+def token_count(input_feed: Dict[str, Any]) -> int:
+    """Token count of a Kokoro input feed, used to pick its bucket"""
+    for name in ("input_ids", "tokens"):
+        value = input_feed.get(name)
+        if value is not None:
+            return int(value.shape[-1])
+    return 0
+
+@dataclass
+class BucketStats:
+    """Runs and memory growth of one input-length bucket"""
+    max_tokens: int
+    shrink: bool
+    runs: int = 0
+    longest: int = 0
+    seconds: float = 0.0
+    shrinks: int = 0
+    peak_growth_bytes: int = 0  # Largest RSS growth across a single run
+    retained_bytes: int = 0  # RSS growth kept since the arena was last shrunk
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_tokens": self.max_tokens,
+            "shrink": self.shrink,
+            "runs": self.runs,
+            "longest": self.longest,
+            "mean_ms": round(self.seconds / self.runs * 1000, 3) if self.runs else 0.0,
+            "shrinks": self.shrinks,
+            "peak_growth_bytes": self.peak_growth_bytes,
+            "retained_bytes": self.retained_bytes,
+        }
+
+class BucketedSession:
+    """
+    InferenceSession wrapper applying the arena policy of each run's length bucket
+
+    Both ``run`` and ``run_with_iobinding`` are bucketed. Attributes not
+    defined here (``get_inputs``, ``io_binding``, ...) are forwarded to the
+    wrapped session.
+
+    Args:
+        session: The InferenceSession to run
+        boundaries: Upper token count of each bucket; longer inputs use the last
+        shrink_above_tokens: Buckets whose bound exceeds this shrink the arena after each run
+    """
+
+    def __init__(self, session: Any, boundaries: Sequence[int] = (64, 128, 256, 512),
+                 shrink_above_tokens: int = 256):
+        self.session = session
+        self.buckets: List[BucketStats] = [
+            BucketStats(bound, bound > shrink_above_tokens) for bound in sorted(boundaries)
+        ]
+        self._shrink_options = None
+        if any(bucket.shrink for bucket in self.buckets):
+            import onnxruntime as ort
+
+            self._shrink_options = ort.RunOptions()
+            self._shrink_options.add_run_config_entry(SHRINK_RUN_OPTION, "cpu:0")
+        self._lock = threading.Lock()
+
+    def bucket_for(self, tokens: int) -> BucketStats:
+        for bucket in self.buckets:
+            if tokens <= bucket.max_tokens:
+                return bucket
+        return self.buckets[-1]
+
+    def run(self, output_names: Optional[List[str]], input_feed: Dict[str, Any], run_options: Any = None):
+        return self._run_in_bucket(token_count(input_feed), run_options,
+                                   lambda options: self.session.run(output_names, input_feed, options))
+
+    def run_with_iobinding(self, iobinding: Any, run_options: Any = None, tokens: int = 0):
+        """``InferenceSession.run_with_iobinding``; ``tokens`` routes it, as a binding has no feed to count"""
+        return self._run_in_bucket(tokens, run_options,
+                                   lambda options: self.session.run_with_iobinding(iobinding, options))
+
+    def _run_in_bucket(self, tokens: int, run_options: Any, run: Any):
+        bucket = self.bucket_for(tokens)
+        if bucket.shrink and run_options is None:
+            run_options = self._shrink_options
+
+        rss_before = _process_rss()
+        start = time.perf_counter()
+        outputs = run(run_options)
+        elapsed = time.perf_counter() - start
+        # Outputs are handed to the caller, not kept by the arena
+        growth = _process_rss() - rss_before - sum(getattr(output, "nbytes", 0) for output in outputs or ())
+        shrunk = self._shrink_options is not None and run_options is self._shrink_options
+        self._record(bucket, tokens, elapsed, growth, shrunk=shrunk)
+        return outputs
+
+    def _record(self, bucket: BucketStats, tokens: int, elapsed: float, growth: int, shrunk: bool):
+        growth = max(0, growth)
+        with self._lock:
+            bucket.runs += 1
+            bucket.longest = max(bucket.longest, tokens)
+            bucket.seconds += elapsed
+            bucket.peak_growth_bytes = max(bucket.peak_growth_bytes, growth)
+            if shrunk:
+                # Shrinkage releases every free chunk, whichever bucket grew it
+                for other in self.buckets:
+                    other.retained_bytes = 0
+                bucket.shrinks += 1
+            bucket.retained_bytes += growth
+
+    def arena_bytes(self) -> float:
+        """
+        Estimated arena memory held since the last shrink
+
+        ONNX Runtime does not report arena usage, so this is the RSS growth
+        measured across runs. Concurrent runs can count the same growth
+        twice; treat it as a pressure signal, not an exact size.
+        """
+        with self._lock:
+            return float(sum(bucket.retained_bytes for bucket in self.buckets))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "buckets": [bucket.to_dict() for bucket in self.buckets],
+                "arena_bytes": sum(bucket.retained_bytes for bucket in self.buckets),
+                "shared_arena": arena_settings(),
+            }
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing on the wrapper itself
+        if name == "session":
+            raise AttributeError(name)
+        return getattr(self.session, name)
@@ -8,11 +8,14 @@ This module provides systematic performance profiling tools including:
 - Custom timing decorators for TTS pipeline measurement
 - Real-Time Factor (RTF) calculation
 - Bottleneck identification and reporting
+- Always-on statistical sampling with folded-stack and speedscope output
 """
 
 import cProfile
 import pstats
 import io
+import os
+import sys
 import time
 import psutil
 import threading
@@ -23,7 +26,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import json
 from contextlib import contextmanager
-from collections import defaultdict
+from collections import defaultdict, deque
 import tracemalloc
 
 logger = logging.getLogger(__name__)
@@ -444,6 +447,286 @@ class PerformanceProfiler:
             }
         }
 
+# Leaf frames of threads blocked in a wait rather than running Python code
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("socket.py", "accept"),
+    ("connection.py", "_recv_bytes"),
+}
+
+_TRUNCATED_FRAME = ("[truncated]", "", 0)
+
+@dataclass
+class FoldedProfile:
+    """Aggregated stack samples, rendered as folded stacks or speedscope JSON"""
+    frames: List[Tuple[str, str, int]]  # (function, file, first line)
+    stacks: Dict[Tuple[str, Tuple[int, ...]], int]  # (thread name, root->leaf frame ids) -> samples
+    sample_interval: float
+    duration: float
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def _frame_label(self, frame_id: int) -> str:
+        function, filename, line = self.frames[frame_id]
+        return f"{function} ({filename}:{line})" if filename else function
+
+    def to_folded(self) -> str:
+        """Brendan Gregg folded format: ``thread;root;...;leaf count`` per line"""
+        lines = []
+        for (thread, stack), count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+            frames = [thread] + [self._frame_label(frame_id).replace(";", ",") for frame_id in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "LiteTTS") -> Dict[str, Any]:
+        """Speedscope file format, one sampled profile per thread"""
+        by_thread: Dict[str, List[Tuple[Tuple[int, ...], int]]] = defaultdict(list)
+        for (thread, stack), count in self.stacks.items():
+            by_thread[thread].append((stack, count))
+
+        profiles = []
+        for thread, stacks in sorted(by_thread.items()):
+            weights = [count * self.sample_interval for _, count in stacks]
+            profiles.append({
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [list(stack) for stack, _ in stacks],
+                "weights": weights,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "LiteTTS.performance.profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [
+                {"name": function, "file": filename, "line": line} if filename else {"name": function}
+                for function, filename, line in self.frames
+            ]},
+            "profiles": profiles,
+        }
+
+    def top_functions(self, top: int = 20) -> List[Dict[str, Any]]:
+        """Functions by self samples (leaf) and total samples (anywhere on stack)"""
+        self_counts: Dict[int, int] = defaultdict(int)
+        total_counts: Dict[int, int] = defaultdict(int)
+        for (_, stack), count in self.stacks.items():
+            if stack:
+                self_counts[stack[-1]] += count
+            for frame_id in set(stack):
+                total_counts[frame_id] += count
+
+        samples = self.total_samples or 1
+        ranked = sorted(total_counts, key=lambda frame_id: (self_counts[frame_id], total_counts[frame_id]),
+                        reverse=True)[:top]
+        return [{
+            "function": self._frame_label(frame_id),
+            "self_percent": 100.0 * self_counts[frame_id] / samples,
+            "total_percent": 100.0 * total_counts[frame_id] / samples,
+        } for frame_id in ranked]
+
+class SamplingProfiler:
+    """Low-overhead statistical profiler for live servers
+
+    A daemon thread samples every thread's Python stack through
+    ``sys._current_frames()`` at ``sample_hz`` and counts folded stacks in
+    one-second buckets. Memory stays bounded: only the last
+    ``window_seconds`` buckets are kept, each bucket holds at most
+    ``max_stacks`` distinct stacks (the rest are counted as truncated) and
+    stacks are cut at ``max_depth`` frames. Threads parked in a wait
+    (idle executor workers, the event loop's select) are skipped unless
+    ``include_idle`` is set.
+    """
+
+    def __init__(self, sample_hz: float = 49.0, window_seconds: int = 300, max_stacks: int = 2000,
+                 max_depth: int = 64, max_frames: int = 20000, include_idle: bool = False):
+        self.sample_hz = sample_hz
+        self.interval = 1.0 / sample_hz
+        self.window_seconds = window_seconds
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.max_frames = max_frames
+        self.include_idle = include_idle
+
+        self._frames: List[Tuple[str, str, int]] = [_TRUNCATED_FRAME]
+        self._frame_ids: Dict[Tuple[str, str, int], int] = {_TRUNCATED_FRAME: 0}
+        self._code_ids: Dict[Any, int] = {}
+        self._buckets: deque = deque(maxlen=window_seconds)  # (second, {stack: count})
+        self._lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._continuous = False
+        self._on_demand = 0
+        self.samples_taken = 0
+        self.sampling_time = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start sampling continuously until stop()"""
+        with self._lock:
+            self._continuous = True
+        self._ensure_thread()
+
+    def stop(self):
+        """Stop continuous sampling (on-demand captures keep it alive until they finish)"""
+        with self._lock:
+            self._continuous = False
+            keep_running = self._on_demand > 0
+        if not keep_running:
+            self._stop_thread()
+
+    def acquire(self):
+        """Keep the sampler running for an on-demand capture"""
+        with self._lock:
+            self._on_demand += 1
+        self._ensure_thread()
+
+    def release(self):
+        with self._lock:
+            self._on_demand = max(0, self._on_demand - 1)
+            keep_running = self._continuous or self._on_demand > 0
+        if not keep_running:
+            self._stop_thread()
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="litetts-sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def _stop_thread(self):
+        thread = self._thread
+        if thread is not None:
+            self._stop_event.set()
+            thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        next_sample = time.perf_counter()
+        while not self._stop_event.is_set():
+            start = time.perf_counter()
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Profiler sample failed: {e}")
+            self.sampling_time += time.perf_counter() - start
+
+            next_sample += self.interval
+            delay = next_sample - time.perf_counter()
+            if delay < 0:
+                # Fell behind (e.g. a long GIL hold), resume the cadence from now
+                next_sample = time.perf_counter()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def sample(self, now: Optional[float] = None):
+        """Record one sample of every thread's stack"""
+        frames = sys._current_frames()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own_ident = threading.get_ident()
+        second = int(now if now is not None else time.monotonic())
+
+        with self._lock:
+            if not self._buckets or self._buckets[-1][0] != second:
+                self._buckets.append((second, {}))
+            counts = self._buckets[-1][1]
+
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                stack = self._fold(frame)
+                if stack is None:
+                    continue
+                key = (thread_names.get(ident, f"thread-{ident}"), stack)
+                if key not in counts and len(counts) >= self.max_stacks:
+                    key = (key[0], (0,))
+                counts[key] = counts.get(key, 0) + 1
+            self.samples_taken += 1
+
+    def _fold(self, frame) -> Optional[Tuple[int, ...]]:
+        """Root-to-leaf frame ids for a stack, None for idle threads"""
+        if not self.include_idle:
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+                return None
+
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            stack.append(self._frame_id(frame.f_code))
+            frame = frame.f_back
+        if frame is not None:
+            stack.append(0)
+        stack.reverse()
+        return tuple(stack)
+
+    def _frame_id(self, code) -> int:
+        frame_id = self._code_ids.get(code)
+        if frame_id is not None:
+            return frame_id
+
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        frame_id = self._frame_ids.get(key)
+        if frame_id is None:
+            if len(self._frames) >= self.max_frames:
+                return 0
+            frame_id = len(self._frames)
+            self._frames.append(key)
+            self._frame_ids[key] = frame_id
+        if len(self._code_ids) < self.max_frames:
+            self._code_ids[code] = frame_id
+        return frame_id
+
+    def snapshot(self, seconds: Optional[float] = None) -> FoldedProfile:
+        """Merge the buckets covering the last ``seconds`` (default: whole window)"""
+        cutoff = int(time.monotonic() - seconds) if seconds is not None else None
+        merged: Dict[Tuple[str, Tuple[int, ...]], int] = defaultdict(int)
+        covered = 0
+        with self._lock:
+            for second, counts in self._buckets:
+                if cutoff is not None and second < cutoff:
+                    continue
+                covered += 1
+                for key, count in counts.items():
+                    merged[key] += count
+            frames = list(self._frames)
+
+        return FoldedProfile(frames=frames, stacks=dict(merged), sample_interval=self.interval,
+                             duration=float(seconds if seconds is not None else covered))
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = len(self._buckets)
+            stacks = sum(len(counts) for _, counts in self._buckets)
+        return {
+            "running": self.is_running,
+            "continuous": self._continuous,
+            "sample_hz": self.sample_hz,
+            "window_seconds": self.window_seconds,
+            "buckets": buckets,
+            "distinct_stacks": stacks,
+            "frames": len(self._frames),
+            "samples_taken": self.samples_taken,
+            "overhead_percent": 100.0 * self.sampling_time / max(self.samples_taken * self.interval, 1e-9),
+        }
+
 # Global profiler instance
 _profiler: Optional[PerformanceProfiler] = None
 
@@ -454,6 +737,27 @@ def get_profiler() -> PerformanceProfiler:
         _profiler = PerformanceProfiler()
     return _profiler
 
+_sampling_profiler: Optional[SamplingProfiler] = None
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Get the global sampling profiler, configured from the profiling settings"""
+    global _sampling_profiler
+    if _sampling_profiler is None:
+        try:
+            from ..config import config
+            settings = config.profiling
+            _sampling_profiler = SamplingProfiler(
+                sample_hz=settings.sample_hz,
+                window_seconds=settings.window_seconds,
+                max_stacks=settings.max_stacks,
+                max_depth=settings.max_depth,
+                include_idle=settings.include_idle
+            )
+        except Exception as e:
+            logger.debug(f"Using default sampling profiler settings: {e}")
+            _sampling_profiler = SamplingProfiler()
+    return _sampling_profiler
+
 def profile_tts_operation(operation_name: str):
     """Decorator for profiling TTS operations"""
     return get_profiler().profile_operation(operation_name)
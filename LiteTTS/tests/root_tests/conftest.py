@@ -58,6 +58,11 @@ def setup_test_environment():
     # Cleanup after test if needed
     pass
 
+@pytest.fixture(scope="session")
+def onnx_toolchain():
+    """Skip tests that build or run the synthetic ONNX model when onnx or onnxruntime is missing"""
+    return pytest.importorskip("onnx"), pytest.importorskip("onnxruntime")
+
 @pytest.fixture
 def mock_audio_data():
     """Generate mock audio data for testing"""
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the queued, sampled logging pipeline
+"""
+
+import contextvars
+import json
+import logging
+import queue
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS import logging_config
+from LiteTTS.logging_config import (
+    BoundedQueueHandler, InfoSamplingFilter, JSONFormatter, LoggingSampler,
+    annotate_request, begin_request_logging, get_logging_stats, log_request_summary,
+    setup_logging, shutdown_logging
+)
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestBoundedQueueHandler:
+    """Test non-blocking enqueue with drop counters"""
+
+    def test_drops_when_full(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+        for _ in range(5):
+            handler.handle(make_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == {"INFO": 3}
+        assert handler.total_dropped() == 3
+
+    def test_records_are_enqueued_unformatted(self):
+        handler = BoundedQueueHandler(queue.Queue())
+        handler.handle(make_record())
+        record = handler.queue.get_nowait()
+        assert record.msg == "hello %s"
+        assert record.args == ("world",)
+
+
+class TestSampling:
+    """Test per-route INFO sampling"""
+
+    def test_longest_prefix_wins(self):
+        sampler = LoggingSampler({"/v1": 0.5, "/v1/audio": 0.1}, default_rate=1.0)
+        assert sampler.rate_for("/v1/audio/speech") == 0.1
+        assert sampler.rate_for("/v1/voices") == 0.5
+        assert sampler.rate_for("/health") == 1.0
+
+    def test_unsampled_request_drops_info_but_keeps_warnings(self, monkeypatch):
+        monkeypatch.setattr(logging_config, "_sampler", LoggingSampler({"/health": 0.0}))
+        sampling_filter = InfoSamplingFilter()
+
+        def in_request():
+            begin_request_logging("/health")
+            return (
+                sampling_filter.filter(make_record(logging.INFO)),
+                sampling_filter.filter(make_record(logging.WARNING)),
+            )
+
+        info_passed, warning_passed = contextvars.copy_context().run(in_request)
+
+        assert not info_passed
+        assert warning_passed
+        assert sampling_filter.sampled_out == 1
+
+    def test_summary_survives_sampling(self, monkeypatch):
+        monkeypatch.setattr(logging_config, "_sampler", LoggingSampler(default_rate=0.0))
+        sampling_filter = InfoSamplingFilter()
+        captured = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                captured.append(record)
+
+        logger = logging.getLogger("test.summary")
+        logger.propagate = False
+        capture = Capture()
+        capture.addFilter(sampling_filter)
+        logger.addHandler(capture)
+        logger.setLevel(logging.INFO)
+
+        def in_request():
+            fields = begin_request_logging("/v1/audio/speech", method="POST")
+            logger.info("free text line")
+            annotate_request(voice="af_heart", rtf=0.2)
+            fields.update(status=200, duration=0.5)
+            log_request_summary(logger, fields)
+
+        try:
+            contextvars.copy_context().run(in_request)
+        finally:
+            logger.removeHandler(capture)
+
+        assert len(captured) == 1
+        entry = json.loads(JSONFormatter().format(captured[0]))
+        assert entry["event"] == "request_summary"
+        assert entry["request"]["voice"] == "af_heart"
+        assert entry["request"]["status"] == 200
+        assert entry["message"] == "POST /v1/audio/speech 200 0.500s"
+
+
+class TestSetupLogging:
+    """Test the queue/listener wiring"""
+
+    @pytest.fixture
+    def restore_root(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+        yield
+        shutdown_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        logging_config._queue_handler = None
+
+    def test_root_gets_single_queue_handler(self, restore_root, tmp_path):
+        setup_logging(level="INFO", queue_size=100)
+
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], BoundedQueueHandler)
+
+        logging.getLogger("test.setup").warning("written by listener")
+        shutdown_logging()
+
+        errors_log = tmp_path / "docs" / "logs" / "errors.log"
+        assert "written by listener" in errors_log.read_text()
+        assert get_logging_stats()["dropped_total"] == 0
+
+    def test_queue_can_be_disabled(self, restore_root):
+        setup_logging(level="INFO", queue_size=0)
+        root = logging.getLogger()
+        assert not any(isinstance(h, BoundedQueueHandler) for h in root.handlers)
+        assert get_logging_stats() == {"async": False}
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the fused audio post-processing kernel
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.audio.audio_segment import AudioSegment
+from LiteTTS.audio.postprocess import PostProcessSpec, plan_gains, process_audio, process_audio_inplace, resolve_backend
+from LiteTTS.audio.processor import AudioProcessor
+
+SAMPLE_RATE = 24000
+
+
+def make_audio(n_samples=SAMPLE_RATE * 3, scale=0.4, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(n_samples) * scale).astype(np.float32)
+
+
+def reference(audio, spec):
+    """Stage-by-stage reference written like the original multi-pass chain"""
+    audio = np.nan_to_num(audio.astype(np.float64), nan=0.0, posinf=1.0, neginf=-1.0)
+    audio = audio * spec.gain
+    if spec.gain_peak_limit is not None:
+        peak = np.max(np.abs(audio))
+        if peak > spec.gain_peak_limit:
+            audio = audio / peak * spec.gain_peak_limit
+    if spec.compress_threshold is not None:
+        above = np.abs(audio) > spec.compress_threshold
+        audio[above] = np.sign(audio[above]) * (
+            spec.compress_threshold + (np.abs(audio[above]) - spec.compress_threshold) / spec.compress_ratio)
+    if spec.peak_ceiling is not None:
+        peak = np.max(np.abs(audio))
+        if peak > spec.peak_ceiling:
+            audio = audio * (spec.peak_ceiling / peak)
+    if spec.clip is not None:
+        audio = np.clip(audio, -spec.clip, spec.clip)
+    if spec.fade_in:
+        audio[:spec.fade_in] *= np.linspace(0, 1, spec.fade_in)
+    if spec.fade_out:
+        audio[-spec.fade_out:] *= np.linspace(1, 0, spec.fade_out)
+    return audio.astype(np.float32)
+
+
+SPECS = [
+    PostProcessSpec(),
+    PostProcessSpec(gain=2.5, gain_peak_limit=1.0),
+    PostProcessSpec(gain=0.5),
+    PostProcessSpec(compress_threshold=0.7, compress_ratio=4.0, peak_ceiling=0.95),
+    PostProcessSpec(gain=1.5, gain_peak_limit=1.0, compress_threshold=0.7, peak_ceiling=0.95,
+                    fade_in=240, fade_out=240),
+    PostProcessSpec(gain=3.0, clip=0.8, fade_out=1),
+]
+
+AVAILABLE_BACKENDS = ["numpy"] + [b for b in ("numexpr", "numba") if resolve_backend(b) == b]
+
+
+class TestKernel:
+    """Test the fused kernel against the stage-by-stage reference"""
+
+    @pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+    @pytest.mark.parametrize("spec", SPECS)
+    def test_matches_reference(self, backend, spec):
+        # Spans more than one numpy block and ends with a partial one
+        audio = make_audio(n_samples=150_001)
+        expected = reference(audio, spec)
+
+        result = process_audio_inplace(audio, spec, backend)
+        assert result.backend == backend
+        np.testing.assert_allclose(audio, expected, atol=1e-6)
+
+    @pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+    def test_non_finite_samples_are_repaired(self, backend):
+        audio = make_audio(n_samples=1000)
+        audio[[3, 10, 500]] = [np.nan, np.inf, -np.inf]
+
+        result = process_audio_inplace(audio, PostProcessSpec(), backend)
+        assert result.non_finite
+        assert np.isfinite(audio).all()
+        assert audio[3] == 0.0
+        assert audio[10] == 1.0 and audio[500] == -1.0
+
+    def test_gains_come_from_the_input_peak(self):
+        spec = PostProcessSpec(gain=2.0, gain_peak_limit=1.0, compress_threshold=0.7,
+                               compress_ratio=4.0, peak_ceiling=0.75)
+        pre_gain, post_gain = plan_gains(0.8, spec)
+        assert pre_gain == pytest.approx(1.25)
+        # 1.0 compresses to 0.7 + 0.3 / 4 = 0.775, then scales to the 0.75 ceiling
+        assert post_gain == pytest.approx(0.75 / 0.775)
+
+    def test_noop_spec_leaves_audio_untouched(self):
+        audio = make_audio(scale=0.1)
+        original = audio.copy()
+        result = process_audio_inplace(audio, PostProcessSpec(compress_threshold=0.99), "numpy")
+        assert result.pre_gain == result.post_gain == 1.0
+        np.testing.assert_array_equal(audio, original)
+
+    def test_rejects_non_contiguous_input(self):
+        with pytest.raises(ValueError):
+            process_audio_inplace(make_audio()[::2], PostProcessSpec())
+        with pytest.raises(ValueError):
+            process_audio_inplace(make_audio().astype(np.float64), PostProcessSpec())
+
+    def test_copying_variant_keeps_input(self):
+        audio = make_audio()
+        original = audio.copy()
+        output, _ = process_audio(audio, PostProcessSpec(gain=0.5))
+        np.testing.assert_array_equal(audio, original)
+        np.testing.assert_allclose(output, original * 0.5)
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_backend("cuda")
+
+
+class TestCallers:
+    """Test AudioSegment and AudioProcessor on top of the kernel"""
+
+    def test_adjust_volume_prevents_clipping(self):
+        segment = AudioSegment(audio_data=make_audio(scale=0.3), sample_rate=SAMPLE_RATE)
+        louder = segment.adjust_volume(10.0)
+        assert np.max(np.abs(louder.audio_data)) == pytest.approx(1.0, abs=1e-6)
+        quieter = segment.adjust_volume(0.5)
+        np.testing.assert_allclose(quieter.audio_data, segment.audio_data * 0.5)
+
+    def test_fades_match_linspace(self):
+        audio = make_audio()
+        segment = AudioSegment(audio_data=audio.copy(), sample_rate=SAMPLE_RATE)
+        faded = segment.fade_in(0.01).fade_out(0.02)
+
+        expected = audio.copy()
+        expected[:240] *= np.linspace(0, 1, 240)
+        expected[-480:] *= np.linspace(1, 0, 480)
+        np.testing.assert_allclose(faded.audio_data, expected, atol=1e-7)
+        np.testing.assert_array_equal(segment.audio_data, audio)
+
+    def test_streaming_optimization_fuses_volume(self):
+        processor = AudioProcessor()
+        segment = AudioSegment(audio_data=make_audio(scale=0.5), sample_rate=SAMPLE_RATE)
+
+        fused = processor.optimize_for_streaming(segment, volume_multiplier=1.8)
+        chained = processor.optimize_for_streaming(segment.adjust_volume(1.8))
+
+        assert fused.metadata["optimized_for_streaming"]
+        np.testing.assert_allclose(fused.audio_data, chained.audio_data, atol=1e-6)
+        assert np.max(np.abs(fused.audio_data)) <= 0.95 + 1e-6
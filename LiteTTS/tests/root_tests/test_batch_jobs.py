@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Tests for offline batch synthesis jobs
+"""
+
+from pathlib import Path
+import io
+import json
+import sys
+import tarfile
+import threading
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.cache.shared import SharedAudioCache
+from LiteTTS.tts.batch_jobs import (
+    CANCELLED, COMPLETED, QUEUED, BatchJobManager, PriorityGate, make_synthesizer, parse_manifest
+)
+
+
+def manifest(*entries):
+    return "\n".join(json.dumps(entry) for entry in entries)
+
+
+class CountingSynthesizer:
+    """Tone per text, counting calls; optionally blocks until released"""
+
+    def __init__(self, block_after=None):
+        self.calls = []
+        self.block_after = block_after
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+
+    def __call__(self, text, voice, speed):
+        with self.lock:
+            self.calls.append((text, voice, speed))
+            count = len(self.calls)
+        if self.block_after is not None and count > self.block_after:
+            self.release.wait(10)
+        t = np.arange(int(24000 * 0.1 * len(text) / speed)) / 24000
+        return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32), 24000
+
+
+def wait_for(job, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestParseManifest:
+    """Test JSONL manifest parsing"""
+
+    def test_defaults_and_overrides(self):
+        items = parse_manifest(manifest(
+            {"input": "Hello."},
+            {"text": "Bye.", "voice": "am_puck", "speed": 1.5, "response_format": "WAV", "id": "bye"},
+        ) + "\n\n", voice="af_heart", response_format="mp3")
+        assert [(item.index, item.id, item.voice, item.speed, item.response_format) for item in items] == [
+            (0, "000000", "af_heart", 1.0, "mp3"),
+            (1, "bye", "am_puck", 1.5, "wav"),
+        ]
+        assert items[1].filename == "bye.wav"
+
+    @pytest.mark.parametrize("line, message", [
+        ('{"voice": "af_heart"}', "missing input"),
+        ('["Hello."]', "JSON object"),
+        ('{"input": "Hi.", "response_format": "aac"}', "unsupported response_format"),
+        ('{"input": "Hi.", "speed": 9}', "outside"),
+        ('{"input": "Hi.", "id": "../escape"}', "invalid id"),
+        ('{"input": "Hi.", "id": "000000"}', "duplicate id"),
+        ("not json", "Line 2"),
+    ])
+    def test_errors_name_the_line(self, line, message):
+        with pytest.raises(ValueError, match="Line 2") as error:
+            parse_manifest('{"input": "First."}\n' + line, voice="af_heart")
+        assert message in str(error.value)
+
+    def test_limits_and_voice_resolution(self):
+        with pytest.raises(ValueError, match="no items"):
+            parse_manifest("\n", voice="af_heart")
+        with pytest.raises(ValueError, match="more than 2"):
+            parse_manifest(manifest(*[{"input": "x"}] * 3), voice="af_heart", max_items=2)
+
+        resolved = []
+
+        def resolve(voice):
+            resolved.append(voice)
+            if voice == "nobody":
+                raise ValueError("Voice 'nobody' not available")
+            return voice.lower()
+
+        items = parse_manifest(manifest({"input": "a", "voice": "AF"}, {"input": "b", "voice": "AF"}),
+                               voice="af_heart", resolve_voice=resolve)
+        assert [item.voice for item in items] == ["af", "af"] and resolved == ["AF"]
+        with pytest.raises(ValueError, match="Line 1: Voice 'nobody'"):
+            parse_manifest(manifest({"input": "a", "voice": "nobody"}), voice="af_heart", resolve_voice=resolve)
+
+
+class TestBatchJobManager:
+    """Test rendering, deduplication, cancellation and resumption"""
+
+    def items(self):
+        return parse_manifest(manifest(
+            {"input": "One.", "id": "one"},
+            {"input": "Two two.", "id": "two", "response_format": "wav"},
+            {"input": "One.", "id": "one-again", "response_format": "flac"},
+            {"input": "One.", "id": "one-slow", "speed": 0.5},
+        ), voice="af_heart")
+
+    def test_renders_every_item_once_per_distinct_request(self, tmp_path):
+        synthesize = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path), synthesize, window=2)
+        job = wait_for(manager.submit(self.items()))
+        manager.shutdown()
+
+        assert job.status == COMPLETED and job.completed == 4 and job.failed == 0
+        assert sorted(synthesize.calls) == [("One.", "af_heart", 0.5), ("One.", "af_heart", 1.0),
+                                            ("Two two.", "af_heart", 1.0)]
+        status = job.to_dict()
+        assert status["deduplicated"] == 1 and status["synthesized"] == 3 and status["progress"] == 1.0
+
+        audio, sample_rate = sf.read(job.directory / "one-again.flac")
+        assert sample_rate == 24000 and len(audio) == 9600
+        assert len(sf.read(job.directory / "one-slow.mp3")[0]) > len(audio)
+        results = manager.results(job.job_id)
+        assert [entry["id"] for entry in results] == ["one", "two", "one-again", "one-slow"]
+        assert all(entry["status"] == "done" for entry in results)
+
+    def test_cached_audio_is_not_synthesized_again(self, tmp_path):
+        cache = SharedAudioCache(max_bytes=16 * 1024 * 1024, shared=False)
+        first = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path / "a"), first, cache=cache)
+        wait_for(manager.submit(self.items()))
+        manager.shutdown()
+
+        second = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path / "b"), second, cache=cache)
+        job = wait_for(manager.submit(self.items()))
+        manager.shutdown()
+        assert second.calls == []
+        assert job.cache_hits == 3 and job.completed == 4
+        # Interactive requests for the same text hit the PCM the batch stored
+        assert cache.get_audio("Two two.", "af_heart", 1.0, "wav")[:4] == b"RIFF"
+
+    def test_failed_items_are_recorded(self, tmp_path):
+        def synthesize(text, voice, speed):
+            if text == "Two two.":
+                raise RuntimeError("model exploded")
+            return CountingSynthesizer()(text, voice, speed)
+
+        manager = BatchJobManager(str(tmp_path), synthesize)
+        job = wait_for(manager.submit(self.items()))
+        manager.shutdown()
+        assert job.status == COMPLETED and job.completed == 3 and job.failed == 1
+        failed = [entry for entry in manager.results(job.job_id) if entry["status"] == "failed"]
+        assert failed == [{"index": 1, "id": "two", "status": "failed", "error": "model exploded"}]
+
+    def test_interrupted_job_resumes_where_it_stopped(self, tmp_path):
+        items = parse_manifest(manifest(*[{"input": f"Sentence {i}."} for i in range(8)]), voice="af_heart")
+        blocked = CountingSynthesizer(block_after=3)
+        manager = BatchJobManager(str(tmp_path), blocked, window=1)
+        job = manager.submit(items)
+        deadline = time.monotonic() + 10
+        while len(blocked.calls) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stopper = threading.Thread(target=manager.shutdown)
+        stopper.start()
+        blocked.release.set()
+        stopper.join(10)
+        assert job.status == QUEUED and job.completed == 4
+
+        resumed = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path), resumed)
+        assert [job.job_id for job in manager.recover()] == [job.job_id]
+        job = wait_for(manager.get(job.job_id))
+        manager.shutdown()
+        assert job.status == COMPLETED and job.completed == 8 and job.resumed
+        assert [call[0] for call in resumed.calls] == [f"Sentence {i}." for i in range(4, 8)]
+
+        # Finished jobs are listed after a restart but not run again
+        manager = BatchJobManager(str(tmp_path), resumed)
+        assert manager.recover() == []
+        assert manager.get(job.job_id).status == COMPLETED
+        manager.shutdown()
+
+    def test_cancel_and_delete(self, tmp_path):
+        synthesize = CountingSynthesizer(block_after=0)
+        manager = BatchJobManager(str(tmp_path), synthesize, window=1)
+        running = manager.submit(self.items())
+        queued = manager.submit(self.items())
+        deadline = time.monotonic() + 10
+        while not synthesize.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.cancel(queued.job_id) and queued.status == CANCELLED
+        assert manager.cancel(running.job_id)
+        synthesize.release.set()
+        assert wait_for(running).status == CANCELLED
+        assert running.completed < running.total
+
+        assert manager.delete(running.job_id)
+        assert not running.directory.exists() and manager.get(running.job_id) is None
+        assert not manager.cancel(queued.job_id)
+        manager.shutdown()
+        assert len(synthesize.calls) == 1
+
+    def test_archive_streams_outputs_and_results(self, tmp_path):
+        manager = BatchJobManager(str(tmp_path), CountingSynthesizer())
+        job = wait_for(manager.submit(self.items()))
+        archive = b"".join(manager.iter_archive(job.job_id))
+        manager.shutdown()
+
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            names = tar.getnames()
+            results = tar.extractfile("results.jsonl").read().decode().splitlines()
+        assert names == ["one.mp3", "two.wav", "one-again.flac", "one-slow.mp3", "results.jsonl"]
+        assert len(results) == 4
+
+    def test_window_can_shrink_while_running(self, tmp_path):
+        synthesize = CountingSynthesizer(block_after=0)
+        manager = BatchJobManager(str(tmp_path), synthesize, window=3)
+        job = manager.submit(parse_manifest(manifest(*[{"input": f"Item {i}."} for i in range(6)]), voice="af_heart"))
+        deadline = time.monotonic() + 10
+        while len(synthesize.calls) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        manager.set_window(1)
+        synthesize.release.set()
+        assert wait_for(job).status == COMPLETED
+        assert manager.stats()["window"] == 1 and manager.stats()["in_flight"] == 0
+        manager.shutdown()
+
+    def test_shedding_pauses_batch_work(self, tmp_path):
+        gate = PriorityGate()
+        gate.set_shedding(True)
+        synthesize = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path), synthesize, gate=gate)
+        job = manager.submit(self.items())
+        time.sleep(0.3)
+        assert synthesize.calls == [] and manager.stats()["shedding"]
+        gate.set_shedding(False)
+        assert wait_for(job).status == COMPLETED
+        manager.shutdown()
+
+    def test_batch_items_wait_for_interactive_requests(self, tmp_path):
+        gate = PriorityGate()
+        synthesize = CountingSynthesizer()
+        manager = BatchJobManager(str(tmp_path), synthesize, gate=gate)
+        with gate.interactive():
+            job = manager.submit(self.items())
+            time.sleep(0.3)
+            assert synthesize.calls == [] and job.completed == 0
+        assert wait_for(job).status == COMPLETED
+        manager.shutdown()
+
+
+def test_pipelined_batch_items_are_background_work_without_encoding():
+    from types import SimpleNamespace
+
+    runs = []
+
+    def run(job, background=False):
+        runs.append((job.response_format, background))
+        return SimpleNamespace(audio=np.zeros(240, dtype=np.float32), sample_rate=24000)
+
+    synthesize = make_synthesizer(object(), pipeline=SimpleNamespace(run=run))
+    audio, sample_rate = synthesize("Hello.", "af_heart", 1.0)
+    assert len(audio) == 240 and sample_rate == 24000
+    assert runs == [(None, True)]
+
+
+def test_batch_through_the_synthetic_model(tmp_path, onnx_toolchain):
+    from LiteTTS.benchmarks.synthetic_model import SyntheticKokoro, SyntheticModelSpec, create_synthetic_assets
+    from LiteTTS.tts.backend import OnnxBackend
+
+    spec = SyntheticModelSpec(hidden=16, depth=1, samples_per_token=300)
+    model_path, voices_dir = create_synthetic_assets(str(tmp_path / "model"), spec)
+    model = SyntheticKokoro(str(model_path), str(voices_dir))
+    backend = OnnxBackend(model, sample_rate=model.sample_rate)
+
+    manager = BatchJobManager(str(tmp_path / "batch"), make_synthesizer(backend))
+    items = parse_manifest(manifest({"input": "Dr. Smith paid $5."}, {"input": "Hello there."}), voice="af_heart")
+    job = wait_for(manager.submit(items), timeout=60)
+    manager.shutdown()
+    assert job.status == COMPLETED and job.completed == 2, manager.results(job.job_id)
+
+
+def test_batch_jobs_config():
+    from LiteTTS.config import config
+
+    assert config.batch_jobs.window >= 1
+    assert config.to_dict()["batch_jobs"]["output_dir"] == config.batch_jobs.output_dir
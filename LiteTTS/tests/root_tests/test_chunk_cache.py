@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the byte-budgeted, cross-worker chunk cache
+"""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from LiteTTS.cache.cache_utils import CacheKeyGenerator
+from LiteTTS.cache.manager import EnhancedCacheManager
+from LiteTTS.audio.progressive_generator import (
+    ProgressiveAudioGenerator, ProgressiveGenerationConfig, GenerationMode
+)
+
+
+class CountingEngine:
+    """Stand-in engine that counts synthesis calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, text, voice, response_format, speed):
+        self.calls += 1
+        return text.encode("utf-8") * 10
+
+
+class TestByteBudgetLRU:
+    """Test memory tier eviction"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = EnhancedCacheManager(cache_dir=None, max_memory_size=300)
+        cache.put("a", b"a" * 100)
+        cache.put("b", b"b" * 100)
+        cache.put("c", b"c" * 100)
+
+        # Touch "a" so "b" becomes least recently used
+        assert cache.get("a") == b"a" * 100
+        cache.put("d", b"d" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.memory_size == 300
+
+    def test_replacing_entry_does_not_double_count(self):
+        cache = EnhancedCacheManager(cache_dir=None, max_memory_size=1000)
+        cache.put("a", b"x" * 400)
+        cache.put("a", b"y" * 200)
+        assert cache.memory_size == 200
+
+    def test_oversized_entry_is_rejected(self):
+        cache = EnhancedCacheManager(cache_dir=None, max_memory_size=100)
+        cache.put("small", b"s" * 50)
+        assert cache.put("huge", b"h" * 500) is False
+        assert cache.get("small") == b"s" * 50
+
+
+class TestSharedDiskTier:
+    """Test that separate cache instances share entries through cache_dir"""
+
+    def test_entry_written_by_other_instance_is_found(self, tmp_path):
+        writer = EnhancedCacheManager(cache_dir=str(tmp_path), max_memory_size=1024)
+        reader = EnhancedCacheManager(cache_dir=str(tmp_path), max_memory_size=1024)
+
+        writer.put("shared-key", b"audio-bytes")
+
+        assert reader.get("shared-key") == b"audio-bytes"
+        assert reader.get_stats()["performance"]["disk_hits"] == 1
+
+    def test_disk_tier_evicts_least_recently_accessed(self, tmp_path):
+        cache = EnhancedCacheManager(cache_dir=str(tmp_path), max_memory_size=1024, max_disk_size=300)
+        cache.put("a", b"a" * 100)
+        cache.put("b", b"b" * 100)
+        cache.put("c", b"c" * 100)
+
+        # Read "a" so "b" becomes least recently accessed, though "a" is older
+        assert cache.get("a") == b"a" * 100
+        cache.put("d", b"d" * 100)
+
+        assert sorted(cache.disk_cache_index) == ["a", "c", "d"]
+        assert not cache._disk_path("b").exists()
+
+    def test_workers_merge_into_one_index_and_budget(self, tmp_path):
+        first = EnhancedCacheManager(cache_dir=str(tmp_path), max_memory_size=1024, max_disk_size=300)
+        second = EnhancedCacheManager(cache_dir=str(tmp_path), max_memory_size=1024, max_disk_size=300)
+        first.put("a", b"a" * 100)
+        second.put("b", b"b" * 100)
+        first.put("c", b"c" * 100)
+
+        # Neither worker's write dropped the other's entries from the shared index
+        assert sorted(EnhancedCacheManager(cache_dir=str(tmp_path))._read_index_file()) == ["a", "b", "c"]
+
+        second.put("d", b"d" * 100)
+        index = EnhancedCacheManager(cache_dir=str(tmp_path))._read_index_file()
+        assert sorted(index) == ["b", "c", "d"]
+        assert sum(entry["size_bytes"] for entry in index.values()) <= 300
+        assert not first._disk_path("a").exists()
+
+    def test_key_is_stable_across_processes(self):
+        code = (
+            "from LiteTTS.cache.cache_utils import CacheKeyGenerator;"
+            "print(CacheKeyGenerator.generate_audio_cache_key("
+            "'Hello there', 'af_heart', 1.0, 'mp3', model_id='model_q4.onnx'))"
+        )
+        keys = {
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=project_root,
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+            for _ in range(2)
+        }
+        expected = CacheKeyGenerator.generate_audio_cache_key(
+            "Hello there", "af_heart", 1.0, "mp3", model_id="model_q4.onnx"
+        )
+        assert keys == {expected}
+
+    def test_model_id_separates_keys(self):
+        base = CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "wav")
+        q4 = CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "wav", model_id="q4")
+        fp16 = CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "wav", model_id="fp16")
+        assert len({base, q4, fp16}) == 3
+
+
+class TestProgressiveChunkCache:
+    """Test chunk reuse inside the progressive generator"""
+
+    def test_relative_chunk_cache_dir_is_under_the_cache_root(self, tmp_path):
+        from types import SimpleNamespace
+        from LiteTTS.audio.progressive_generator import config_from_chunked_generation
+        from LiteTTS.config import config
+
+        chunked = config.audio.chunked_generation
+        assert config_from_chunked_generation(chunked, str(tmp_path)).chunk_cache_dir == str(tmp_path / "chunks")
+        absolute = SimpleNamespace(**dict(vars(chunked), chunk_cache_dir="/var/cache/litetts"))
+        assert config_from_chunked_generation(absolute, str(tmp_path)).chunk_cache_dir == "/var/cache/litetts"
+
+    def test_repeated_chunks_hit_across_generators(self, tmp_path):
+        config = ProgressiveGenerationConfig(
+            mode=GenerationMode.CHUNKED, streaming_delay=0.0, chunk_cache_dir=str(tmp_path)
+        )
+        first_engine, second_engine = CountingEngine(), CountingEngine()
+        first = ProgressiveAudioGenerator(first_engine, config)
+        second = ProgressiveAudioGenerator(second_engine, config)
+
+        async def synthesize_twice():
+            a = await first._synthesize_chunk("Your order has shipped.", "af_heart", "mp3", 1.0)
+            b = await first._synthesize_chunk("Your order has shipped.", "af_heart", "mp3", 1.0)
+            c = await second._synthesize_chunk("Your order has shipped.", "af_heart", "mp3", 1.0)
+            return a, b, c
+
+        a, b, c = asyncio.run(synthesize_twice())
+
+        assert a == b == c
+        assert first_engine.calls == 1
+        assert second_engine.calls == 0
+        assert first.get_cache_stats()["cache_size"] == 1
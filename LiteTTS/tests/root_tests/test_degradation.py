@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-pressure-aware adaptive degradation
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.performance.degradation import (
+    LEVEL_NAMES, DegradationController, default_memory_limit_bytes, process_rss_bytes, release_free_memory
+)
+
+
+def recording_controller(**kwargs):
+    """Controller whose actions append ("apply"|"revert", level) to a list"""
+    controller = DegradationController(**kwargs)
+    events = []
+    for name in LEVEL_NAMES[1:]:
+        controller.set_action(name, lambda name=name: events.append(("apply", name)),
+                              lambda name=name: events.append(("revert", name)))
+    return controller, events
+
+
+class TestDegradationController:
+    """Test escalation, hysteresis and recovery"""
+
+    def test_escalation_applies_every_level_in_order(self):
+        controller, events = recording_controller()
+        assert controller.evaluate(0.5, now=0) == 0 and events == []
+        assert controller.evaluate(0.87, now=1) == 3
+        assert events == [("apply", "shrink_caches"), ("apply", "cap_lookahead"), ("apply", "reduce_batch")]
+        assert controller.level_name == "reduce_batch"
+        assert controller.is_active("cap_lookahead") and not controller.is_active("small_model")
+        assert controller.evaluate(0.99, now=2) == 5
+        assert events[3:] == [("apply", "small_model"), ("apply", "shed_low_priority")]
+
+    def test_recovery_waits_and_steps_down_one_level_at_a_time(self):
+        controller, events = recording_controller(recovery_seconds=30)
+        controller.evaluate(0.86, now=0)
+        events.clear()
+
+        # Below the threshold but within the hysteresis band: stay
+        controller.evaluate(0.80, now=10)
+        controller.evaluate(0.80, now=100)
+        assert controller.level_name == "reduce_batch"
+
+        controller.evaluate(0.70, now=100)
+        controller.evaluate(0.70, now=129)
+        assert controller.level_name == "reduce_batch"
+        controller.evaluate(0.70, now=130)
+        assert controller.level_name == "cap_lookahead" and events == [("revert", "reduce_batch")]
+        # 0.72 is within the cap_lookahead band (0.80 - 0.10)
+        controller.evaluate(0.72, now=500)
+        assert controller.level_name == "cap_lookahead"
+
+        controller.evaluate(0.1, now=500)
+        controller.evaluate(0.1, now=530)
+        controller.evaluate(0.1, now=560)
+        assert controller.level == 0
+        assert events == [("revert", "reduce_batch"), ("revert", "cap_lookahead"), ("revert", "shrink_caches")]
+
+    def test_a_pressure_spike_restarts_the_recovery_period(self):
+        controller, _ = recording_controller(recovery_seconds=30)
+        controller.evaluate(0.75, now=0)
+        controller.evaluate(0.5, now=10)
+        controller.evaluate(0.65, now=30)  # Inside the hysteresis band
+        controller.evaluate(0.5, now=41)
+        assert controller.level_name == "shrink_caches"
+        controller.evaluate(0.5, now=71)
+        assert controller.level == 0
+
+    def test_transitions_and_time_in_level_are_recorded(self):
+        controller, _ = recording_controller(recovery_seconds=0)
+        controller.evaluate(0.81, now=controller._level_since + 5)
+        controller.evaluate(0.0, now=controller._level_since + 1)
+        controller.evaluate(0.0, now=controller._level_since + 1)
+        stats = controller.stats()
+        assert {(t["from"], t["to"]): t["count"] for t in stats["transitions"]} == {
+            ("normal", "shrink_caches"): 1, ("shrink_caches", "cap_lookahead"): 1,
+            ("cap_lookahead", "shrink_caches"): 1,
+        }
+        assert stats["seconds_in_level"]["normal"] >= 5
+        assert [entry["to"] for entry in stats["history"]] == ["shrink_caches", "cap_lookahead", "shrink_caches"]
+
+    def test_a_failing_action_still_changes_level(self):
+        controller = DegradationController()
+
+        def broken():
+            raise RuntimeError("no memory to free")
+
+        controller.set_action("shrink_caches", broken, broken)
+        assert controller.evaluate(0.75, now=0) == 1
+        controller.stop()
+        assert controller.level == 0
+
+    def test_signals_drive_pressure(self):
+        controller = DegradationController()
+        values = {"rss": 600.0, "queue": 10.0}
+        controller.add_signal("rss", lambda: values["rss"], 1000)
+        controller.add_signal("queue", lambda: values["queue"], 64)
+        controller.add_signal("arena", lambda: None, 100)
+        controller.add_signal("broken", lambda: 1 / 0, 100)
+
+        assert controller.evaluate(now=0) == 0 and controller.driver == "rss"
+        values["queue"] = 58
+        assert controller.evaluate(now=1) == 4 and controller.driver == "queue"
+        signals = controller.stats()["signals"]
+        assert signals["rss"]["ratio"] == 0.6 and signals["arena"]["value"] is None
+        assert signals["broken"]["ratio"] == 0.0
+
+    def test_stop_restores_every_level(self):
+        controller, events = recording_controller()
+        controller.evaluate(0.96, now=0)
+        events.clear()
+        controller.stop()
+        assert controller.level == 0
+        assert [name for _, name in events] == list(reversed(LEVEL_NAMES[1:]))
+
+    def test_thresholds_are_validated(self):
+        with pytest.raises(ValueError, match="Expected 5"):
+            DegradationController(thresholds=(0.5, 0.9))
+        with pytest.raises(ValueError, match="increasing"):
+            DegradationController(thresholds=(0.7, 0.9, 0.8, 0.95, 0.99))
+        with pytest.raises(ValueError, match="Unknown"):
+            DegradationController().set_action("panic")
+
+
+class TestMemoryHooks:
+    """Test the resize hooks degradation actions use"""
+
+    def test_local_store_resize_evicts_oldest(self):
+        from LiteTTS.cache.shared import LocalAudioStore
+
+        store = LocalAudioStore(1000, max_entry_bytes=1000)
+        for i in range(4):
+            store.put(bytes([i]) * 16, b"x" * 200)
+        store.get(bytes([0]) * 16)
+        store.resize(450)
+        assert store.get(bytes([0]) * 16) is not None and store.get(bytes([3]) * 16) is not None
+        assert store.get(bytes([1]) * 16) is None and store.get(bytes([2]) * 16) is None
+
+    def test_cache_manager_resize_memory(self):
+        from LiteTTS.cache.manager import EnhancedCacheManager
+
+        cache = EnhancedCacheManager(cache_dir=None, max_memory_size=1 << 20)
+        for i in range(8):
+            cache.put(f"chunk-{i}", np.zeros(8192, dtype=np.float32))
+        assert cache.resize_memory(40000) == 1 << 20
+        assert cache.memory_size <= 40000
+        assert cache.get("chunk-7") is not None and cache.get("chunk-0") is None
+
+    def test_process_memory_helpers(self):
+        assert process_rss_bytes() > 0
+        assert default_memory_limit_bytes(2) <= default_memory_limit_bytes(1)
+        assert release_free_memory() >= 0
+
+
+class TestApplicationActions:
+    """The server's degradation actions reach the generator it streams through"""
+
+    @pytest.fixture
+    def application(self, monkeypatch, tmp_path):
+        import importlib
+        import logging
+        from types import SimpleNamespace
+        from LiteTTS.audio.progressive_generator import (
+            BackendChunkEngine, ProgressiveAudioGenerator, config_from_chunked_generation
+        )
+        from LiteTTS.config import config
+
+        # Import the module without building the application (which loads the model)
+        monkeypatch.setenv("LITETTS_IMPORT_ONLY", "1")
+        app_module = importlib.import_module("app")
+
+        application = app_module.LiteTTSApplication.__new__(app_module.LiteTTSApplication)
+        application.config = config
+        application.logger = logging.getLogger("test_degradation")
+        application.batch_jobs = application.preloader = None
+        application.priority_gate = SimpleNamespace(set_shedding=lambda shedding: None)
+        engine = BackendChunkEngine(SimpleNamespace(), "model.onnx")
+        application.progressive_generator = ProgressiveAudioGenerator(
+            engine, config_from_chunked_generation(config.audio.chunked_generation, str(tmp_path))
+        )
+        return application
+
+    def test_cap_lookahead_and_shrink_caches_reach_the_progressive_generator(self, application):
+        from LiteTTS.config import config
+
+        generator = application.progressive_generator
+        lookahead = generator.config.max_lookahead_chunks
+        memory = generator.chunk_cache.max_memory_size
+        assert lookahead > config.degradation.lookahead_chunks
+
+        controller = DegradationController()
+        application._register_degradation_actions(controller)
+        controller.evaluate(0.81, now=0)
+        assert controller.level_name == "cap_lookahead"
+        assert generator.config.max_lookahead_chunks == config.degradation.lookahead_chunks
+        assert generator.chunk_cache.max_memory_size == int(memory * config.degradation.cache_shrink_factor)
+
+        controller.stop()
+        assert generator.config.max_lookahead_chunks == lookahead
+        assert generator.chunk_cache.max_memory_size == memory
+
+    def test_streaming_uses_chunks_for_long_text_only(self, application):
+        min_length = application.config.audio.chunked_generation.min_text_length_for_chunking
+        assert application._should_stream_chunked("x" * min_length)
+        assert not application._should_stream_chunked("x" * (min_length - 1))
+        application.progressive_generator = None
+        assert not application._should_stream_chunked("x" * min_length)
+
+
+def test_degradation_config():
+    from LiteTTS.config import config
+
+    assert len(config.degradation.thresholds) == len(LEVEL_NAMES) - 1
+    assert config.to_dict()["degradation"]["hysteresis"] == config.degradation.hysteresis
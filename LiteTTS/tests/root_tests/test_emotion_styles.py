@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for copy-on-write emotion styles and the style cache
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.tts.emotion_controller import EmotionController
+
+
+@pytest.fixture
+def voice_data():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((510, 256)).astype(np.float32)
+
+
+class TestEmotionStyles:
+    """Test that emotions never touch the shared embedding"""
+
+    def test_source_embedding_is_not_mutated(self, voice_data):
+        controller = EmotionController()
+        original = voice_data.copy()
+
+        styled = controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+
+        np.testing.assert_array_equal(voice_data, original)
+        assert styled is not voice_data
+        assert not styled.flags.writeable
+        assert not np.array_equal(styled, voice_data)
+
+    def test_neutral_returns_source(self, voice_data):
+        controller = EmotionController()
+        assert controller.get_emotion_style("af_heart", voice_data, "neutral", 1.0) is voice_data
+        assert controller.get_emotion_style("af_heart", voice_data, "happy", 0.0) is voice_data
+        assert controller.get_emotion_style("af_heart", voice_data, None, 1.0) is voice_data
+
+    def test_style_is_deterministic(self, voice_data):
+        a = EmotionController().apply_emotion(voice_data, "sad", 1.0)
+        b = EmotionController().apply_emotion(voice_data, "sad", 1.0)
+        np.testing.assert_array_equal(a, b)
+
+
+class TestStyleCache:
+    """Test the bounded (voice, emotion, strength) cache"""
+
+    def test_quantized_strengths_share_an_entry(self, voice_data):
+        controller = EmotionController()
+        first = controller.get_emotion_style("af_heart", voice_data, "happy", 0.98)
+        second = controller.get_emotion_style("af_heart", voice_data, "happy", 1.02)
+
+        assert first is second
+        stats = controller.get_style_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_reloaded_voice_is_recomputed(self, voice_data):
+        controller = EmotionController()
+        first = controller.get_emotion_style("af_heart", voice_data, "calm", 1.0)
+        reloaded = voice_data * 2.0
+        second = controller.get_emotion_style("af_heart", reloaded, "calm", 1.0)
+
+        assert second is not first
+        np.testing.assert_allclose(second, controller.apply_emotion(reloaded, "calm", 1.0))
+
+    def test_equal_copies_of_a_voice_share_an_entry(self, voice_data):
+        controller = EmotionController()
+        first = controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+        assert controller.get_emotion_style("af_heart", voice_data.copy(), "happy", 1.0) is first
+
+    def test_voice_version_keys_the_entry(self, voice_data):
+        controller = EmotionController()
+        first = controller.get_emotion_style("af_heart", voice_data, "happy", 1.0, "hash-1")
+        assert controller.get_emotion_style("af_heart", voice_data.copy(), "happy", 1.0, "hash-1") is first
+        assert controller.get_emotion_style("af_heart", voice_data, "happy", 1.0, "hash-2") is not first
+
+        controller.clear_style_cache(emotion="happy")
+        assert controller.get_style_cache_stats()["entries"] == 0
+
+    def test_cache_is_bounded(self, voice_data):
+        controller = EmotionController(style_cache_size=3)
+        for emotion in ["happy", "sad", "angry", "calm"]:
+            controller.get_emotion_style("af_heart", voice_data, emotion, 1.0)
+
+        assert controller.get_style_cache_stats()["entries"] == 3
+        # Oldest entry was evicted
+        controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+        assert controller.get_style_cache_stats()["misses"] == 5
+
+    def test_precompute_makes_requests_hits(self, voice_data):
+        controller = EmotionController()
+        built = controller.precompute_styles("af_heart", voice_data)
+
+        assert built == len(controller.common_emotions)
+        for emotion in controller.common_emotions:
+            controller.get_emotion_style("af_heart", voice_data, emotion, 1.0)
+        assert controller.get_style_cache_stats()["hits"] == built
+
+    def test_precomputed_voices_do_not_evict_each_other(self, voice_data):
+        controller = EmotionController(style_cache_size=4)
+        voices = [f"voice_{i}" for i in range(10)]
+        for name in voices:
+            controller.precompute_styles(name, voice_data, voice_version=name)
+        controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+
+        stats = controller.get_style_cache_stats()
+        assert stats["max_entries"] == 4 + len(voices) * len(controller.common_emotions)
+        assert stats["entries"] == len(voices) * len(controller.common_emotions) + 1
+        for name in voices:
+            controller.get_emotion_style(name, voice_data, "sad", 1.0, name)
+        assert controller.get_style_cache_stats()["misses"] == stats["misses"]
+
+    def test_custom_emotion_invalidates_cached_styles(self, voice_data):
+        controller = EmotionController()
+        before = controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+        controller.create_custom_emotion("happy", {"energy": -0.5})
+        after = controller.get_emotion_style("af_heart", voice_data, "happy", 1.0)
+
+        assert after is not before
+        assert not np.array_equal(after, before)
+
+
+def test_engine_precomputes_styles_for_preloaded_voices(voice_data):
+    from types import SimpleNamespace
+    from LiteTTS.tts.engine import KokoroTTSEngine
+
+    engine = KokoroTTSEngine.__new__(KokoroTTSEngine)
+    engine.emotion_controller = EmotionController()
+    engine.voice_blender = SimpleNamespace(prebuild_presets=lambda voices: None)
+    engine.voice_manager = SimpleNamespace(
+        setup_system=lambda download_all: {'success': True, 'cache_results': {'af_heart': True, 'am_puck': False}},
+        get_available_voices=lambda: ['af_heart', 'am_puck'],
+        get_voice_embedding=lambda name: SimpleNamespace(embedding_data=voice_data, file_hash=f"{name}-hash")
+    )
+    engine._setup_voice_system()
+
+    controller = engine.emotion_controller
+    assert controller.get_style_cache_stats()["entries"] == len(controller.common_emotions)
+    controller.get_emotion_style("af_heart", voice_data, "happy", 1.0, "af_heart-hash")
+    assert controller.get_style_cache_stats()["hits"] == 1
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized code point tokenizer
+"""
+
+import threading
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.tts.tokenizer import CodepointTokenizer
+
+
+CHARS = " abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.,!?;:-'ˈəɪ"
+CHAR_TO_ID = {char: i for i, char in enumerate(CHARS)}
+UNK_ID = 3
+
+
+def reference_tokenize(text):
+    """Per-character mapping the engine used before vectorization"""
+    return np.array([CHAR_TO_ID.get(char, UNK_ID) for char in text], dtype=np.int64)
+
+
+class TestCodepointTokenizer:
+    """Test equivalence with the per-character mapping"""
+
+    def test_matches_reference_mapping(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID)
+        for text in ["Hello, world!", "ˈhɛləʊ wɜːld", "Emoji 🎉 and café", "日本語 text", "a"]:
+            tokens = tokenizer.encode(text)
+            assert tokens.dtype == np.int64
+            np.testing.assert_array_equal(tokens, reference_tokenize(text))
+
+    def test_unknown_code_points_above_table_map_to_unk(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID)
+        tokens = tokenizer.encode("\U0010FFFF一")
+        assert tokens.tolist() == [UNK_ID, UNK_ID]
+
+    def test_lone_surrogates_map_to_unk(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID)
+        text = "a\ud83db"
+        np.testing.assert_array_equal(tokenizer.encode(text), reference_tokenize(text))
+        assert tokenizer.encode_to_input_ids(text).shape == (1, 3)
+
+    def test_multi_character_keys_are_ignored(self):
+        tokenizer = CodepointTokenizer({"a": 1, "ab": 7}, unk_token_id=0)
+        assert tokenizer.encode("ab").tolist() == [1, 0]
+
+
+class TestInputBuffer:
+    """Test the reusable model input buffer"""
+
+    def test_encodes_into_batched_view_without_copy(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID, initial_capacity=8)
+        first = tokenizer.encode_to_input_ids("hello")
+        assert first.shape == (1, 5)
+        np.testing.assert_array_equal(first[0], reference_tokenize("hello"))
+
+        second = tokenizer.encode_to_input_ids("hey")
+        assert np.shares_memory(first, second)
+
+    def test_buffer_grows_for_long_text(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID, initial_capacity=4)
+        text = "long text " * 10
+        input_ids = tokenizer.encode_to_input_ids(text)
+        assert input_ids.shape == (1, len(text))
+        assert input_ids.base.shape[1] == 128
+        np.testing.assert_array_equal(input_ids[0], reference_tokenize(text))
+
+    def test_buffers_are_per_thread(self):
+        tokenizer = CodepointTokenizer(CHAR_TO_ID, UNK_ID)
+        main_buffer = tokenizer.input_ids_buffer(4)
+        other = {}
+
+        thread = threading.Thread(target=lambda: other.setdefault("buffer", tokenizer.input_ids_buffer(4)))
+        thread.start()
+        thread.join()
+
+        assert not np.shares_memory(main_buffer, other["buffer"])
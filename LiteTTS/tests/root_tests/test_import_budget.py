@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the package import-time budget and the import profiler
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+import sys
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from LiteTTS.performance.import_profiler import parse_importtime, profile_imports
+
+# Generous default so slow CI machines pass; tighten locally via the env var
+IMPORT_BUDGET_MS = float(os.environ.get("LITETTS_IMPORT_BUDGET_MS", "500"))
+
+HEAVY_MODULES = [
+    "torch",
+    "fastapi",
+    "LiteTTS.nlp.emotion_detector",
+    "LiteTTS.audio.watermarking",
+]
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 |     encodings.utf_8
+import time:      1500 |       2500 | LiteTTS
+import time:        40 |         40 |   LiteTTS.exceptions
+"""
+
+
+class TestParseImporttime:
+    """Test parsing of -X importtime output"""
+
+    def test_parses_entries_and_depth(self):
+        timings = parse_importtime(SAMPLE_OUTPUT)
+        assert [t.module for t in timings] == ["_io", "encodings.utf_8", "LiteTTS", "LiteTTS.exceptions"]
+        assert [t.depth for t in timings] == [1, 2, 0, 1]
+        assert timings[2].self_us == 1500
+        assert timings[2].cumulative_us == 2500
+
+
+class TestImportBudget:
+    """Importing the package must not pull in optional heavy subsystems"""
+
+    def test_heavy_modules_stay_lazy(self):
+        code = (
+            "import json, sys\n"
+            "import LiteTTS, LiteTTS.audio, LiteTTS.nlp\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=str(PROJECT_ROOT),
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+    def test_server_entry_point_keeps_torch_lazy(self):
+        # Only the voice validator's .pt loading needs torch; the server must start without it
+        code = (
+            "import json, sys\n"
+            "import app\n"
+            "print(json.dumps({'torch': 'torch' in sys.modules, 'app': app.app is None}))\n"
+        )
+        env = dict(os.environ, LITETTS_IMPORT_ONLY="1")
+        result = subprocess.run([sys.executable, "-c", code], cwd=str(PROJECT_ROOT), env=env,
+                                capture_output=True, text=True, timeout=300)
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == {"torch": False, "app": True}
+
+    def test_lazy_exports_are_listed_in_all(self):
+        import LiteTTS
+
+        lazy = [name for name in LiteTTS.__all__ if name in LiteTTS._LAZY_EXPORTS]
+        assert lazy == list(LiteTTS._LAZY_EXPORTS)
+
+    def test_lazy_exports_still_resolve(self):
+        import LiteTTS.nlp as nlp
+        assert "NLPProcessor" in dir(nlp)
+        assert nlp.NLPProcessor.__name__ == "NLPProcessor"
+
+    def test_package_import_within_budget(self):
+        profile = profile_imports("import LiteTTS", cwd=str(PROJECT_ROOT))
+        cumulative_ms = profile.cumulative_us("LiteTTS") / 1000
+        assert profile.imported("LiteTTS")
+        assert cumulative_ms <= IMPORT_BUDGET_MS, (
+            f"import LiteTTS took {cumulative_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+        )
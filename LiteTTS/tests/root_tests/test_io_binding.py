@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for IOBinding inference and in-place post-processing in KokoroTTSEngine
+"""
+
+import threading
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+onnx = pytest.importorskip("onnx")
+ort = pytest.importorskip("onnxruntime")
+from onnx import helper, TensorProto
+
+from LiteTTS.tts.engine import KokoroTTSEngine
+
+
+def build_session():
+    """Tiny model whose audio length depends on the token count, like Kokoro"""
+    nodes = [
+        helper.make_node("Cast", ["input_ids"], ["ids_f"], to=TensorProto.FLOAT),
+        helper.make_node("ReduceMean", ["style"], ["style_mean"], keepdims=0),
+        helper.make_node("Mul", ["ids_f", "speed"], ["scaled"]),
+        helper.make_node("Add", ["scaled", "style_mean"], ["shifted"]),
+        helper.make_node("Reshape", ["shifted", "flat"], ["audio"]),
+    ]
+    graph = helper.make_graph(
+        nodes, "tiny_tts",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, [1, "n"]),
+            helper.make_tensor_value_info("style", TensorProto.FLOAT, [1, 256]),
+            helper.make_tensor_value_info("speed", TensorProto.FLOAT, [1]),
+        ],
+        [helper.make_tensor_value_info("audio", TensorProto.FLOAT, ["samples"])],
+        [helper.make_tensor("flat", TensorProto.INT64, [1], [-1])],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    return ort.InferenceSession(model.SerializeToString(), providers=["CPUExecutionProvider"])
+
+
+def make_engine(use_io_binding=True):
+    engine = KokoroTTSEngine.__new__(KokoroTTSEngine)
+    engine.onnx_session = build_session()
+    engine._input_names = [node.name for node in engine.onnx_session.get_inputs()]
+    engine._output_names = [node.name for node in engine.onnx_session.get_outputs()]
+    engine.use_io_binding = use_io_binding
+    engine._binding_local = threading.local()
+    engine.io_binding_retry_seconds = 60.0
+    engine.io_binding_failures = 0
+    engine._io_binding_suspended_until = 0.0
+    engine.sample_rate = 24000
+    return engine
+
+
+def model_inputs(length):
+    return {
+        "input_ids": np.arange(1, length + 1, dtype=np.int64).reshape(1, -1),
+        "style": np.zeros((1, 256), dtype=np.float32),
+        "speed": np.array([0.5], dtype=np.float32),
+    }
+
+
+class TestIOBindingInference:
+    """Test that the bound path matches session.run"""
+
+    def test_matches_session_run(self):
+        bound = make_engine(use_io_binding=True)
+        plain = make_engine(use_io_binding=False)
+        for length in (3, 17, 5):
+            np.testing.assert_array_equal(
+                bound._run_inference(model_inputs(length)),
+                plain._run_inference(model_inputs(length))
+            )
+        assert bound.use_io_binding
+
+    def test_outputs_survive_later_runs(self):
+        engine = make_engine()
+        first = engine._run_inference(model_inputs(4))
+        expected = first.copy()
+        engine._run_inference(model_inputs(4))
+        engine._run_inference(model_inputs(9))
+        np.testing.assert_array_equal(first, expected)
+
+    def test_binding_is_reused_per_thread(self):
+        engine = make_engine()
+        engine._run_inference(model_inputs(3))
+        binding = engine._get_io_binding()
+        engine._run_inference(model_inputs(6))
+        assert engine._get_io_binding() is binding
+
+    def test_a_failure_suspends_io_binding_for_the_cooldown_only(self):
+        class FailingOnce:
+            def __init__(self, session):
+                self.session = session
+                self.bound_runs = 0
+
+            def run_with_iobinding(self, binding, run_options=None):
+                self.bound_runs += 1
+                if self.bound_runs == 1:
+                    raise RuntimeError("transient bind failure")
+                return self.session.run_with_iobinding(binding, run_options)
+
+            def __getattr__(self, name):
+                return getattr(self.session, name)
+
+        engine = make_engine()
+        engine.onnx_session = FailingOnce(engine.onnx_session)
+        expected = make_engine(use_io_binding=False)._run_inference(model_inputs(5))
+
+        np.testing.assert_array_equal(engine._run_inference(model_inputs(5)), expected)
+        np.testing.assert_array_equal(engine._run_inference(model_inputs(5)), expected)
+        assert engine.onnx_session.bound_runs == 1 and engine.io_binding_failures == 1
+        assert engine.use_io_binding
+
+        engine._io_binding_suspended_until = 0.0  # Cooldown over
+        np.testing.assert_array_equal(engine._run_inference(model_inputs(5)), expected)
+        assert engine.onnx_session.bound_runs == 2 and engine.io_binding_failures == 1
+
+    def test_bound_runs_use_length_buckets(self):
+        from LiteTTS.performance.onnx_memory import BucketedSession
+
+        engine = make_engine()
+        engine.onnx_session = BucketedSession(engine.onnx_session, boundaries=(4, 64), shrink_above_tokens=4)
+        expected = make_engine(use_io_binding=False)._run_inference(model_inputs(9))
+        engine._run_inference(model_inputs(3))
+        np.testing.assert_array_equal(engine._run_inference(model_inputs(9)), expected)
+        short, long = engine.onnx_session.buckets
+        assert (short.runs, long.runs, long.shrinks, long.longest) == (1, 1, 1, 9)
+        assert engine.use_io_binding
+
+
+class TestInPlacePostProcessing:
+    """Test that post-processing works on the inference buffer directly"""
+
+    def test_fast_path_normalizes_in_place(self):
+        engine = make_engine()
+        audio = np.array([[0.5, -2.0, 1.0]], dtype=np.float32)
+        segment = engine._post_process_audio_fast(audio)
+        assert np.shares_memory(segment.audio_data, audio)
+        assert np.isclose(np.abs(segment.audio_data).max(), 0.95)
+
+    def test_full_path_repairs_nan_in_place(self):
+        engine = make_engine()
+        audio = np.array([0.1, np.nan, -0.2], dtype=np.float32)
+        segment = engine._post_process_audio(audio, 1.0)
+        assert np.shares_memory(segment.audio_data, audio)
+        assert segment.audio_data.tolist() == pytest.approx([0.1, 0.0, -0.2])
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for the open-loop load generator
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import asyncio
+import json
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.benchmarks.load_generator import (
+    SLO, SPEECH_ENDPOINT, STREAM_ENDPOINT, LengthBucket, PlannedRequest, RequestResult, StandinServer,
+    TextMix, WorkloadPlanner, WorkloadSettings, build_standin_app, execute_plan, find_saturation,
+    load_trace, main, poisson_arrivals, ramp_rates, run_load_test, summarize_step
+)
+from LiteTTS.benchmarks.offline_benchmark import BenchmarkContext
+from LiteTTS.benchmarks.synthetic_model import SyntheticModelSpec
+from LiteTTS.cache.shared import SharedAudioCache
+
+SPEC = SyntheticModelSpec(hidden=16, depth=1, samples_per_token=300)
+
+
+@pytest.fixture(scope="module")
+def standin_app(tmp_path_factory, onnx_toolchain):
+    context = BenchmarkContext(str(tmp_path_factory.mktemp("load")), SPEC)
+    return build_standin_app(context, SharedAudioCache(max_bytes=4 * 1024 * 1024, shared=False))
+
+
+def asgi_client(app):
+    import httpx
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), timeout=30)
+
+
+def step(offered, sent, ok, p99, errors=0, duration=10.0):
+    results = [RequestResult(SPEECH_ENDPOINT, i / sent, 10, 200, latency=p99, ttfb=p99 / 2)
+               for i in range(ok)]
+    results += [RequestResult(SPEECH_ENDPOINT, 0.0, 10, 500, latency=0.1, error="HTTP 500")
+                for _ in range(errors)]
+    summary = summarize_step(results, offered, duration, duration)
+    summary["sent_rps"] = sent / duration
+    return summary
+
+
+class TestWorkload:
+    """Test arrival schedules and the text mix"""
+
+    def test_poisson_arrivals(self):
+        arrivals = poisson_arrivals(50.0, 20.0, np.random.default_rng(1))
+        assert arrivals == sorted(arrivals)
+        assert all(0 <= t < 20.0 for t in arrivals)
+        assert len(arrivals) == pytest.approx(1000, rel=0.15)
+        gaps = np.diff(arrivals)
+        # Exponential gaps: the coefficient of variation is about 1
+        assert gaps.std() / gaps.mean() == pytest.approx(1.0, abs=0.15)
+        assert poisson_arrivals(50.0, 20.0, np.random.default_rng(1)) == arrivals
+
+    def test_text_mix_lengths(self):
+        mix = TextMix((LengthBucket("short", 1, 20, 40), LengthBucket("long", 1, 300, 400)), seed=3)
+        lengths = [len(mix.sample()) for _ in range(200)]
+        assert all(length <= 400 for length in lengths)
+        assert sum(length <= 40 for length in lengths) == pytest.approx(100, abs=30)
+        assert 90 <= len(mix.text_of_length(100)) <= 100
+
+    def test_poisson_plan(self):
+        planner = WorkloadPlanner(WorkloadSettings(stream_fraction=0.5, voices=("a", "b"), unique=True))
+        plan = planner.plan(20.0, 10.0)
+        endpoints = {request.endpoint for request in plan}
+        assert endpoints == {SPEECH_ENDPOINT, STREAM_ENDPOINT}
+        assert {request.payload["voice"] for request in plan} == {"a", "b"}
+        assert len({request.payload["input"] for request in plan}) == len(plan)
+
+
+class TestTrace:
+    """Test structured.jsonl replay"""
+
+    def write_trace(self, path, count=10, gap=0.5):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        with open(path, "w") as f:
+            f.write("not json\n")
+            f.write(json.dumps({"timestamp": start.isoformat(), "message": "startup"}) + "\n")
+            for i in range(count):
+                finished = start + timedelta(seconds=i * gap + 0.2)
+                f.write(json.dumps({
+                    "timestamp": finished.isoformat(), "event": "request_summary",
+                    "request": {"path": STREAM_ENDPOINT if i % 2 else SPEECH_ENDPOINT, "method": "POST",
+                                "status": 200, "duration": 0.2, "voice": "af_heart",
+                                "format": "wav", "text_length": 50 + i},
+                }) + "\n")
+            f.write(json.dumps({"timestamp": start.isoformat(), "event": "request_summary",
+                                "request": {"path": "/v1/voices", "method": "GET", "duration": 0.01}}) + "\n")
+
+    def test_load_trace(self, tmp_path):
+        path = tmp_path / "structured.jsonl"
+        self.write_trace(path)
+        records = load_trace(str(path))
+        assert len(records) == 10
+        assert records[1].arrival - records[0].arrival == pytest.approx(0.5)
+        assert records[0].arrival == pytest.approx(datetime(2025, 1, 1, 12, 0, 0).timestamp())
+        assert records[3].path == STREAM_ENDPOINT and records[3].text_length == 53
+        assert records[3].response_format == "wav"
+
+    def test_replay_is_rescaled_and_looped(self, tmp_path):
+        path = tmp_path / "structured.jsonl"
+        self.write_trace(path)
+        planner = WorkloadPlanner(WorkloadSettings(voices=("af_heart",)), trace=load_trace(str(path)))
+        assert planner.trace_rate == pytest.approx(2.0)
+
+        plan = planner.plan(8.0, 5.0)
+        assert len(plan) == pytest.approx(40, abs=1)
+        assert plan[1].offset - plan[0].offset == pytest.approx(0.125)
+        assert plan[1].endpoint == STREAM_ENDPOINT
+        assert all(request.payload["response_format"] == "wav" for request in plan)
+        assert 45 <= len(plan[0].payload["input"]) <= 50
+
+
+class TestReporting:
+    """Test step statistics and saturation detection"""
+
+    def test_summarize_step(self):
+        results = [RequestResult(SPEECH_ENDPOINT, i * 0.1, 10, 200, latency=(i + 1) / 100, ttfb=0.01)
+                   for i in range(100)]
+        results.append(RequestResult(STREAM_ENDPOINT, 0.5, 10, error="timeout"))
+        summary = summarize_step(results, 10.0, 10.0, 11.0)
+        assert summary["requests"] == 101 and summary["ok"] == 100
+        assert summary["errors"] == {"timeout": 1}
+        assert summary["throughput_rps"] == pytest.approx(100 / 11.0)
+        assert summary["latency"]["p50"] == pytest.approx(0.505)
+        assert summary["latency"]["p99"] == pytest.approx(0.9901)
+        assert summary["endpoints"][STREAM_ENDPOINT]["error_rate"] == 1.0
+
+    def test_find_saturation(self):
+        slo = SLO(p99_latency=1.0, max_error_rate=0.05, min_throughput_ratio=0.9)
+        steps = [step(1, 10, 10, 0.2), step(2, 20, 20, 0.4), step(4, 40, 30, 2.5)]
+        saturation = find_saturation(steps, slo)
+        assert saturation["saturated"]
+        assert saturation["max_sustainable_rps"] == 2
+        assert saturation["saturation_rps"] == 4
+        assert len(saturation["reasons"]) == 2
+
+        errors = find_saturation([step(1, 10, 8, 0.2, errors=2)], slo)
+        assert errors["saturated"] and errors["max_sustainable_rps"] is None
+        assert not find_saturation(steps[:2], slo)["saturated"]
+
+    def test_ramp_rates(self):
+        assert ramp_rates(1, 8, 2) == [1, 2, 4, 8]
+        with pytest.raises(ValueError):
+            ramp_rates(4, 2)
+
+
+class TestAgainstStandin:
+    """Test the generator against the stand-in app"""
+
+    def test_execute_plan(self, standin_app):
+        plan = [PlannedRequest(0.0, SPEECH_ENDPOINT, {"input": "Hello there.", "voice": "af_heart",
+                                                      "response_format": "wav"}),
+                PlannedRequest(0.05, STREAM_ENDPOINT, {"input": "One. Two. Three.", "voice": "af_heart",
+                                                       "response_format": "wav"}),
+                PlannedRequest(0.1, SPEECH_ENDPOINT, {"input": "Hello.", "voice": "nobody"})]
+
+        async def run():
+            async with asgi_client(standin_app) as client:
+                return await execute_plan("http://standin", plan, client=client)
+
+        results, elapsed = asyncio.run(run())
+        assert [result.ok for result in results] == [True, True, False]
+        assert results[0].bytes > 44 and results[0].ttfb <= results[0].latency
+        assert results[2].error == "HTTP 500" and results[2].status == 500
+        assert elapsed >= 0.1
+
+    def test_requests_over_the_in_flight_limit_are_dropped(self, standin_app):
+        plan = [PlannedRequest(0.0, SPEECH_ENDPOINT, {"input": f"Text {i}.", "voice": "af_heart"})
+                for i in range(4)]
+
+        async def run():
+            async with asgi_client(standin_app) as client:
+                return await execute_plan("http://standin", plan, max_in_flight=1, client=client)
+
+        results, _ = asyncio.run(run())
+        assert sum(result.error == "dropped" for result in results) >= 1
+
+    def test_run_load_test_report(self, standin_app):
+        planner = WorkloadPlanner(WorkloadSettings(response_format="wav", unique=True))
+
+        async def run():
+            async with asgi_client(standin_app) as client:
+                return await run_load_test("http://standin", [2.0, 4.0], planner, step_duration=1.0,
+                                           slo=SLO(p99_latency=30.0, min_throughput_ratio=0.0),
+                                           warmup_requests=1, settle=0.0, client=client)
+
+        report = asyncio.run(run())
+        json.dumps(report)
+        assert [s["offered_rps"] for s in report["steps"]] == [2.0, 4.0]
+        assert report["workload"]["arrivals"] == "poisson"
+        assert not report["saturation"]["saturated"]
+        assert report["saturation"]["max_sustainable_rps"] == 4.0
+
+
+def test_standin_server_cli(tmp_path, onnx_toolchain):
+    output = tmp_path / "report.json"
+    with StandinServer(SPEC, workdir=str(tmp_path / "model")) as server:
+        assert main(["run", "--url", server.url, "--rates", "2", "--duration", "1", "--format", "wav",
+                     "--slo-p99", "30", "--json", "--output", str(output)]) == 0
+    assert server.process is None
+
+    report = json.loads(output.read_text())
+    assert report["steps"][0]["requests"] >= 0
+    assert report["target"] == server.url
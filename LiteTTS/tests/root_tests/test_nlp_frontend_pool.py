@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-pool NLP front-end
+"""
+
+from multiprocessing import shared_memory
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.nlp.frontend_pool import FrontEndProcessor, NLPProcessPool, ResultArena
+from LiteTTS.tts.tokenizer import CodepointTokenizer
+
+VOCABULARY = {"char_to_id": {c: i + 1 for i, c in enumerate(" abcdefghijklmnopqrstuvwxyz.,$é")},
+              "unk_token_id": 0}
+
+TEXTS = ["Dr. Smith paid $5 on Jan. 5th.", "The café opens at 9 a.m.", "Hello world!", "I read 3 books."]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with NLPProcessPool(2, vocabulary=VOCABULARY, slots=2) as pool:
+        pool.warm()
+        yield pool
+
+
+class TestResultArena:
+    """Test the shared-memory result slots"""
+
+    def test_round_trip(self):
+        arena = ResultArena(2, 1024)
+        try:
+            tokens = np.array([3, 1, 4, 1, 5], dtype=np.int64)
+            assert arena.write(1, "naïve café".encode("utf-8"), tokens) == (12, 5)
+            assert arena.write(0, b"plain", None) == (5, -1)
+
+            result = arena.read(1, 12, 5)
+            assert result.text == "naïve café"
+            assert result.token_ids.dtype == np.int64
+            np.testing.assert_array_equal(result.token_ids, tokens)
+            assert arena.read(0, 5, -1).token_ids is None
+        finally:
+            arena.close()
+
+    def test_oversized_result_does_not_fit(self):
+        arena = ResultArena(1, 64)
+        try:
+            assert arena.write(0, b"x" * 40, np.zeros(8, dtype=np.int64)) is None
+            assert arena.write(0, b"x" * 40, np.zeros(6, dtype=np.int64)) == (40, 6)
+        finally:
+            arena.close()
+
+
+class TestNLPProcessPool:
+    """Test normalization in worker processes"""
+
+    def test_matches_in_process_processing(self, pool):
+        processor = FrontEndProcessor()
+        tokenizer = CodepointTokenizer(VOCABULARY["char_to_id"], 0)
+        for text in TEXTS:
+            result = pool.process(text, timeout=30)
+            assert result.text == processor(text)
+            np.testing.assert_array_equal(result.token_ids, tokenizer.encode(result.text))
+
+    def test_more_requests_than_slots(self, pool):
+        futures = [pool.submit(text, timeout=30) for text in TEXTS * 5]
+        results = [future.result(30) for future in futures]
+        assert [result.text for result in results[:4]] == [result.text for result in results[4:8]]
+
+        stats = pool.stats()
+        assert stats["slots_in_use"] == 0
+        assert stats["failed"] == 0 and stats["completed"] == stats["submitted"]
+
+    def test_timed_out_caller_frees_its_slot(self, pool, caplog):
+        import asyncio
+        import time
+
+        async def give_up():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.wrap_future(pool.submit("word " * 2000, timeout=30)), 0)
+
+        asyncio.run(give_up())
+        deadline = time.monotonic() + 30
+        while pool.stats()["slots_in_use"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert pool.stats()["slots_in_use"] == 0
+        assert not [record for record in caplog.records if record.name == "concurrent.futures"]
+        assert pool.process("Hello world!", timeout=30).text == FrontEndProcessor()("Hello world!")
+
+    def test_cancelled_result_is_not_set(self, pool):
+        from concurrent.futures import Future
+
+        task, result = Future(), Future()
+        task.set_result(("overflow", "Hello.", None))
+        result.cancel()
+        slot = pool._free_slots.get()
+        pool._collect(task, slot, 0.0, result)
+        assert result.cancelled()
+        assert pool.stats()["slots_in_use"] == 0
+
+    def test_results_larger_than_a_slot_are_pickled(self):
+        text = "word " * 100
+        with NLPProcessPool(1, vocabulary=VOCABULARY, slot_bytes=256) as small:
+            result = small.process(text, timeout=30)
+            assert result.text == FrontEndProcessor()(text)
+            assert len(result.token_ids) == len(result.text)
+            assert small.stats()["overflows"] == 1
+
+    def test_shutdown_releases_shared_memory(self):
+        pool = NLPProcessPool(1)
+        name = pool.arena.name
+        assert pool.process("Hello.", timeout=30).token_ids is None
+        pool.shutdown()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        with pytest.raises(RuntimeError):
+            pool.submit("Hello.")
+
+
+def _root_handler_types():
+    import logging
+
+    return [type(handler).__name__ for handler in logging.getLogger().handlers]
+
+
+def test_workers_do_not_log_into_the_parent_queue():
+    import logging
+    import queue
+
+    from LiteTTS.logging_config import BoundedQueueHandler
+
+    root = logging.getLogger()
+    handler = BoundedQueueHandler(queue.Queue(maxsize=10))
+    root.addHandler(handler)
+    try:
+        with NLPProcessPool(1, slots=1) as pool:
+            assert pool._executor.submit(_root_handler_types).result(timeout=60) == ["StreamHandler"]
+    finally:
+        root.removeHandler(handler)
+    assert handler.queue.empty()
+
+
+def test_nlp_pool_config():
+    from LiteTTS.config import config
+
+    assert not config.nlp_pool.enabled
+    assert config.nlp_pool.slot_bytes == 65536
+    assert config.to_dict()["nlp_pool"]["workers"] == config.nlp_pool.workers
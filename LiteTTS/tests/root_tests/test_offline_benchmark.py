@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline benchmark harness and its synthetic model
+"""
+
+from pathlib import Path
+import copy
+import json
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.benchmarks.offline_benchmark import (
+    QUICK_SETTINGS, TimingSettings, compare_results, compute_stats, main, measure, run_benchmarks
+)
+from LiteTTS.benchmarks.synthetic_model import (
+    SyntheticKokoro, SyntheticModelSpec, build_synthetic_model, create_synthetic_assets
+)
+from LiteTTS.tts.backend import OnnxBackend
+
+SPEC = SyntheticModelSpec(hidden=32, depth=2, samples_per_token=600)
+
+
+@pytest.fixture(scope="module")
+def assets(tmp_path_factory, onnx_toolchain):
+    return create_synthetic_assets(str(tmp_path_factory.mktemp("synthetic")), SPEC)
+
+
+@pytest.fixture(scope="module")
+def model(assets):
+    model_path, voices_dir = assets
+    return SyntheticKokoro(str(model_path), str(voices_dir))
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory, onnx_toolchain):
+    return run_benchmarks(["tokenize", "cache"], QUICK_SETTINGS, SPEC,
+                          workdir=str(tmp_path_factory.mktemp("bench")))
+
+
+class TestSyntheticModel:
+    """Test the stand-in model's interface and determinism"""
+
+    def test_graph_interface(self, model):
+        inputs = {node.name: node.type for node in model.sess.get_inputs()}
+        assert inputs == {"input_ids": "tensor(int64)", "style": "tensor(float)", "speed": "tensor(float)"}
+        assert model.sess.get_outputs()[0].type == "tensor(float)"
+        assert model.get_voices() == ["af_heart", "am_puck"]
+
+    def test_length_follows_tokens_and_speed(self, model):
+        audio, sample_rate = model.create("Hello there", "af_heart")
+        assert sample_rate == 24000
+        assert len(audio) == (len("Hello there") + 2) * SPEC.samples_per_token
+        assert np.abs(audio).max() <= 0.5
+
+        faster, _ = model.create("Hello there", "af_heart", speed=2.0)
+        assert len(faster) == len(audio) // 2
+
+    def test_long_text_is_split_like_kokoro(self, model):
+        audio, _ = model.create("a" * 1000, "af_heart")
+        assert len(audio) == (1000 + 2 * 2) * SPEC.samples_per_token
+
+    def test_builds_are_reproducible(self, tmp_path, assets, model):
+        path = build_synthetic_model(str(tmp_path / "again.onnx"), SPEC)
+        again = SyntheticKokoro(str(path), str(assets[1]))
+        np.testing.assert_array_equal(again.create("Same text", "am_puck")[0], model.create("Same text", "am_puck")[0])
+
+    def test_runs_behind_the_onnx_backend(self, model):
+        backend = OnnxBackend(model)
+        segment = backend.synthesize("Hello there", voice="af_heart")
+        assert segment.duration == pytest.approx((len("Hello there") + 2) * SPEC.samples_per_token / 24000)
+        with pytest.raises(ValueError):
+            backend.create("Hello", voice="missing")
+
+
+class TestStatistics:
+    """Test timing statistics and measurement"""
+
+    def test_compute_stats(self):
+        stats = compute_stats([0.004, 0.001, 0.002, 0.003, 0.010], iterations=4)
+        assert stats["min"] == 0.001 and stats["max"] == 0.010
+        assert stats["median"] == 0.003
+        assert stats["mean"] == pytest.approx(0.004)
+        assert stats["ops"] == pytest.approx(250)
+        assert stats["iqr"] == pytest.approx(0.002)
+        assert stats["outliers"] == "1;1"
+        assert stats["rounds"] == 5 and stats["iterations"] == 4
+
+    def test_measure_calibrates_iterations(self):
+        calls = []
+        stats = measure(lambda: calls.append(1), TimingSettings(min_rounds=3, max_rounds=5, max_time=0.01,
+                                                                min_round_time=0.0005))
+        assert stats["iterations"] > 1
+        assert 3 <= stats["rounds"] <= 5
+        assert len(calls) >= stats["rounds"] * stats["iterations"]
+
+
+class TestBaselines:
+    """Test result files and regression comparison"""
+
+    def test_results_are_json(self, results):
+        names = [b["name"] for b in results["benchmarks"]]
+        assert "tokenize.codepoint[long]" in names and "cache.hit_encoded" in names
+        assert {b["layer"] for b in results["benchmarks"]} == {"tokenize", "cache"}
+        assert json.loads(json.dumps(results))["schema"] == 1
+
+    def test_comparison_flags_regressions(self, results):
+        baseline = copy.deepcopy(results)
+        for benchmark in baseline["benchmarks"]:
+            if benchmark["name"] == "cache.miss":
+                benchmark["stats"]["median"] /= 2
+        baseline["benchmarks"].append({"name": "tokenize.removed", "layer": "tokenize", "stats": {"median": 1.0}})
+        baseline["benchmarks"].append({"name": "encode.wav", "layer": "encode", "stats": {"median": 1.0}})
+
+        comparison = compare_results(results, baseline, threshold=0.2)
+        assert [row["name"] for row in comparison["regressions"]] == ["cache.miss"]
+        assert comparison["regressions"][0]["ratio"] == pytest.approx(2.0)
+        # Layers that were not run are not reported as missing
+        assert comparison["missing"] == ["tokenize.removed"]
+
+    def test_cli_exit_code(self, results, tmp_path, capsys):
+        baseline = copy.deepcopy(results)
+        for benchmark in baseline["benchmarks"]:
+            benchmark["stats"]["median"] /= 100
+        baseline_path = tmp_path / "baseline.json"
+        baseline_path.write_text(json.dumps(baseline))
+
+        argv = ["--quick", "--layers", "tokenize", "--hidden", "32", "--depth", "2", "--workdir", str(tmp_path)]
+        assert main(argv + ["--compare", str(baseline_path)]) == 1
+        assert main(argv + ["--save-baseline", str(tmp_path / "new.json")]) == 0
+        assert json.loads((tmp_path / "new.json").read_text())["layers"] == ["tokenize"]
+        capsys.readouterr()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the ONNX Runtime arena policy per input-length bucket
+"""
+
+from dataclasses import replace
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+# Shrinking buckets build their RunOptions from onnxruntime
+pytest.importorskip("onnxruntime")
+
+from LiteTTS.config import config
+from LiteTTS.performance.onnx_memory import BucketedSession, arena_settings, configure_session_options
+
+
+def memory_config(**overrides):
+    return replace(config.onnx_memory, **{"enable_mem_pattern": False, **overrides})
+
+
+@pytest.fixture(scope="module")
+def synthetic(tmp_path_factory, onnx_toolchain):
+    from LiteTTS.benchmarks.synthetic_model import SyntheticKokoro, SyntheticModelSpec, create_synthetic_assets
+
+    spec = SyntheticModelSpec(hidden=16, depth=1, samples_per_token=300)
+    model_path, voices_dir = create_synthetic_assets(str(tmp_path_factory.mktemp("model")), spec)
+    return model_path, voices_dir, SyntheticKokoro(str(model_path), str(voices_dir))
+
+
+def new_session(model_path):
+    import onnxruntime as ort
+
+    options = configure_session_options(ort.SessionOptions(), memory_config())
+    return ort.InferenceSession(str(model_path), sess_options=options, providers=["CPUExecutionProvider"])
+
+
+class TestBucketedSession:
+    """Test routing, arena shrinkage and statistics"""
+
+    def test_bucket_routing(self):
+        session = BucketedSession(object(), boundaries=(128, 64, 512), shrink_above_tokens=128)
+        assert [bucket.max_tokens for bucket in session.buckets] == [64, 128, 512]
+        assert [bucket.shrink for bucket in session.buckets] == [False, False, True]
+        assert session.bucket_for(1).max_tokens == 64
+        assert session.bucket_for(64).max_tokens == 64
+        assert session.bucket_for(65).max_tokens == 128
+        assert session.bucket_for(4000).max_tokens == 512
+
+    def test_runs_match_the_plain_session(self, synthetic):
+        model_path, _, model = synthetic
+        bucketed = BucketedSession(new_session(model_path), boundaries=(32, 128), shrink_above_tokens=32)
+        for text in ("Short.", "A much longer sentence that lands in the second bucket of the session."):
+            inputs = model.prepare_inputs(text, "af_heart")
+            expected = model.sess.run(None, inputs)[0]
+            np.testing.assert_array_equal(bucketed.run(None, inputs)[0], expected)
+
+        short, long = bucketed.stats()["buckets"]
+        assert (short["runs"], short["shrinks"], short["longest"]) == (1, 0, 8)
+        assert (long["runs"], long["shrinks"]) == (1, 1)
+        # Everything else is forwarded to the wrapped session
+        assert [node.name for node in bucketed.get_inputs()] == ["input_ids", "style", "speed"]
+
+    def test_shrinking_resets_retained_growth(self):
+        session = BucketedSession(object(), boundaries=(64, 512), shrink_above_tokens=64)
+        short, long = session.buckets
+        session._record(short, 10, 0.01, 4096, shrunk=False)
+        session._record(short, 20, 0.01, 8192, shrunk=False)
+        session._record(short, 20, 0.01, -100, shrunk=False)
+        assert session.arena_bytes() == 12288 and short.peak_growth_bytes == 8192
+
+        session._record(long, 400, 0.2, 1024, shrunk=True)
+        assert session.arena_bytes() == 1024
+        assert short.retained_bytes == 0 and short.peak_growth_bytes == 8192
+        assert session.stats()["buckets"][1]["shrinks"] == 1
+
+    def test_runs_without_shrinking_buckets_are_not_counted_as_shrinks(self):
+        class Session:
+            def run(self, output_names, input_feed, run_options=None):
+                assert run_options is None
+                return [np.zeros(4, dtype=np.float32)]
+
+        session = BucketedSession(Session(), boundaries=(64, 128), shrink_above_tokens=512)
+        assert session._shrink_options is None
+        for length in (10, 100, 1000):
+            session.run(None, {"input_ids": np.zeros((1, length), dtype=np.int64)})
+        assert [bucket.runs for bucket in session.buckets] == [1, 2]
+        assert sum(bucket.shrinks for bucket in session.buckets) == 0
+
+        # Growth is kept, since nothing released it
+        session._record(session.buckets[0], 10, 0.01, 4096, shrunk=False)
+        assert session.arena_bytes() >= 4096
+
+    def test_caller_run_options_are_kept(self, synthetic):
+        import onnxruntime as ort
+
+        model_path, _, model = synthetic
+        bucketed = BucketedSession(new_session(model_path), boundaries=(8,), shrink_above_tokens=0)
+        bucketed.run(None, model.prepare_inputs("Long enough to shrink.", "af_heart"), ort.RunOptions())
+        assert bucketed.buckets[0].shrinks == 0 and bucketed.buckets[0].runs == 1
+
+
+def test_session_options_policy(synthetic):
+    import onnxruntime as ort
+
+    options = configure_session_options(ort.SessionOptions(), memory_config())
+    assert not options.enable_mem_pattern and options.enable_cpu_mem_arena
+    if arena_settings():
+        assert options.get_session_config_entry("session.use_env_allocators") == "1"
+        assert arena_settings()["extend_strategy"] in ("same_as_requested", "next_power_of_two")
+    assert configure_session_options(ort.SessionOptions(), memory_config(enable_mem_pattern=True)).enable_mem_pattern
+
+
+def test_backend_reports_arena_bytes(synthetic):
+    from LiteTTS.benchmarks.synthetic_model import SyntheticKokoro
+    from LiteTTS.tts.backend import OnnxBackend
+
+    model_path, voices_dir, model = synthetic
+    assert OnnxBackend(model).arena_bytes() is None
+
+    bucketed = SyntheticKokoro(str(model_path), str(voices_dir))
+    bucketed.sess = BucketedSession(new_session(model_path))
+    backend = OnnxBackend(bucketed)
+    audio, _ = backend.create("Hello there.", "af_heart")
+    assert len(audio) > 0 and backend.arena_bytes() >= 0.0
+    assert sum(bucket.runs for bucket in bucketed.sess.buckets) == 1
+
+
+def test_onnx_memory_config():
+    assert config.onnx_memory.bucket_boundaries == sorted(config.onnx_memory.bucket_boundaries)
+    assert config.to_dict()["onnx_memory"]["arena_extend_strategy"] == config.onnx_memory.arena_extend_strategy
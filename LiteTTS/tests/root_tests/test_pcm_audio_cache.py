@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the format-independent PCM audio cache
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.audio.format_converter import encode_audio
+from LiteTTS.cache.cache_utils import CacheKeyGenerator
+from LiteTTS.cache.legacy import AudioCache, CacheManager
+from LiteTTS.cache.pcm import pack_pcm, quantize_pcm16, unpack_pcm
+from LiteTTS.cache.shared import SharedAudioCache
+
+SAMPLE_RATE = 24000
+FORMATS = ["mp3", "wav", "ogg", "flac"]
+
+
+def speech(seconds=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(len(t))).astype(np.float32)
+
+
+@pytest.fixture(params=["shared", "legacy"])
+def cache(request, tmp_path):
+    if request.param == "shared":
+        return SharedAudioCache(max_bytes=4 * 1024 * 1024, path=str(tmp_path / "audio.cache"))
+    return AudioCache(max_size=10)
+
+
+class TestPcmRecords:
+    """Test packing and quantization of PCM records"""
+
+    @pytest.mark.parametrize("codec", ["raw", "flac"])
+    def test_round_trip(self, codec):
+        samples = quantize_pcm16(speech())
+        restored, sample_rate = unpack_pcm(pack_pcm(samples, SAMPLE_RATE, codec))
+        np.testing.assert_array_equal(restored, samples)
+        assert sample_rate == SAMPLE_RATE
+
+    def test_flac_records_are_smaller(self):
+        samples = quantize_pcm16(speech(seconds=2.0))
+        assert len(pack_pcm(samples, SAMPLE_RATE, "flac")) < len(pack_pcm(samples, SAMPLE_RATE, "raw"))
+
+    def test_wav_from_pcm_matches_wav_from_float(self):
+        audio = speech()
+        assert encode_audio(quantize_pcm16(audio), SAMPLE_RATE, "wav") == encode_audio(audio, SAMPLE_RATE, "wav")
+
+    def test_invalid_records(self):
+        with pytest.raises(ValueError):
+            unpack_pcm(b"\0" * 32)
+        with pytest.raises(ValueError):
+            pack_pcm(quantize_pcm16(speech()), SAMPLE_RATE, "opus")
+
+
+class TestTranscodingCache:
+    """Test that one cached inference serves every response format"""
+
+    @pytest.mark.parametrize("response_format", FORMATS)
+    def test_every_format_hits_one_entry(self, cache, response_format):
+        audio = speech()
+        cache.put_pcm("Hello there", "af_heart", audio, SAMPLE_RATE,
+                      encoded={"mp3": encode_audio(audio, SAMPLE_RATE, "mp3")})
+
+        audio_data = cache.get_audio("Hello there", "af_heart", 1.0, response_format)
+        assert audio_data
+        if response_format == "wav":
+            assert audio_data == encode_audio(audio, SAMPLE_RATE, "wav")
+
+    def test_encoded_variants_skip_the_encoder(self, cache):
+        audio = speech()
+        cache.put_pcm("Hello there", "af_heart", audio, SAMPLE_RATE)
+
+        first = cache.get_audio("Hello there", "af_heart", 1.0, "wav")
+        second = cache.get_audio("Hello there", "af_heart", 1.0, "wav")
+        assert first == second
+        assert cache.encoded_stats()["transcodes"] == 1
+        assert cache.encoded_stats()["hits"] == 1
+
+    def test_seeded_encoding_is_served_as_is(self, cache):
+        cache.put_pcm("Hello there", "af_heart", speech(), SAMPLE_RATE, encoded={"mp3": b"fresh-mp3"})
+        assert cache.get_audio("Hello there", "af_heart", 1.0, "mp3") == b"fresh-mp3"
+        assert cache.encoded_stats()["transcodes"] == 0
+
+    def test_flac_codec(self, tmp_path):
+        cache = SharedAudioCache(max_bytes=4 * 1024 * 1024, path=str(tmp_path / "audio.cache"),
+                                 pcm_codec="flac", encoded_cache_bytes=0)
+        audio = speech()
+        cache.put_pcm("Hello there", "af_heart", audio, SAMPLE_RATE)
+        assert cache.get_audio("Hello there", "af_heart", 1.0, "wav") == encode_audio(audio, SAMPLE_RATE, "wav")
+        assert cache.stats()["pcm_codec"] == "flac"
+
+    def test_misses(self, cache):
+        cache.put_pcm("Hello there", "af_heart", speech(), SAMPLE_RATE)
+        assert cache.get_audio("Hello there", "af_heart", 1.5, "wav") is None
+        assert cache.get_audio("Goodbye", "af_heart", 1.0, "wav") is None
+
+    def test_clear_drops_encoded_variants(self, cache):
+        cache.put_pcm("Hello there", "af_heart", speech(), SAMPLE_RATE, encoded={"mp3": b"mp3"})
+        cache.clear()
+        assert cache.get_audio("Hello there", "af_heart", 1.0, "mp3") is None
+
+    def test_cache_manager_per_process_cache(self):
+        manager = CacheManager(audio_cache_size=5)
+        assert isinstance(manager.audio_cache, AudioCache)
+        manager.audio_cache.put_pcm("Hello there", "af_heart", speech(), SAMPLE_RATE)
+        assert manager.get_stats()["audio_cache"]["size"] == 1
+
+    def test_record_store_methods_are_required(self):
+        from LiteTTS.cache.pcm import TranscodingAudioCache
+
+        class NoRecords(TranscodingAudioCache):
+            def _get_record(self, digest):
+                return None
+
+        with pytest.raises(TypeError, match="_put_record"):
+            NoRecords()
+
+
+class TestCacheKeys:
+    """Test the format-independent key"""
+
+    def test_pcm_key_ignores_format(self):
+        pcm_key = CacheKeyGenerator.generate_pcm_cache_key("Hi", "af_heart", 1.0, model_id="q4")
+        assert pcm_key == CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, None, model_id="q4")
+        assert pcm_key != CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "wav", model_id="q4")
+
+    def test_format_still_separates_encoded_keys(self):
+        mp3 = CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "mp3")
+        wav = CacheKeyGenerator.generate_audio_cache_key("Hi", "af_heart", 1.0, "wav")
+        assert mp3 != wav
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for cooperative cancellation of progressive audio generation
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.audio.cancellation import (
+    CancellationToken, GenerationCancelled, get_cancellation_metrics
+)
+from LiteTTS.audio.chunking import ChunkingConfig, ChunkingStrategy
+from LiteTTS.audio.progressive_generator import (
+    ProgressiveAudioGenerator, ProgressiveGenerationConfig, GenerationMode
+)
+
+
+class SlowEngine:
+    """Stand-in engine that records every synthesis call"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def synthesize(self, text, voice, response_format, speed):
+        with self.lock:
+            self.calls.append(text)
+        time.sleep(self.delay)
+        return text.encode("utf-8")
+
+
+LONG_TEXT = " ".join(f"This is sentence number {i} of the test document." for i in range(40))
+
+
+def make_generator(engine, mode):
+    config = ProgressiveGenerationConfig(
+        mode=mode,
+        chunking_config=ChunkingConfig(
+            strategy=ChunkingStrategy.SENTENCE, max_chunk_size=60, min_chunk_size=10
+        ),
+        max_concurrent_chunks=2,
+        streaming_delay=0.0
+    )
+    return ProgressiveAudioGenerator(engine, config)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_cancellation_metrics().reset()
+    yield
+    get_cancellation_metrics().reset()
+
+
+class TestCancellationToken:
+    """Test the token itself"""
+
+    def test_cancel_is_idempotent(self):
+        token = CancellationToken("gen")
+        assert not token.cancelled
+        assert token.cancel("client_disconnected") is True
+        assert token.cancel("again") is False
+        assert token.reason == "client_disconnected"
+        assert get_cancellation_metrics().get_stats()["cancelled_generations"] == 1
+
+    def test_callbacks_run_once(self):
+        token = CancellationToken()
+        fired = []
+        token.add_callback(lambda t: fired.append(t.reason))
+        token.cancel("stop")
+        token.cancel("stop")
+        assert fired == ["stop"]
+
+        # Late registration fires immediately
+        token.add_callback(lambda t: fired.append("late"))
+        assert fired == ["stop", "late"]
+
+    def test_raise_if_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        with pytest.raises(GenerationCancelled):
+            token.raise_if_cancelled()
+
+
+class TestProgressiveCancellation:
+    """Test that cancelled generations stop scheduling chunk work"""
+
+    @pytest.mark.parametrize("mode", [GenerationMode.CHUNKED, GenerationMode.STREAMING])
+    def test_consumer_close_drops_unstarted_chunks(self, mode):
+        engine = SlowEngine()
+        generator = make_generator(engine, mode)
+        total_chunks = len(generator.text_chunker.chunk_text(LONG_TEXT))
+        assert total_chunks > 5
+
+        async def consume_one():
+            stream = generator.generate_progressive(LONG_TEXT, "af_heart", "wav", 1.0, "gen_close")
+            await stream.__anext__()
+            await stream.aclose()
+            # Let executor threads drain
+            await asyncio.sleep(0.3)
+
+        asyncio.run(consume_one())
+
+        assert len(engine.calls) < total_chunks
+        stats = get_cancellation_metrics().get_stats()
+        assert stats["cancelled_generations"] == 1
+        assert stats["dropped_chunks"] > 0
+        assert "gen_close" not in generator.cancellation_tokens
+
+    def test_cancel_generation_fires_token(self):
+        engine = SlowEngine()
+        generator = make_generator(engine, GenerationMode.STREAMING)
+
+        async def run():
+            results = []
+            token = CancellationToken("gen_cancel")
+            async for result in generator.generate_progressive(
+                LONG_TEXT, "af_heart", "wav", 1.0, "gen_cancel", cancellation_token=token
+            ):
+                results.append(result)
+                generator.cancel_generation("gen_cancel", reason="client_disconnected")
+            await asyncio.sleep(0.3)
+            return results, token
+
+        results, token = asyncio.run(run())
+
+        assert token.cancelled
+        assert token.reason == "client_disconnected"
+        assert len(results) < len(generator.text_chunker.chunk_text(LONG_TEXT))
+        assert get_cancellation_metrics().get_stats()["reasons"] == {"client_disconnected": 1}
+
+    def test_inference_finishing_after_cancel_is_wasted(self):
+        engine = SlowEngine(delay=0.1)
+        generator = make_generator(engine, GenerationMode.CHUNKED)
+        token = CancellationToken("gen_wasted")
+
+        def cancel_soon():
+            time.sleep(0.03)
+            token.cancel("client_disconnected")
+
+        threading.Thread(target=cancel_soon).start()
+        with pytest.raises(GenerationCancelled):
+            generator._sync_synthesize("hello", "af_heart", "wav", 1.0, token)
+
+        assert get_cancellation_metrics().get_stats()["wasted_inference_seconds"] > 0.05
+
+    def test_completed_generation_is_not_counted(self):
+        engine = SlowEngine(delay=0.0)
+        generator = make_generator(engine, GenerationMode.STREAMING)
+
+        async def run():
+            return [r async for r in generator.generate_progressive(LONG_TEXT, "af_heart", "wav")]
+
+        results = asyncio.run(run())
+
+        assert results[-1].is_final
+        assert get_cancellation_metrics().get_stats()["cancelled_generations"] == 0
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for bounded look-ahead in progressive streaming generation
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.audio.chunking import ChunkingConfig, ChunkingStrategy
+from LiteTTS.audio.progressive_generator import (
+    ProgressiveAudioGenerator, ProgressiveGenerationConfig, GenerationMode
+)
+
+
+class CountingEngine:
+    """Stand-in engine that tracks how many chunks are in flight"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def synthesize(self, text, voice, response_format, speed):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return text.encode("utf-8")
+
+
+class SampleEngine(CountingEngine):
+    """Stand-in engine that reports raw samples, like the backend and Kokoro engines"""
+
+    sample_rate = 24000
+
+    def __init__(self, delay: float = 0.05, seconds: float = 1.0):
+        super().__init__(delay)
+        self.seconds = seconds
+
+    def synthesize_samples(self, text, voice, speed):
+        self.synthesize(text, voice, "wav", speed)
+        return np.zeros(int(self.sample_rate * self.seconds), dtype=np.float32), self.sample_rate
+
+
+LONG_TEXT = " ".join(f"Sentence number {i} belongs to a very long book." for i in range(60))
+
+
+def make_generator(engine, **overrides):
+    options = dict(
+        mode=GenerationMode.STREAMING,
+        chunking_config=ChunkingConfig(
+            strategy=ChunkingStrategy.SENTENCE, max_chunk_size=60, min_chunk_size=10
+        ),
+        max_concurrent_chunks=8,
+        streaming_delay=0.0,
+        min_lookahead_chunks=1,
+        max_lookahead_chunks=3
+    )
+    options.update(overrides)
+    return ProgressiveAudioGenerator(engine, ProgressiveGenerationConfig(**options))
+
+
+class TestLookaheadWindow:
+    """Test that streaming never runs far ahead of the consumer"""
+
+    @pytest.mark.parametrize("mode", [GenerationMode.CHUNKED, GenerationMode.STREAMING])
+    def test_slow_consumer_bounds_scheduled_work(self, mode):
+        engine = CountingEngine()
+        generator = make_generator(engine, mode=mode)
+        total_chunks = len(generator.text_chunker.chunk_text(LONG_TEXT))
+        assert total_chunks > 10
+
+        async def consume_slowly():
+            consumed = 0
+            async for _ in generator.generate_progressive(LONG_TEXT, "af_heart", "wav", 1.0, "gen_slow"):
+                consumed += 1
+                await asyncio.sleep(0.03)
+                # Scheduled work is bounded by the cursor plus the window
+                assert engine.calls <= consumed + generator.config.max_lookahead_chunks
+            return consumed
+
+        consumed = asyncio.run(consume_slowly())
+
+        assert consumed == total_chunks
+        assert engine.max_in_flight <= generator.config.max_lookahead_chunks
+
+    def test_results_stay_in_order(self):
+        engine = CountingEngine(delay=0.0)
+        generator = make_generator(engine)
+
+        async def collect():
+            return [r async for r in generator.generate_progressive(LONG_TEXT, "af_heart", "wav")]
+
+        results = asyncio.run(collect())
+
+        positions = [r.metadata["chunk_position"] for r in results]
+        assert positions == sorted(positions)
+        assert results[-1].is_final
+
+    def test_chunked_mode_synthesizes_ahead(self):
+        # The engine and the server both generate in chunked mode
+        engine = CountingEngine(delay=0.05)
+        generator = make_generator(engine, mode=GenerationMode.CHUNKED)
+
+        async def collect():
+            return [r async for r in generator.generate_progressive(LONG_TEXT, "af_heart", "wav")]
+
+        results = asyncio.run(collect())
+
+        assert results[0].metadata["mode"] == "chunked"
+        assert engine.max_in_flight > 1
+
+
+class TestMeasuredRTF:
+    """Test that the RTF is measured against the real audio duration"""
+
+    def test_rtf_uses_sample_count(self):
+        engine = SampleEngine(delay=0.05, seconds=2.0)
+        generator = make_generator(engine, mode=GenerationMode.CHUNKED)
+
+        async def collect():
+            return [r async for r in generator.generate_progressive(LONG_TEXT, "af_heart", "wav")]
+
+        results = asyncio.run(collect())
+
+        assert all(r.duration == 2.0 for r in results)
+        # ~0.05s of synthesis per 2s of audio, not per len(text) * 50ms
+        assert 0.02 < generator.rtf_estimate < 0.1
+        assert generator._compute_lookahead() == 2
+
+    def test_cache_hits_keep_duration_without_measuring(self):
+        engine = SampleEngine(delay=0.0, seconds=0.5)
+        generator = make_generator(engine)
+
+        async def synthesize_twice():
+            first = await generator._synthesize_chunk("Hello there.", "af_heart", "wav", 1.0)
+            generator.rtf_estimate = None
+            second = await generator._synthesize_chunk("Hello there.", "af_heart", "wav", 1.0)
+            return first, second
+
+        first, second = asyncio.run(synthesize_twice())
+
+        assert first == second
+        assert first[1] == 0.5
+        assert engine.calls == 1
+        assert generator.rtf_estimate is None
+
+    def test_byte_only_engine_reports_no_duration(self):
+        generator = make_generator(CountingEngine(delay=0.0))
+        assert generator._sync_synthesize("Hello.", "af_heart", "wav", 1.0) == (b"Hello.", None)
+
+
+class TestLookaheadSizing:
+    """Test the RTF-derived window size"""
+
+    def test_defaults_before_measurement(self):
+        generator = make_generator(CountingEngine(), max_concurrent_chunks=2, max_lookahead_chunks=6)
+        assert generator.rtf_estimate is None
+        assert generator._compute_lookahead() == 2
+
+    def test_fast_synthesis_keeps_small_window(self):
+        generator = make_generator(CountingEngine(), max_lookahead_chunks=6)
+        generator._record_chunk_rtf(0.2, 1.0)
+        assert generator._compute_lookahead() == 2
+
+    def test_slow_synthesis_grows_window_up_to_cap(self):
+        generator = make_generator(CountingEngine(), max_lookahead_chunks=6)
+        generator._record_chunk_rtf(1.8, 1.0)
+        assert generator._compute_lookahead() == 4
+
+        for _ in range(20):
+            generator._record_chunk_rtf(10.0, 1.0)
+        assert generator._compute_lookahead() == 6
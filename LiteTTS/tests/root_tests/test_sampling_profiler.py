@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the continuous sampling profiler
+"""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.performance.profiler import SamplingProfiler
+
+
+def busy_normalizer_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(i * i for i in range(2000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_normalizer_loop, args=(stop,), name="busy-worker", daemon=True)
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+@pytest.fixture
+def idle_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name="idle-worker", daemon=True)
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+class TestSampling:
+    """Test stack sampling and aggregation"""
+
+    def test_busy_thread_is_sampled_and_idle_thread_skipped(self, busy_thread, idle_thread):
+        profiler = SamplingProfiler(sample_hz=200)
+        for _ in range(20):
+            profiler.sample()
+            time.sleep(0.001)
+
+        profile = profiler.snapshot()
+        threads = {thread for thread, _ in profile.stacks}
+        assert "busy-worker" in threads
+        assert "idle-worker" not in threads
+        assert "busy_normalizer_loop" in profile.to_folded()
+
+        top = [entry["function"] for entry in profile.top_functions(50)]
+        assert any(name.startswith("busy_normalizer_loop") for name in top)
+
+    def test_include_idle_keeps_waiting_threads(self, idle_thread):
+        profiler = SamplingProfiler(include_idle=True)
+        profiler.sample()
+        assert "idle-worker" in {thread for thread, _ in profiler.snapshot().stacks}
+
+    def test_folded_lines_are_flamegraph_compatible(self, busy_thread):
+        profiler = SamplingProfiler()
+        profiler.sample()
+        for line in profiler.snapshot().to_folded().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) >= 1
+            assert stack.split(";")[0]
+
+    def test_stack_depth_is_bounded(self, busy_thread):
+        profiler = SamplingProfiler(max_depth=2)
+        profiler.sample()
+        for _, stack in profiler.snapshot().stacks:
+            assert len(stack) <= 3
+
+    def test_distinct_stacks_per_bucket_are_bounded(self, busy_thread, idle_thread):
+        profiler = SamplingProfiler(max_stacks=1, include_idle=True)
+        profiler.sample(now=100.0)
+        stacks = profiler.snapshot().stacks
+        assert len(stacks) <= 1 + threading.active_count()
+        assert any(stack == (0,) for _, stack in stacks)
+
+    def test_window_keeps_recent_buckets_only(self, busy_thread):
+        profiler = SamplingProfiler(window_seconds=3)
+        now = time.monotonic()
+        for offset in range(6, 0, -1):
+            profiler.sample(now=now - offset)
+        profiler.sample(now=now)
+
+        assert profiler.get_stats()["buckets"] == 3
+        recent = profiler.snapshot(seconds=0.5).total_samples
+        assert 0 < recent < profiler.snapshot().total_samples
+
+
+class TestSpeedscope:
+    """Test speedscope export"""
+
+    def test_speedscope_profile_is_consistent(self, busy_thread):
+        profiler = SamplingProfiler(sample_hz=100)
+        for _ in range(5):
+            profiler.sample()
+
+        document = profiler.snapshot().to_speedscope("test")
+        assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+        n_frames = len(document["shared"]["frames"])
+        assert document["profiles"]
+
+        for profile in document["profiles"]:
+            assert profile["type"] == "sampled"
+            assert len(profile["samples"]) == len(profile["weights"])
+            assert all(0 <= frame < n_frames for sample in profile["samples"] for frame in sample)
+            assert profile["endValue"] == pytest.approx(sum(profile["weights"]))
+
+        busy = next(p for p in document["profiles"] if p["name"] == "busy-worker")
+        assert sum(busy["weights"]) == pytest.approx(5 * 0.01)
+
+
+class TestLifecycle:
+    """Test the background sampling thread"""
+
+    def test_on_demand_capture_stops_sampler(self, busy_thread):
+        profiler = SamplingProfiler(sample_hz=200)
+        profiler.acquire()
+        assert profiler.is_running
+        time.sleep(0.1)
+        profiler.release()
+
+        assert not profiler.is_running
+        assert profiler.snapshot(seconds=5).total_samples > 0
+
+    def test_continuous_sampling_survives_on_demand_release(self):
+        profiler = SamplingProfiler(sample_hz=100)
+        profiler.start()
+        profiler.acquire()
+        profiler.release()
+        assert profiler.is_running
+
+        profiler.stop()
+        assert not profiler.is_running
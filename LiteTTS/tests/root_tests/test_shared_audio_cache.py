@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-worker shared audio cache
+"""
+
+from pathlib import Path
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.cache.legacy import CacheManager
+from LiteTTS.cache.shared import LocalAudioStore, MmapAudioArena, SharedAudioCache, cache_digest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the shared arena needs fcntl")
+
+ARENA_BYTES = 256 * 1024
+SAMPLE_RATE = 24000
+
+
+def pcm(seconds=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 3000).astype(np.int16)
+
+
+def worker_round_trip(path, queue):
+    """Runs in a separate process: read the parent's entry and add one"""
+    cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=path)
+    queue.put(cache.get_pcm("hello", "af_heart", 1.0))
+    cache.put_pcm("from worker", "af_heart", pcm(seed=1), SAMPLE_RATE)
+    queue.put(cache.stats()["aggregate"])
+
+
+class TestMmapAudioArena:
+    """Test the memory-mapped ring"""
+
+    def test_put_and_get(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        arena.put(cache_digest("a"), b"x" * 1000)
+        assert arena.get(cache_digest("a")) == b"x" * 1000
+        assert arena.get(cache_digest("b")) is None
+        assert arena.stats()["worker"]["hits"] == 1
+
+    def test_entries_are_visible_to_a_second_mapping(self, tmp_path):
+        path = str(tmp_path / "audio.cache")
+        writer = MmapAudioArena(path, ARENA_BYTES)
+        reader = MmapAudioArena(path, ARENA_BYTES)
+        writer.put(cache_digest("a"), b"shared")
+        assert reader.get(cache_digest("a")) == b"shared"
+
+    def test_eviction_is_bounded_by_bytes(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        for i in range(200):
+            assert arena.put(cache_digest(i), bytes([i % 256]) * 4000)
+
+        stats = arena.stats()
+        assert stats["bytes_used"] <= ARENA_BYTES
+        assert 0 < stats["entries"] < 200
+        assert arena.get(cache_digest(0)) is None
+        assert arena.get(cache_digest(199)) == bytes([199]) * 4000
+
+    def test_hot_entries_get_a_second_chance(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        arena.put(cache_digest("hot"), b"h" * 4000)
+        for i in range(200):
+            arena.put(cache_digest(i), b"c" * 4000)
+            assert arena.get(cache_digest("hot")) == b"h" * 4000
+
+    def test_oversized_values_are_rejected(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        assert not arena.put(cache_digest("big"), b"x" * ARENA_BYTES)
+        assert arena.get(cache_digest("big")) is None
+
+    def test_ttl(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        arena.put(cache_digest("short"), b"x", ttl=1)
+        assert arena.get(cache_digest("short")) == b"x"
+        time.sleep(1.1)
+        assert arena.get(cache_digest("short")) is None
+
+    def test_second_chance_keeps_the_original_expiry(self, tmp_path):
+        arena = MmapAudioArena(str(tmp_path / "audio.cache"), ARENA_BYTES)
+        arena.put(cache_digest("hot"), b"h" * 4000, ttl=1)
+        created = arena._read(cache_digest("hot"))[3]
+        for i in range(100):
+            arena.put(cache_digest(i), b"c" * 4000)
+            arena.get(cache_digest("hot"))
+        payload, offset, ttl, refreshed_created = arena._read(cache_digest("hot"))
+        assert payload == b"h" * 4000 and offset > ARENA_BYTES and ttl == 1 and refreshed_created == created
+        time.sleep(1.1)
+        assert arena.get(cache_digest("hot")) is None
+
+    def test_clear(self, tmp_path):
+        path = str(tmp_path / "audio.cache")
+        arena = MmapAudioArena(path, ARENA_BYTES)
+        arena.put(cache_digest("a"), b"x")
+        MmapAudioArena(path, ARENA_BYTES).clear()
+        assert arena.get(cache_digest("a")) is None
+        assert arena.stats()["entries"] == 0
+
+
+class TestSharedAudioCache:
+    """Test the SharedAudioCache front end"""
+
+    def test_hit_across_processes(self, tmp_path):
+        path = str(tmp_path / "audio.cache")
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=path)
+        cache.put_pcm("hello", "af_heart", pcm(), SAMPLE_RATE)
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=worker_round_trip, args=(path, queue))
+        process.start()
+        try:
+            samples, sample_rate = queue.get(timeout=60)
+            aggregate = queue.get(timeout=60)
+        finally:
+            process.join(timeout=60)
+
+        np.testing.assert_array_equal(samples, pcm())
+        assert sample_rate == SAMPLE_RATE
+        assert aggregate["workers"] == 2
+        assert aggregate["hits"] == 1
+        np.testing.assert_array_equal(cache.get_pcm("from worker", "af_heart")[0], pcm(seed=1))
+
+    def test_keys_include_text_voice_speed_and_model(self, tmp_path):
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=str(tmp_path / "audio.cache"))
+        cache.put_pcm("hello", "af_heart", pcm(), SAMPLE_RATE, 1.0)
+        assert cache.get_pcm("hello", "af_heart", 1.0) is not None
+        assert cache.get_pcm("hello", "af_heart", 1.2) is None
+        assert cache.get_pcm("hello", "am_adam", 1.0) is None
+        assert cache.get_pcm("goodbye", "af_heart", 1.0) is None
+
+        other_model = SharedAudioCache(max_bytes=ARENA_BYTES, path=str(tmp_path / "audio.cache"),
+                                       namespace="model_fp16.onnx")
+        assert other_model.get_pcm("hello", "af_heart", 1.0) is None
+
+    def test_legacy_stats_keys(self, tmp_path):
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=str(tmp_path / "audio.cache"))
+        cache.put_pcm("hello", "af_heart", pcm(), SAMPLE_RATE)
+        cache.get_pcm("hello", "af_heart")
+        cache.get_pcm("missing", "af_heart")
+
+        stats = cache.stats()
+        assert stats["backend"] == "mmap"
+        assert stats["size"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_local_store(self):
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, shared=False)
+        assert isinstance(cache.store, LocalAudioStore)
+        for i in range(200):
+            cache.put_pcm(f"text {i}", "af_heart", pcm(), SAMPLE_RATE)
+
+        stats = cache.stats()
+        assert stats["bytes_used"] <= ARENA_BYTES
+        assert cache.get_pcm("text 0", "af_heart") is None
+        assert cache.get_pcm("text 199", "af_heart") is not None
+
+    def test_unusable_path_falls_back_to_local_store(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_bytes(b"")
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=str(blocker / "audio.cache"))
+        assert isinstance(cache.store, LocalAudioStore)
+        cache.put_pcm("hello", "af_heart", pcm(), SAMPLE_RATE)
+        np.testing.assert_array_equal(cache.get_pcm("hello", "af_heart")[0], pcm())
+
+    def test_full_shm_falls_back_to_local_store(self, tmp_path, monkeypatch):
+        import errno
+        import os
+
+        def no_space(fd, offset, length):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(os, "posix_fallocate", no_space, raising=False)
+        path = tmp_path / "audio.cache"
+        cache = SharedAudioCache(max_bytes=ARENA_BYTES, path=str(path))
+        assert isinstance(cache.store, LocalAudioStore)
+        assert path.stat().st_size == 0
+
+    def test_cache_manager_uses_the_shared_cache(self, tmp_path):
+        manager = CacheManager(audio_cache_mb=1, shared_cache_path=str(tmp_path / "audio.cache"))
+        assert isinstance(manager.audio_cache, SharedAudioCache)
+        manager.audio_cache.put_pcm("hello", "af_heart", pcm(), SAMPLE_RATE)
+        assert manager.get_stats()["audio_cache"]["size"] == 1
+        manager.clear_all()
+        assert manager.audio_cache.get_pcm("hello", "af_heart") is None
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-request staged synthesis pipeline
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+import contextvars
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.nlp.frontend_pool import FrontEndProcessor
+from LiteTTS.tts.pipeline import (
+    PipelineClosed, PipelineFull, PipelineStage, StagedPipeline, SynthesisJob, build_synthesis_pipeline
+)
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def sleeper(seconds, tag):
+    def stage(item):
+        time.sleep(seconds)
+        return item + [tag]
+    return stage
+
+
+def pipeline_config(**overrides):
+    values = dict(nlp_executor="thread", nlp_workers=1, inference_workers=1, encode_workers=1, queue_size=4)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture(scope="module")
+def backend(tmp_path_factory, onnx_toolchain):
+    from LiteTTS.benchmarks.synthetic_model import SyntheticKokoro, SyntheticModelSpec, create_synthetic_assets
+    from LiteTTS.tts.backend import OnnxBackend
+
+    spec = SyntheticModelSpec(hidden=16, depth=1, samples_per_token=300)
+    model_path, voices_dir = create_synthetic_assets(str(tmp_path_factory.mktemp("pipeline")), spec)
+    model = SyntheticKokoro(str(model_path), str(voices_dir))
+    return OnnxBackend(model, sample_rate=model.sample_rate)
+
+
+class TestStagedPipeline:
+    """Test the generic stage machinery"""
+
+    def test_items_pass_through_every_stage_in_order(self):
+        with StagedPipeline([PipelineStage("a", lambda x: x + ["a"]),
+                             PipelineStage("b", lambda x: x + ["b"])]) as pipeline:
+            assert pipeline.run([]) == ["a", "b"]
+
+    def test_requests_overlap_across_stages(self):
+        stages = [PipelineStage(name, sleeper(0.05, name)) for name in ("nlp", "inference", "encode")]
+        with StagedPipeline(stages) as pipeline:
+            started = time.perf_counter()
+            futures = [pipeline.submit([]) for _ in range(10)]
+            assert all(future.result(10) == ["nlp", "inference", "encode"] for future in futures)
+            elapsed = time.perf_counter() - started
+        # Back to back would take 10 * 3 * 50 ms; pipelined it is about (10 + 2) * 50 ms
+        assert elapsed < 1.1
+
+    def test_full_queue_rejects_without_waiting(self):
+        release = threading.Event()
+        with StagedPipeline([PipelineStage("slow", lambda x: release.wait(10) and x, queue_size=1)]) as pipeline:
+            first = pipeline.submit(1)
+            deadline = time.monotonic() + 5
+            while pipeline.stats()["stages"]["slow"]["busy_workers"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            queued = pipeline.submit(2)
+            with pytest.raises(PipelineFull):
+                pipeline.submit(3, timeout=0)
+            with pytest.raises(PipelineFull):
+                pipeline.submit(3, timeout=0.05)
+            release.set()
+            assert first.result(5) == 1 and queued.result(5) == 2
+            assert pipeline.stats()["rejected"] == 2
+
+    def test_stage_errors_fail_the_request_only(self):
+        def fail_on_odd(x):
+            if x % 2:
+                raise ValueError(f"odd {x}")
+            return x
+
+        calls = []
+        stages = [PipelineStage("check", fail_on_odd), PipelineStage("record", lambda x: calls.append(x) or x)]
+        with StagedPipeline(stages) as pipeline:
+            futures = [pipeline.submit(i) for i in range(4)]
+            with pytest.raises(ValueError, match="odd 1"):
+                futures[1].result(5)
+            assert [futures[i].result(5) for i in (0, 2)] == [0, 2]
+            futures[3].exception(5)
+            stats = pipeline.stats()
+        assert sorted(calls) == [0, 2]
+        assert stats["stages"]["check"]["failed"] == 2
+        assert stats["completed"] == 2 and stats["failed"] == 2 and stats["in_flight"] == 0
+
+    def test_cancelled_requests_are_dropped_before_running(self):
+        release = threading.Event()
+        ran = []
+
+        def stage(x):
+            release.wait(10)
+            ran.append(x)
+            return x
+
+        with StagedPipeline([PipelineStage("slow", stage)]) as pipeline:
+            first = pipeline.submit(1)
+            second = pipeline.submit(2)
+            assert second.cancel()
+            release.set()
+            assert first.result(5) == 1
+        assert ran == [1]
+        assert pipeline.stats()["stages"]["slow"]["cancelled"] == 1
+
+    def test_background_work_leaves_room_for_interactive_requests(self):
+        release = threading.Event()
+        with StagedPipeline([PipelineStage("slow", lambda x: release.wait(10) and x, queue_size=4)]) as pipeline:
+            assert pipeline.background_slots == 2
+            results = []
+            batch = [threading.Thread(target=lambda i=i: results.append(pipeline.run(i, background=True)))
+                     for i in range(5)]
+            for thread in batch:
+                thread.start()
+            deadline = time.monotonic() + 5
+            while pipeline.stats()["submitted"] < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+
+            # Two background jobs hold their slots; the other three wait without queueing
+            assert pipeline.stats()["submitted"] == 2
+            interactive = [pipeline.submit(f"request-{i}", timeout=0) for i in range(3)]
+            release.set()
+            assert [future.result(5) for future in interactive] == ["request-0", "request-1", "request-2"]
+            for thread in batch:
+                thread.join(5)
+        assert sorted(results) == [0, 1, 2, 3, 4]
+        assert pipeline.stats()["rejected"] == 0
+
+    def test_stats_show_the_bottleneck(self):
+        stages = [PipelineStage("fast", sleeper(0.001, "fast")),
+                  PipelineStage("slow", sleeper(0.03, "slow"))]
+        with StagedPipeline(stages) as pipeline:
+            for future in [pipeline.submit([]) for _ in range(8)]:
+                future.result(10)
+            stats = pipeline.stats()["stages"]
+        assert stats["slow"]["processed"] == 8
+        assert stats["slow"]["utilization"] > stats["fast"]["utilization"]
+        assert stats["slow"]["avg_service_ms"] >= 25
+        assert stats["slow"]["max_queue_depth"] >= 1
+
+    def test_stages_run_in_the_submitters_context(self):
+        with StagedPipeline([PipelineStage("read", lambda _: request_id.get())]) as pipeline:
+            request_id.set("abc")
+            assert pipeline.run(None) == "abc"
+
+    def test_shutdown_drains_then_rejects(self):
+        pipeline = StagedPipeline([PipelineStage("a", sleeper(0.01, "a")), PipelineStage("b", sleeper(0.01, "b"))])
+        futures = [pipeline.submit([]) for _ in range(5)]
+        pipeline.shutdown()
+        assert all(future.done() for future in futures)
+        with pytest.raises(PipelineClosed):
+            pipeline.submit([])
+
+    def test_invalid_stage(self):
+        with pytest.raises(ValueError):
+            PipelineStage("bad", lambda x: x, workers=0)
+
+
+def test_jobs_without_a_format_skip_encoding():
+    from LiteTTS.tts.pipeline import _encode
+
+    job = SynthesisJob(text="Hi.", voice="af_heart", backend=None, response_format=None,
+                       audio=np.zeros((1, 240), dtype=np.float64), sample_rate=24000)
+    job = _encode(job)
+    assert job.audio_data is None
+    assert job.audio.dtype == np.float32 and job.audio.shape == (240,)
+
+
+class TestSynthesisPipeline:
+    """Test the NLP -> inference -> encode pipeline on the synthetic model"""
+
+    def job(self, backend, text="Hello there. How are you?"):
+        return SynthesisJob(text=text, voice="af_heart", backend=backend, response_format="wav")
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_pipeline_produces_encoded_audio(self, backend, executor):
+        with build_synthesis_pipeline(pipeline_config(nlp_executor=executor, nlp_workers=2)) as pipeline:
+            jobs = [pipeline.submit(self.job(backend, f"Sentence number {i}.")) for i in range(4)]
+            results = [future.result(60) for future in jobs]
+            stats = pipeline.stats()
+
+        for result in results:
+            assert result.processed_text
+            assert result.audio.dtype == np.float32 and result.audio.ndim == 1
+            assert result.audio_data[:4] == b"RIFF"
+            assert result.generation_time > 0
+        assert set(stats["stages"]) == {"nlp", "inference", "encode"}
+        assert stats["completed"] == 4
+
+    def test_nlp_matches_the_inline_preprocessing(self, backend):
+        text = "Dr. Smith paid $5 on Jan. 5th."
+        with build_synthesis_pipeline(pipeline_config(nlp_executor="process")) as pipeline:
+            result = pipeline.run(self.job(backend, text))
+        assert result.processed_text == FrontEndProcessor()(text)
+
+    def test_unknown_voice_fails_the_job(self, backend):
+        job = self.job(backend)
+        job.voice = "nobody"
+        with build_synthesis_pipeline(pipeline_config()) as pipeline:
+            with pytest.raises(ValueError):
+                pipeline.run(job)
+            assert pipeline.stats()["stages"]["inference"]["failed"] == 1
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming WSOLA time stretcher
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.audio.audio_segment import AudioSegment
+from LiteTTS.audio.processor import AudioProcessor
+from LiteTTS.audio.time_stretcher import (
+    StreamingTimeStretcher, StretchQuality, TimeStretchConfig, TimeStretcher
+)
+
+SAMPLE_RATE = 24000
+
+
+def tone(seconds=2.0, frequency=220.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 3 * t)
+    return (0.5 * np.sin(2 * np.pi * frequency * t) * envelope).astype(np.float32)
+
+
+def dominant_frequency(audio):
+    window = audio[SAMPLE_RATE // 4:SAMPLE_RATE // 4 + SAMPLE_RATE]
+    return np.argmax(np.abs(np.fft.rfft(window))) * SAMPLE_RATE / len(window)
+
+
+def stream_in_chunks(stretcher, audio, seed=0):
+    rng = np.random.default_rng(seed)
+    parts, position = [], 0
+    while position < len(audio):
+        size = int(rng.integers(1, 4000))
+        parts.append(stretcher.process(audio[position:position + size]))
+        position += size
+    parts.append(stretcher.flush())
+    return np.concatenate(parts)
+
+
+class TestStreamingTimeStretcher:
+    """Test WSOLA output and streaming behaviour"""
+
+    @pytest.mark.parametrize("ratio", [0.8, 1.2, 1.5, 2.0])
+    def test_length_and_pitch(self, ratio):
+        audio = tone()
+        stretched = StreamingTimeStretcher(ratio, SAMPLE_RATE).stretch(audio)
+        assert len(stretched) == round(len(audio) * ratio)
+        assert dominant_frequency(stretched) == pytest.approx(220.0, abs=2.0)
+
+    @pytest.mark.parametrize("ratio", [0.8, 1.25])
+    def test_chunking_does_not_change_output(self, ratio):
+        audio = tone()
+        whole = StreamingTimeStretcher(ratio, SAMPLE_RATE).stretch(audio)
+        streamed = stream_in_chunks(StreamingTimeStretcher(ratio, SAMPLE_RATE), audio)
+        np.testing.assert_array_equal(streamed, whole)
+
+    def test_level_is_preserved(self):
+        sine = (0.5 * np.sin(2 * np.pi * 200 * np.arange(2 * SAMPLE_RATE) / SAMPLE_RATE)).astype(np.float32)
+        stretched = StreamingTimeStretcher(1.25, SAMPLE_RATE).stretch(sine)
+        frames = stretched[:len(stretched) // 480 * 480].reshape(-1, 480)
+        rms = np.sqrt((frames[2:-2] ** 2).mean(axis=1))
+        assert rms.min() > 0.33 and rms.max() < 0.37
+
+    def test_output_lag_is_bounded(self):
+        stretcher = StreamingTimeStretcher(1.2, SAMPLE_RATE)
+        audio = tone()
+        fed, produced = 0, 0
+        for start in range(0, len(audio), 2400):
+            chunk = audio[start:start + 2400]
+            produced += len(stretcher.process(chunk))
+            fed += len(chunk)
+            assert produced >= (fed - stretcher.latency_samples) * 1.2 - stretcher.frame_length
+
+    def test_flush_resets_for_the_next_stream(self):
+        stretcher = StreamingTimeStretcher(1.3, SAMPLE_RATE)
+        first = stretcher.stretch(tone())
+        second = stretcher.stretch(tone())
+        np.testing.assert_array_equal(first, second)
+        assert stretcher.samples_in == 2 * len(tone())
+
+    def test_unit_ratio_passes_audio_through(self):
+        audio = tone()
+        stretcher = StreamingTimeStretcher(1.0, SAMPLE_RATE)
+        np.testing.assert_array_equal(stretcher.process(audio), audio)
+        assert len(stretcher.flush()) == 0
+
+    def test_invalid_ratio(self):
+        with pytest.raises(ValueError):
+            StreamingTimeStretcher(0.0)
+
+
+class TestTimeStretcherIntegration:
+    """Test the TimeStretcher entry points that use WSOLA"""
+
+    def test_low_quality_uses_wsola(self):
+        stretcher = TimeStretcher(TimeStretchConfig(enabled=True, correction_quality=StretchQuality.LOW))
+        segment = AudioSegment(audio_data=tone(), sample_rate=SAMPLE_RATE)
+        stretched, metrics = stretcher.stretch_audio_to_normal_speed(segment, 1.2)
+
+        assert len(stretched.audio_data) == round(len(segment.audio_data) * 1.2)
+        assert dominant_frequency(stretched.audio_data) == pytest.approx(220.0, abs=2.0)
+        assert metrics.stretched_duration == pytest.approx(segment.duration * 1.2, rel=1e-3)
+
+    def test_stream_metrics(self):
+        stretcher = TimeStretcher(TimeStretchConfig(enabled=True, compress_playback_rate=25))
+        stream = stretcher.create_stream(stretcher.get_generation_speed_multiplier(), SAMPLE_RATE)
+        stream_in_chunks(stream, tone())
+
+        metrics = stretcher.record_stream_metrics(stream, generation_time=0.5)
+        assert metrics.original_duration == pytest.approx(2.0)
+        assert metrics.stretched_duration == pytest.approx(2.5, rel=1e-3)
+        assert metrics.rtf_original == pytest.approx(0.25)
+        assert stretcher.metrics_history[-1] is metrics
+
+    def test_chunk_optimization_is_level_stable(self):
+        processor = AudioProcessor()
+        quiet = AudioSegment(audio_data=tone() * 0.2, sample_rate=SAMPLE_RATE)
+        optimized = processor.optimize_chunk_for_streaming(quiet, volume_multiplier=1.5)
+
+        # No per-chunk peak normalization: a quiet chunk only gets the volume gain
+        np.testing.assert_allclose(optimized.audio_data, quiet.audio_data * 1.5, atol=1e-6)
+        loud = AudioSegment(audio_data=tone() * 4, sample_rate=SAMPLE_RATE)
+        assert np.max(np.abs(processor.optimize_chunk_for_streaming(loud, 5.0).audio_data)) <= 1.0
+
+    def test_request_overrides(self):
+        disabled = TimeStretcher(TimeStretchConfig())
+        assert disabled.for_request(None, text_length=500) is None
+        assert disabled.for_request(False, 40) is None
+        forced = disabled.for_request(True, text_length=5)
+        assert forced.get_generation_speed_multiplier() == pytest.approx(1.2)
+        assert disabled.for_request(True, 50, "low").config.correction_quality == StretchQuality.LOW
+
+        enabled = TimeStretcher(TimeStretchConfig(enabled=True))
+        assert enabled.for_request(None, text_length=500) is enabled
+        assert enabled.for_request(None, text_length=5) is None
+
+
+def test_time_stretched_stream_endpoint():
+    import io
+
+    import soundfile as sf
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    from LiteTTS.audio.stretched_stream import stream_time_stretched
+
+    calls = []
+
+    def synthesize(text, speed):
+        calls.append((text, speed))
+        return tone(0.05 * len(text) / speed), SAMPLE_RATE
+
+    app = FastAPI()
+    stretcher = TimeStretcher(TimeStretchConfig()).for_request(True, 25)
+
+    @app.post("/stream")
+    async def stream(text: str):
+        return StreamingResponse(stream_time_stretched(synthesize, text, 1.0, "wav", stretcher,
+                                                       max_chunk_length=40), media_type="audio/wav")
+
+    text = "The first sentence is here. A second one follows it. And the third one ends the text."
+    with TestClient(app).stream("POST", "/stream", params={"text": text}) as response:
+        assert response.status_code == 200
+        body = b"".join(response.iter_raw())
+    # Transport chunks don't follow block boundaries; every block is a whole WAV file
+    blocks = [b"RIFF" + block for block in body.split(b"RIFF")[1:]]
+
+    # Each chunk was generated 25% faster and stretched back to normal speed
+    assert len(calls) == 3 and all(speed == pytest.approx(1.25) for _, speed in calls)
+    audio = [sf.read(io.BytesIO(block))[0] for block in blocks]
+    assert len(audio) >= 3
+    expected = sum(len(tone(0.05 * len(chunk) / 1.25)) for chunk, _ in calls) * 1.25
+    assert sum(len(part) for part in audio) == pytest.approx(expected, abs=4)
+
+
+def test_sentence_split_packs_without_overlap():
+    from LiteTTS.audio.stretched_stream import split_sentences
+
+    text = "One. Two is here! Three? A much longer fourth sentence that exceeds the limit."
+    chunks = split_sentences(text, max_chunk_length=20)
+    assert chunks == ["One. Two is here!", "Three?", "A much longer fourth sentence that exceeds the limit."]
+    assert " ".join(chunks) == text
+
+
+def test_whole_synthesis_matches_the_stream():
+    from LiteTTS.audio.stretched_stream import split_sentences, synthesize_time_stretched
+
+    def synthesize(text, speed):
+        return tone(0.05 * len(text) / speed), SAMPLE_RATE
+
+    text = "The first sentence is here. A second one follows it. And the third one ends the text."
+    stretcher = TimeStretcher(TimeStretchConfig()).for_request(True, 25)
+    audio, sample_rate = synthesize_time_stretched(synthesize, text, 1.0, stretcher, max_chunk_length=40)
+    streamed = stretcher.stream_synthesis(synthesize, split_sentences(text, 40), 1.0)
+
+    assert sample_rate == SAMPLE_RATE
+    np.testing.assert_array_equal(audio, np.concatenate([block for block, _ in streamed]))
+
+
+class TestTimeStretchingSettings:
+    """The server builds its time-stretcher from beta_features.time_stretching_optimization"""
+
+    def test_settings_map_onto_the_stretch_config(self):
+        from dataclasses import replace
+        from LiteTTS.audio.time_stretcher import config_from_settings
+        from LiteTTS.config import config
+
+        settings = replace(config.time_stretching, enabled=True, generation_speed_boost=40, correction_quality="low")
+        stretch_config = config_from_settings(settings)
+        assert stretch_config.enabled and stretch_config.compress_playback_rate == 40
+        assert stretch_config.correction_quality == StretchQuality.LOW
+        assert stretch_config.max_rate == settings.max_speed_boost
+        assert config.to_dict()["time_stretching"]["enabled"] == config.time_stretching.enabled
+
+    def test_application_uses_the_configured_stretcher(self, monkeypatch):
+        import importlib
+        from dataclasses import replace
+        from types import SimpleNamespace
+        from fastapi import HTTPException
+        from LiteTTS.config import config
+
+        monkeypatch.setenv("LITETTS_IMPORT_ONLY", "1")
+        app_module = importlib.import_module("app")
+        application = app_module.LiteTTSApplication.__new__(app_module.LiteTTSApplication)
+        application.config = SimpleNamespace(time_stretching=replace(
+            config.time_stretching, enabled=True, generation_speed_boost=40
+        ))
+        application._time_stretcher = None
+
+        def request(**fields):
+            return app_module.TTSRequest(input="A sentence long enough to stretch.", **fields)
+
+        stretcher = application._time_stretcher_for(request())
+        assert stretcher.get_generation_speed_multiplier() == pytest.approx(1.4)
+        assert application._time_stretcher_for(request(time_stretching_enabled=False)) is None
+        with pytest.raises(HTTPException) as raised:
+            application._time_stretcher_for(request(time_stretching_quality="ultra"))
+        assert raised.value.status_code == 400
+
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable synthesis backend interface
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.tts.backend import (
+    BackendCapabilities, BackendRouter, OnnxBackend, SynthesisBackend,
+    create_backend, registered_backends
+)
+from LiteTTS.tts.ttscpp_backend import TTSCppLibrary, find_library
+from LiteTTS.validation import validate_request
+
+
+class FakeKokoro:
+    """kokoro_onnx.Kokoro stand-in"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, text, voice, speed=1.0, lang="en-us"):
+        self.calls.append((text, voice, speed, lang))
+        return np.zeros(2400, dtype=np.float32), 24000
+
+    def get_voices(self):
+        return ["af_heart", "am_puck"]
+
+    def synthesize_with_preset_blend(self, *args):
+        return "blended"
+
+
+class FixedSpeedBackend(SynthesisBackend):
+    name = "fixed"
+    capabilities = BackendCapabilities(speed_control=False)
+
+    @property
+    def sample_rate(self):
+        return 24000
+
+    def get_voices(self):
+        return ["af_heart"]
+
+    def create(self, text, voice, speed=1.0, lang="en-us"):
+        return np.ones(10, dtype=np.float32), 24000
+
+
+class TestOnnxBackend:
+    """Test the kokoro_onnx wrapper"""
+
+    def test_create_and_synthesize_delegate(self):
+        model = FakeKokoro()
+        backend = OnnxBackend(model)
+
+        audio, sample_rate = backend.create("hello", voice="af_heart", speed=1.2)
+        segment = backend.synthesize("hello", voice="am_puck")
+
+        assert sample_rate == 24000 and len(audio) == 2400
+        assert model.calls[0] == ("hello", "af_heart", 1.2, "en-us")
+        assert segment.duration == pytest.approx(0.1)
+        assert segment.metadata["backend"] == "onnx"
+
+    def test_model_attributes_are_forwarded(self):
+        backend = OnnxBackend(FakeKokoro())
+        assert hasattr(backend, "synthesize_with_preset_blend")
+        assert not hasattr(backend, "progressive_generator")
+
+    def test_reload_drains_and_drops_the_old_model_first(self):
+        import threading
+        import weakref
+
+        release = threading.Event()
+
+        class SlowKokoro(FakeKokoro):
+            def create(self, *args, **kwargs):
+                release.wait(5)
+                return super().create(*args, **kwargs)
+
+        old = SlowKokoro()
+        old_ref = weakref.ref(old)
+        backend = OnnxBackend(old)
+        del old
+        worker = threading.Thread(target=backend.create, args=("hello", "af_heart"))
+        worker.start()
+
+        seen = {}
+
+        def load():
+            seen["old_alive"] = old_ref() is not None
+            return FakeKokoro()
+
+        reloader = threading.Thread(target=backend.reload_model, args=(load,))
+        reloader.start()
+        reloader.join(0.2)
+        assert reloader.is_alive() and "old_alive" not in seen  # Waiting for the running call
+        release.set()
+        worker.join(5)
+        reloader.join(5)
+        assert seen == {"old_alive": False}
+        assert backend.create("next", voice="af_heart")[1] == 24000
+
+    def test_failed_reload_is_raised(self):
+        backend = OnnxBackend(FakeKokoro())
+
+        def broken():
+            raise RuntimeError("no such variant")
+
+        with pytest.raises(RuntimeError):
+            backend.reload_model(broken)
+        assert backend.model is None
+        backend.reload_model(FakeKokoro)
+        assert backend.create("back", voice="af_heart")[1] == 24000
+
+
+class TestBackendRouter:
+    """Test per-request backend selection"""
+
+    def test_default_and_named_selection(self):
+        onnx = OnnxBackend(FakeKokoro())
+        fixed = FixedSpeedBackend()
+        router = BackendRouter(onnx)
+        router.add(fixed, make_default=True)
+
+        assert router.select() is fixed
+        assert router.select("onnx") is onnx
+        assert router.names() == ["fixed", "onnx"]
+
+    def test_unsupported_speed_falls_back(self):
+        onnx = OnnxBackend(FakeKokoro())
+        router = BackendRouter(onnx)
+        router.add(FixedSpeedBackend())
+
+        assert router.select("fixed", speed=1.0).name == "fixed"
+        assert router.select("fixed", speed=1.5) is onnx
+
+    def test_unknown_backend_is_rejected(self):
+        router = BackendRouter(OnnxBackend(FakeKokoro()))
+        with pytest.raises(ValueError):
+            router.select("missing")
+
+
+class TestRegistry:
+    """Test backend factories"""
+
+    def test_builtin_backends_registered(self):
+        assert {"onnx", "ttscpp"} <= set(registered_backends())
+
+    def test_unknown_factory(self):
+        with pytest.raises(ValueError):
+            create_backend("nope")
+
+    def test_ttscpp_requires_model_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            create_backend("ttscpp", model_path=str(tmp_path / "missing.gguf"))
+
+
+class TestTTSCppLibrary:
+    """Test the ctypes binding against a built library, when one is available"""
+
+    def test_missing_library_reports_build_hint(self, tmp_path):
+        with pytest.raises(RuntimeError, match="TTS_BUILD_C_API"):
+            TTSCppLibrary(str(tmp_path / "libtts_c.so"))
+
+    @pytest.mark.skipif(find_library() is None, reason="tts_c library not built")
+    def test_library_binding(self):
+        library = TTSCppLibrary()
+        assert library.lib.tts_c_api_version() == 1
+        assert library.lib.tts_c_list_voices(None, None, 0) == -1
+        assert library.lib.tts_c_load(b"", 1, None, None, 1) is None
+        assert library.last_error() == "model_path is required"
+
+
+class TestRequestValidation:
+    """Test the per-request backend field"""
+
+    def test_backend_is_passed_through(self):
+        ok, data, _ = validate_request({"input": "Hello", "voice": "af_heart", "backend": "TTSCPP"}, ["af_heart"])
+        assert ok and data["backend"] == "ttscpp"
+
+    def test_invalid_backend_rejected(self):
+        ok, _, _ = validate_request({"input": "Hello", "voice": "af_heart", "backend": "../x"}, ["af_heart"])
+        assert not ok
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Tests for per-request stage tracing and OTLP/JSON span export
+"""
+
+from dataclasses import replace
+from pathlib import Path
+import json
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.config import config
+from LiteTTS.metrics import tracing
+from LiteTTS.metrics.tracing import (
+    FileSpanExporter, InMemorySpanExporter, Tracer, STATUS_ERROR,
+    configure_tracing, parse_traceparent, to_otlp_json, trace_span
+)
+
+
+@pytest.fixture
+def memory_tracer():
+    """Install a global tracer that keeps spans in memory"""
+    previous = tracing._tracer
+    exporter = InMemorySpanExporter()
+    tracer = Tracer([exporter], flush_interval=0.05)
+    tracing._tracer = tracer
+    yield tracer, exporter
+    tracer.shutdown()
+    tracing._tracer = previous
+
+
+def finished(tracer, exporter):
+    assert tracer.flush()
+    return {span.name: span for span in exporter.spans}
+
+
+class TestTracer:
+    """Test span creation, nesting and sampling"""
+
+    def test_spans_nest_under_root(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        root = tracer.start_trace("POST /v1/audio/speech", request_id="req-1")
+        with trace_span("nlp", mode="enhanced"):
+            with trace_span("nlp.text_normalization"):
+                pass
+        tracer.end_span(root)
+
+        spans = finished(tracer, exporter)
+        assert spans["nlp"].parent_span_id == root.span_id
+        assert spans["nlp.text_normalization"].parent_span_id == spans["nlp"].span_id
+        assert {span.trace_id for span in spans.values()} == {root.trace_id}
+        assert spans["POST /v1/audio/speech"].attributes["litetts.request_id"] == "req-1"
+        assert spans["nlp"].end_ns >= spans["nlp.text_normalization"].end_ns
+
+    def test_spans_are_noop_outside_a_trace(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        tracer.start_trace("unsampled", traceparent="00-" + "a" * 32 + "-" + "b" * 16 + "-00")
+        with trace_span("cache.lookup") as span:
+            assert span is None
+        assert finished(tracer, exporter) == {}
+
+    def test_sampled_traceparent_overrides_sample_rate(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer([exporter], sample_rate=0.0)
+        assert tracer.start_trace("dropped") is None
+
+        root = tracer.start_trace("forced", traceparent="00-" + "a" * 32 + "-" + "b" * 16 + "-01")
+        assert root.trace_id == "a" * 32
+        assert root.parent_span_id == "b" * 16
+        assert root.traceparent().startswith("00-" + "a" * 32 + "-" + root.span_id)
+        tracer.shutdown()
+
+    def test_errors_are_recorded(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        root = tracer.start_trace("request")
+        with pytest.raises(ValueError):
+            with trace_span("synthesis"):
+                raise ValueError("empty audio")
+        tracer.end_span(root)
+
+        span = finished(tracer, exporter)["synthesis"]
+        assert span.status == STATUS_ERROR
+        assert "empty audio" in span.status_message
+
+    def test_disabled_without_exporters(self):
+        tracer = configure_tracing(replace(config.tracing, enabled=False))
+        assert not tracer.enabled
+        assert tracer.start_trace("request") is None
+
+    @pytest.mark.parametrize("header", [
+        None, "", "garbage", "00-" + "0" * 32 + "-" + "b" * 16 + "-01",
+        "ff-" + "a" * 32 + "-" + "b" * 16 + "-01",
+    ])
+    def test_invalid_traceparent_is_ignored(self, header):
+        assert parse_traceparent(header) is None
+
+
+class TestExport:
+    """Test the OTLP/JSON exporters"""
+
+    def test_otlp_json_shape(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        root = tracer.start_trace("request")
+        with trace_span("encode", format="wav", bytes=1024, cache_hit=False, rtf=0.25):
+            pass
+        tracer.end_span(root)
+        finished(tracer, exporter)
+
+        body = to_otlp_json(exporter.spans, service_name="litetts-test")
+        resource_spans = body["resourceSpans"][0]
+        assert {"key": "service.name", "value": {"stringValue": "litetts-test"}} in resource_spans["resource"]["attributes"]
+
+        spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+        encode = spans["encode"]
+        assert encode["parentSpanId"] == spans["request"]["spanId"]
+        assert "parentSpanId" not in spans["request"]
+        assert int(encode["endTimeUnixNano"]) >= int(encode["startTimeUnixNano"])
+        attributes = {a["key"]: a["value"] for a in encode["attributes"]}
+        assert attributes == {
+            "format": {"stringValue": "wav"},
+            "bytes": {"intValue": "1024"},
+            "cache_hit": {"boolValue": False},
+            "rtf": {"doubleValue": 0.25},
+        }
+
+    def test_file_exporter_writes_json_lines(self, tmp_path):
+        path = tmp_path / "traces" / "traces.jsonl"
+        tracer = Tracer([FileSpanExporter(str(path))], flush_interval=0.05)
+        root = tracer.start_trace("request", request_id="req-2")
+        with tracer.span("cache.lookup"):
+            pass
+        tracer.end_span(root)
+        tracer.shutdown()
+
+        lines = path.read_text().splitlines()
+        spans = [span for line in lines
+                 for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+        assert sorted(span["name"] for span in spans) == ["cache.lookup", "request"]
+
+    def test_full_queue_drops_spans(self):
+        tracer = Tracer([InMemorySpanExporter()], max_queue_size=1)
+        tracer._ensure_worker = lambda: None
+        root = tracer.start_trace("request")
+        for _ in range(3):
+            with tracer.span("stage"):
+                pass
+        assert tracer.dropped_spans == 2
+        assert root is not None
+
+    def test_exporters_must_implement_export(self):
+        class Incomplete(tracing.SpanExporter):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestStageSpans:
+    """Test spans emitted by the request path"""
+
+    def test_validation_records_admission_span(self, memory_tracer):
+        from LiteTTS.validation import validate_request
+
+        tracer, exporter = memory_tracer
+        root = tracer.start_trace("request")
+        is_valid, _, _ = validate_request({"input": "Hello world", "voice": "af_heart"}, ["af_heart"])
+        tracer.end_span(root)
+
+        assert is_valid
+        assert finished(tracer, exporter)["admission.validate"].attributes["valid"] is True
+
+    def test_onnx_backend_splits_phonemization(self, memory_tracer):
+        from LiteTTS.tts.backend import OnnxBackend
+
+        class FakeTokenizer:
+            def phonemize(self, text, lang):
+                return "həlˈoʊ"
+
+        class FakeKokoro:
+            tokenizer = FakeTokenizer()
+
+            def __init__(self):
+                self.calls = []
+
+            def create(self, text, voice, speed=1.0, lang="en-us", is_phonemes=False):
+                self.calls.append((text, is_phonemes))
+                return np.zeros(240, dtype=np.float32), 24000
+
+        tracer, exporter = memory_tracer
+        model = FakeKokoro()
+        backend = OnnxBackend(model)
+
+        backend.create("Hello", voice="af_heart")
+        assert model.calls == [("Hello", False)]
+
+        root = tracer.start_trace("request")
+        backend.create("Hello", voice="af_heart")
+        tracer.end_span(root)
+
+        assert model.calls[-1] == ("həlˈoʊ", True)
+        assert finished(tracer, exporter)["phonemize"].attributes["phonemes"] == 6
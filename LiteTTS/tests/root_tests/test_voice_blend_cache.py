@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the canonical blended voice cache
+"""
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.voice.blender import BlendConfig, VoiceBlender, VoiceEmbedding
+
+
+class FakeVoiceManager:
+    """Serves deterministic random voices and counts loads"""
+
+    def __init__(self, names, with_hashes=True):
+        rng = np.random.default_rng(0)
+        self.voices = {
+            name: VoiceEmbedding(
+                name=name,
+                embedding_data=rng.standard_normal((510, 256)).astype(np.float32),
+                file_hash=f"hash-{name}" if with_hashes else ""
+            )
+            for name in names
+        }
+        self.loads = 0
+
+    def get_voice_embedding(self, name):
+        self.loads += 1
+        return self.voices.get(name)
+
+
+VOICES = ["af_heart", "af_sarah", "am_puck", "af_bella", "af_sky", "am_echo", "af_nova"]
+
+
+@pytest.fixture
+def manager():
+    return FakeVoiceManager(VOICES)
+
+
+class TestCanonicalKey:
+    """Test blend specification canonicalization"""
+
+    def test_order_scale_and_rounding_are_equivalent(self, manager):
+        blender = VoiceBlender(manager)
+        a = blender.canonical_blend_key(BlendConfig(voices=[("af_heart", 0.6), ("af_sarah", 0.4)]))
+        b = blender.canonical_blend_key(BlendConfig(voices=[("af_sarah", 2.0), ("af_heart", 3.001)]))
+        assert a == b
+        assert a[0] == (("af_heart", 0.6), ("af_sarah", 0.4))
+
+    def test_duplicates_are_merged_and_zero_weights_dropped(self, manager):
+        blender = VoiceBlender(manager)
+        key = blender.canonical_blend_key(BlendConfig(
+            voices=[("af_heart", 0.25), ("af_sarah", 0.5), ("af_heart", 0.25), ("am_puck", 0.0)]
+        ))
+        assert key[0] == (("af_heart", 0.5), ("af_sarah", 0.5))
+
+    def test_smoothing_only_matters_for_style_mixing(self, manager):
+        blender = VoiceBlender(manager)
+        voices = [("af_heart", 0.5), ("af_sarah", 0.5)]
+        assert (blender.canonical_blend_key(BlendConfig(voices=voices, smoothing_factor=0.1)) ==
+                blender.canonical_blend_key(BlendConfig(voices=voices, smoothing_factor=0.3)))
+        assert (blender.canonical_blend_key(BlendConfig(voices=voices, blend_method="style_mixing", smoothing_factor=0.1)) !=
+                blender.canonical_blend_key(BlendConfig(voices=voices, blend_method="style_mixing", smoothing_factor=0.3)))
+
+
+class TestBlendCache:
+    """Test cached and persisted blends"""
+
+    def test_equivalent_specs_share_one_embedding(self, manager):
+        blender = VoiceBlender(manager)
+        first = blender.blend_voices(BlendConfig(voices=[("af_heart", 0.6), ("af_sarah", 0.4)]))
+        second = blender.blend_voices(BlendConfig(voices=[("af_sarah", 0.4), ("af_heart", 0.6)]))
+
+        assert first is second
+        assert not first.embedding_data.flags.writeable
+        stats = blender.get_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    def test_changed_component_invalidates(self, manager):
+        blender = VoiceBlender(manager)
+        config = BlendConfig(voices=[("af_heart", 0.5), ("af_sarah", 0.5)])
+        first = blender.blend_voices(config)
+
+        manager.voices["af_sarah"] = VoiceEmbedding(
+            name="af_sarah", embedding_data=np.ones((510, 256), np.float32), file_hash="hash-new"
+        )
+        second = blender.blend_voices(config)
+        assert second is not first
+        assert not np.array_equal(second.embedding_data, first.embedding_data)
+
+    def test_style_mixing_is_deterministic_per_spec(self, manager):
+        config = BlendConfig(voices=[("af_sky", 0.5), ("am_echo", 0.3), ("af_nova", 0.2)],
+                             blend_method="style_mixing", smoothing_factor=0.2)
+        a = VoiceBlender(manager).blend_voices(config)
+        b = VoiceBlender(manager).blend_voices(config)
+        np.testing.assert_array_equal(a.embedding_data, b.embedding_data)
+
+    def test_cache_is_bounded(self, manager):
+        blender = VoiceBlender(manager, cache_size=2)
+        for other in ["af_sarah", "am_puck", "af_bella"]:
+            blender.blend_voices(BlendConfig(voices=[("af_heart", 0.5), (other, 0.5)]))
+        assert blender.get_cache_stats()["entries"] == 2
+
+    def test_packs_are_memory_mapped(self, manager, tmp_path):
+        config = BlendConfig(voices=[("af_heart", 0.7), ("am_puck", 0.3)], blend_method="interpolation")
+        built = VoiceBlender(manager, pack_dir=tmp_path).blend_voices(config)
+        assert len(list(tmp_path.glob("blend_*.npy"))) == 1
+
+        fresh = VoiceBlender(manager, pack_dir=tmp_path)
+        loaded = fresh.blend_voices(config)
+        assert isinstance(loaded.embedding_data, np.memmap)
+        assert fresh.get_cache_stats()["pack_loads"] == 1
+        np.testing.assert_array_equal(loaded.embedding_data, built.embedding_data)
+
+    def test_prebuild_presets_skips_missing_voices(self, manager):
+        blender = VoiceBlender(manager)
+        results = blender.prebuild_presets(available_voices=["af_heart", "af_sarah", "am_puck", "af_bella"])
+
+        assert results == {"warm_friendly": True, "professional_calm": True, "energetic_mix": False}
+        loads = manager.loads
+        blender.blend_voices(blender.create_preset_blend("warm_friendly"))
+        assert blender.get_cache_stats()["hits"] == 1
+        assert manager.loads == loads + 2
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming spectral features, parallel multi-clip cloning and cloning jobs
+"""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.voice.clone_jobs import CANCELLED, COMPLETED, FAILED, CloneJobManager
+from LiteTTS.voice.cloning import VoiceCloner
+from LiteTTS.voice.enhanced_cloning import EnhancedVoiceCloneConfig, EnhancedVoiceCloner
+from LiteTTS.voice.spectral_features import analyze_array, analyze_file, style_vectors
+
+
+def voice_like(seconds, sample_rate=24000, f0=180.0, seed=0, noise=0.02):
+    """Amplitude-modulated harmonic tone after half a second of room noise"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = sum(0.3 / k * np.sin(2 * np.pi * k * f0 * t) for k in (1, 2, 3))
+    tone *= (1 + 0.5 * np.sin(2 * np.pi * 3 * t)) * (t >= 0.5)
+    return (tone + noise * rng.standard_normal(len(t))).astype(np.float32)
+
+
+def wait_for(job, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestSpectralFeatures:
+    """Test the frame-based streaming analyzer"""
+
+    def test_blocking_does_not_change_the_result(self, tmp_path):
+        audio = voice_like(5, 22050)
+        path = tmp_path / "clip.wav"
+        sf.write(path, audio, 22050, subtype="FLOAT")
+
+        whole = analyze_array(audio, 22050)
+        small_blocks = analyze_array(audio, 22050, block_samples=1000)
+        from_file = analyze_file(str(path), block_seconds=0.37)
+        assert from_file["duration"] == pytest.approx(5.0)
+        for summary in (small_blocks, from_file["summary"]):
+            np.testing.assert_allclose(summary.mean_power, whole.mean_power, rtol=1e-9)
+            np.testing.assert_allclose(summary.frame_stats, whole.frame_stats)
+            assert summary.zero_crossings == whole.zero_crossings
+            assert summary.samples == whole.samples
+
+    def test_characteristics(self):
+        summary = analyze_array(voice_like(3), 24000)
+        characteristics = summary.characteristics()
+        assert characteristics["fundamental_frequency"] == pytest.approx(180, abs=15)
+        assert characteristics["energy"] > 0
+        assert summary.quality_score() == 1.0
+        assert analyze_array(np.zeros(24000), 24000).quality_score() == 0.0
+
+    def test_features_do_not_depend_on_sample_rate(self):
+        low = analyze_array(voice_like(4, 16000, noise=0.0), 16000)
+        high = analyze_array(voice_like(4, 24000, noise=0.0), 24000)
+        assert low.characteristics()["fundamental_frequency"] == pytest.approx(180, abs=15)
+        # Bands below the 8 kHz Nyquist of the 16 kHz recording
+        assert np.corrcoef(low.mel_features()[:100], high.mel_features()[:100])[0, 1] > 0.8
+        assert np.dot(low.speaker_embedding(), high.speaker_embedding()) > 0.9
+
+    def test_short_audio_is_padded_to_one_frame(self):
+        summary = analyze_array(voice_like(0.01), 24000)
+        assert summary.frames == 1
+        assert np.isfinite(summary.speaker_embedding()).all()
+
+    def test_style_vectors_match_the_per_row_construction(self):
+        base = np.random.default_rng(3).standard_normal(256)
+        base /= np.linalg.norm(base)
+        expected = np.zeros((510, 256))
+        for i in range(510):
+            row = base + np.random.RandomState(i).normal(0, 0.05, 256)
+            expected[i] = row / (np.linalg.norm(row) + 1e-8)
+        np.testing.assert_allclose(style_vectors(base), expected.astype(np.float32), rtol=1e-5, atol=1e-6)
+
+
+class TestVoiceCloner:
+    """Test single-file cloning on the streaming features"""
+
+    def test_clone_voice(self, tmp_path):
+        path = tmp_path / "sample.wav"
+        sf.write(path, np.column_stack([voice_like(6, 22050)] * 2), 22050)
+        cloner = VoiceCloner(str(tmp_path / "voices"))
+
+        analysis = cloner.analyze_audio(str(path))
+        assert analysis.success and analysis.channels == 2
+        assert analysis.duration == pytest.approx(6.0)
+
+        result = cloner.clone_voice(str(path), "sample_voice")
+        assert result.success, result.error_message
+        assert result.embedding_data.shape == (510, 256)
+        assert np.fromfile(result.voice_file_path, dtype=np.float32).size == 510 * 256
+
+    def test_rejects_short_audio(self, tmp_path):
+        path = tmp_path / "short.wav"
+        sf.write(path, voice_like(1), 24000)
+        result = VoiceCloner(str(tmp_path / "voices")).clone_voice(str(path), "short")
+        assert not result.success and "too short" in result.error_message
+
+
+class TestMultiClipCloning:
+    """Test parallel clip processing"""
+
+    def write_clips(self, tmp_path, durations):
+        paths = []
+        for i, seconds in enumerate(durations):
+            path = tmp_path / f"clip_{i}.wav"
+            sf.write(path, voice_like(seconds, 22050, f0=150 + 20 * i, seed=i), 22050)
+            paths.append(str(path))
+        return paths
+
+    def test_clips_are_processed_in_parallel_and_kept_in_order(self, tmp_path):
+        paths = self.write_clips(tmp_path, [8, 4, 6])
+        cloner = EnhancedVoiceCloner(str(tmp_path / "voices"))
+        updates = []
+        profile = cloner.clone_voice_from_multiple_clips(paths, "multi", progress=lambda f, m: updates.append(f))
+
+        assert [clip["file_path"] for clip in profile.clips] == paths
+        assert [clip["clip_id"] for clip in profile.clips] == ["clip_00", "clip_01", "clip_02"]
+        assert profile.total_duration == pytest.approx(18.0)
+        assert profile.combined_embedding.shape == (510, 256)
+        assert updates == sorted(updates) and updates[-1] == 1.0
+        assert (tmp_path / "voices" / "multi.bin").exists()
+
+    def test_a_failing_clip_fails_the_clone(self, tmp_path):
+        paths = self.write_clips(tmp_path, [4, 12])
+        config = EnhancedVoiceCloneConfig(max_audio_duration=10.0)
+        cloner = EnhancedVoiceCloner(str(tmp_path / "voices"), config)
+        with pytest.raises(ValueError, match="Clip too long"):
+            cloner.clone_voice_from_multiple_clips(paths, "broken")
+        assert not (tmp_path / "voices" / "broken.bin").exists()
+
+
+class TestCloneJobManager:
+    """Test background cloning jobs"""
+
+    def test_job_reports_progress_and_result(self):
+        manager = CloneJobManager()
+        seen = threading.Event()
+        cleaned = []
+
+        def work(progress):
+            progress(0.5, "Halfway")
+            seen.wait(5)
+            return {"name": "voice"}
+
+        job = manager.submit("voice", work, cleanup=lambda: cleaned.append(True))
+        deadline = time.monotonic() + 5
+        while job.progress < 0.5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert job.to_dict()["message"] == "Halfway"
+        with pytest.raises(ValueError):
+            manager.submit("voice", work)
+        seen.set()
+
+        assert wait_for(job).status == COMPLETED
+        assert job.result == {"name": "voice"} and job.progress == 1.0
+        assert cleaned == [True]
+        assert manager.get(job.job_id) is job
+        manager.shutdown()
+
+    def test_failures_are_recorded(self):
+        manager = CloneJobManager()
+
+        def work(progress):
+            raise ValueError("bad audio")
+
+        job = wait_for(manager.submit("voice", work))
+        assert job.status == FAILED and job.error == "bad audio"
+        manager.shutdown()
+
+    def test_queued_jobs_can_be_cancelled(self):
+        manager = CloneJobManager(max_concurrent=1)
+        release = threading.Event()
+        cleaned = []
+        running = manager.submit("first", lambda progress: release.wait(5) and {})
+        queued = manager.submit("second", lambda progress: {}, cleanup=lambda: cleaned.append(True))
+
+        assert manager.cancel(queued.job_id)
+        assert queued.status == CANCELLED and cleaned == [True]
+        assert not manager.cancel(running.job_id)
+        release.set()
+        assert wait_for(running).status == COMPLETED
+        manager.shutdown()
+
+    def test_finished_jobs_expire(self):
+        manager = CloneJobManager(retention_seconds=0.0)
+        job = wait_for(manager.submit("voice", lambda progress: {}))
+        time.sleep(0.01)
+        assert manager.list_jobs() == []
+        assert manager.get(job.job_id) is None
+        manager.shutdown()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for batched voice usage statistics persistence
+"""
+
+import json
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.voice.metadata import VoiceMetadataManager
+from LiteTTS.voice.usage_stats import VoiceUsageRecorder
+
+
+def make_manager(tmp_path, **kwargs):
+    return VoiceMetadataManager(
+        metadata_file=str(tmp_path / "metadata.json"),
+        stats_db_file=str(tmp_path / "voice_stats.sqlite3"),
+        **kwargs
+    )
+
+
+class TestRequestPath:
+    """Test that recording usage does not touch the disk"""
+
+    def test_update_does_not_rewrite_metadata(self, tmp_path):
+        manager = make_manager(tmp_path, stats_flush_interval=3600)
+        metadata_file = tmp_path / "metadata.json"
+        before = metadata_file.stat().st_mtime_ns
+
+        for _ in range(50):
+            manager.update_voice_stats("af_heart", 1.5, success=True)
+
+        assert metadata_file.stat().st_mtime_ns == before
+        assert manager.usage_recorder.flush_count == 0
+
+        # Unflushed usage is still visible to readers in this worker
+        stats = manager.get_voice_stats("af_heart")
+        assert stats.total_requests == 50
+        assert stats.total_duration == 75.0
+
+    def test_errors_update_success_rate(self, tmp_path):
+        manager = make_manager(tmp_path, stats_flush_interval=3600)
+        manager.update_voice_stats("am_puck", 2.0, success=True)
+        manager.update_voice_stats("am_puck", 0.0, success=False)
+
+        stats = manager.get_voice_stats("am_puck")
+        assert stats.error_count == 1
+        assert stats.success_rate == 0.5
+
+
+class TestSharedSink:
+    """Test cross-worker aggregation through the SQLite sink"""
+
+    def test_workers_see_aggregated_totals(self, tmp_path):
+        first = make_manager(tmp_path, stats_flush_interval=3600)
+        second = make_manager(tmp_path, stats_flush_interval=3600)
+
+        for _ in range(3):
+            first.update_voice_stats("af_heart", 1.0)
+        for _ in range(2):
+            second.update_voice_stats("af_heart", 2.0)
+
+        assert first.usage_recorder.flush()
+        assert second.usage_recorder.flush()
+
+        for manager in (first, second):
+            stats = manager.get_voice_stats("af_heart")
+            assert stats.total_requests == 5
+            assert stats.total_duration == 7.0
+
+    def test_save_metadata_snapshots_totals(self, tmp_path):
+        manager = make_manager(tmp_path, stats_flush_interval=3600)
+        manager.update_voice_stats("af_bella", 3.0)
+        manager.save_metadata()
+
+        data = json.loads((tmp_path / "metadata.json").read_text())
+        assert data["stats"]["af_bella"]["total_requests"] == 1
+
+        # Reloading seeds the sink without double counting
+        reloaded = make_manager(tmp_path, stats_flush_interval=3600)
+        assert reloaded.get_voice_stats("af_bella").total_requests == 1
+
+    def test_background_flush(self, tmp_path):
+        recorder = VoiceUsageRecorder(str(tmp_path / "stats.sqlite3"), flush_interval=0.05)
+        recorder.record("af_sky", 1.0)
+        recorder.close()
+
+        totals = recorder.load_totals()
+        assert totals["af_sky"][0] == 1
+
+    def test_forget_removes_voice(self, tmp_path):
+        manager = make_manager(tmp_path, stats_flush_interval=3600)
+        manager.update_voice_stats("custom_voice", 1.0)
+        manager.usage_recorder.flush()
+
+        manager.remove_voice("custom_voice")
+
+        assert manager.get_voice_stats("custom_voice") is None
+        assert "custom_voice" not in manager.usage_recorder.load_totals()
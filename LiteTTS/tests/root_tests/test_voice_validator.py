@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the voice model validator's lazily imported torch
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+import types
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from LiteTTS.voice.validator import VoiceValidator
+
+
+class FakeTensor:
+    """Just enough of torch.Tensor for the memory estimate"""
+
+    def __init__(self, array):
+        self.array = array
+
+    def element_size(self):
+        return self.array.itemsize
+
+    def numel(self):
+        return self.array.size
+
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """torch stand-in, so the validator's own import is what resolves the name"""
+    loaded = {"af_heart.pt": FakeTensor(np.zeros((510, 256), dtype=np.float32))}
+    module = types.ModuleType("torch")
+    module.Tensor = FakeTensor
+    module.load = lambda path, map_location=None: loaded[Path(path).name]
+    module.cuda = SimpleNamespace(is_available=lambda: False)
+    monkeypatch.setitem(sys.modules, "torch", module)
+    return module
+
+
+class TestCheckCompatibility:
+    """check_compatibility imports torch itself, like the other .pt readers"""
+
+    def test_reports_memory_requirements(self, fake_torch):
+        result = VoiceValidator().check_compatibility("af_heart", Path("af_heart.pt"))
+        assert result["issues"] == []
+        assert result["compatible"] and result["device_compatible"]
+        assert result["memory_requirements"] == 510 * 256 * 4
+
+    def test_missing_cuda_falls_back_to_cpu(self, fake_torch):
+        result = VoiceValidator().check_compatibility("af_heart", Path("af_heart.pt"), target_device="cuda")
+        assert result["issues"] == ["CUDA not available"]
+        assert result["device_compatible"] and not result["compatible"]
+
+    def test_importing_the_validator_does_not_load_torch(self):
+        import subprocess
+
+        code = "import sys, LiteTTS.voice.validator; print('torch' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parent.parent.parent.parent),
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.strip().splitlines()[-1] == "False"
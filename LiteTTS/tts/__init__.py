@@ -1,13 +1,36 @@
 # TTS engine package
+#
+# Engines are imported on first access so that lightweight modules such as the
+# backend interface and emotion controller do not pull in torch/onnxruntime
 
-from .engine import KokoroTTSEngine
-from .emotion_controller import EmotionController
-from .chunk_processor import ChunkProcessor
-from .synthesizer import TTSSynthesizer
-
-__all__ = [
-    'KokoroTTSEngine',
-    'EmotionController',
-    'ChunkProcessor', 
-    'TTSSynthesizer'
-]
\ No newline at end of file
+_LAZY_EXPORTS = {
+    'KokoroTTSEngine': '.engine',
+    'EmotionController': '.emotion_controller',
+    'ChunkProcessor': '.chunk_processor',
+    'TTSSynthesizer': '.synthesizer',
+    'SynthesisBackend': '.backend',
+    'BackendCapabilities': '.backend',
+    'BackendRouter': '.backend',
+    'OnnxBackend': '.backend',
+    'create_backend': '.backend',
+    'register_backend': '.backend',
+    'TTSCppBackend': '.ttscpp_backend',
+    'StagedPipeline': '.pipeline',
+    'PipelineStage': '.pipeline',
+    'build_synthesis_pipeline': '.pipeline',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+__all__ = list(_LAZY_EXPORTS)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Pluggable synthesis backends
+
+A backend turns normalized text into audio for a voice. The NLP front-end,
+caching and streaming layers only rely on this interface, so a deployment
+(or a single request) can run on ONNX Runtime or on the in-process TTS.cpp
+engine with quantized GGUF weights.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import gc
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ..audio.audio_segment import AudioSegment
+from ..metrics.tracing import get_tracer, trace_span
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class BackendCapabilities:
+    """Features a backend can honor natively"""
+    speed_control: bool = True
+    quantized_weights: bool = False
+    thread_safe: bool = True
+
+class SynthesisBackend(ABC):
+    """Interface shared by all synthesis backends
+
+    ``create`` mirrors ``kokoro_onnx.Kokoro.create`` so existing call sites can
+    switch backends without changes.
+    """
+
+    name = "base"
+    capabilities = BackendCapabilities()
+
+    @property
+    @abstractmethod
+    def sample_rate(self) -> int:
+        """Output sample rate in Hz"""
+
+    @abstractmethod
+    def get_voices(self) -> List[str]:
+        """Voices this backend can synthesize"""
+
+    @abstractmethod
+    def create(self, text: str, voice: str, speed: float = 1.0,
+               lang: str = "en-us") -> Tuple[np.ndarray, int]:
+        """Synthesize text, returning float32 mono samples and the sample rate"""
+
+    def synthesize(self, text: str, voice: str, speed: float = 1.0,
+                   lang: str = "en-us") -> AudioSegment:
+        """Synthesize text into an AudioSegment"""
+        audio, sample_rate = self.create(text, voice=voice, speed=speed, lang=lang)
+        return AudioSegment(audio_data=audio, sample_rate=sample_rate,
+                            metadata={'backend': self.name})
+
+    def supports(self, speed: float = 1.0) -> bool:
+        """Whether this backend can serve a request with these parameters"""
+        return self.capabilities.speed_control or speed == 1.0
+
+    def close(self):
+        """Release native resources"""
+
+class OnnxBackend(SynthesisBackend):
+    """ONNX Runtime backend wrapping a ``kokoro_onnx.Kokoro`` compatible model
+
+    Attributes not defined here are forwarded to the wrapped model, so code
+    that probes it (``hasattr(model, 'synthesize_with_blended_voice')``) keeps
+    working.
+    """
+
+    name = "onnx"
+    capabilities = BackendCapabilities(speed_control=True)
+
+    def __init__(self, model: Any = None, model_path: Optional[str] = None,
+                 voices_path: Optional[str] = None, sample_rate: int = 24000):
+        if model is None:
+            from kokoro_onnx import Kokoro
+            model = Kokoro(model_path, voices_path)
+        self.model = model
+        self._sample_rate = sample_rate
+        # In-flight create() calls, and whether new ones must wait for a model reload
+        self._calls = 0
+        self._reloading = False
+        self._idle = threading.Condition()
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def get_voices(self) -> List[str]:
+        return list(self.model.get_voices())
+
+    def create(self, text: str, voice: str, speed: float = 1.0,
+               lang: str = "en-us") -> Tuple[np.ndarray, int]:
+        with self._in_flight():
+            model = self.model
+            tokenizer = getattr(model, "tokenizer", None)
+            if get_tracer().current_span() is None or not hasattr(tokenizer, "phonemize"):
+                return model.create(text, voice=voice, speed=speed, lang=lang)
+
+            # Traced requests phonemize up front so G2P and inference get separate spans
+            with trace_span("phonemize", lang=lang, text_length=len(text)) as span:
+                phonemes = tokenizer.phonemize(text, lang)
+                span.set_attribute("phonemes", len(phonemes))
+            return model.create(phonemes, voice=voice, speed=speed, lang=lang, is_phonemes=True)
+
+    @contextmanager
+    def _in_flight(self):
+        with self._idle:
+            while self._reloading:
+                self._idle.wait()
+            self._calls += 1
+        try:
+            yield
+        finally:
+            with self._idle:
+                self._calls -= 1
+                self._idle.notify_all()
+
+    def close(self):
+        if hasattr(self.model, "cleanup"):
+            self.model.cleanup()
+
+    def arena_bytes(self) -> Optional[float]:
+        """Estimated ONNX Runtime arena memory, None when the session does not track it"""
+        session = getattr(self.model, "sess", None)
+        if not hasattr(session, "arena_bytes"):
+            return None
+        return session.arena_bytes()
+
+    def reload_model(self, load: Callable[[], Any], drain_timeout: float = 30.0) -> Any:
+        """
+        Replace the model with the one ``load`` builds, never holding both
+
+        New calls wait while in-flight ones drain, then the current model is
+        dropped before ``load`` runs, so a switch to a smaller variant under
+        memory pressure does not first need room for two models. Calls still
+        running after ``drain_timeout`` keep the old model alive until they
+        finish. If ``load`` fails the backend is left without a model and
+        the error is raised; the caller reloads a known-good one.
+        """
+        with self._idle:
+            self._reloading = True
+            deadline = time.monotonic() + drain_timeout
+            while self._calls and time.monotonic() < deadline:
+                self._idle.wait(max(0.0, deadline - time.monotonic()))
+            if self._calls:
+                logger.warning(f"Reloading the ONNX model with {self._calls} call(s) still running")
+        try:
+            self.model = None
+            gc.collect()
+            self.model = load()
+            return self.model
+        finally:
+            with self._idle:
+                self._reloading = False
+                self._idle.notify_all()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing on the backend itself
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+_BACKEND_FACTORIES: Dict[str, Callable[..., SynthesisBackend]] = {}
+
+def register_backend(name: str, factory: Callable[..., SynthesisBackend]):
+    """Register a backend factory under a name usable in config and requests"""
+    _BACKEND_FACTORIES[name] = factory
+
+def create_backend(name: str, **kwargs) -> SynthesisBackend:
+    """Instantiate a registered backend"""
+    if name not in _BACKEND_FACTORIES:
+        raise ValueError(f"Unknown synthesis backend '{name}'. Registered: {sorted(_BACKEND_FACTORIES)}")
+    return _BACKEND_FACTORIES[name](**kwargs)
+
+def registered_backends() -> List[str]:
+    """Names of all registered backend factories"""
+    return sorted(_BACKEND_FACTORIES)
+
+def _create_ttscpp_backend(**kwargs) -> SynthesisBackend:
+    from .ttscpp_backend import TTSCppBackend
+    return TTSCppBackend(**kwargs)
+
+register_backend("onnx", OnnxBackend)
+register_backend("ttscpp", _create_ttscpp_backend)
+
+class BackendRouter:
+    """Loaded backends for this process with a deployment default
+
+    Requests may name a backend; requests it cannot serve (e.g. a speed
+    change on a backend without speed control) fall back to the default.
+    """
+
+    def __init__(self, default: SynthesisBackend):
+        self._backends: Dict[str, SynthesisBackend] = {default.name: default}
+        self.default_name = default.name
+
+    @property
+    def default(self) -> SynthesisBackend:
+        return self._backends[self.default_name]
+
+    def add(self, backend: SynthesisBackend, make_default: bool = False):
+        self._backends[backend.name] = backend
+        if make_default:
+            self.default_name = backend.name
+
+    def names(self) -> List[str]:
+        return sorted(self._backends)
+
+    def get(self, name: Optional[str] = None) -> SynthesisBackend:
+        if not name:
+            return self.default
+        if name not in self._backends:
+            raise ValueError(f"Synthesis backend '{name}' is not loaded. Available: {self.names()}")
+        return self._backends[name]
+
+    def select(self, name: Optional[str] = None, speed: float = 1.0) -> SynthesisBackend:
+        """Pick the backend for a request, honoring capabilities"""
+        backend = self.get(name)
+        if backend.supports(speed=speed):
+            return backend
+
+        for fallback in [self.default, *self._backends.values()]:
+            if fallback.supports(speed=speed):
+                logger.debug(f"Backend '{backend.name}' cannot serve speed={speed}, using '{fallback.name}'")
+                return fallback
+        return backend
+
+    def close(self):
+        for backend in self._backends.values():
+            try:
+                backend.close()
+            except Exception as e:
+                logger.warning(f"Failed to close backend '{backend.name}': {e}")
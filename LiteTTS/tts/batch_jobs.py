@@ -0,0 +1,736 @@
+#!/usr/bin/env python3
+"""
+Offline bulk synthesis jobs
+
+A batch job renders a JSONL manifest of speech requests to files in the
+background. Items with the same text, voice and speed are synthesized once
+and encoded into each requested format, and synthesized PCM goes through
+the audio cache: items already rendered by /v1/audio/speech (or an earlier
+batch) are only transcoded.
+
+Every job has its own directory under the output root:
+
+    job.json       the parsed manifest, written once at submission
+    journal.jsonl  one line per finished item, appended as it completes,
+                   then one final line when the job ends
+    <id>.<format>  the rendered audio, in place before its journal line
+    cancel         marker asking whichever process runs the job to stop
+
+A job whose journal has no final line was interrupted; ``recover`` queues
+it again and only items without a ``done`` line are rendered. With several
+server workers, a job is run by the worker holding its lock file.
+
+Jobs run one at a time with at most ``window`` items in flight, and a
+PriorityGate holds back new items while interactive requests are being
+served, so bulk work fills idle capacity instead of queueing in front of
+/v1/audio/speech.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import io
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from ..nlp.frontend_pool import FrontEndProcessor, NLPProcessPool
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-worker servers only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+BATCH_FORMATS = ("mp3", "wav", "ogg", "flac")
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+JOB_FILE = "job.json"
+JOURNAL_FILE = "journal.jsonl"
+CANCEL_FILE = "cancel"
+LOCK_FILE = ".lock"
+
+_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,127}$")
+
+# (text, voice, speed) -> (samples, sample_rate)
+Synthesize = Callable[[str, str, float], Tuple[np.ndarray, int]]
+
+@dataclass
+class BatchItem:
+    """One manifest line"""
+    index: int
+    text: str
+    voice: str
+    speed: float = 1.0
+    response_format: str = "mp3"
+    id: str = ""
+
+    @property
+    def key(self) -> Tuple[str, str, float]:
+        """Items with the same key share one synthesis"""
+        return (self.text, self.voice, self.speed)
+
+    @property
+    def filename(self) -> str:
+        return f"{self.id}.{self.response_format}"
+
+def parse_manifest(manifest: Union[str, bytes], voice: str, speed: float = 1.0,
+                   response_format: str = "mp3", max_items: int = 10000,
+                   resolve_voice: Optional[Callable[[str], str]] = None) -> List[BatchItem]:
+    """
+    Parse a JSONL batch manifest
+
+    Each non-blank line is an object with ``input`` (or ``text``) and
+    optional ``voice``, ``speed``, ``response_format`` and ``id``. The id
+    names the output file and defaults to the item's zero-padded position;
+    the other arguments are the defaults for fields a line leaves out.
+
+    Args:
+        resolve_voice: Maps a requested voice to the served name, raising
+            ValueError for unknown voices
+
+    Raises:
+        ValueError: A malformed manifest, naming the offending line
+    """
+    if isinstance(manifest, bytes):
+        manifest = manifest.decode("utf-8")
+
+    items: List[BatchItem] = []
+    ids = set()
+    voices: Dict[str, str] = {}
+    for line_number, line in enumerate(manifest.splitlines(), 1):
+        if not line.strip():
+            continue
+        if len(items) >= max_items:
+            raise ValueError(f"Manifest has more than {max_items} items")
+        try:
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                raise ValueError("expected a JSON object")
+
+            text = entry.get("input", entry.get("text"))
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError("missing input text")
+
+            item_speed = float(entry.get("speed") if entry.get("speed") is not None else speed)
+            if not 0.25 <= item_speed <= 4.0:
+                raise ValueError(f"speed {item_speed} is outside 0.25-4.0")
+
+            item_format = str(entry.get("response_format") or response_format).lower()
+            if item_format not in BATCH_FORMATS:
+                raise ValueError(f"unsupported response_format '{item_format}', use one of {list(BATCH_FORMATS)}")
+
+            requested_voice = str(entry.get("voice") or voice)
+            if requested_voice not in voices:
+                voices[requested_voice] = resolve_voice(requested_voice) if resolve_voice else requested_voice
+
+            item_id = str(entry["id"]) if entry.get("id") is not None else f"{len(items):06d}"
+            if not _ID_PATTERN.match(item_id):
+                raise ValueError(f"invalid id '{item_id}' (letters, digits, '.', '_' and '-' only)")
+            if item_id in ids:
+                raise ValueError(f"duplicate id '{item_id}'")
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: {e}") from e
+
+        ids.add(item_id)
+        items.append(BatchItem(len(items), text, voices[requested_voice], item_speed, item_format, item_id))
+
+    if not items:
+        raise ValueError("Manifest has no items")
+    return items
+
+@dataclass
+class BatchJob:
+    """Progress of one batch job"""
+    job_id: str
+    directory: Path
+    items: List[BatchItem] = field(repr=False)
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    completed: int = 0
+    failed: int = 0
+    synthesized: int = 0  # Distinct (text, voice, speed) rendered by the model
+    cache_hits: int = 0  # Distinct (text, voice, speed) served from the audio cache
+    audio_seconds: float = 0.0
+    resumed: bool = False
+    error: Optional[str] = None
+    _resumed_items: int = field(default=0, repr=False)
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED, CANCELLED)
+
+    @property
+    def cancel_requested(self) -> bool:
+        return (self.directory / CANCEL_FILE).exists()
+
+    def to_dict(self) -> Dict[str, Any]:
+        unique = len({item.key for item in self.items})
+        processed = self.completed + self.failed
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0.0
+        rate = (processed - self._resumed_items) / elapsed if elapsed > 0 else 0.0
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "progress": round(processed / self.total, 4) if self.total else 1.0,
+            "unique_items": unique,
+            "deduplicated": self.total - unique,
+            "synthesized": self.synthesized,
+            "cache_hits": self.cache_hits,
+            "audio_seconds": round(self.audio_seconds, 3),
+            "items_per_second": round(rate, 3),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "resumed": self.resumed,
+            "error": self.error,
+        }
+
+class PriorityGate:
+    """
+    Lets background work yield to interactive requests
+
+    Request handlers wrap synthesis in ``interactive()``; batch runners call
+    ``wait_idle`` before starting an item, which returns once no more than
+    ``threshold`` interactive requests are active. While ``shedding`` is set
+    (under memory pressure) background work does not start at all.
+    """
+
+    def __init__(self, threshold: int = 0):
+        self.threshold = threshold
+        self._active = 0
+        self._shedding = False
+        self._condition = threading.Condition()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def shedding(self) -> bool:
+        return self._shedding
+
+    def set_shedding(self, shedding: bool):
+        with self._condition:
+            self._shedding = shedding
+            self._condition.notify_all()
+
+    @contextmanager
+    def interactive(self):
+        with self._condition:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._shedding and self._active <= self.threshold, timeout)
+
+class _Journal:
+    """Append-only job journal shared by the item threads of one run"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]):
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def _read_journal(directory: Path) -> Tuple[Dict[int, Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Latest entry per item index and the final entry, if the job ended"""
+    entries: Dict[int, Dict[str, Any]] = {}
+    final = None
+    try:
+        with open(directory / JOURNAL_FILE, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line of a crashed run
+                if "index" in entry:
+                    entries[entry["index"]] = entry
+                elif "status" in entry:
+                    final = entry
+    except FileNotFoundError:
+        pass
+    return entries, final
+
+def _write_json_atomic(path: Path, data: Any):
+    temporary = path.with_name(path.name + ".part")
+    temporary.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(temporary, path)
+
+class _ChunkWriter:
+    """File object collecting what tarfile writes, drained between members"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+class BatchJobManager:
+    """
+    Queues batch jobs and renders their items in the background
+
+    Args:
+        output_dir: Root directory holding one directory per job
+        synthesize: Renders one (text, voice, speed), see ``make_synthesizer``
+        cache: Audio cache with ``get_pcm``/``put_pcm`` (TranscodingAudioCache)
+        window: Items in flight at once; enough to keep every stage of the
+            synthesis pipeline busy without crowding out interactive requests
+        gate: PriorityGate to yield to interactive requests
+    """
+
+    def __init__(self, output_dir: str, synthesize: Synthesize, cache: Any = None,
+                 window: int = 4, gate: Optional[PriorityGate] = None):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.synthesize = synthesize
+        self.cache = cache
+        self.window = max(1, int(window))
+        self.gate = gate
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._slots = threading.Condition()
+        self._jobs: Dict[str, BatchJob] = {}
+        self._queue: "queue.Queue[Optional[BatchJob]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=self.window, thread_name_prefix="batch-item")
+        self._closed = False
+        self._scheduler = threading.Thread(target=self._schedule, name="batch-scheduler", daemon=True)
+        self._scheduler.start()
+
+    # Jobs
+
+    def submit(self, items: List[BatchItem]) -> BatchJob:
+        """Persist a parsed manifest and queue it"""
+        if self._closed:
+            raise RuntimeError("Batch job manager is shut down")
+        job_id = uuid.uuid4().hex
+        directory = self.output_dir / job_id
+        directory.mkdir(parents=True)
+        job = BatchJob(job_id, directory, items)
+        _write_json_atomic(directory / JOB_FILE, {
+            "job_id": job_id,
+            "created_at": job.created_at,
+            "items": [asdict(item) for item in items],
+        })
+        with self._lock:
+            self._jobs[job_id] = job
+        self._queue.put(job)
+        logger.info(f"Queued batch job {job_id}: {job.total} items")
+        return job
+
+    def recover(self) -> List[BatchJob]:
+        """Load jobs from the output directory and queue the interrupted ones"""
+        resumed = []
+        for directory in sorted(self.output_dir.iterdir()):
+            if directory.name in self._jobs or not (directory / JOB_FILE).exists():
+                continue
+            job = self._load(directory)
+            if job is None:
+                continue
+            with self._lock:
+                self._jobs[job.job_id] = job
+            if not job.finished:
+                job.resumed = True
+                resumed.append(job)
+        for job in sorted(resumed, key=lambda job: job.created_at):
+            self._queue.put(job)
+        if resumed:
+            logger.info(f"Resuming {len(resumed)} interrupted batch job(s)")
+        return resumed
+
+    def _load(self, directory: Path) -> Optional[BatchJob]:
+        try:
+            spec = json.loads((directory / JOB_FILE).read_text(encoding="utf-8"))
+            items = [BatchItem(**item) for item in spec["items"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Skipping unreadable batch job {directory.name}: {e}")
+            return None
+
+        job = BatchJob(spec["job_id"], directory, items, created_at=spec.get("created_at", 0.0))
+        entries, final = _read_journal(directory)
+        for entry in entries.values():
+            if entry.get("status") == "done":
+                job.completed += 1
+                job.audio_seconds += entry.get("duration", 0.0)
+            else:
+                job.failed += 1
+        if final is not None:
+            job.status = final["status"]
+            job.error = final.get("error")
+            job.started_at = final.get("started_at")
+            job.finished_at = final.get("finished_at")
+            job.synthesized = final.get("synthesized", 0)
+            job.cache_hits = final.get("cache_hits", 0)
+        return job
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        """A job of this process, or the on-disk state of one another worker runs"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        directory = self.output_dir / job_id
+        if not _ID_PATTERN.match(job_id) or not (directory / JOB_FILE).exists():
+            return None
+        job = self._load(directory)
+        if job is not None and not job.finished and self._locked_elsewhere(directory):
+            job.status = RUNNING
+        return job
+
+    def list_jobs(self) -> List[BatchJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def results(self, job_id: str) -> List[Dict[str, Any]]:
+        """Per-item journal entries in manifest order"""
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        entries, _ = _read_journal(job.directory)
+        return [entries[index] for index in sorted(entries)]
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop a job; items already in flight finish, a queued job never starts"""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        (job.directory / CANCEL_FILE).touch()
+        with self._lock:
+            queued = job.status == QUEUED and job_id in self._jobs
+        if queued:
+            self._finish(job, CANCELLED)
+        logger.info(f"Cancelled batch job {job_id}")
+        return True
+
+    def delete(self, job_id: str) -> bool:
+        """Remove a finished job and its outputs"""
+        job = self.get(job_id)
+        if job is None or not job.finished:
+            return False
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        shutil.rmtree(job.directory, ignore_errors=True)
+        return True
+
+    def iter_archive(self, job_id: str) -> Iterator[bytes]:
+        """
+        Stream the job's finished outputs as an uncompressed tar
+
+        Audio files are added in manifest order followed by results.jsonl,
+        each member yielded as soon as it is written so large jobs never
+        sit in memory.
+        """
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        entries = self.results(job_id)
+        writer = _ChunkWriter()
+        with tarfile.open(fileobj=writer, mode="w|") as archive:
+            for entry in entries:
+                if entry.get("status") != "done":
+                    continue
+                try:
+                    archive.add(str(job.directory / entry["file"]), arcname=entry["file"])
+                except FileNotFoundError:
+                    continue
+                yield writer.drain()
+            results = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+            info = tarfile.TarInfo("results.jsonl")
+            info.size = len(results)
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(results))
+        yield writer.drain()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        by_status: Dict[str, int] = {}
+        for job in jobs:
+            by_status[job.status] = by_status.get(job.status, 0) + 1
+        return {
+            "jobs": by_status,
+            "window": self.window,
+            "in_flight": self._in_flight,
+            "shedding": self.gate.shedding if self.gate is not None else False,
+            "output_dir": str(self.output_dir),
+            "interactive_active": self.gate.active if self.gate is not None else 0,
+        }
+
+    # Running
+
+    def _schedule(self):
+        while True:
+            job = self._queue.get()
+            if job is None or self._closed:
+                return
+            if job.status != QUEUED:
+                continue
+            try:
+                self._run(job)
+            except Exception as e:
+                logger.error(f"Batch job {job.job_id} failed: {e}")
+                self._finish(job, FAILED, error=str(e))
+
+    def _run(self, job: BatchJob):
+        lock = self._claim(job.directory)
+        if lock is False:
+            logger.info(f"Batch job {job.job_id} is running in another worker")
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+            return
+        try:
+            if job.finished:
+                return  # Cancelled while the scheduler picked it up
+            if job.cancel_requested:
+                self._finish(job, CANCELLED)
+                return
+            self._render_job(job)
+        finally:
+            if lock is not None:
+                lock.close()
+
+    def _render_job(self, job: BatchJob):
+        entries, _ = _read_journal(job.directory)
+        done = {index for index, entry in entries.items()
+                if entry.get("status") == "done" and (job.directory / entry["file"]).exists()}
+        groups: Dict[Tuple[str, str, float], List[BatchItem]] = {}
+        for item in job.items:
+            if item.index not in done:
+                groups.setdefault(item.key, []).append(item)
+
+        job.completed, job.failed = len(done), 0
+        job.audio_seconds = sum(entries[index].get("duration", 0.0) for index in done)
+        job._resumed_items = job.completed
+        job.status = RUNNING
+        job.started_at = time.time()
+        logger.info(f"Batch job {job.job_id}: rendering {len(groups)} distinct items "
+                    f"({job.total - len(done)} of {job.total} outstanding)")
+
+        journal = _Journal(job.directory / JOURNAL_FILE)
+        futures: List[Future] = []
+        try:
+            for group in groups.values():
+                if not self._wait_for_turn(job):
+                    break
+                future = self._executor.submit(self._render_group, job, group, journal)
+                future.add_done_callback(self._release_slot)
+                futures.append(future)
+            wait(futures)
+        finally:
+            journal.close()
+
+        if job.cancel_requested:
+            self._finish(job, CANCELLED)
+        elif self._closed:
+            job.status = QUEUED  # No final line: the next start resumes it
+            logger.info(f"Batch job {job.job_id} interrupted at {job.completed}/{job.total} items")
+        else:
+            self._finish(job, COMPLETED)
+
+    def set_window(self, window: int):
+        """Change the number of items in flight; takes effect as items finish"""
+        with self._slots:
+            self.window = max(1, int(window))
+            self._slots.notify_all()
+
+    def _wait_for_turn(self, job: BatchJob) -> bool:
+        """Block until a window slot is free and no interactive request is waiting"""
+        while not (self._closed or job.cancel_requested):
+            if self.gate is not None and not self.gate.wait_idle(0.1):
+                continue
+            with self._slots:
+                if self._in_flight < self.window:
+                    self._in_flight += 1
+                    return True
+                self._slots.wait(0.1)
+        return False
+
+    def _release_slot(self, _future: Future):
+        with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def _render_group(self, job: BatchJob, group: List[BatchItem], journal: _Journal):
+        """Synthesize one distinct (text, voice, speed) and write every item that uses it"""
+        from ..audio.format_converter import encode_audio
+
+        pending = list(group)
+        try:
+            audio, sample_rate, cached = self._pcm(group[0])
+            duration = len(audio) / sample_rate
+            with self._lock:
+                if cached:
+                    job.cache_hits += 1
+                else:
+                    job.synthesized += 1
+
+            encoded: Dict[str, bytes] = {}
+            while pending:
+                item = pending[0]
+                audio_data = encoded.get(item.response_format)
+                if audio_data is None:
+                    audio_data = encoded[item.response_format] = encode_audio(audio, sample_rate, item.response_format)
+                path = job.directory / item.filename
+                temporary = path.with_name(path.name + ".part")
+                temporary.write_bytes(audio_data)
+                os.replace(temporary, path)
+                journal.append({"index": item.index, "id": item.id, "status": "done", "file": item.filename,
+                                "bytes": len(audio_data), "duration": round(duration, 3), "cached": cached})
+                pending.pop(0)
+                with self._lock:
+                    job.completed += 1
+                    job.audio_seconds += duration
+        except Exception as e:
+            logger.warning(f"Batch job {job.job_id}: item {group[0].id} failed: {e}")
+            for item in pending:
+                journal.append({"index": item.index, "id": item.id, "status": "failed", "error": str(e)})
+            with self._lock:
+                job.failed += len(pending)
+
+    def _pcm(self, item: BatchItem) -> Tuple[np.ndarray, int, bool]:
+        """Samples for an item from the cache, or synthesized and cached"""
+        if self.cache is not None:
+            try:
+                cached = self.cache.get_pcm(item.text, item.voice, item.speed)
+            except Exception as e:
+                logger.debug(f"Batch cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                return cached[0], cached[1], True
+
+        audio, sample_rate = self.synthesize(item.text, item.voice, item.speed)
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if audio.size == 0:
+            raise ValueError("Generated audio is empty")
+        if not np.isfinite(audio).all():
+            raise ValueError("Generated audio contains invalid values (NaN or Inf)")
+        if self.cache is not None:
+            try:
+                self.cache.put_pcm(item.text, item.voice, audio, sample_rate, item.speed)
+            except Exception as e:
+                logger.debug(f"Batch cache store failed: {e}")
+        return audio, sample_rate, False
+
+    def _finish(self, job: BatchJob, status: str, error: Optional[str] = None):
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        with open(job.directory / JOURNAL_FILE, "a", encoding="utf-8") as journal:
+            journal.write(json.dumps({
+                "status": status, "error": error, "started_at": job.started_at, "finished_at": job.finished_at,
+                "synthesized": job.synthesized, "cache_hits": job.cache_hits,
+            }) + "\n")
+        if status != CANCELLED or job.started_at is not None:
+            logger.info(f"Batch job {job.job_id} {status}: {job.completed} done, {job.failed} failed, "
+                        f"{job.synthesized} synthesized, {job.cache_hits} from cache")
+
+    @staticmethod
+    def _claim(directory: Path):
+        """Exclusive lock on a job: the open lock file, None without fcntl, False if held elsewhere"""
+        if fcntl is None:
+            return None
+        lock = open(directory / LOCK_FILE, "a")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+        return lock
+
+    @staticmethod
+    def _locked_elsewhere(directory: Path) -> bool:
+        if fcntl is None or not (directory / LOCK_FILE).exists():
+            return False
+        with open(directory / LOCK_FILE, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except OSError:
+                return True
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        return False
+
+    def shutdown(self, wait: bool = True):
+        """Stop after the items in flight; interrupted jobs resume on the next recover()"""
+        self._closed = True
+        self._queue.put(None)
+        if wait:
+            self._scheduler.join()
+        self._executor.shutdown(wait=wait)
+
+def make_synthesizer(backend: Any, lang: str = "en-us", processing_options: Any = None,
+                     nlp_pool: Optional[NLPProcessPool] = None, pipeline: Any = None) -> Synthesize:
+    """
+    Batch synthesize function using the serving path's text processing
+
+    With a staged pipeline the items go through it as background work,
+    overlapping NLP and inference with interactive requests without taking
+    their queue places, and stop before the encode stage since the batch
+    runner writes the samples itself. Otherwise the text is normalized (in
+    the NLP pool when there is one) and synthesized on the calling batch
+    thread.
+    """
+    if pipeline is not None:
+        from .pipeline import SynthesisJob
+
+        def synthesize(text: str, voice: str, speed: float) -> Tuple[np.ndarray, int]:
+            job = pipeline.run(SynthesisJob(text=text, voice=voice, backend=backend, speed=speed,
+                                            lang=lang, response_format=None), background=True)
+            return job.audio, job.sample_rate
+        return synthesize
+
+    local = threading.local()
+
+    def normalize(text: str) -> str:
+        if nlp_pool is not None:
+            return nlp_pool.process(text).text
+        processor = getattr(local, "processor", None)
+        if processor is None:
+            processor = local.processor = FrontEndProcessor(processing_options)
+        return processor(text)
+
+    def synthesize(text: str, voice: str, speed: float) -> Tuple[np.ndarray, int]:
+        return backend.create(normalize(text), voice=voice, speed=speed, lang=lang)
+    return synthesize
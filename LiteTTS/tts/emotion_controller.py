@@ -4,9 +4,13 @@ Emotion controller for TTS synthesis
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import hashlib
 import logging
+import threading
+import zlib
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +25,32 @@ class EmotionMapping:
     description: str = ""
 
 class EmotionController:
-    """Controls emotion and expression in TTS synthesis"""
+    """Controls emotion and expression in TTS synthesis
+
+    Emotional style tables are derived copy-on-write from the shared voice
+    embedding and kept in a bounded LRU keyed by (voice, emotion, quantized
+    strength), so repeated emotional requests cost the same as neutral ones.
+    Precomputed voices get room for their tables on top of style_cache_size,
+    so preloading many voices never evicts the styles requests built.
+    """
     
-    def __init__(self):
+    def __init__(self, style_cache_size: int = 64, strength_step: float = 0.1):
         self.emotion_mappings = self._load_emotion_mappings()
         self.supported_emotions = list(self.emotion_mappings.keys())
+
+        # Derived style tables: (voice name, voice version, emotion, strength) -> read-only styled copy
+        self.style_cache_size = style_cache_size
+        self.strength_step = strength_step
+        self._style_cache: "OrderedDict[Tuple[str, str, str, float], np.ndarray]" = OrderedDict()
+        self._style_cache_lock = threading.Lock()
+        self._reserved_styles: Dict[str, int] = {}  # Voice name -> tables precomputed for it
+        self._style_cache_hits = 0
+        self._style_cache_misses = 0
+    
+    @property
+    def common_emotions(self) -> List[str]:
+        """Emotions worth precomputing for every preloaded voice"""
+        return [emotion for emotion in self.emotion_mappings if emotion != 'neutral']
         
     def _load_emotion_mappings(self) -> Dict[str, EmotionMapping]:
         """Load emotion mappings and their effects"""
@@ -173,7 +198,9 @@ class EmotionController:
             
             # Apply adjustment to a portion of the embedding
             # (This is a placeholder - actual implementation would depend on embedding structure)
-            start_idx = hash(weight_type) % len(modified_embedding)
+            # crc32 rather than hash(): str hashes are salted per process, which
+            # gave every worker a different style for the same emotion
+            start_idx = zlib.crc32(weight_type.encode('utf-8')) % len(modified_embedding)
             end_idx = min(start_idx + len(modified_embedding) // 10, len(modified_embedding))
             
             modified_embedding[start_idx:end_idx] *= adjustment_factor
@@ -186,6 +213,103 @@ class EmotionController:
         logger.debug(f"Applied emotion '{emotion}' with strength {strength}")
         return modified_embedding
     
+    def quantize_strength(self, strength: float) -> float:
+        """Clamp strength to [0, 2] and round it to the cache step"""
+        strength = max(0.0, min(2.0, float(strength)))
+        return round(round(strength / self.strength_step) * self.strength_step, 6)
+
+    def get_emotion_style(self, voice_name: str, voice_embedding: np.ndarray,
+                          emotion: Optional[str], strength: float = 1.0,
+                          voice_version: str = "") -> np.ndarray:
+        """
+        Get the emotional style table for a voice without mutating it
+
+        Returns ``voice_embedding`` itself for neutral or zero-strength requests,
+        otherwise a cached read-only copy with the emotion applied. Entries are
+        keyed on the voice's version (its file hash), or on a digest of the
+        embedding when no version is known, so reloading a voice never serves
+        a stale style and converting the same voice again still hits.
+        """
+        if not emotion or emotion == 'neutral' or emotion not in self.emotion_mappings:
+            return voice_embedding
+
+        strength = self.quantize_strength(strength)
+        if strength == 0.0:
+            return voice_embedding
+
+        key = (voice_name, voice_version or self._embedding_digest(voice_embedding), emotion, strength)
+        with self._style_cache_lock:
+            styled = self._style_cache.get(key)
+            if styled is not None:
+                self._style_cache.move_to_end(key)
+                self._style_cache_hits += 1
+                return styled
+            self._style_cache_misses += 1
+
+        styled = self.apply_emotion(voice_embedding, emotion, strength)
+        styled.setflags(write=False)
+
+        with self._style_cache_lock:
+            self._style_cache[key] = styled
+            self._style_cache.move_to_end(key)
+            while len(self._style_cache) > self._style_capacity():
+                self._style_cache.popitem(last=False)
+
+        return styled
+
+    def _style_capacity(self) -> int:
+        """Style cache bound: the on-demand budget plus every precomputed voice's tables"""
+        return self.style_cache_size + sum(self._reserved_styles.values())
+
+    @staticmethod
+    def _embedding_digest(voice_embedding: np.ndarray) -> str:
+        """Content digest standing in for a version when the voice has no file hash"""
+        data = np.ascontiguousarray(voice_embedding)
+        digest = hashlib.blake2b(data.view(np.uint8), digest_size=16)
+        digest.update(repr((data.shape, data.dtype.str)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def precompute_styles(self, voice_name: str, voice_embedding: np.ndarray,
+                          emotions: Optional[List[str]] = None,
+                          strengths: Tuple[float, ...] = (1.0,), voice_version: str = "") -> int:
+        """Warm the style cache for a voice, returns the number of tables built"""
+        built = 0
+        voice_version = voice_version or self._embedding_digest(voice_embedding)
+        emotions = emotions or self.common_emotions
+        with self._style_cache_lock:
+            self._reserved_styles[voice_name] = len(emotions) * len(strengths)
+        for emotion in emotions:
+            for strength in strengths:
+                before = self._style_cache_misses
+                self.get_emotion_style(voice_name, voice_embedding, emotion, strength, voice_version)
+                built += self._style_cache_misses - before
+        if built:
+            logger.debug(f"Precomputed {built} emotion styles for voice '{voice_name}'")
+        return built
+
+    def clear_style_cache(self, voice_name: Optional[str] = None, emotion: Optional[str] = None):
+        """Drop cached styles, optionally only for one voice and/or emotion"""
+        with self._style_cache_lock:
+            if voice_name is None and emotion is None:
+                self._style_cache.clear()
+                return
+            for key in [k for k in self._style_cache
+                        if (voice_name is None or k[0] == voice_name)
+                        and (emotion is None or k[2] == emotion)]:
+                del self._style_cache[key]
+
+    def get_style_cache_stats(self) -> Dict[str, Any]:
+        """Style cache size and hit rate"""
+        with self._style_cache_lock:
+            lookups = self._style_cache_hits + self._style_cache_misses
+            return {
+                'entries': len(self._style_cache),
+                'max_entries': self._style_capacity(),
+                'hits': self._style_cache_hits,
+                'misses': self._style_cache_misses,
+                'hit_rate': self._style_cache_hits / lookups if lookups else 0.0
+            }
+    
     def get_emotion_adjustments(self, emotion: str, strength: float = 1.0) -> Dict[str, float]:
         """Get audio processing adjustments for an emotion"""
         if emotion not in self.emotion_mappings:
@@ -307,6 +431,8 @@ class EmotionController:
             
             self.emotion_mappings[name] = custom_emotion
             self.supported_emotions = list(self.emotion_mappings.keys())
+            # Redefining an emotion invalidates styles derived from the old mapping
+            self.clear_style_cache(emotion=name)
             
             logger.info(f"Created custom emotion: {name}")
             return True
@@ -3,7 +3,6 @@
 Kokoro TTS engine wrapper with ONNX runtime integration
 """
 
-import torch
 import onnxruntime as ort
 import numpy as np
 from pathlib import Path
@@ -14,18 +13,27 @@ import queue
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..models import VoiceEmbedding, AudioSegment, TTSConfiguration
+from ..models import VoiceEmbedding, TTSConfiguration
+from ..audio.audio_segment import AudioSegment
 from ..voice.manager import VoiceManager
 from ..voice.blender import VoiceBlender, BlendConfig
 from ..audio.processor import AudioProcessor
-from ..audio.progressive_generator import ProgressiveAudioGenerator, ProgressiveGenerationConfig, GenerationMode
-from ..audio.chunking import ChunkingConfig, ChunkingStrategy
+from ..audio.postprocess import PostProcessSpec, process_audio_inplace
+from ..audio.progressive_generator import ProgressiveAudioGenerator, config_from_chunked_generation
 from ..audio.voice_consistency import VoiceConsistencyManager, ConsistencyLevel
 from ..monitoring.chunked_performance import ChunkedPerformanceMonitor, GenerationType
 from ..metrics import performance_logger
+from ..performance.onnx_memory import BucketedSession, configure_session_options, token_count
+from .tokenizer import CodepointTokenizer
+from .pipeline import PipelineStage, StagedPipeline
+from .emotion_controller import EmotionController
 
 logger = logging.getLogger(__name__)
 
+# Post-processing applied to raw model output by the fused kernel
+_FAST_POSTPROCESS_SPEC = PostProcessSpec(peak_ceiling=0.95)
+_SANITIZE_SPEC = PostProcessSpec()
+
 class KokoroTTSEngine:
     """Main TTS engine using Kokoro model with ONNX runtime"""
     
@@ -36,8 +44,15 @@ class KokoroTTSEngine:
         
         # Initialize components
         self.voice_manager = VoiceManager()
-        self.voice_blender = VoiceBlender(self.voice_manager)
+        self.voice_blender = VoiceBlender(
+            self.voice_manager,
+            cache_size=getattr(config, 'blend_cache_size', 32),
+            pack_dir=getattr(config, 'blend_pack_dir', None)
+        )
         self.audio_processor = AudioProcessor()
+        self.emotion_controller = EmotionController(
+            style_cache_size=getattr(config, 'emotion_style_cache_size', 64)
+        )
 
         # Initialize chunked generation components
         self._initialize_chunked_generation()
@@ -45,6 +60,21 @@ class KokoroTTSEngine:
         # ONNX session
         self.onnx_session = None
         self.tokenizer = None
+        self.fast_tokenizer = None
+        self._input_names: List[str] = []
+        self._output_names: List[str] = []
+
+        # IOBinding state, one binding per worker thread
+        self.use_io_binding = getattr(config, 'use_io_binding', True)
+        self._binding_local = threading.local()
+        # A failed bound run falls back to session.run for a cooldown, then IOBinding is retried
+        self.io_binding_retry_seconds = getattr(config, 'io_binding_retry_seconds', 60.0)
+        self.io_binding_failures = 0
+        self._io_binding_suspended_until = 0.0
+
+        # Staged pipeline shared by concurrent callers, built on first use
+        self._pipeline: Optional[StagedPipeline] = None
+        self._pipeline_lock = threading.Lock()
         
         # Model state
         self.model_loaded = False
@@ -60,25 +90,8 @@ class KokoroTTSEngine:
             chunked_config = getattr(self.config, 'chunked_generation', None)
 
             if chunked_config and chunked_config.enabled:
-                # Create chunking configuration
-                chunking_config = ChunkingConfig(
-                    enabled=chunked_config.enabled,
-                    strategy=ChunkingStrategy(chunked_config.strategy),
-                    max_chunk_size=chunked_config.max_chunk_size,
-                    min_chunk_size=chunked_config.min_chunk_size,
-                    overlap_size=chunked_config.overlap_size,
-                    respect_sentence_boundaries=chunked_config.respect_sentence_boundaries,
-                    respect_paragraph_boundaries=chunked_config.respect_paragraph_boundaries,
-                    preserve_punctuation=chunked_config.preserve_punctuation
-                )
-
-                # Create progressive generation configuration
-                progressive_config = ProgressiveGenerationConfig(
-                    mode=GenerationMode.CHUNKED,
-                    chunking_config=chunking_config,
-                    enable_voice_consistency=True,
-                    enable_prosody_continuity=True
-                )
+                from ..config import config as app_config
+                progressive_config = config_from_chunked_generation(chunked_config, app_config.paths.cache_dir)
 
                 # Initialize components
                 self.progressive_generator = ProgressiveAudioGenerator(self, progressive_config)
@@ -138,12 +151,25 @@ class KokoroTTSEngine:
         # Create ONNX session
         session_options = ort.SessionOptions()
         session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        from ..config import config as app_config
+        memory_config = app_config.onnx_memory
+        if memory_config.enabled:
+            configure_session_options(session_options, memory_config)
         
         self.onnx_session = ort.InferenceSession(
             str(model_path),
             sess_options=session_options,
             providers=providers
         )
+        if memory_config.enabled:
+            # Both session.run and the IOBinding path go through the length buckets
+            self.onnx_session = BucketedSession(
+                self.onnx_session, memory_config.bucket_boundaries, memory_config.shrink_above_tokens
+            )
+
+        # Resolve graph I/O names once instead of on every inference
+        self._input_names = [node.name for node in self.onnx_session.get_inputs()]
+        self._output_names = [node.name for node in self.onnx_session.get_outputs()]
         
         logger.info(f"Loaded ONNX model from {model_path}")
         logger.info(f"Using providers: {self.onnx_session.get_providers()}")
@@ -168,6 +194,20 @@ class KokoroTTSEngine:
         except Exception as e:
             logger.error(f"Failed to load tokenizer: {e}")
             self.tokenizer = self._create_simple_tokenizer()
+
+        self.fast_tokenizer = self._build_fast_tokenizer(self.tokenizer)
+
+    def _build_fast_tokenizer(self, tokenizer: Dict[str, Any]) -> Optional[CodepointTokenizer]:
+        """Build the vectorized lookup-table tokenizer for a character vocabulary"""
+        char_to_id = tokenizer.get('char_to_id') if isinstance(tokenizer, dict) else None
+        if not char_to_id:
+            return None
+
+        try:
+            return CodepointTokenizer(char_to_id, tokenizer.get('unk_token_id', 0))
+        except Exception as e:
+            logger.warning(f"Vectorized tokenizer unavailable, using per-character mapping: {e}")
+            return None
     
     def _create_simple_tokenizer(self) -> Dict[str, Any]:
         """Create a simple character-based tokenizer"""
@@ -208,6 +248,17 @@ class KokoroTTSEngine:
         # Get available voices
         self.available_voices = self.voice_manager.get_available_voices()
         logger.info(f"Available voices: {self.available_voices}")
+
+        # Emotional requests on the preloaded voices are style cache hits from the start
+        for voice_name, loaded in setup_results.get('cache_results', {}).items():
+            if loaded:
+                self._precompute_emotion_styles(voice_name)
+
+        # Preset blends are served at high volume, build them before the first request
+        try:
+            self.voice_blender.prebuild_presets(self.available_voices)
+        except Exception as e:
+            logger.warning(f"Failed to prebuild preset voice blends: {e}")
     
     def synthesize(self, text: str, voice: str, speed: float = 1.0,
                   emotion: Optional[str] = None, emotion_strength: float = 1.0) -> AudioSegment:
@@ -250,6 +301,11 @@ class KokoroTTSEngine:
             # Fallback to core synthesis without optimization
             return self._synthesize_core(text, voice, speed, emotion, emotion_strength)
 
+    def synthesize_samples(self, text: str, voice: str, speed: float = 1.0) -> Tuple[np.ndarray, int]:
+        """Samples and sample rate for one progressive generation chunk"""
+        audio_segment = self.synthesize(text, voice, speed)
+        return audio_segment.audio_data, audio_segment.sample_rate
+
     def _synthesize_core(self, text: str, voice: str, speed: float = 1.0,
                         emotion: Optional[str] = None, emotion_strength: float = 1.0) -> AudioSegment:
         """Core synthesis method without optimization wrapper"""
@@ -300,47 +356,35 @@ class KokoroTTSEngine:
             self.voice_manager.metadata_manager.update_voice_stats(voice, 0.0, success=False)
             raise    
 
-    def _tokenize_text(self, text: str) -> np.ndarray:
-        """Tokenize input text"""
+    def _tokenize_text(self, text: str, reuse_buffer: bool = False) -> np.ndarray:
+        """Tokenize input text
+
+        With ``reuse_buffer`` the tokens are written into a thread-local buffer
+        that the next call on the same thread overwrites, so only pass it when
+        the result is consumed by a single inference and not cached.
+        """
         if not text or not text.strip():
             logger.warning("Empty or whitespace-only text provided for tokenization")
             # Return a minimal token sequence for empty text
             return np.array([0], dtype=np.int64)  # Just the pad token
 
-        if self.tokenizer['type'] == 'character':
-            # Character-based tokenization
-            char_to_id = self.tokenizer['char_to_id']
-            unk_id = self.tokenizer['unk_token_id']
-
-            token_ids = []
-            for char in text:
-                token_ids.append(char_to_id.get(char, unk_id))
-
-            # Ensure we have at least one token
-            if not token_ids:
-                logger.warning("No valid tokens generated from text, using unknown token")
-                token_ids = [unk_id]
+        if self.tokenizer['type'] != 'character':
+            logger.warning(f"Unknown tokenizer type '{self.tokenizer['type']}', falling back to character-based")
 
-            tokens = np.array(token_ids, dtype=np.int64)
-            logger.debug(f"Tokenized '{text[:50]}...' to {len(tokens)} tokens")
-            return tokens
+        if self.fast_tokenizer is not None:
+            if reuse_buffer:
+                tokens = self.fast_tokenizer.encode_to_input_ids(text)[0]
+            else:
+                tokens = self.fast_tokenizer.encode(text)
         else:
-            # Fallback to character-based tokenization for unknown types
-            logger.warning(f"Unknown tokenizer type '{self.tokenizer['type']}', falling back to character-based")
             char_to_id = self.tokenizer.get('char_to_id', {})
             unk_id = self.tokenizer.get('unk_token_id', 0)
+            tokens = np.fromiter((char_to_id.get(char, unk_id) for char in text),
+                                 dtype=np.int64, count=len(text))
 
-            token_ids = []
-            for char in text:
-                token_ids.append(char_to_id.get(char, unk_id))
-
-            if not token_ids:
-                logger.warning("No valid tokens generated from text, using unknown token")
-                token_ids = [unk_id]
-
-            tokens = np.array(token_ids, dtype=np.int64)
-            logger.debug(f"Tokenized '{text[:50]}...' to {len(tokens)} tokens (fallback)")
-            return tokens
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tokenized '{text[:50]}...' to {len(tokens)} tokens")
+        return tokens
     
     def _prepare_model_inputs(self, tokens: np.ndarray, voice_embedding: VoiceEmbedding,
                             speed: float, emotion: Optional[str], emotion_strength: float) -> Dict[str, np.ndarray]:
@@ -352,6 +396,12 @@ class KokoroTTSEngine:
         if hasattr(voice_data, 'numpy'):
             voice_data = voice_data.numpy()
 
+        # Emotion is applied to a cached copy, never to the shared embedding
+        if emotion and emotion != 'neutral':
+            voice_data = self.emotion_controller.get_emotion_style(
+                voice_embedding.name, voice_data, emotion, emotion_strength, voice_embedding.file_hash
+            )
+
         # Ensure voice data is the right shape for the model
         # Model expects style input with shape [1, 256]
         if voice_data.shape == (510, 256):
@@ -372,24 +422,24 @@ class KokoroTTSEngine:
                 raise ValueError(f"Voice data too small: {voice_data.shape}, need at least 256 elements")
 
         # Basic input preparation with correct input names for ONNX model
+        # Views and no-op casts avoid copying token and style arrays that are already in shape
         inputs = {
-            'input_ids': tokens.reshape(1, -1).astype(np.int64),  # Add batch dimension, ensure int64
-            'style': style_vector.astype(np.float32),  # Ensure float32
+            'input_ids': np.asarray(tokens, dtype=np.int64).reshape(1, -1),  # Add batch dimension, ensure int64
+            'style': style_vector.astype(np.float32, copy=False),  # Ensure float32
             'speed': np.array([speed], dtype=np.float32)  # Shape: [1]
         }
 
-        logger.debug(f"Model inputs prepared: input_ids shape={inputs['input_ids'].shape}, "
-                    f"style shape={inputs['style'].shape}, speed shape={inputs['speed'].shape}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Model inputs prepared: input_ids shape={inputs['input_ids'].shape}, "
+                        f"style shape={inputs['style'].shape}, speed shape={inputs['speed'].shape}")
 
         return inputs
     
     def _run_inference(self, model_inputs: Dict[str, np.ndarray]) -> np.ndarray:
         """Run ONNX model inference"""
         try:
-            # Get input names from the model
-            input_names = [input.name for input in self.onnx_session.get_inputs()]
-            logger.debug(f"Model expects inputs: {input_names}")
-            logger.debug(f"Provided inputs: {list(model_inputs.keys())}")
+            # Input names are resolved once at model load
+            input_names = self._input_names or [node.name for node in self.onnx_session.get_inputs()]
 
             # Prepare inputs for ONNX session
             onnx_inputs = {}
@@ -398,7 +448,6 @@ class KokoroTTSEngine:
             for name in input_names:
                 if name in model_inputs:
                     onnx_inputs[name] = model_inputs[name]
-                    logger.debug(f"Input '{name}' shape: {model_inputs[name].shape}, dtype: {model_inputs[name].dtype}")
                 else:
                     missing_inputs.append(name)
                     logger.warning(f"Missing required input: {name}")
@@ -408,14 +457,18 @@ class KokoroTTSEngine:
 
             # Run inference
             logger.debug("Running ONNX inference...")
-            outputs = self.onnx_session.run(None, onnx_inputs)
+            if self.use_io_binding and time.monotonic() >= self._io_binding_suspended_until:
+                outputs = self._run_with_io_binding(onnx_inputs)
+            else:
+                outputs = self.onnx_session.run(None, onnx_inputs)
 
             # Check output
             if not outputs or len(outputs) == 0:
                 raise RuntimeError("ONNX model returned no outputs")
 
             audio_output = outputs[0]
-            logger.debug(f"ONNX output shape: {audio_output.shape}, dtype: {audio_output.dtype}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"ONNX output shape: {audio_output.shape}, dtype: {audio_output.dtype}")
 
             # Validate output
             if audio_output.size == 0:
@@ -428,6 +481,59 @@ class KokoroTTSEngine:
             logger.error(f"Model inputs were: {[(k, v.shape, v.dtype) for k, v in model_inputs.items()]}")
             raise
     
+    def _get_io_binding(self):
+        """Get this thread's IOBinding for the current session"""
+        binding = getattr(self._binding_local, 'binding', None)
+        if binding is None or getattr(self._binding_local, 'session', None) is not self.onnx_session:
+            binding = self.onnx_session.io_binding()
+            self._binding_local.binding = binding
+            self._binding_local.session = self.onnx_session
+        return binding
+
+    def _run_with_io_binding(self, onnx_inputs: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        """
+        Run inference through IOBinding
+
+        Inputs are bound in place from their numpy buffers and outputs are
+        allocated by the session's arena and returned as views over that
+        memory, so neither side is copied on the way through. The waveform
+        length depends on predicted durations, so outputs cannot be bound to
+        pre-sized buffers; ORT rejects a pre-allocated output whose shape
+        differs from the computed one.
+        """
+        try:
+            binding = self._get_io_binding()
+            binding.clear_binding_inputs()
+            binding.clear_binding_outputs()
+
+            for name, value in onnx_inputs.items():
+                binding.bind_cpu_input(name, np.ascontiguousarray(value))
+
+            output_names = self._output_names or [node.name for node in self.onnx_session.get_outputs()]
+            for name in output_names:
+                binding.bind_output(name, 'cpu')
+
+            if isinstance(self.onnx_session, BucketedSession):
+                self.onnx_session.run_with_iobinding(binding, tokens=token_count(onnx_inputs))
+            else:
+                self.onnx_session.run_with_iobinding(binding)
+            outputs = [value.numpy() for value in binding.get_outputs()]
+
+            # Drop the session's references so the arena can recycle the blocks
+            # once the caller releases the returned arrays
+            binding.clear_binding_inputs()
+            binding.clear_binding_outputs()
+            return outputs
+
+        except Exception as e:
+            self.io_binding_failures += 1
+            self._io_binding_suspended_until = time.monotonic() + self.io_binding_retry_seconds
+            # This thread's binding may be left half-bound; build a fresh one on retry
+            self._binding_local.binding = None
+            logger.warning(f"IOBinding inference failed, using session.run for "
+                           f"{self.io_binding_retry_seconds:g}s: {e}")
+            return self.onnx_session.run(None, onnx_inputs)
+
     def _post_process_audio_fast(self, audio_data: np.ndarray) -> AudioSegment:
         """Fast post-processing for simple requests (minimal processing for RTF optimization)"""
         try:
@@ -435,18 +541,13 @@ class KokoroTTSEngine:
             if audio_data.size == 0:
                 raise ValueError("Cannot post-process empty audio data")
 
-            # Ensure audio is in the right format
-            if audio_data.ndim > 1:
-                audio_data = audio_data.flatten()
+            # Ensure audio is in the right format (views and in-place ops on
+            # the inference output, no intermediate copies)
+            audio_data = audio_data.reshape(-1).astype(np.float32, copy=False)
 
-            # Convert to float32 if needed
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-
-            # Quick normalization only (skip complex processing)
-            max_val = np.max(np.abs(audio_data))
-            if max_val > 0.95:
-                audio_data = audio_data * (0.95 / max_val)
+            # Quick normalization only (skip complex processing); one peak scan
+            # plus at most one in-place scaling pass
+            process_audio_inplace(audio_data, _FAST_POSTPROCESS_SPEC)
 
             # Create AudioSegment with minimal processing
             audio_segment = AudioSegment(
@@ -469,28 +570,22 @@ class KokoroTTSEngine:
 
     def _post_process_audio(self, audio_data: np.ndarray, speed: float) -> AudioSegment:
         """Full post-processing for complex requests"""
-        logger.debug(f"Post-processing audio: shape={audio_data.shape}, dtype={audio_data.dtype}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Post-processing audio: shape={audio_data.shape}, dtype={audio_data.dtype}")
 
         # Check for empty audio
         if audio_data.size == 0:
             raise ValueError("Cannot post-process empty audio data")
 
-        # Ensure audio is in the right format
-        if audio_data.ndim > 1:
-            audio_data = audio_data.flatten()
-
-        # Convert to float32 if needed
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-
-        # Check for invalid values
-        if np.any(np.isnan(audio_data)):
-            logger.warning("Audio contains NaN values, replacing with zeros")
-            audio_data = np.nan_to_num(audio_data, nan=0.0)
+        # Ensure audio is in the right format (views and in-place ops on the
+        # inference output, no intermediate copies)
+        audio_data = audio_data.reshape(-1).astype(np.float32, copy=False)
 
-        if np.any(np.isinf(audio_data)):
-            logger.warning("Audio contains infinite values, clipping")
-            audio_data = np.clip(audio_data, -1.0, 1.0)
+        # Replace invalid values in place: NaN becomes 0 and +-Inf becomes +-1.
+        # The kernel's peak scan doubles as the finite check
+        result = process_audio_inplace(audio_data, _SANITIZE_SPEC)
+        if result.non_finite:
+            logger.warning("Audio contains NaN or infinite values, replaced with zeros and clipped")
 
         # Apply speed adjustment if needed (simple time-stretching)
         if speed != 1.0:
@@ -562,7 +657,8 @@ class KokoroTTSEngine:
         response_format: str = "mp3",
         speed: float = 1.0,
         streaming: bool = True,
-        generation_id: Optional[str] = None
+        generation_id: Optional[str] = None,
+        cancellation_token=None
     ):
         """
         Synthesize audio using progressive/chunked generation
@@ -574,6 +670,7 @@ class KokoroTTSEngine:
             speed: Speech speed
             streaming: Whether to stream chunks
             generation_id: Optional generation ID
+            cancellation_token: Optional CancellationToken fired on client disconnect
 
         Yields:
             Audio chunks as they become available
@@ -597,7 +694,8 @@ class KokoroTTSEngine:
             voice=voice,
             response_format=response_format,
             speed=speed,
-            generation_id=generation_id
+            generation_id=generation_id,
+            cancellation_token=cancellation_token
         ):
             # Record chunk completion for monitoring
             if self.performance_monitor and generation_id:
@@ -692,12 +790,31 @@ class KokoroTTSEngine:
         }
     
     def preload_voice(self, voice_name: str) -> bool:
-        """Preload a voice into cache"""
-        return self.voice_manager.preload_voice(voice_name)
+        """Preload a voice into cache along with its common emotion styles"""
+        loaded = self.voice_manager.preload_voice(voice_name)
+        if loaded:
+            self._precompute_emotion_styles(voice_name)
+        return loaded
     
     def preload_voices(self, voice_names: List[str]) -> Dict[str, bool]:
-        """Preload multiple voices into cache"""
-        return self.voice_manager.preload_voices(voice_names)
+        """Preload multiple voices into cache along with their common emotion styles"""
+        results = self.voice_manager.preload_voices(voice_names)
+        for voice_name, loaded in results.items():
+            if loaded:
+                self._precompute_emotion_styles(voice_name)
+        return results
+
+    def _precompute_emotion_styles(self, voice_name: str):
+        """Build style tables for the common emotions so they are cache hits"""
+        try:
+            voice_embedding = self.voice_manager.get_voice_embedding(voice_name)
+            voice_data = voice_embedding.embedding_data if voice_embedding else None
+            if isinstance(voice_data, np.ndarray):
+                self.emotion_controller.precompute_styles(
+                    voice_name, voice_data, voice_version=voice_embedding.file_hash
+                )
+        except Exception as e:
+            logger.warning(f"Failed to precompute emotion styles for {voice_name}: {e}")
     
     def get_voice_info(self, voice_name: str) -> Dict[str, Any]:
         """Get detailed information about a voice"""
@@ -754,8 +871,8 @@ class KokoroTTSEngine:
             if not blended_voice:
                 raise RuntimeError("Failed to create blended voice")
 
-            # Tokenize text
-            tokens = self._tokenize_text(text)
+            # Tokenize text straight into the reusable input buffer
+            tokens = self._tokenize_text(text, reuse_buffer=True)
 
             # Prepare inputs for ONNX model using blended voice
             model_inputs = self._prepare_model_inputs(tokens, blended_voice, speed, emotion, emotion_strength)
@@ -792,7 +909,7 @@ class KokoroTTSEngine:
 
     def get_blend_presets(self) -> List[str]:
         """Get available voice blend presets"""
-        return ["warm_friendly", "professional_calm", "energetic_mix"]
+        return self.voice_blender.get_preset_names()
 
     def synthesize_with_preset_blend(self, text: str, preset_name: str,
                                    speed: float = 1.0, emotion: Optional[str] = None,
@@ -924,121 +1041,81 @@ class KokoroTTSEngine:
                                            emotion: Optional[str] = None,
                                            emotion_strength: float = 1.0) -> AudioSegment:
         """
-        Synthesize with pipeline parallelism for maximum performance
-        Overlaps phonemization, inference, and audio processing stages
-        """
-        try:
-            from concurrent.futures import ThreadPoolExecutor
-            import queue
-
-            # Pipeline stages
-            phoneme_queue = queue.Queue(maxsize=2)
-            inference_queue = queue.Queue(maxsize=2)
-
-            def phonemization_stage():
-                """Stage 1: Text to phonemes"""
-                try:
-                    # Apply model optimizations for phonemization
-                    from LiteTTS.performance.model_optimizer import get_model_optimizer
-                    model_optimizer = get_model_optimizer()
-
-                    # Check cache first
-                    cached_phonemes = model_optimizer.optimize_phoneme_processing(text, voice)
-                    if cached_phonemes:
-                        phoneme_queue.put(cached_phonemes)
-                        return
-
-                    # Phonemize text
-                    phonemes = self.phonemizer.phonemize(text)
-
-                    # Cache result
-                    model_optimizer.cache_phoneme_result(text, voice, phonemes)
-
-                    phoneme_queue.put(phonemes)
-
-                except Exception as e:
-                    phoneme_queue.put(e)
-
-            def inference_stage():
-                """Stage 2: Phonemes to mel-spectrogram"""
-                try:
-                    phonemes = phoneme_queue.get(timeout=5.0)
-                    if isinstance(phonemes, Exception):
-                        raise phonemes
-
-                    # Convert to tokens
-                    tokens = self.phonemizer.phonemes_to_tokens(phonemes)
-
-                    # Get voice embedding
-                    voice_embedding = self.voice_manager.get_voice_embedding(voice)
-
-                    # Apply model optimizations
-                    from LiteTTS.performance.model_optimizer import get_model_optimizer
-                    model_optimizer = get_model_optimizer()
-
-                    # Optimize inputs
-                    inputs = model_optimizer.optimize_input_preparation(
-                        tokens, voice_embedding.data, speed
-                    )
-
-                    # Run inference
-                    outputs = self.model.run(None, inputs)
-                    mel_spectrogram = outputs[0]
+        Synthesize through the engine's staged pipeline
 
-                    inference_queue.put(mel_spectrogram)
-
-                except Exception as e:
-                    inference_queue.put(e)
-
-            def audio_processing_stage():
-                """Stage 3: Mel-spectrogram to audio"""
-                try:
-                    mel_spectrogram = inference_queue.get(timeout=10.0)
-                    if isinstance(mel_spectrogram, Exception):
-                        raise mel_spectrogram
-
-                    # Convert to audio
-                    audio_data = self.vocoder.mel_to_audio(mel_spectrogram)
-
-                    # Apply post-processing
-                    if emotion and emotion != "neutral":
-                        audio_data = self._apply_emotion_processing(audio_data, emotion, emotion_strength)
-
-                    return AudioSegment(
-                        audio_data=audio_data,
-                        sample_rate=self.sample_rate,
-                        metadata={
-                            'voice': voice,
-                            'speed': speed,
-                            'emotion': emotion,
-                            'emotion_strength': emotion_strength,
-                            'pipeline_mode': 'parallel'
-                        }
-                    )
-
-                except Exception as e:
-                    raise e
-
-            # Execute pipeline stages in parallel
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                # Start all stages
-                phoneme_future = executor.submit(phonemization_stage)
-                inference_future = executor.submit(inference_stage)
-                audio_future = executor.submit(audio_processing_stage)
-
-                # Wait for completion
-                result = audio_future.result(timeout=15.0)
+        Tokenization, inference and post-processing run on separate worker
+        pools shared by every caller, so concurrent requests overlap across
+        stages instead of each running the three steps back to back.
+        """
+        if not self.model_loaded:
+            raise RuntimeError("TTS engine not properly initialized")
 
-                return result
+        if voice not in self.available_voices:
+            raise ValueError(f"Voice '{voice}' not available. Available voices: {self.available_voices}")
 
+        request = {
+            'text': text, 'voice': voice, 'speed': speed,
+            'emotion': emotion, 'emotion_strength': emotion_strength
+        }
+        try:
+            return self._get_pipeline().run(request)
         except Exception as e:
             logger.error(f"Pipeline parallelism failed, falling back to sequential: {e}")
-            # Fallback to regular synthesis
             return self.synthesize(text, voice, speed, emotion, emotion_strength)
 
+    def _get_pipeline(self) -> StagedPipeline:
+        """Engine-wide staged pipeline, created on first use"""
+        with self._pipeline_lock:
+            if self._pipeline is None:
+                from ..config import config
+                pipeline_config = config.pipeline
+                self._pipeline = StagedPipeline([
+                    PipelineStage("tokenize", self._pipeline_tokenize,
+                                  pipeline_config.nlp_workers, pipeline_config.queue_size),
+                    PipelineStage("inference", self._pipeline_infer,
+                                  pipeline_config.inference_workers, pipeline_config.queue_size),
+                    PipelineStage("postprocess", self._pipeline_postprocess,
+                                  pipeline_config.encode_workers, pipeline_config.queue_size),
+                ], name="engine")
+            return self._pipeline
+
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """Per-stage queue depths and utilization of the staged pipeline"""
+        if self._pipeline is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._pipeline.stats()}
+
+    def _pipeline_tokenize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage 1: voice embedding and tokens"""
+        voice_embedding = self.voice_manager.get_voice_embedding(request['voice'])
+        if not voice_embedding:
+            raise RuntimeError(f"Failed to load voice embedding: {request['voice']}")
+        request['voice_embedding'] = voice_embedding
+        request['tokens'] = self._tokenize_text(request['text'])
+        return request
+
+    def _pipeline_infer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage 2: model inputs and ONNX inference"""
+        model_inputs = self._prepare_model_inputs(
+            request['tokens'], request['voice_embedding'], request['speed'],
+            request['emotion'], request['emotion_strength']
+        )
+        request['audio_data'] = self._run_inference(model_inputs)
+        return request
+
+    def _pipeline_postprocess(self, request: Dict[str, Any]) -> AudioSegment:
+        """Stage 3: post-processing, with the same fast path as _synthesize_core"""
+        if request['emotion'] is None and request['speed'] == 1.0 and len(request['text']) <= 50:
+            return self._post_process_audio_fast(request['audio_data'])
+        return self._post_process_audio(request['audio_data'], request['speed'])
+
     def cleanup(self):
         """Clean up engine resources"""
         logger.info("Cleaning up TTS engine")
+
+        if self._pipeline is not None:
+            self._pipeline.shutdown()
+            self._pipeline = None
         
         if self.onnx_session:
             # ONNX sessions don't need explicit cleanup, but we can clear the reference
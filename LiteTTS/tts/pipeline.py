@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Cross-request staged synthesis pipeline
+
+Each stage has a bounded input queue and its own pool of workers, so
+different requests overlap across stages: while one request is in
+inference the next is being normalized and the previous one encoded. A
+full queue blocks the stage feeding it and ``submit`` waits (then raises
+PipelineFull) when the first queue is full, so overload turns into
+backpressure at the caller instead of unbounded buffering. Background work
+(batch jobs) is admitted through its own semaphore, so it never holds more
+than ``background_slots`` places and interactive submissions keep the rest.
+
+The synthesis pipeline built by ``build_synthesis_pipeline`` has three
+stages:
+
+    nlp        text processing in an NLPProcessPool (pure-Python regex work
+               that would otherwise hold the GIL while ONNX Runtime waits)
+    inference  ``backend.create`` on worker threads (ONNX Runtime releases the GIL)
+    encode     validation and ``encode_audio`` on their own threads
+
+``stats()`` exports per-stage queue depths, busy workers and utilization
+(busy worker-seconds over available worker-seconds) for sizing each pool:
+a stage near 100% with a deep queue is the bottleneck, a stage with a high
+blocked time is waiting on the stage after it.
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import contextvars
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from ..nlp.frontend_pool import FrontEndProcessor, NLPProcessPool
+
+logger = logging.getLogger(__name__)
+
+class PipelineFull(RuntimeError):
+    """The first stage's queue stayed full for the whole submit timeout"""
+
+class PipelineClosed(RuntimeError):
+    """The pipeline was shut down"""
+
+_STOP = object()
+
+class _Job:
+    __slots__ = ("item", "future", "context", "enqueued")
+
+    def __init__(self, item: Any, future: Future, context: contextvars.Context):
+        self.item = item
+        self.future = future
+        self.context = context
+        self.enqueued = 0.0
+
+class PipelineStage:
+    """
+    One stage: a bounded queue drained by a fixed number of worker threads
+
+    ``func`` takes the item from the previous stage and returns the item for
+    the next one. To run work in another process, have ``func`` submit to an
+    executor and wait; the waiting thread does not hold the GIL.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1, queue_size: int = 8):
+        if workers < 1 or queue_size < 1:
+            raise ValueError(f"Stage {name} needs at least one worker and a queue size of at least 1")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.downstream: Optional["PipelineStage"] = None
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._busy = 0
+        self._max_depth = 0
+        self._processed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._busy_seconds = 0.0
+        self._blocked_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    def start(self, first: bool = False):
+        self._started_at = time.perf_counter()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, args=(first,), daemon=True,
+                                      name=f"pipeline-{self.name}-{index}")
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, job: _Job, timeout: Optional[float] = None):
+        """Queue a job, waiting up to timeout for room (None waits indefinitely)"""
+        job.enqueued = time.perf_counter()
+        self.queue.put(job, block=timeout is None or timeout > 0, timeout=timeout or None)
+        depth = self.queue.qsize()
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+    def _run(self, first: bool):
+        while True:
+            job = self.queue.get()
+            if job is _STOP:
+                return
+
+            started = time.perf_counter()
+            with self._lock:
+                self._wait_seconds += started - job.enqueued
+            # The first stage owns the pending -> running transition; a job
+            # cancelled while queued is dropped here
+            if first and not job.future.set_running_or_notify_cancel():
+                with self._lock:
+                    self._cancelled += 1
+                continue
+
+            with self._lock:
+                self._busy += 1
+            ok = False
+            try:
+                job.item = job.context.run(self.func, job.item)
+                ok = True
+            except Exception as e:
+                job.future.set_exception(e)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._busy -= 1
+                    self._busy_seconds += finished - started
+                    if ok:
+                        self._processed += 1
+                    else:
+                        self._failed += 1
+
+            if not ok:
+                continue
+            if self.downstream is None:
+                job.future.set_result(job.item)
+                continue
+            self.downstream.put(job)
+            with self._lock:
+                self._blocked_seconds += time.perf_counter() - finished
+
+    def stop(self, timeout: Optional[float] = None):
+        """Let the workers finish what is queued, then stop them"""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+            finished = self._processed + self._failed
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queue_depth": self.queue.qsize(),
+                "max_queue_depth": self._max_depth,
+                "busy_workers": self._busy,
+                "processed": self._processed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "utilization": self._busy_seconds / (elapsed * self.workers) if elapsed > 0 else 0.0,
+                "busy_seconds": self._busy_seconds,
+                "blocked_seconds": self._blocked_seconds,
+                "avg_queue_wait_ms": self._wait_seconds / (finished + self._cancelled) * 1000
+                                     if finished + self._cancelled else 0.0,
+                "avg_service_ms": self._busy_seconds / finished * 1000 if finished else 0.0,
+            }
+
+class StagedPipeline:
+    """
+    Chain of stages shared by all requests
+
+    ``submit`` returns a ``concurrent.futures.Future`` for the last stage's
+    output (``asyncio.wrap_future`` it from a coroutine). Stage functions
+    run in a copy of the submitter's context, so tracing spans opened in a
+    stage nest under the request's span.
+
+    Args:
+        background_slots: Jobs submitted with ``background=True`` that may be
+            in the pipeline at once (default: half the first queue)
+    """
+
+    def __init__(self, stages: Sequence[PipelineStage], name: str = "pipeline",
+                 on_shutdown: Optional[Callable[[], None]] = None, background_slots: int = 0):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.name = name
+        self.stages = list(stages)
+        self.background_slots = background_slots or max(1, self.stages[0].queue_size // 2)
+        self._background = threading.BoundedSemaphore(self.background_slots)
+        self._on_shutdown = on_shutdown
+        self._lock = threading.Lock()
+        self._closed = False
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+        self._started_at = time.time()
+
+        for stage, downstream in zip(self.stages, self.stages[1:]):
+            stage.downstream = downstream
+        for index, stage in enumerate(self.stages):
+            stage.start(first=index == 0)
+
+    def submit(self, item: Any, timeout: Optional[float] = None, background: bool = False) -> Future:
+        """
+        Queue item for the first stage
+
+        Args:
+            timeout: Seconds to wait for room in the first queue; None waits
+                indefinitely, 0 raises PipelineFull at once when it is full
+            background: Wait for a background slot first (indefinitely), so
+                low-priority work cannot fill the queue interactive requests use
+        """
+        if self._closed:
+            raise PipelineClosed(f"Pipeline {self.name} is shut down")
+        if background:
+            self._background.acquire()
+        future: Future = Future()
+        job = _Job(item, future, contextvars.copy_context())
+        try:
+            self.stages[0].put(job, timeout)
+        except queue.Full:
+            if background:
+                self._background.release()
+            with self._lock:
+                self._rejected += 1
+            raise PipelineFull(f"Pipeline {self.name} is full ({self.stages[0].queue_size} queued)") from None
+        with self._lock:
+            self._submitted += 1
+        future.add_done_callback(self._on_done)
+        if background:
+            future.add_done_callback(lambda _: self._background.release())
+        return future
+
+    def run(self, item: Any, timeout: Optional[float] = None, background: bool = False) -> Any:
+        """Submit item and wait for its result"""
+        return self.submit(item, background=background).result(timeout)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self._completed + self._failed
+            summary = {
+                "name": self.name,
+                "uptime_seconds": time.time() - self._started_at,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "completed": self._completed,
+                "failed": self._failed,
+                "in_flight": self._submitted - finished,
+            }
+        summary["stages"] = {stage.name: stage.stats() for stage in self.stages}
+        return summary
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Stop accepting work, drain every stage in order and release resources"""
+        if self._closed:
+            return
+        self._closed = True
+        for stage in self.stages:
+            stage.stop(timeout)
+        if self._on_shutdown is not None:
+            self._on_shutdown()
+
+    def __enter__(self) -> "StagedPipeline":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+# Synthesis pipeline
+
+@dataclass
+class SynthesisJob:
+    """A request travelling through the synthesis pipeline; each stage fills in its fields"""
+    text: str
+    voice: str
+    backend: Any  # SynthesisBackend
+    speed: float = 1.0
+    lang: str = "en-us"
+    response_format: Optional[str] = "mp3"  # None stops at validated samples, without encoding
+    processed_text: Optional[str] = None
+    audio: Optional[np.ndarray] = None
+    sample_rate: Optional[int] = None
+    audio_data: Optional[bytes] = None
+    generation_time: float = 0.0  # Seconds in backend.create
+
+def _inference(job: SynthesisJob) -> SynthesisJob:
+    from ..metrics.tracing import trace_span
+
+    started = time.perf_counter()
+    with trace_span("synthesis", backend=getattr(job.backend, "name", "unknown"), voice=job.voice, pipeline=True):
+        audio, sample_rate = job.backend.create(job.processed_text or job.text, voice=job.voice,
+                                                speed=job.speed, lang=job.lang)
+    job.generation_time = time.perf_counter() - started
+    if audio is None or len(audio) == 0:
+        raise ValueError("Backend generated empty audio")
+    job.audio, job.sample_rate = audio, sample_rate
+    return job
+
+def _encode(job: SynthesisJob) -> SynthesisJob:
+    from ..audio.format_converter import encode_audio
+    from ..metrics.tracing import trace_span
+
+    audio = np.asarray(job.audio)
+    if not np.isfinite(audio).all():
+        raise ValueError("Generated audio contains invalid values (NaN or Inf)")
+    job.audio = audio.astype(np.float32, copy=False).reshape(-1)
+    if job.response_format is None:
+        return job
+    with trace_span("encode", format=job.response_format, pipeline=True):
+        job.audio_data = encode_audio(job.audio, job.sample_rate, job.response_format)
+    return job
+
+def build_synthesis_pipeline(pipeline_config: Any, processing_options: Any = None,
+                             nlp_pool: Optional[NLPProcessPool] = None) -> StagedPipeline:
+    """
+    NLP -> inference -> encode pipeline sized by a PipelineConfig
+
+    Args:
+        pipeline_config: PipelineConfig (or any object with the same fields)
+        processing_options: UnifiedTextProcessor options, None for preprocessing only
+        nlp_pool: Shared NLP process pool to normalize in; without one, process
+            mode starts a pool of nlp_workers owned by the pipeline
+    """
+    workers = pipeline_config.nlp_workers
+    on_shutdown = None
+    if nlp_pool is None and pipeline_config.nlp_executor == "process":
+        nlp_pool = NLPProcessPool(workers, processing_options)
+        nlp_pool.warm()
+        on_shutdown = nlp_pool.shutdown
+
+    if nlp_pool is not None:
+        def normalize(text: str) -> str:
+            return nlp_pool.process(text).text
+    else:
+        local = threading.local()
+
+        def normalize(text: str) -> str:
+            processor = getattr(local, "processor", None)
+            if processor is None:
+                processor = local.processor = FrontEndProcessor(processing_options)
+            return processor(text)
+
+    def nlp(job: SynthesisJob) -> SynthesisJob:
+        job.processed_text = normalize(job.text)
+        return job
+
+    queue_size = pipeline_config.queue_size
+    return StagedPipeline([
+        PipelineStage("nlp", nlp, workers, queue_size),
+        PipelineStage("inference", _inference, pipeline_config.inference_workers, queue_size),
+        PipelineStage("encode", _encode, pipeline_config.encode_workers, queue_size),
+    ], name="synthesis", on_shutdown=on_shutdown)
@@ -3,12 +3,13 @@
 Main TTS synthesizer that orchestrates all TTS components
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterator
 import logging
 import time
 
+import numpy as np
+
 from .engine import KokoroTTSEngine
-from .emotion_controller import EmotionController
 from .chunk_processor import ChunkProcessor
 from ..models import AudioSegment, TTSConfiguration, TTSRequest
 from ..nlp.processor import NLPProcessor
@@ -27,7 +28,8 @@ class TTSSynthesizer:
         
         # Initialize components
         self.engine = KokoroTTSEngine(config)
-        self.emotion_controller = EmotionController()
+        # Share the engine's controller so custom emotions and the style cache stay in sync
+        self.emotion_controller = self.engine.emotion_controller
         self.chunk_processor = ChunkProcessor(
             max_chunk_length=config.chunk_size,
             overlap_length=20
@@ -157,6 +159,51 @@ class TTSSynthesizer:
             # Return disabled time-stretcher as fallback
             return TimeStretcher(TimeStretchConfig(enabled=False))
     
+    def _process_text(self, plain_text: str, request: TTSRequest) -> str:
+        """Advanced text processing with the basic NLP processor as fallback"""
+        # Use UnifiedTextProcessor for advanced text processing
+        # This handles TSLA→T-S-L-A, $5,678.89→currency words, ~$568.91→symbol words, custom phonetics
+        try:
+            processing_result = self.unified_processor.process_text(plain_text, self.processing_options)
+            processed_text = processing_result.processed_text
+
+            # Log processing details for debugging
+            if processing_result.changes_made:
+                logger.info(f"Advanced text processing applied: {', '.join(processing_result.changes_made[:3])}")
+            if processing_result.currency_enhancements > 0:
+                logger.debug(f"Currency processing: {processing_result.currency_enhancements} enhancements")
+            if processing_result.datetime_enhancements > 0:
+                logger.debug(f"DateTime processing: {processing_result.datetime_enhancements} enhancements")
+
+        except Exception as e:
+            logger.warning(f"Advanced text processing failed, falling back to basic: {e}")
+            # Fallback to basic NLP processor
+            processed_text = self.nlp_processor.process_text(
+                plain_text,
+                request.normalization_options
+            )
+
+        return processed_text
+
+    def _resolve_emotion(self, request: TTSRequest):
+        """Emotion and strength for a request, dropping unsupported emotions"""
+        # Emotion is applied by the engine to a cached copy of the style
+        # table; the shared voice embedding must never be modified here
+        emotion = getattr(request, 'emotion', None)
+        emotion_strength = getattr(request, 'emotion_strength', 1.0)
+        
+        if emotion and emotion not in self.emotion_controller.get_supported_emotions():
+            logger.warning(f"Unsupported emotion '{emotion}', synthesizing without it")
+            emotion = None
+        return emotion, emotion_strength
+
+    def _resolve_time_stretcher(self, request: TTSRequest, text_length: int) -> Optional[TimeStretcher]:
+        """Time-stretcher for a request, or None if time-stretching does not apply"""
+        return self.time_stretcher.for_request(
+            request.time_stretching_enabled, request.time_stretching_rate,
+            request.time_stretching_quality, text_length
+        )
+    
     def synthesize(self, request: TTSRequest, 
                   progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> AudioSegment:
         """Main synthesis method"""
@@ -173,27 +220,7 @@ class TTSSynthesizer:
             if progress_callback:
                 progress_callback({'stage': 'preprocessing', 'progress': 0.1})
 
-            # Use UnifiedTextProcessor for advanced text processing
-            # This handles TSLA→T-S-L-A, $5,678.89→currency words, ~$568.91→symbol words, custom phonetics
-            try:
-                processing_result = self.unified_processor.process_text(plain_text, self.processing_options)
-                processed_text = processing_result.processed_text
-
-                # Log processing details for debugging
-                if processing_result.changes_made:
-                    logger.info(f"Advanced text processing applied: {', '.join(processing_result.changes_made[:3])}")
-                if processing_result.currency_enhancements > 0:
-                    logger.debug(f"Currency processing: {processing_result.currency_enhancements} enhancements")
-                if processing_result.datetime_enhancements > 0:
-                    logger.debug(f"DateTime processing: {processing_result.datetime_enhancements} enhancements")
-
-            except Exception as e:
-                logger.warning(f"Advanced text processing failed, falling back to basic: {e}")
-                # Fallback to basic NLP processor
-                processed_text = self.nlp_processor.process_text(
-                    plain_text,
-                    request.normalization_options
-                )
+            processed_text = self._process_text(plain_text, request)
             
             # Step 2: Text chunking (if needed)
             if progress_callback:
@@ -209,50 +236,18 @@ class TTSSynthesizer:
             if not voice_embedding:
                 raise RuntimeError(f"Failed to load voice: {request.voice}")
             
-            # Apply emotion if specified
-            emotion = getattr(request, 'emotion', None)
-            emotion_strength = getattr(request, 'emotion_strength', 1.0)
-            
-            if emotion and emotion in self.emotion_controller.get_supported_emotions():
-                voice_embedding.embedding_data = self.emotion_controller.apply_emotion(
-                    voice_embedding.embedding_data, emotion, emotion_strength
-                )
+            emotion, emotion_strength = self._resolve_emotion(request)
             
             # Step 4: Synthesis (with optional time-stretching optimization)
             if progress_callback:
                 progress_callback({'stage': 'synthesis', 'progress': 0.4})
 
-            # Check if time-stretching should be applied (API parameters override config)
-            use_time_stretching = False
-            if request.time_stretching_enabled is not None:
-                # API parameter overrides config
-                use_time_stretching = request.time_stretching_enabled
-            else:
-                # Use config-based decision
-                use_time_stretching = self.time_stretcher.should_apply_stretching(len(processed_text))
-
+            active_time_stretcher = self._resolve_time_stretcher(request, len(processed_text))
+            use_time_stretching = active_time_stretcher is not None
             synthesis_speed = request.speed
             generation_start_time = None
 
             if use_time_stretching:
-                # Create temporary time-stretcher with API parameters if provided
-                active_time_stretcher = self.time_stretcher
-                if request.time_stretching_rate is not None or request.time_stretching_quality is not None:
-                    # Create temporary config with API overrides
-                    from ..audio.time_stretcher import TimeStretchConfig, StretchQuality
-                    temp_config = TimeStretchConfig(
-                        enabled=True,
-                        compress_playback_rate=request.time_stretching_rate or self.time_stretcher.config.compress_playback_rate,
-                        correction_quality=StretchQuality(request.time_stretching_quality) if request.time_stretching_quality else self.time_stretcher.config.correction_quality,
-                        max_rate=self.time_stretcher.config.max_rate,
-                        min_rate=self.time_stretcher.config.min_rate,
-                        auto_enable_threshold=self.time_stretcher.config.auto_enable_threshold,
-                        quality_fallback=self.time_stretcher.config.quality_fallback,
-                        benchmark_mode=self.time_stretcher.config.benchmark_mode
-                    )
-                    from ..audio.time_stretcher import TimeStretcher
-                    active_time_stretcher = TimeStretcher(temp_config)
-
                 # Generate at faster speed for time-stretching optimization
                 generation_speed_multiplier = active_time_stretcher.get_generation_speed_multiplier()
                 synthesis_speed = request.speed * generation_speed_multiplier
@@ -300,13 +295,13 @@ class TTSSynthesizer:
             if progress_callback:
                 progress_callback({'stage': 'post_processing', 'progress': 0.8})
 
-            # Apply volume adjustment
-            if request.volume_multiplier != 1.0:
-                audio_segment = audio_segment.adjust_volume(request.volume_multiplier)
-
-            # Optimize for streaming if needed
+            # Volume adjustment and streaming optimization share one fused pass
             if request.stream:
-                audio_segment = self.audio_processor.optimize_for_streaming(audio_segment)
+                audio_segment = self.audio_processor.optimize_for_streaming(
+                    audio_segment, volume_multiplier=request.volume_multiplier
+                )
+            elif request.volume_multiplier != 1.0:
+                audio_segment = audio_segment.adjust_volume(request.volume_multiplier)
             
             # Step 6: Format conversion
             if progress_callback:
@@ -328,6 +323,85 @@ class TTSSynthesizer:
                 progress_callback({'stage': 'error', 'progress': 0.0, 'error': str(e)})
             raise
     
+    def synthesize_stream(self, request: TTSRequest) -> Iterator[AudioSegment]:
+        """
+        Synthesize chunk by chunk, yielding audio as soon as each chunk is ready
+
+        Time-stretching runs incrementally on the chunk stream, so the
+        compress-then-stretch optimization no longer waits for the whole
+        utterance. Only per-sample post-processing (volume, compression,
+        clipping) is applied; SSML background mixing needs the full audio
+        and is not supported here.
+        """
+        logger.info(f"Starting streaming synthesis: '{request.input[:50]}...' with voice '{request.voice}'")
+
+        plain_text, background_config, _ = self.ssml_processor.process_ssml(request.input)
+        if background_config:
+            logger.warning("SSML background audio is not supported for streaming synthesis, ignoring it")
+
+        processed_text = self._process_text(plain_text, request)
+        chunks = self.chunk_processor.chunk_text(processed_text)
+
+        if not self.engine.load_voice(request.voice):
+            raise RuntimeError(f"Failed to load voice: {request.voice}")
+        emotion, emotion_strength = self._resolve_emotion(request)
+
+        active_time_stretcher = self._resolve_time_stretcher(request, len(processed_text))
+        synthesis_speed = request.speed
+        stream = None
+        if active_time_stretcher is not None:
+            generation_speed_multiplier = active_time_stretcher.get_generation_speed_multiplier()
+            synthesis_speed = request.speed * generation_speed_multiplier
+            stream = active_time_stretcher.create_stream(generation_speed_multiplier, self.config.sample_rate)
+
+        generation_time = 0.0
+        produced = False
+        for index, chunk in enumerate(chunks):
+            try:
+                start_time = time.perf_counter()
+                chunk_audio = self.engine.synthesize(chunk.text, request.voice, synthesis_speed,
+                                                     emotion, emotion_strength)
+                generation_time += time.perf_counter() - start_time
+            except Exception as e:
+                logger.error(f"Failed to process chunk {chunk.chunk_index}: {e}")
+                continue
+
+            audio_data = chunk_audio.audio_data
+            if stream is not None:
+                audio_data = stream.process(audio_data)
+                # Pauses and the end of the text are natural places to drain
+                # the stretcher's look-ahead
+                if chunk.pause_after > 0.0 or index == len(chunks) - 1:
+                    audio_data = np.concatenate([audio_data, stream.flush()])
+
+            if len(audio_data) > 0:
+                produced = True
+                yield self.audio_processor.optimize_chunk_for_streaming(
+                    self.audio_processor.create_audio_segment(
+                        audio_data, chunk_audio.sample_rate, request.response_format
+                    ),
+                    volume_multiplier=request.volume_multiplier
+                )
+
+            if chunk.pause_after > 0.0:
+                yield self.audio_processor.create_audio_segment(
+                    np.zeros(int(chunk.pause_after * chunk_audio.sample_rate), dtype=np.float32),
+                    chunk_audio.sample_rate, request.response_format
+                )
+
+        if stream is not None:
+            tail = stream.flush()
+            if len(tail) > 0:
+                produced = True
+                yield self.audio_processor.create_audio_segment(
+                    tail, self.config.sample_rate, request.response_format
+                )
+            metrics = active_time_stretcher.record_stream_metrics(stream, generation_time)
+            logger.debug(f"Streaming time-stretching metrics: RTF {metrics.rtf_original:.3f} → {metrics.rtf_stretched:.3f}")
+
+        if not produced:
+            raise RuntimeError("No audio segments were successfully generated")
+    
     def synthesize_simple(self, text: str, voice: str = None, 
                          speed: float = 1.0, emotion: str = None) -> AudioSegment:
         """Simple synthesis method with minimal parameters"""
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Vectorized character tokenizer for the Kokoro ONNX engine
+Maps text to token ids through a code point lookup table
+"""
+
+import threading
+from typing import Dict, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class CodepointTokenizer:
+    """
+    Character tokenizer backed by a dense lookup table indexed by code point
+
+    Encoding is a single UTF-32 encode plus one ``np.take`` over the table, so
+    per-call Python overhead does not grow with text length. Code points
+    outside the table clip onto a trailing slot holding the unknown id.
+    """
+
+    def __init__(self, char_to_id: Dict[str, int], unk_token_id: int = 0,
+                 initial_capacity: int = 512):
+        self.unk_token_id = unk_token_id
+
+        single_chars = {c: i for c, i in char_to_id.items() if len(c) == 1}
+        max_codepoint = max((ord(c) for c in single_chars), default=0)
+
+        # Last slot is the clip target for any code point above the table
+        self.lookup_table = np.full(max_codepoint + 2, unk_token_id, dtype=np.int64)
+        for char, token_id in single_chars.items():
+            self.lookup_table[ord(char)] = token_id
+
+        self.initial_capacity = initial_capacity
+        self._local = threading.local()
+
+    def encode(self, text: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode text to int64 token ids
+
+        Args:
+            text: Text to encode
+            out: Optional int64 array of exactly len(text) elements to write into
+
+        Returns:
+            1-D int64 array of token ids (``out`` when provided)
+        """
+        # surrogatepass keeps one code point per character for lone surrogates
+        # (e.g. from a bad JSON escape), which then map to the unknown id
+        codepoints = np.frombuffer(text.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+        return np.take(self.lookup_table, codepoints, mode='clip', out=out)
+
+    def input_ids_buffer(self, length: int) -> np.ndarray:
+        """
+        Return a reusable (1, length) int64 view for this thread
+
+        The backing buffer grows geometrically and is reused by later calls on
+        the same thread, so callers must not keep the view past one inference.
+        """
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None or buffer.shape[1] < length:
+            capacity = max(self.initial_capacity, 1)
+            while capacity < length:
+                capacity *= 2
+            buffer = np.empty((1, capacity), dtype=np.int64)
+            self._local.buffer = buffer
+        return buffer[:, :length]
+
+    def encode_to_input_ids(self, text: str) -> np.ndarray:
+        """Encode text straight into this thread's reusable (1, n) input buffer"""
+        input_ids = self.input_ids_buffer(len(text))
+        self.encode(text, out=input_ids[0])
+        return input_ids
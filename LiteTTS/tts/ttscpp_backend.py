@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+In-process TTS.cpp backend
+
+Loads the ``tts_c`` shared library built from ``LiteTTS/backends/TTS.cpp``
+(configure with ``-DTTS_BUILD_C_API=ON``) through ctypes and runs Kokoro GGUF
+models, including quantized ones produced by ``py-gguf/convert_kokoro_to_gguf``
+and the TTS.cpp quantize tool, on ggml's CPU kernels.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from ..metrics.tracing import trace_span
+from .backend import BackendCapabilities, SynthesisBackend
+
+logger = logging.getLogger(__name__)
+
+TTSCPP_DIR = Path(__file__).resolve().parent.parent / "backends" / "TTS.cpp"
+LIBRARY_ENV_VAR = "LITETTS_TTSCPP_LIBRARY"
+SUPPORTED_API_VERSION = 1
+
+_LIBRARY_NAMES = ["libtts_c.so", "libtts_c.dylib", "tts_c.dll"]
+_LIBRARY_SEARCH_DIRS = [
+    TTSCPP_DIR / "build" / "src",
+    TTSCPP_DIR / "build" / "bin",
+    TTSCPP_DIR / "build" / "lib",
+]
+
+def find_library(library_path: Optional[str] = None) -> Optional[str]:
+    """Locate the tts_c shared library
+
+    Order: explicit path, ``LITETTS_TTSCPP_LIBRARY``, the in-tree CMake build
+    directories, then the system loader path.
+    """
+    for candidate in (library_path, os.environ.get(LIBRARY_ENV_VAR)):
+        if candidate:
+            return candidate if Path(candidate).exists() else None
+
+    for directory in _LIBRARY_SEARCH_DIRS:
+        for name in _LIBRARY_NAMES:
+            if (directory / name).exists():
+                return str(directory / name)
+
+    return ctypes.util.find_library("tts_c")
+
+class TTSCppLibrary:
+    """ctypes binding for the TTS.cpp C API (include/tts_c_api.h)"""
+
+    def __init__(self, library_path: Optional[str] = None):
+        path = find_library(library_path)
+        if not path:
+            raise RuntimeError(
+                "TTS.cpp library not found. Build it with "
+                "`cmake -B build -DTTS_BUILD_C_API=ON && cmake --build build --target tts_c` "
+                f"in {TTSCPP_DIR} or set {LIBRARY_ENV_VAR}"
+            )
+
+        self.path = path
+        lib = ctypes.CDLL(path)
+
+        lib.tts_c_api_version.argtypes = []
+        lib.tts_c_api_version.restype = ctypes.c_int
+        lib.tts_c_load.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        lib.tts_c_load.restype = ctypes.c_void_p
+        lib.tts_c_generate.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+                                       ctypes.POINTER(ctypes.POINTER(ctypes.c_float)),
+                                       ctypes.POINTER(ctypes.c_size_t)]
+        lib.tts_c_generate.restype = ctypes.c_int
+        lib.tts_c_sample_rate.argtypes = [ctypes.c_void_p]
+        lib.tts_c_sample_rate.restype = ctypes.c_float
+        lib.tts_c_list_voices.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
+        lib.tts_c_list_voices.restype = ctypes.c_int
+        lib.tts_c_free.argtypes = [ctypes.c_void_p]
+        lib.tts_c_free.restype = None
+        lib.tts_c_last_error.argtypes = []
+        lib.tts_c_last_error.restype = ctypes.c_char_p
+
+        version = lib.tts_c_api_version()
+        if version != SUPPORTED_API_VERSION:
+            raise RuntimeError(f"TTS.cpp C API version {version} is not supported "
+                               f"(expected {SUPPORTED_API_VERSION}): {path}")
+        self.lib = lib
+
+    def last_error(self) -> str:
+        message = self.lib.tts_c_last_error()
+        return message.decode("utf-8", "replace") if message else ""
+
+class TTSCppBackend(SynthesisBackend):
+    """Kokoro synthesis on TTS.cpp/ggml
+
+    A runner is not thread safe, so generation is serialized per backend;
+    scale out with workers rather than threads. Speed control is not
+    available in TTS.cpp's Kokoro runner, so speed changes are routed to
+    another backend by ``BackendRouter``.
+    """
+
+    name = "ttscpp"
+    capabilities = BackendCapabilities(speed_control=False, quantized_weights=True, thread_safe=False)
+
+    def __init__(self, model_path: str, library_path: Optional[str] = None, n_threads: int = 0,
+                 default_voice: str = "af_heart", espeak_voice_id: Optional[str] = None,
+                 cpu_only: bool = True):
+        # The native loader aborts the process on unreadable files, check first
+        if not model_path or not Path(model_path).is_file():
+            raise FileNotFoundError(f"GGUF model not found: {model_path}")
+
+        self.library = TTSCppLibrary(library_path)
+        self.model_path = str(model_path)
+        self.default_voice = default_voice
+        self.n_threads = n_threads or os.cpu_count() or 1
+        self._lock = threading.Lock()
+
+        handle = self.library.lib.tts_c_load(
+            self.model_path.encode("utf-8"), self.n_threads,
+            default_voice.encode("utf-8"), (espeak_voice_id or "").encode("utf-8"), int(cpu_only)
+        )
+        if not handle:
+            raise RuntimeError(f"TTS.cpp failed to load {model_path}: {self.library.last_error()}")
+        self._handle = ctypes.c_void_p(handle)
+        self._sample_rate = int(round(self.library.lib.tts_c_sample_rate(self._handle)))
+
+        logger.info(f"TTS.cpp backend loaded {Path(model_path).name} "
+                    f"({self._sample_rate} Hz, {self.n_threads} threads) from {self.library.path}")
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def get_voices(self) -> List[str]:
+        lib = self.library.lib
+        with self._lock:
+            needed = lib.tts_c_list_voices(self._handle, None, 0)
+            if needed < 0:
+                return []
+            buffer = ctypes.create_string_buffer(needed + 1)
+            lib.tts_c_list_voices(self._handle, buffer, len(buffer))
+        return [voice for voice in buffer.value.decode("utf-8").split("\n") if voice]
+
+    def create(self, text: str, voice: str, speed: float = 1.0,
+               lang: str = "en-us") -> Tuple[np.ndarray, int]:
+        if speed != 1.0:
+            raise ValueError("TTS.cpp backend does not support speed control")
+        if self._handle is None:
+            raise RuntimeError("TTS.cpp backend is closed")
+
+        samples = ctypes.POINTER(ctypes.c_float)()
+        n_samples = ctypes.c_size_t(0)
+        with self._lock, trace_span("inference", backend=self.name, text_length=len(text)):
+            status = self.library.lib.tts_c_generate(
+                self._handle, text.encode("utf-8"), (voice or self.default_voice).encode("utf-8"),
+                ctypes.byref(samples), ctypes.byref(n_samples)
+            )
+            if status != 0:
+                raise RuntimeError(f"TTS.cpp generation failed: {self.library.last_error()}")
+            # The runner reuses its output buffer on the next call, copy while locked
+            if n_samples.value:
+                audio = np.ctypeslib.as_array(samples, shape=(n_samples.value,)).copy()
+            else:
+                audio = np.zeros(0, dtype=np.float32)
+
+        return audio, self._sample_rate
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                self.library.lib.tts_c_free(self._handle)
+                self._handle = None
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Process pools for CPU-bound work inside the server
+
+Workers are forked where the platform allows it: spawned workers would
+re-import the server's main module, which builds the application and
+loads the model. A forked worker also inherits the parent's logging, so
+every pool runs init_worker_process first.
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+def worker_context() -> BaseContext:
+    """Multiprocessing context for server worker pools: fork, or spawn where fork is unavailable"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+def init_worker_process() -> None:
+    """Per-worker setup every pool runs before its own initializer"""
+    from ..logging_config import reset_logging_in_worker
+
+    reset_logging_in_worker()
@@ -11,6 +11,8 @@ from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 import logging
 
+from .metrics.tracing import trace_span
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -319,6 +321,16 @@ class InputValidator:
         else:
             # Default to 1.0 if field is missing or null (OpenWebUI compatibility)
             sanitized_request["speed"] = 1.0
+
+        # Optional synthesis backend override; availability is checked by the server
+        backend = request_data.get("backend")
+        if backend is not None:
+            if not isinstance(backend, str) or not re.fullmatch(r"[a-z0-9_\-]{1,32}", backend.strip().lower()):
+                return ValidationResult(
+                    is_valid=False,
+                    error_message=f"Invalid backend: {backend!r}"
+                )
+            sanitized_request["backend"] = backend.strip().lower()
         
         return ValidationResult(
             is_valid=True,
@@ -405,7 +417,10 @@ def validate_request(request_data: Dict[str, Any], available_voices: List[str])
     Convenience function for request validation
     Returns: (is_valid, sanitized_data_or_error_message, warnings)
     """
-    result = InputValidator.validate_tts_request(request_data, available_voices)
+    with trace_span("admission.validate") as span:
+        result = InputValidator.validate_tts_request(request_data, available_voices)
+        if span is not None:
+            span.set_attribute("valid", result.is_valid)
 
     if result.is_valid:
         return True, result.sanitized_value, result.warnings or []
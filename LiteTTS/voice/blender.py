@@ -5,8 +5,12 @@ Allows blending multiple voices with customizable weights
 """
 
 import numpy as np
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Optional, Union
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 import sys
 import os
@@ -60,11 +64,62 @@ class BlendConfig:
     smoothing_factor: float = 0.1  # For style mixing
 
 class VoiceBlender:
-    """Voice blending system for creating custom voice combinations"""
+    """Voice blending system for creating custom voice combinations
+
+    Blends are cached under a canonical key (voices merged and ordered by
+    weight, weights rounded to ``weight_resolution``, method, smoothing), so
+    equivalent requests share one embedding. With ``pack_dir`` set, blends are
+    also persisted as ``.npy`` voice packs and memory-mapped on load.
+    """
     
-    def __init__(self, voice_manager):
+    def __init__(self, voice_manager, cache_size: int = 32, weight_resolution: float = 0.01,
+                 pack_dir: Optional[Union[str, Path]] = None):
         self.voice_manager = voice_manager
         self.supported_methods = ["weighted_average", "interpolation", "style_mixing"]
+
+        self.cache_size = cache_size
+        self.weight_resolution = weight_resolution
+        self.pack_dir = Path(pack_dir) if pack_dir else None
+        if self.pack_dir:
+            self.pack_dir.mkdir(parents=True, exist_ok=True)
+
+        # canonical key -> (component signature, blended embedding)
+        self._blend_cache: "OrderedDict[Tuple, Tuple[Tuple, VoiceEmbedding]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {'hits': 0, 'misses': 0, 'pack_loads': 0}
+
+    def canonical_blend_key(self, blend_config: BlendConfig) -> Optional[Tuple]:
+        """
+        Canonical, hashable form of a blend configuration
+
+        Duplicate voices are merged, weights are normalized (if requested) and
+        rounded to the weight resolution, and voices are ordered by descending
+        weight then name, so the dominant voice stays the energy reference.
+        Returns None if no voice keeps a non-zero weight.
+        """
+        merged: Dict[str, float] = {}
+        for voice_name, weight in blend_config.voices:
+            merged[voice_name] = merged.get(voice_name, 0.0) + float(weight)
+
+        total_weight = sum(merged.values())
+        if blend_config.normalize_weights:
+            if total_weight <= 0:
+                return None
+            merged = {name: weight / total_weight for name, weight in merged.items()}
+
+        decimals = max(0, int(round(-np.log10(self.weight_resolution))))
+        voices = []
+        for name, weight in merged.items():
+            weight = round(round(weight / self.weight_resolution) * self.weight_resolution, decimals)
+            if weight > 0:
+                voices.append((name, weight))
+        if not voices:
+            return None
+        voices.sort(key=lambda item: (-item[1], item[0]))
+
+        smoothing = round(blend_config.smoothing_factor, 3) if blend_config.blend_method == "style_mixing" else None
+        return (tuple(voices), blend_config.blend_method, smoothing,
+                blend_config.normalize_weights, blend_config.preserve_energy)
         
     def blend_voices(self, blend_config: BlendConfig) -> Optional[VoiceEmbedding]:
         """
@@ -74,76 +129,198 @@ class VoiceBlender:
             blend_config: Configuration specifying voices and blending parameters
             
         Returns:
-            VoiceEmbedding with blended voice data
+            VoiceEmbedding with blended voice data (shared and read-only when cached)
         """
         if not blend_config.voices:
             logger.error("No voices specified for blending")
             return None
             
-        if len(blend_config.voices) < 2:
-            logger.warning("Only one voice specified, returning original voice")
-            voice_name = blend_config.voices[0][0]
-            return self.voice_manager.get_voice_embedding(voice_name)
-            
         if blend_config.blend_method not in self.supported_methods:
             logger.error(f"Unsupported blend method: {blend_config.blend_method}")
             return None
+
+        key = self.canonical_blend_key(blend_config)
+        if key is None:
+            logger.error("All weights are zero")
+            return None
+
+        voices = key[0]
+        if len(voices) < 2:
+            logger.warning("Only one voice specified, returning original voice")
+            return self.voice_manager.get_voice_embedding(voices[0][0])
             
         # Load all voice embeddings
         voice_embeddings = []
-        weights = []
-        
-        for voice_name, weight in blend_config.voices:
+        for voice_name, _ in voices:
             embedding = self.voice_manager.get_voice_embedding(voice_name)
             if embedding is None:
                 logger.error(f"Failed to load voice: {voice_name}")
                 return None
             voice_embeddings.append(embedding)
-            weights.append(weight)
-            
-        # Normalize weights if requested
-        if blend_config.normalize_weights:
-            total_weight = sum(weights)
-            if total_weight > 0:
-                weights = [w / total_weight for w in weights]
-            else:
-                logger.error("All weights are zero")
-                return None
-                
-        # Perform blending based on method
-        if blend_config.blend_method == "weighted_average":
-            blended_data = self._weighted_average_blend(voice_embeddings, weights)
-        elif blend_config.blend_method == "interpolation":
-            blended_data = self._interpolation_blend(voice_embeddings, weights)
-        elif blend_config.blend_method == "style_mixing":
-            blended_data = self._style_mixing_blend(voice_embeddings, weights, blend_config.smoothing_factor)
-        else:
-            logger.error(f"Blend method not implemented: {blend_config.blend_method}")
-            return None
-            
+
+        # A cached blend is only valid while its component voices are unchanged
+        signature = self._component_signature(voice_embeddings)
+        with self._cache_lock:
+            entry = self._blend_cache.get(key)
+            if entry is not None and self._same_components(entry[0], signature):
+                self._blend_cache.move_to_end(key)
+                self._cache_stats['hits'] += 1
+                return entry[1]
+            self._cache_stats['misses'] += 1
+
+        pack_path = self._pack_path(key, signature)
+        blended_data = self._load_pack(pack_path) if pack_path else None
+
+        weights = [weight for _, weight in voices]
         if blended_data is None:
-            logger.error("Blending failed")
-            return None
-            
-        # Apply energy preservation if requested
-        if blend_config.preserve_energy:
-            blended_data = self._preserve_energy(blended_data, voice_embeddings[0].embedding_data)
+            blended_data = self._compute_blend(key, voice_embeddings, weights, blend_config)
+            if blended_data is None:
+                logger.error("Blending failed")
+                return None
+            blended_data.setflags(write=False)
+            if pack_path:
+                self._save_pack(pack_path, blended_data)
             
         # Create metadata for blended voice
         blended_metadata = self._create_blended_metadata(voice_embeddings, weights)
         
         # Create blended voice embedding
-        blended_name = self._generate_blend_name(blend_config.voices)
+        blended_name = self._generate_blend_name(list(voices))
         blended_embedding = VoiceEmbedding(
             name=blended_name,
             embedding_data=blended_data,
             metadata=blended_metadata,
             loaded_at=None,
-            file_hash=""
+            file_hash=pack_path.stem if pack_path else ""
         )
+
+        with self._cache_lock:
+            self._blend_cache[key] = (signature, blended_embedding)
+            self._blend_cache.move_to_end(key)
+            while len(self._blend_cache) > self.cache_size:
+                self._blend_cache.popitem(last=False)
         
         logger.info(f"Successfully blended {len(voice_embeddings)} voices into '{blended_name}'")
         return blended_embedding
+
+    def _compute_blend(self, key: Tuple, voice_embeddings: List[VoiceEmbedding],
+                       weights: List[float], blend_config: BlendConfig) -> Optional[np.ndarray]:
+        """Run the configured blend method and energy preservation"""
+        if blend_config.blend_method == "weighted_average":
+            blended_data = self._weighted_average_blend(voice_embeddings, weights)
+        elif blend_config.blend_method == "interpolation":
+            blended_data = self._interpolation_blend(voice_embeddings, weights)
+        elif blend_config.blend_method == "style_mixing":
+            # Seed from the key so every worker derives the same mix for a spec
+            seed = int(hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16], 16)
+            blended_data = self._style_mixing_blend(voice_embeddings, weights, blend_config.smoothing_factor,
+                                                    rng=np.random.default_rng(seed))
+        else:
+            logger.error(f"Blend method not implemented: {blend_config.blend_method}")
+            return None
+
+        if blended_data is None:
+            return None
+
+        # Apply energy preservation if requested
+        if blend_config.preserve_energy:
+            blended_data = self._preserve_energy(blended_data, voice_embeddings[0].embedding_data)
+
+        return np.ascontiguousarray(blended_data, dtype=np.float32)
+
+    def _component_signature(self, voice_embeddings: List[VoiceEmbedding]) -> Tuple:
+        """Identify the exact component data a blend was built from
+
+        Voices are identified by file hash, or by the embedding array itself
+        when no hash is known (the entry keeps it alive, so identity is safe).
+        """
+        return tuple(
+            (embedding.name, embedding.file_hash or embedding.embedding_data)
+            for embedding in voice_embeddings
+        )
+
+    @staticmethod
+    def _same_components(cached: Tuple, current: Tuple) -> bool:
+        if len(cached) != len(current):
+            return False
+        for (cached_name, cached_source), (name, source) in zip(cached, current):
+            if cached_name != name:
+                return False
+            if isinstance(cached_source, str) and isinstance(source, str):
+                if cached_source != source:
+                    return False
+            elif cached_source is not source:
+                return False
+        return True
+
+    def _pack_path(self, key: Tuple, signature: Tuple) -> Optional[Path]:
+        """Voice pack file for a blend, only when components have file hashes"""
+        if not self.pack_dir or not all(isinstance(source, str) for _, source in signature):
+            return None
+        digest = hashlib.sha1(repr((key, signature)).encode('utf-8')).hexdigest()[:20]
+        return self.pack_dir / f"blend_{digest}.npy"
+
+    def _load_pack(self, pack_path: Path) -> Optional[np.ndarray]:
+        """Memory-map a persisted blend"""
+        if not pack_path.exists():
+            return None
+        try:
+            data = np.load(pack_path, mmap_mode='r')
+            with self._cache_lock:
+                self._cache_stats['pack_loads'] += 1
+            return data
+        except Exception as e:
+            logger.warning(f"Failed to load voice pack {pack_path}: {e}")
+            return None
+
+    def _save_pack(self, pack_path: Path, blended_data: np.ndarray):
+        """Persist a blend atomically so concurrent workers never read a partial file"""
+        tmp_path = pack_path.with_name(f"{pack_path.stem}.{os.getpid()}.tmp.npy")
+        try:
+            np.save(tmp_path, blended_data)
+            os.replace(tmp_path, pack_path)
+        except Exception as e:
+            logger.warning(f"Failed to save voice pack {pack_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def prebuild_presets(self, available_voices: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Build all preset blends into the cache
+
+        Presets whose voices are not in ``available_voices`` are skipped, so
+        startup never triggers voice downloads.
+        """
+        results = {}
+        for preset_name in self.get_preset_names():
+            blend_config = self.create_preset_blend(preset_name)
+            if available_voices is not None and any(
+                voice_name not in available_voices for voice_name, _ in blend_config.voices
+            ):
+                logger.debug(f"Skipping preset blend '{preset_name}': voices not available")
+                results[preset_name] = False
+                continue
+            results[preset_name] = self.blend_voices(blend_config) is not None
+
+        built = sum(results.values())
+        if built:
+            logger.info(f"Prebuilt {built}/{len(results)} preset voice blends")
+        return results
+
+    def clear_cache(self):
+        """Drop all cached blends (persisted packs are kept)"""
+        with self._cache_lock:
+            self._blend_cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Blend cache size and hit rate"""
+        with self._cache_lock:
+            lookups = self._cache_stats['hits'] + self._cache_stats['misses']
+            return {
+                'entries': len(self._blend_cache),
+                'max_entries': self.cache_size,
+                **self._cache_stats,
+                'hit_rate': self._cache_stats['hits'] / lookups if lookups else 0.0
+            }
         
     def _weighted_average_blend(self, voice_embeddings: List[VoiceEmbedding], 
                                weights: List[float]) -> Optional[np.ndarray]:
@@ -195,7 +372,8 @@ class VoiceBlender:
             return None
             
     def _style_mixing_blend(self, voice_embeddings: List[VoiceEmbedding], 
-                          weights: List[float], smoothing_factor: float) -> Optional[np.ndarray]:
+                          weights: List[float], smoothing_factor: float,
+                          rng: Optional[np.random.Generator] = None) -> Optional[np.ndarray]:
         """Blend voices using style mixing (different parts of the embedding from different voices)"""
         try:
             embedding_arrays = []
@@ -218,12 +396,12 @@ class VoiceBlender:
             blended = np.zeros_like(embedding_arrays[0])
             
             if len(target_shape) == 2 and target_shape[0] == 510:  # (510, 256) format
-                # Mix different style vectors
+                # Mix different style vectors, choosing a source voice per row by weight
                 num_styles = target_shape[0]
-                for i in range(num_styles):
-                    # Choose which voice to use for this style vector based on weights
-                    voice_idx = np.random.choice(len(embedding_arrays), p=weights)
-                    blended[i] = embedding_arrays[voice_idx][i]
+                rng = rng or np.random.default_rng()
+                probabilities = np.asarray(weights, dtype=np.float64)
+                voice_idx = rng.choice(len(embedding_arrays), size=num_styles, p=probabilities / probabilities.sum())
+                blended[:] = np.stack(embedding_arrays)[voice_idx, np.arange(num_styles)]
                     
                 # Apply smoothing
                 if smoothing_factor > 0:
@@ -334,9 +512,17 @@ class VoiceBlender:
         """Get list of supported blending methods"""
         return self.supported_methods.copy()
         
+    def get_preset_names(self) -> List[str]:
+        """Get available preset blend names"""
+        return list(self._preset_configs().keys())
+
     def create_preset_blend(self, preset_name: str) -> Optional[BlendConfig]:
         """Create a preset blend configuration"""
-        presets = {
+        return self._preset_configs().get(preset_name)
+
+    def _preset_configs(self) -> Dict[str, BlendConfig]:
+        """Fresh preset configurations (BlendConfig is mutable)"""
+        return {
             "warm_friendly": BlendConfig(
                 voices=[("af_heart", 0.6), ("af_sarah", 0.4)],
                 blend_method="weighted_average",
@@ -354,5 +540,3 @@ class VoiceBlender:
                 smoothing_factor=0.2
             )
         }
-        
-        return presets.get(preset_name)
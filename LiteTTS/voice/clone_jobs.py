@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Asynchronous voice cloning jobs
+
+Cloning several minutes of reference audio takes far longer than an HTTP
+request should stay open. CloneJobManager runs cloning work on a small
+background pool and keeps per-job status and progress for polling; finished
+jobs are kept for a while so clients can collect their result.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+@dataclass
+class CloneJob:
+    """Status of one cloning job"""
+    job_id: str
+    voice_name: str
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = "Queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED, CANCELLED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "voice_name": self.voice_name,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "message": self.message,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+class CloneJobManager:
+    """
+    Runs cloning callables in the background and tracks their progress
+
+    A job's callable receives a ``progress(fraction, message)`` function and
+    returns a JSON-serializable result dict; an exception fails the job.
+    """
+
+    def __init__(self, max_concurrent: int = 1, retention_seconds: float = 3600.0, max_jobs: int = 200):
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="clone-job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, CloneJob] = {}
+        self._futures: Dict[str, Future] = {}
+        self._cleanups: Dict[str, Callable[[], None]] = {}
+
+    def submit(self, voice_name: str, work: Callable[[Callable[[float, str], None]], Dict[str, Any]],
+               cleanup: Optional[Callable[[], None]] = None) -> CloneJob:
+        """
+        Queue a cloning job
+
+        Args:
+            work: Does the cloning; called with a progress function
+            cleanup: Always called once the job ends, e.g. to delete uploads
+
+        Raises:
+            ValueError: A job for the same voice is already queued or running
+        """
+        with self._lock:
+            self._expire()
+            if self.active_job_for(voice_name) is not None:
+                raise ValueError(f"A cloning job for voice '{voice_name}' is already in progress")
+            job = CloneJob(job_id=uuid.uuid4().hex, voice_name=voice_name)
+            self._jobs[job.job_id] = job
+            if cleanup is not None:
+                self._cleanups[job.job_id] = cleanup
+            self._futures[job.job_id] = self._executor.submit(self._run, job, work)
+        logger.info(f"Queued cloning job {job.job_id} for voice '{voice_name}'")
+        return job
+
+    def _run(self, job: CloneJob, work: Callable):
+        def progress(fraction: float, message: str):
+            job.progress = max(job.progress, min(float(fraction), 1.0))
+            job.message = message
+
+        try:
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.message = "Running"
+            job.result = work(progress)
+            job.progress = 1.0
+            job.status = COMPLETED
+            logger.info(f"Cloning job {job.job_id} completed in {time.time() - job.started_at:.1f}s")
+        except Exception as e:
+            job.error = str(e)
+            job.message = "Failed"
+            job.status = FAILED
+            logger.error(f"Cloning job {job.job_id} failed: {e}")
+        finally:
+            job.finished_at = time.time()
+            self._futures.pop(job.job_id, None)
+            self._cleanup(job.job_id)
+
+    def _cleanup(self, job_id: str):
+        cleanup = self._cleanups.pop(job_id, None)
+        if cleanup is not None:
+            try:
+                cleanup()
+            except Exception as e:
+                logger.warning(f"Cloning job {job_id} cleanup failed: {e}")
+
+    def get(self, job_id: str) -> Optional[CloneJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_job_for(self, voice_name: str) -> Optional[CloneJob]:
+        return next((job for job in self._jobs.values()
+                     if job.voice_name == voice_name and not job.finished), None)
+
+    def list_jobs(self) -> List[CloneJob]:
+        with self._lock:
+            self._expire()
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started; running jobs finish"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            future = self._futures.get(job_id)
+            if job is None or future is None or not future.cancel():
+                return False
+            self._futures.pop(job_id, None)
+            job.status = CANCELLED
+            job.message = "Cancelled"
+            job.finished_at = time.time()
+        self._cleanup(job_id)
+        return True
+
+    def _expire(self):
+        """Drop finished jobs past retention, then the oldest finished ones over max_jobs"""
+        now = time.time()
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and now - job.finished_at > self.retention_seconds]:
+            del self._jobs[job_id]
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at)
+        for job in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job.job_id]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+# Global job manager instance
+_clone_job_manager: Optional[CloneJobManager] = None
+_clone_job_manager_lock = threading.Lock()
+
+def get_clone_job_manager() -> CloneJobManager:
+    """Get the global cloning job manager"""
+    global _clone_job_manager
+    with _clone_job_manager_lock:
+        if _clone_job_manager is None:
+            _clone_job_manager = CloneJobManager()
+        return _clone_job_manager
@@ -15,6 +15,8 @@ import hashlib
 import json
 from datetime import datetime
 
+from .spectral_features import SpectralSummary, analyze_array, analyze_file, style_vectors
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -71,34 +73,22 @@ class VoiceCloner:
         Returns:
             AudioAnalysisResult with analysis information
         """
+        return self._analyze_file(audio_file_path)[0]
+
+    def _analyze_file(self, audio_file_path: str) -> Tuple[AudioAnalysisResult, Optional[SpectralSummary]]:
+        """Analysis result plus the spectral summary it came from, in one streaming pass over the file"""
         try:
-            import soundfile as sf
-            
-            # Load audio file
-            audio_data, sample_rate = sf.read(audio_file_path)
-            
-            # Basic audio properties
-            duration = len(audio_data) / sample_rate
-            channels = 1 if audio_data.ndim == 1 else audio_data.shape[1]
-            
-            # Convert to mono if stereo
-            if audio_data.ndim == 2:
-                audio_data = np.mean(audio_data, axis=1)
-            
-            # Quality assessment
-            quality_score = self._assess_audio_quality(audio_data, sample_rate)
-            
-            # Voice characteristics analysis
-            voice_characteristics = self._analyze_voice_characteristics(audio_data, sample_rate)
-            
+            analysis = analyze_file(audio_file_path)
+            summary = analysis['summary']
+
             return AudioAnalysisResult(
                 success=True,
-                duration=duration,
-                sample_rate=sample_rate,
-                channels=channels,
-                quality_score=quality_score,
-                voice_characteristics=voice_characteristics
-            )
+                duration=analysis['duration'],
+                sample_rate=analysis['sample_rate'],
+                channels=analysis['channels'],
+                quality_score=summary.quality_score(),
+                voice_characteristics=summary.characteristics()
+            ), summary
             
         except Exception as e:
             logger.error(f"Audio analysis failed: {e}")
@@ -110,7 +100,7 @@ class VoiceCloner:
                 quality_score=0.0,
                 voice_characteristics={},
                 error_message=str(e)
-            )
+            ), None
     
     def clone_voice(self, audio_file_path: str, voice_name: str, 
                    description: str = "") -> VoiceCloneResult:
@@ -126,8 +116,8 @@ class VoiceCloner:
             VoiceCloneResult with cloning information
         """
         try:
-            # First analyze the audio
-            analysis = self.analyze_audio(audio_file_path)
+            # First analyze the audio; the same pass yields the embedding features
+            analysis, summary = self._analyze_file(audio_file_path)
             if not analysis.success:
                 return VoiceCloneResult(
                     success=False,
@@ -158,7 +148,7 @@ class VoiceCloner:
                 )
             
             # Extract voice embedding
-            embedding_data = self._extract_voice_embedding(audio_file_path)
+            embedding_data = self._embedding_from_summary(summary)
             if embedding_data is None:
                 return VoiceCloneResult(
                     success=False,
@@ -187,7 +177,7 @@ class VoiceCloner:
                     'characteristics': analysis.voice_characteristics
                 },
                 'embedding_shape': embedding_data.shape,
-                'cloning_method': 'simple_speaker_embedding'
+                'cloning_method': 'stft_speaker_embedding'
             }
             
             # Calculate similarity score (placeholder for now)
@@ -218,38 +208,7 @@ class VoiceCloner:
             Quality score between 0.0 and 1.0
         """
         try:
-            # Signal-to-noise ratio estimation
-            signal_power = np.mean(audio_data ** 2)
-            if signal_power == 0:
-                return 0.0
-            
-            # Dynamic range assessment
-            dynamic_range = np.max(audio_data) - np.min(audio_data)
-            
-            # Clipping detection
-            clipping_ratio = np.sum(np.abs(audio_data) > 0.95) / len(audio_data)
-            
-            # Silence detection
-            silence_threshold = 0.01
-            silence_ratio = np.sum(np.abs(audio_data) < silence_threshold) / len(audio_data)
-            
-            # Calculate quality score
-            quality_score = 1.0
-            
-            # Penalize clipping
-            quality_score -= clipping_ratio * 0.5
-            
-            # Penalize excessive silence
-            if silence_ratio > 0.3:
-                quality_score -= (silence_ratio - 0.3) * 0.5
-            
-            # Penalize low dynamic range
-            if dynamic_range < 0.1:
-                quality_score -= (0.1 - dynamic_range) * 2.0
-            
-            # Ensure score is between 0 and 1
-            return max(0.0, min(1.0, quality_score))
-            
+            return analyze_array(audio_data, sample_rate).quality_score()
         except Exception as e:
             logger.warning(f"Quality assessment failed: {e}")
             return 0.5  # Default moderate quality
@@ -263,30 +222,7 @@ class VoiceCloner:
             Dictionary with voice characteristics
         """
         try:
-            # Basic spectral analysis
-            fft = np.fft.fft(audio_data)
-            freqs = np.fft.fftfreq(len(fft), 1/sample_rate)
-            magnitude = np.abs(fft)
-            
-            # Find dominant frequencies
-            positive_freqs = freqs[:len(freqs)//2]
-            positive_magnitude = magnitude[:len(magnitude)//2]
-            
-            # Fundamental frequency estimation (very basic)
-            peak_idx = np.argmax(positive_magnitude[1:]) + 1  # Skip DC component
-            fundamental_freq = positive_freqs[peak_idx]
-            
-            # Voice characteristics
-            characteristics = {
-                'fundamental_frequency': float(fundamental_freq),
-                'spectral_centroid': float(np.sum(positive_freqs * positive_magnitude) / np.sum(positive_magnitude)),
-                'spectral_bandwidth': float(np.sqrt(np.sum(((positive_freqs - fundamental_freq) ** 2) * positive_magnitude) / np.sum(positive_magnitude))),
-                'energy': float(np.mean(audio_data ** 2)),
-                'zero_crossing_rate': float(np.sum(np.diff(np.sign(audio_data)) != 0) / len(audio_data))
-            }
-            
-            return characteristics
-            
+            return analyze_array(audio_data, sample_rate).characteristics()
         except Exception as e:
             logger.warning(f"Voice characteristics analysis failed: {e}")
             return {
@@ -308,35 +244,16 @@ class VoiceCloner:
             Voice embedding array with shape (510, 256) or None if failed
         """
         try:
-            import soundfile as sf
-            
-            # Load and preprocess audio
-            audio_data, sample_rate = sf.read(audio_file_path)
-            
-            # Convert to mono if stereo
-            if audio_data.ndim == 2:
-                audio_data = np.mean(audio_data, axis=1)
-            
-            # Resample to target sample rate if needed
-            if sample_rate != self.target_sample_rate:
-                # Simple resampling (in production, use proper resampling)
-                ratio = self.target_sample_rate / sample_rate
-                new_length = int(len(audio_data) * ratio)
-                audio_data = np.interp(
-                    np.linspace(0, len(audio_data), new_length),
-                    np.arange(len(audio_data)),
-                    audio_data
-                )
-            
-            # Extract features (simplified approach)
-            # In production, use a proper speaker encoder
-            embedding = self._simple_speaker_embedding(audio_data)
-            
-            return embedding
-            
+            return self._embedding_from_summary(analyze_file(audio_file_path)['summary'])
         except Exception as e:
             logger.error(f"Voice embedding extraction failed: {e}")
             return None
+
+    def _embedding_from_summary(self, summary: Optional[SpectralSummary]) -> Optional[np.ndarray]:
+        """Style vectors from a recording's spectral summary, None without one"""
+        if summary is None:
+            return None
+        return style_vectors(summary.speaker_embedding(self.embedding_dim), self.num_style_vectors)
     
     def _simple_speaker_embedding(self, audio_data: np.ndarray) -> np.ndarray:
         """
@@ -350,98 +267,9 @@ class VoiceCloner:
         Returns:
             Embedding array with shape (510, 256)
         """
-        # Create a deterministic but unique embedding based on audio characteristics
-        # This is a simplified approach for demonstration
-        
-        # Calculate spectral features
-        fft = np.fft.fft(audio_data)
-        magnitude = np.abs(fft)
-        
-        # Extract mel-scale features (simplified)
-        n_mels = 128
-        mel_features = self._extract_mel_features(audio_data, n_mels)
-        
-        # Create base embedding from audio characteristics
-        base_embedding = np.zeros(256)
-        
-        # Fill embedding with spectral and temporal features
-        if len(mel_features) >= 128:
-            base_embedding[:128] = mel_features[:128]
-        else:
-            base_embedding[:len(mel_features)] = mel_features
-        
-        # Add temporal features
-        temporal_features = self._extract_temporal_features(audio_data)
-        base_embedding[128:128+len(temporal_features)] = temporal_features[:128]
-        
-        # Normalize embedding
-        base_embedding = base_embedding / (np.linalg.norm(base_embedding) + 1e-8)
-        
-        # Create 510 style vectors with variations
-        # Each style vector represents different speaking styles/contexts
-        style_vectors = np.zeros((self.num_style_vectors, self.embedding_dim))
-        
-        for i in range(self.num_style_vectors):
-            # Add controlled variation to create different style vectors
-            variation = np.random.RandomState(i).normal(0, 0.05, self.embedding_dim)
-            style_vectors[i] = base_embedding + variation
-            
-            # Normalize each style vector
-            style_vectors[i] = style_vectors[i] / (np.linalg.norm(style_vectors[i]) + 1e-8)
-        
-        return style_vectors.astype(np.float32)
-    
-    def _extract_mel_features(self, audio_data: np.ndarray, n_mels: int) -> np.ndarray:
-        """Extract mel-scale features (simplified implementation)"""
-        # Simple spectral features as placeholder for mel features
-        fft = np.fft.fft(audio_data)
-        magnitude = np.abs(fft[:len(fft)//2])
-        
-        # Downsample to n_mels features
-        if len(magnitude) > n_mels:
-            step = len(magnitude) // n_mels
-            mel_features = magnitude[::step][:n_mels]
-        else:
-            mel_features = np.pad(magnitude, (0, n_mels - len(magnitude)))
-        
-        # Log scale and normalize
-        mel_features = np.log(mel_features + 1e-8)
-        mel_features = (mel_features - np.mean(mel_features)) / (np.std(mel_features) + 1e-8)
-        
-        return mel_features
-    
-    def _extract_temporal_features(self, audio_data: np.ndarray) -> np.ndarray:
-        """Extract temporal features from audio"""
-        features = []
-        
-        # Energy features
-        frame_size = 1024
-        hop_size = 512
-        
-        for i in range(0, len(audio_data) - frame_size, hop_size):
-            frame = audio_data[i:i + frame_size]
-            
-            # Frame energy
-            energy = np.sum(frame ** 2)
-            features.append(energy)
-            
-            # Zero crossing rate
-            zcr = np.sum(np.diff(np.sign(frame)) != 0) / len(frame)
-            features.append(zcr)
-            
-            if len(features) >= 128:
-                break
-        
-        # Pad if necessary
-        while len(features) < 128:
-            features.append(0.0)
-        
-        features = np.array(features[:128])
-        
-        # Normalize
-        features = (features - np.mean(features)) / (np.std(features) + 1e-8)
-        
-        return features
+        # Log mel spectrum and opening-frame energy/ZCR from a frame-based STFT,
+        # spread into 510 deterministic style variations
+        return self._embedding_from_summary(analyze_array(audio_data, self.target_sample_rate))
     
     def _generate_bin_file(self, voice_name: str, embedding_data: np.ndarray) -> Optional[str]:
         """
@@ -10,14 +10,17 @@ import logging
 import tempfile
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Callable
 from dataclasses import dataclass, field
 import hashlib
 import json
 from datetime import datetime
 import asyncio
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .spectral_features import analyze_array, style_vectors
+from ..utils.worker_processes import init_worker_process, worker_context
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ class EnhancedVoiceCloneConfig:
     enable_noise_reduction: bool = True
     enable_normalization: bool = True
     enable_silence_trimming: bool = True
+    max_workers: int = 0  # Clip worker processes; 0 = one per clip, up to the core count
 
 @dataclass
 class AudioSegment:
@@ -182,21 +186,17 @@ class AudioPreprocessor:
         # Clipping ratio
         clipping_ratio = np.sum(np.abs(audio_data) > 0.95) / len(audio_data)
         
-        # Frequency analysis
-        fft = np.fft.fft(audio_data)
-        freqs = np.fft.fftfreq(len(fft), 1/sample_rate)
-        magnitude = np.abs(fft[:len(fft)//2])
+        # Frequency analysis over STFT frames rather than one FFT of the whole clip
+        spectral = analyze_array(audio_data, sample_rate)
         
         # Find frequency range (where magnitude > 10% of max)
-        threshold = 0.1 * np.max(magnitude)
-        active_freqs = freqs[:len(freqs)//2][magnitude > threshold]
-        freq_range = (np.min(active_freqs), np.max(active_freqs)) if len(active_freqs) > 0 else (0, sample_rate/2)
+        freq_range = spectral.frequency_range(0.1)
         
         # Dynamic range
         dynamic_range_db = 20 * np.log10(np.max(np.abs(audio_data)) / (np.min(np.abs(audio_data[audio_data != 0])) + 1e-10))
         
         # Spectral centroid
-        spectral_centroid = np.sum(freqs[:len(freqs)//2] * magnitude) / np.sum(magnitude)
+        spectral_centroid = spectral.characteristics()['spectral_centroid']
         
         # Voice activity detection (simple energy-based)
         frame_length = int(0.025 * sample_rate)
@@ -329,6 +329,50 @@ class IntelligentAudioSegmenter:
         
         return quality_score
 
+def extract_segment_embedding(audio_data: np.ndarray, config: EnhancedVoiceCloneConfig) -> np.ndarray:
+    """Unit-norm base embedding of one segment from its frame-based spectral summary"""
+    # Simplified embedding extraction (same features as cloning.py)
+    # In production, use proper speaker encoder
+    summary = analyze_array(audio_data, config.target_sample_rate)
+    return summary.speaker_embedding(config.embedding_dim).astype(np.float32)
+
+def process_clip(audio_file: str, clip_id: str, config: EnhancedVoiceCloneConfig) -> Dict[str, Any]:
+    """
+    Preprocess, segment and embed one clip
+
+    Module-level so clips can run in worker processes; only the small
+    per-segment embeddings and metadata travel back, never the audio.
+    """
+    import soundfile as sf
+
+    info = sf.info(audio_file)
+    duration = info.frames / info.samplerate
+
+    # Validate duration before reading any samples
+    if duration > config.max_audio_duration:
+        raise ValueError(f"Clip too long: {duration:.1f}s > {config.max_audio_duration}s")
+
+    audio_data, sample_rate = sf.read(audio_file, dtype='float32')
+
+    # Preprocess audio
+    processed_audio, quality_metrics = AudioPreprocessor(config).preprocess_audio(audio_data, sample_rate)
+
+    # Segment if needed
+    segments = IntelligentAudioSegmenter(config).segment_audio(processed_audio, config.target_sample_rate)
+
+    # Extract embeddings from segments
+    segment_embeddings = [extract_segment_embedding(segment.audio_data, config) for segment in segments]
+
+    return {
+        'clip_id': clip_id,
+        'file_path': audio_file,
+        'duration': duration,
+        'quality_metrics': quality_metrics.__dict__,
+        'segments': [EnhancedVoiceCloner._segment_to_dict(seg) for seg in segments],
+        'embeddings': segment_embeddings,
+        'processed_audio_shape': processed_audio.shape
+    }
+
 class EnhancedVoiceCloner:
     """Enhanced voice cloning system with extended capabilities"""
     
@@ -341,34 +385,32 @@ class EnhancedVoiceCloner:
         self.preprocessor = AudioPreprocessor(self.config)
         self.segmenter = IntelligentAudioSegmenter(self.config)
         
-        # Thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        
         logger.info(f"EnhancedVoiceCloner initialized with max duration: {self.config.max_audio_duration}s")
         
     def clone_voice_from_multiple_clips(self, audio_files: List[str], voice_name: str, 
-                                      description: str = "") -> MultiClipVoiceProfile:
-        """Clone voice from multiple audio clips"""
+                                      description: str = "",
+                                      progress: Optional[Callable[[float, str], None]] = None) -> MultiClipVoiceProfile:
+        """
+        Clone voice from multiple audio clips
+
+        Clips are processed in parallel worker processes (the work is numpy
+        and pure-Python framing that would serialize on the GIL in threads).
+
+        Args:
+            progress: Called with (fraction done, message) as clips finish
+        """
         if len(audio_files) > self.config.max_reference_clips:
             raise ValueError(f"Too many clips: {len(audio_files)} (max: {self.config.max_reference_clips})")
-            
-        clips_data = []
-        total_duration = 0.0
-        
-        # Process each clip
-        for i, audio_file in enumerate(audio_files):
-            try:
-                clip_data = self._process_single_clip(audio_file, f"clip_{i:02d}")
-                clips_data.append(clip_data)
-                total_duration += clip_data['duration']
-                
-                if total_duration > self.config.max_total_reference_duration:
-                    raise ValueError(f"Total duration exceeds limit: {total_duration:.1f}s > {self.config.max_total_reference_duration}s")
-                    
-            except Exception as e:
-                logger.error(f"Failed to process clip {audio_file}: {e}")
-                raise
-                
+
+        report = progress or (lambda fraction, message: None)
+        report(0.0, f"Processing {len(audio_files)} clips")
+        clips_data = self._process_clips(audio_files, report)
+
+        total_duration = sum(clip['duration'] for clip in clips_data)
+        if total_duration > self.config.max_total_reference_duration:
+            raise ValueError(f"Total duration exceeds limit: {total_duration:.1f}s > {self.config.max_total_reference_duration}s")
+
+        report(0.9, "Combining clip embeddings")
         # Combine embeddings from all clips
         combined_embedding = self._combine_clip_embeddings(clips_data)
         
@@ -393,44 +435,49 @@ class EnhancedVoiceCloner:
         
         # Save voice profile
         self._save_voice_profile(profile)
+        report(1.0, f"Voice '{voice_name}' created")
         
         return profile
 
-    def _process_single_clip(self, audio_file: str, clip_id: str) -> Dict[str, Any]:
-        """Process a single audio clip"""
-        import soundfile as sf
-
-        # Load audio
-        audio_data, sample_rate = sf.read(audio_file)
-        duration = len(audio_data) / sample_rate
-
-        # Validate duration
-        if duration > self.config.max_audio_duration:
-            raise ValueError(f"Clip too long: {duration:.1f}s > {self.config.max_audio_duration}s")
-
-        # Preprocess audio
-        processed_audio, quality_metrics = self.preprocessor.preprocess_audio(audio_data, sample_rate)
-
-        # Segment if needed
-        segments = self.segmenter.segment_audio(processed_audio, self.config.target_sample_rate)
+    def _process_clips(self, audio_files: List[str], report: Callable[[float, str], None]) -> List[Dict[str, Any]]:
+        """Process clips in parallel, returning them in input order"""
+        clip_ids = [f"clip_{i:02d}" for i in range(len(audio_files))]
+        if len(audio_files) <= 1:
+            clips = [self._process_single_clip(audio_file, clip_id) for audio_file, clip_id in zip(audio_files, clip_ids)]
+            if clips:
+                report(0.9, f"Processed {clip_ids[0]}")
+            return clips
+
+        workers = self.config.max_workers or min(len(audio_files), os.cpu_count() or 1)
+        results: Dict[int, Dict[str, Any]] = {}
+        with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context(),
+                                 initializer=init_worker_process) as executor:
+            futures = {
+                executor.submit(process_clip, audio_file, clip_id, self.config): index
+                for index, (audio_file, clip_id) in enumerate(zip(audio_files, clip_ids))
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process clip {audio_files[index]}: {e}")
+                        raise
+                    report(0.9 * len(results) / len(audio_files), f"Processed {clip_ids[index]}")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
-        # Extract embeddings from segments
-        segment_embeddings = []
-        for segment in segments:
-            embedding = self._extract_segment_embedding(segment.audio_data)
-            segment_embeddings.append(embedding)
+        return [results[index] for index in range(len(audio_files))]
 
-        return {
-            'clip_id': clip_id,
-            'file_path': audio_file,
-            'duration': duration,
-            'quality_metrics': quality_metrics.__dict__,
-            'segments': [self._segment_to_dict(seg) for seg in segments],
-            'embeddings': segment_embeddings,
-            'processed_audio_shape': processed_audio.shape
-        }
+    def _process_single_clip(self, audio_file: str, clip_id: str) -> Dict[str, Any]:
+        """Process a single audio clip"""
+        return process_clip(audio_file, clip_id, self.config)
 
-    def _segment_to_dict(self, segment: AudioSegment) -> Dict[str, Any]:
+    @staticmethod
+    def _segment_to_dict(segment: AudioSegment) -> Dict[str, Any]:
         """Convert AudioSegment to dictionary"""
         return {
             'segment_id': segment.segment_id,
@@ -445,85 +492,7 @@ class EnhancedVoiceCloner:
 
     def _extract_segment_embedding(self, audio_data: np.ndarray) -> np.ndarray:
         """Extract embedding from audio segment"""
-        # Simplified embedding extraction (same as original cloning.py)
-        # In production, use proper speaker encoder
-
-        # Calculate spectral features
-        fft = np.fft.fft(audio_data)
-        magnitude = np.abs(fft)
-
-        # Extract mel-scale features (simplified)
-        n_mels = 128
-        mel_features = self._extract_mel_features(audio_data, n_mels)
-
-        # Create base embedding
-        base_embedding = np.zeros(self.config.embedding_dim)
-
-        # Fill embedding with spectral and temporal features
-        if len(mel_features) >= 128:
-            base_embedding[:128] = mel_features[:128]
-        else:
-            base_embedding[:len(mel_features)] = mel_features
-
-        # Add temporal features
-        temporal_features = self._extract_temporal_features(audio_data)
-        base_embedding[128:128+len(temporal_features)] = temporal_features[:128]
-
-        # Normalize embedding
-        base_embedding = base_embedding / (np.linalg.norm(base_embedding) + 1e-8)
-
-        return base_embedding.astype(np.float32)
-
-    def _extract_mel_features(self, audio_data: np.ndarray, n_mels: int) -> np.ndarray:
-        """Extract mel-scale features (simplified implementation)"""
-        fft = np.fft.fft(audio_data)
-        magnitude = np.abs(fft[:len(fft)//2])
-
-        # Downsample to n_mels features
-        if len(magnitude) > n_mels:
-            step = len(magnitude) // n_mels
-            mel_features = magnitude[::step][:n_mels]
-        else:
-            mel_features = np.pad(magnitude, (0, n_mels - len(magnitude)))
-
-        # Log scale and normalize
-        mel_features = np.log(mel_features + 1e-8)
-        mel_features = (mel_features - np.mean(mel_features)) / (np.std(mel_features) + 1e-8)
-
-        return mel_features
-
-    def _extract_temporal_features(self, audio_data: np.ndarray) -> np.ndarray:
-        """Extract temporal features from audio"""
-        features = []
-
-        # Energy features
-        frame_size = 1024
-        hop_size = 512
-
-        for i in range(0, len(audio_data) - frame_size, hop_size):
-            frame = audio_data[i:i + frame_size]
-
-            # Frame energy
-            energy = np.sum(frame ** 2)
-            features.append(energy)
-
-            # Zero crossing rate
-            zcr = np.sum(np.diff(np.sign(frame)) != 0) / len(frame)
-            features.append(zcr)
-
-            if len(features) >= 128:
-                break
-
-        # Pad if necessary
-        while len(features) < 128:
-            features.append(0.0)
-
-        features = np.array(features[:128])
-
-        # Normalize
-        features = (features - np.mean(features)) / (np.std(features) + 1e-8)
-
-        return features
+        return extract_segment_embedding(audio_data, self.config)
 
     def _combine_clip_embeddings(self, clips_data: List[Dict[str, Any]]) -> np.ndarray:
         """Combine embeddings from multiple clips"""
@@ -554,17 +523,7 @@ class EnhancedVoiceCloner:
         combined_embedding = combined_embedding / (np.linalg.norm(combined_embedding) + 1e-8)
 
         # Create style vectors (same approach as original)
-        style_vectors = np.zeros((self.config.num_style_vectors, self.config.embedding_dim))
-
-        for i in range(self.config.num_style_vectors):
-            # Add controlled variation
-            variation = np.random.RandomState(i).normal(0, 0.05, self.config.embedding_dim)
-            style_vectors[i] = combined_embedding + variation
-
-            # Normalize each style vector
-            style_vectors[i] = style_vectors[i] / (np.linalg.norm(style_vectors[i]) + 1e-8)
-
-        return style_vectors.astype(np.float32)
+        return style_vectors(combined_embedding, self.config.num_style_vectors)
 
     def _calculate_combined_quality_metrics(self, clips_data: List[Dict[str, Any]]) -> Dict[str, float]:
         """Calculate combined quality metrics from all clips"""
@@ -4,6 +4,7 @@ Voice metadata management and categorization
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -36,6 +37,8 @@ except ImportError:
             language: str = "en-us"
             description: str = ""
 
+from .usage_stats import VoiceUsageRecorder
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -51,9 +54,19 @@ class VoiceStats:
 class VoiceMetadataManager:
     """Manages voice metadata and categorization"""
     
-    def __init__(self, metadata_file: str = "LiteTTS/voices/metadata.json"):
+    def __init__(self, metadata_file: str = "LiteTTS/voices/metadata.json",
+                 stats_db_file: Optional[str] = None, stats_flush_interval: float = 5.0):
         self.metadata_file = Path(metadata_file)
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Usage stats are recorded in memory and flushed to a SQLite table
+        # shared by all workers, never written on the request path
+        if stats_db_file is None:
+            stats_db_file = self.metadata_file.with_name("voice_stats.sqlite3")
+        self.usage_recorder = VoiceUsageRecorder(stats_db_file, stats_flush_interval)
+        self._sink_totals: Dict[str, tuple] = {}
+        self._sink_refreshed_at = 0.0
+        self._sink_flush_count = -1
         
         # Default voice metadata
         self.default_metadata = {
@@ -143,6 +156,13 @@ class VoiceMetadataManager:
         self.voice_metadata = {}
         self.voice_stats = {}
         self.load_metadata()
+
+        # Carry stats from the JSON snapshot into the shared sink on first run
+        self.usage_recorder.seed({
+            voice_name: self._stats_to_totals(stats)
+            for voice_name, stats in self.voice_stats.items()
+            if stats.total_requests > 0
+        })
     
     def load_metadata(self):
         """Load metadata from file"""
@@ -180,6 +200,10 @@ class VoiceMetadataManager:
     def save_metadata(self):
         """Save metadata to file"""
         try:
+            # Snapshot service-wide stats rather than only this worker's view
+            self.usage_recorder.flush()
+            self._refresh_stats(force=True)
+
             data = {
                 'voices': {},
                 'stats': {},
@@ -206,6 +230,44 @@ class VoiceMetadataManager:
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
     
+    @staticmethod
+    def _stats_to_totals(stats: VoiceStats) -> tuple:
+        last_used = stats.last_used.timestamp() if stats.last_used else None
+        return (stats.total_requests, stats.total_duration, stats.error_count, last_used)
+
+    @staticmethod
+    def _stats_from_totals(total_requests: int, total_duration: float,
+                           error_count: int, last_used: Optional[float]) -> VoiceStats:
+        return VoiceStats(
+            total_requests=total_requests,
+            total_duration=total_duration,
+            average_request_length=total_duration / total_requests if total_requests else 0.0,
+            last_used=datetime.fromtimestamp(last_used) if last_used else None,
+            error_count=error_count,
+            success_rate=(total_requests - error_count) / total_requests if total_requests else 1.0
+        )
+
+    def _refresh_stats(self, force: bool = False):
+        """Rebuild voice_stats from shared totals plus this worker's unflushed deltas"""
+        recorder = self.usage_recorder
+        now = time.time()
+        if (force or recorder.flush_count != self._sink_flush_count
+                or now - self._sink_refreshed_at >= recorder.flush_interval):
+            self._sink_flush_count = recorder.flush_count
+            self._sink_totals = recorder.load_totals() or self._sink_totals
+            self._sink_refreshed_at = now
+
+        pending = recorder.pending_totals()
+        for voice_name in set(self._sink_totals) | set(pending):
+            requests, duration, errors, last_used = self._sink_totals.get(voice_name, (0, 0.0, 0, None))
+            if voice_name in pending:
+                p_requests, p_duration, p_errors, p_last_used = pending[voice_name]
+                requests += p_requests
+                duration += p_duration
+                errors += p_errors
+                last_used = max(filter(None, (last_used, p_last_used)), default=None)
+            self.voice_stats[voice_name] = self._stats_from_totals(requests, duration, errors, last_used)
+
     def _initialize_stats(self):
         """Initialize statistics for all voices"""
         for voice_name in self.voice_metadata.keys():
@@ -267,6 +329,7 @@ class VoiceMetadataManager:
         """Get recommended voices based on quality and usage"""
         voices_with_scores = []
         
+        self._refresh_stats()
         for voice_name, metadata in self.voice_metadata.items():
             stats = self.voice_stats.get(voice_name, VoiceStats())
             
@@ -290,33 +353,17 @@ class VoiceMetadataManager:
     
     def update_voice_stats(self, voice_name: str, request_duration: float, 
                           success: bool = True):
-        """Update usage statistics for a voice"""
-        if voice_name not in self.voice_stats:
-            self.voice_stats[voice_name] = VoiceStats()
-        
-        stats = self.voice_stats[voice_name]
-        stats.total_requests += 1
-        stats.total_duration += request_duration
-        stats.last_used = datetime.now()
-        
-        if success:
-            # Update average request length
-            stats.average_request_length = stats.total_duration / stats.total_requests
-        else:
-            stats.error_count += 1
-        
-        # Update success rate
-        stats.success_rate = (stats.total_requests - stats.error_count) / stats.total_requests
-        
-        # Save updated stats
-        self.save_metadata()
+        """Record usage for a voice; persisted in the background"""
+        self.usage_recorder.record(voice_name, request_duration, success)
     
     def get_voice_stats(self, voice_name: str) -> Optional[VoiceStats]:
         """Get usage statistics for a voice"""
+        self._refresh_stats()
         return self.voice_stats.get(voice_name)
     
     def get_usage_summary(self) -> Dict[str, Any]:
         """Get overall usage summary"""
+        self._refresh_stats()
         total_requests = sum(stats.total_requests for stats in self.voice_stats.values())
         total_duration = sum(stats.total_duration for stats in self.voice_stats.values())
         total_errors = sum(stats.error_count for stats in self.voice_stats.values())
@@ -353,6 +400,8 @@ class VoiceMetadataManager:
             del self.voice_metadata[voice_name]
         if voice_name in self.voice_stats:
             del self.voice_stats[voice_name]
+        self.usage_recorder.forget(voice_name)
+        self._sink_totals.pop(voice_name, None)
         self.save_metadata()
         logger.info(f"Removed voice: {voice_name}")
     
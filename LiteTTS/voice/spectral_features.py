@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Frame-based spectral analysis for voice cloning
+
+Replaces full-length FFTs over whole recordings (slow and memory-heavy on
+minutes of audio with non-power-of-two lengths) with a short-time Fourier
+transform over fixed frames. Audio is consumed block by block, so a file is
+analyzed in one streaming pass with memory bounded by the block size: only
+running sums of the frame power spectra and per-sample statistics are kept.
+
+Frames are defined in seconds at the cloning target rate (1024 samples at
+24 kHz) and scaled to the source rate, so features do not depend on the
+file's sample rate and no resampling pass is needed.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 24000
+FRAME_SIZE = 1024  # At the target rate
+HOP_SIZE = 512
+N_MELS = 128
+TEMPORAL_FEATURES = 128  # Energy and zero crossing rate of the first 64 frames
+SILENCE_THRESHOLD = 0.01
+CLIPPING_THRESHOLD = 0.95
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + np.asarray(hz) / 700.0)
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (np.asarray(mel) / 2595.0) - 1.0)
+
+@lru_cache(maxsize=16)
+def mel_filterbank(sample_rate: int, n_fft: int, n_mels: int = N_MELS, fmax: float = TARGET_SAMPLE_RATE / 2) -> np.ndarray:
+    """Triangular mel filters, shape (n_mels, n_fft // 2 + 1)"""
+    fmax = min(fmax, sample_rate / 2)
+    bin_freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    edges = _mel_to_hz(np.linspace(_hz_to_mel(0.0), _hz_to_mel(fmax), n_mels + 2))
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bin_freqs - lower) / np.maximum(center - lower, 1e-8)
+    falling = (upper - bin_freqs) / np.maximum(upper - center, 1e-8)
+    filters = np.maximum(0.0, np.minimum(rising, falling))
+    # Filters narrower than a bin would be empty: give them their nearest bin
+    empty = filters.sum(axis=1) == 0
+    if np.any(empty):
+        nearest = np.abs(bin_freqs[None, :] - center[empty]).argmin(axis=1)
+        filters[np.flatnonzero(empty), nearest] = 1.0
+    return filters
+
+@dataclass
+class SpectralSummary:
+    """Running statistics of one recording, enough for every cloning feature"""
+    sample_rate: int
+    samples: int
+    frames: int
+    mean_power: np.ndarray  # Mean frame power spectrum
+    frame_stats: np.ndarray  # Energy, zero crossing rate pairs of the first frames (scaled to target frames)
+    sum_squares: float
+    peak_max: float
+    peak_min: float
+    clipped: int
+    silent: int
+    zero_crossings: int
+
+    @property
+    def duration(self) -> float:
+        return self.samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def n_fft(self) -> int:
+        return (len(self.mean_power) - 1) * 2
+
+    def mel_features(self, n_mels: int = N_MELS) -> np.ndarray:
+        """Standardized log mel spectrum of the whole recording"""
+        filters = mel_filterbank(self.sample_rate, self.n_fft, n_mels)
+        mel = np.log(filters @ self.mean_power + 1e-8)
+        return (mel - np.mean(mel)) / (np.std(mel) + 1e-8)
+
+    def temporal_features(self) -> np.ndarray:
+        """Standardized energy and zero crossing rate of the opening frames"""
+        features = np.zeros(TEMPORAL_FEATURES)
+        features[:len(self.frame_stats)] = self.frame_stats[:TEMPORAL_FEATURES]
+        return (features - np.mean(features)) / (np.std(features) + 1e-8)
+
+    def speaker_embedding(self, dim: int = 256) -> np.ndarray:
+        """Unit-norm base embedding: mel features followed by temporal features"""
+        embedding = np.zeros(dim)
+        mel = self.mel_features()
+        embedding[:min(len(mel), dim)] = mel[:dim]
+        temporal = self.temporal_features()
+        embedding[N_MELS:N_MELS + len(temporal)] = temporal[:max(dim - N_MELS, 0)]
+        return embedding / (np.linalg.norm(embedding) + 1e-8)
+
+    def characteristics(self) -> Dict[str, float]:
+        """Fundamental frequency, spectral centroid and bandwidth, energy and zero crossing rate"""
+        freqs = np.fft.rfftfreq(self.n_fft, 1.0 / self.sample_rate)
+        magnitude = np.sqrt(self.mean_power)
+        total = np.sum(magnitude) or 1e-8
+        fundamental = freqs[np.argmax(magnitude[1:]) + 1] if len(magnitude) > 1 else 0.0
+        return {
+            'fundamental_frequency': float(fundamental),
+            'spectral_centroid': float(np.sum(freqs * magnitude) / total),
+            'spectral_bandwidth': float(np.sqrt(np.sum(((freqs - fundamental) ** 2) * magnitude) / total)),
+            'energy': self.sum_squares / self.samples if self.samples else 0.0,
+            'zero_crossing_rate': self.zero_crossings / self.samples if self.samples else 0.0,
+        }
+
+    def frequency_range(self, threshold: float = 0.1):
+        """Lowest and highest frequency whose magnitude exceeds threshold times the peak"""
+        freqs = np.fft.rfftfreq(self.n_fft, 1.0 / self.sample_rate)
+        magnitude = np.sqrt(self.mean_power)
+        active = freqs[magnitude > threshold * np.max(magnitude)] if len(magnitude) else freqs[:0]
+        if len(active) == 0:
+            return 0.0, self.sample_rate / 2
+        return float(np.min(active)), float(np.max(active))
+
+    def quality_score(self) -> float:
+        """Cloning suitability between 0 and 1 from clipping, silence and dynamic range"""
+        if not self.samples or self.sum_squares == 0:
+            return 0.0
+        score = 1.0
+        score -= self.clipped / self.samples * 0.5
+        silence_ratio = self.silent / self.samples
+        if silence_ratio > 0.3:
+            score -= (silence_ratio - 0.3) * 0.5
+        dynamic_range = self.peak_max - self.peak_min
+        if dynamic_range < 0.1:
+            score -= (0.1 - dynamic_range) * 2.0
+        return max(0.0, min(1.0, score))
+
+class StreamingSpectralAnalyzer:
+    """
+    STFT statistics over audio fed in blocks of any size
+
+    Samples that do not complete a frame are carried into the next block, so
+    the result does not depend on how the audio was split.
+    """
+
+    def __init__(self, sample_rate: int, target_sample_rate: int = TARGET_SAMPLE_RATE):
+        self.sample_rate = int(sample_rate)
+        scale = self.sample_rate / target_sample_rate
+        self.frame = max(16, int(round(FRAME_SIZE * scale)))
+        self.hop = max(8, int(round(HOP_SIZE * scale)))
+        # Energy matches target-rate frames whatever the source rate
+        self._energy_scale = FRAME_SIZE / self.frame
+        self.window = np.hanning(self.frame)
+        self._pending = np.zeros(0)
+        self._power_sum = np.zeros(self.frame // 2 + 1)
+        self._frames = 0
+        self._frame_stats = []
+        self._samples = 0
+        self._sum_squares = 0.0
+        self._max = -np.inf
+        self._min = np.inf
+        self._clipped = 0
+        self._silent = 0
+        self._crossings = 0
+        self._last_sign = None
+
+    def update(self, block: np.ndarray):
+        """Add mono samples (stereo blocks are mixed down)"""
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim == 2:
+            block = block.mean(axis=1)
+        if len(block) == 0:
+            return
+
+        self._samples += len(block)
+        self._sum_squares += float(np.dot(block, block))
+        self._max = max(self._max, float(block.max()))
+        self._min = min(self._min, float(block.min()))
+        magnitude = np.abs(block)
+        self._clipped += int(np.count_nonzero(magnitude > CLIPPING_THRESHOLD))
+        self._silent += int(np.count_nonzero(magnitude < SILENCE_THRESHOLD))
+        signs = np.sign(block)
+        self._crossings += int(np.count_nonzero(signs[1:] != signs[:-1]))
+        if self._last_sign is not None and signs[0] != self._last_sign:
+            self._crossings += 1
+        self._last_sign = signs[-1]
+
+        buffer = np.concatenate((self._pending, block)) if len(self._pending) else block
+        count = 0 if len(buffer) < self.frame else 1 + (len(buffer) - self.frame) // self.hop
+        if count:
+            self._add_frames(np.lib.stride_tricks.sliding_window_view(buffer, self.frame)[::self.hop][:count])
+        self._pending = buffer[count * self.hop:].copy()
+
+    def _add_frames(self, frames: np.ndarray):
+        spectrum = np.fft.rfft(frames * self.window, axis=1)
+        self._power_sum += np.sum(spectrum.real ** 2 + spectrum.imag ** 2, axis=0)
+        self._frames += len(frames)
+
+        wanted = TEMPORAL_FEATURES // 2 - len(self._frame_stats) // 2
+        if wanted > 0:
+            head = frames[:wanted]
+            energy = np.einsum('ij,ij->i', head, head) * self._energy_scale
+            signs = np.sign(head)
+            zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame
+            self._frame_stats.extend(np.column_stack((energy, zcr)).ravel().tolist())
+
+    def finish(self) -> SpectralSummary:
+        """Summary of everything fed so far; audio shorter than a frame is zero-padded"""
+        if self._frames == 0 and len(self._pending):
+            padded = np.zeros(self.frame)
+            padded[:len(self._pending)] = self._pending
+            self._add_frames(padded[None, :])
+        frames = max(self._frames, 1)
+        return SpectralSummary(
+            sample_rate=self.sample_rate,
+            samples=self._samples,
+            frames=self._frames,
+            mean_power=self._power_sum / frames,
+            frame_stats=np.asarray(self._frame_stats),
+            sum_squares=self._sum_squares,
+            peak_max=self._max if self._samples else 0.0,
+            peak_min=self._min if self._samples else 0.0,
+            clipped=self._clipped,
+            silent=self._silent,
+            zero_crossings=self._crossings,
+        )
+
+def analyze_array(audio: np.ndarray, sample_rate: int, block_samples: int = 1 << 18) -> SpectralSummary:
+    """Spectral summary of in-memory audio, processed in blocks"""
+    analyzer = StreamingSpectralAnalyzer(sample_rate)
+    for start in range(0, len(audio), block_samples):
+        analyzer.update(audio[start:start + block_samples])
+    return analyzer.finish()
+
+def analyze_file(path: str, block_seconds: float = 10.0, max_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Stream an audio file through the analyzer
+
+    Args:
+        path: Any file soundfile can read
+        block_seconds: Read size; memory use is bounded by one block
+        max_seconds: Stop reading after this much audio (the duration reported
+            is still the file's full length)
+
+    Returns:
+        Dict with the summary and the file's duration, sample rate and channels
+    """
+    import soundfile as sf
+
+    with sf.SoundFile(path) as f:
+        sample_rate, channels, frames = f.samplerate, f.channels, f.frames
+        analyzer = StreamingSpectralAnalyzer(sample_rate)
+        limit = frames if max_seconds is None else min(frames, int(max_seconds * sample_rate))
+        block = max(1, int(block_seconds * sample_rate))
+        read = 0
+        while read < limit:
+            data = f.read(min(block, limit - read), dtype='float64', always_2d=True)
+            if len(data) == 0:
+                break
+            analyzer.update(data[:, 0] if channels == 1 else data.mean(axis=1))
+            read += len(data)
+
+    return {
+        'summary': analyzer.finish(),
+        'duration': frames / sample_rate if sample_rate else 0.0,
+        'sample_rate': sample_rate,
+        'channels': channels,
+    }
+
+@lru_cache(maxsize=4)
+def style_variations(num_style_vectors: int, embedding_dim: int) -> np.ndarray:
+    """The fixed per-row perturbations that turn one embedding into style vectors"""
+    variations = np.stack([np.random.RandomState(i).normal(0, 0.05, embedding_dim) for i in range(num_style_vectors)])
+    variations.setflags(write=False)
+    return variations
+
+def style_vectors(base_embedding: np.ndarray, num_style_vectors: int = 510) -> np.ndarray:
+    """Unit-norm float32 style vectors: base embedding plus each row's fixed variation"""
+    vectors = base_embedding[None, :] + style_variations(num_style_vectors, len(base_embedding))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8
+    return vectors.astype(np.float32)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Batched voice usage statistics with a cross-worker SQLite sink
+"""
+
+import atexit
+import sqlite3
+from contextlib import closing, contextmanager
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (total_requests, total_duration, error_count, last_used)
+StatsTotals = Tuple[int, float, int, Optional[float]]
+
+class VoiceUsageRecorder:
+    """
+    Records voice usage off the request path
+
+    ``record`` only appends to a deque (atomic under the GIL, no lock taken),
+    so synthesis never waits on bookkeeping. A daemon thread drains the
+    events every ``flush_interval`` seconds and adds them to a SQLite table
+    shared by all workers; aggregated totals are read back from the same
+    table so every worker reports service-wide usage.
+    """
+
+    def __init__(self, db_path: str, flush_interval: float = 5.0):
+        self.db_path = Path(db_path)
+        self.flush_interval = flush_interval
+
+        self._events = deque()
+        self._pending: Dict[str, list] = defaultdict(lambda: [0, 0.0, 0, None])
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+        self.flush_count = 0
+        self.flush_errors = 0
+
+        self._init_db()
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection that commits on success and always closes"""
+        with closing(sqlite3.connect(str(self.db_path), timeout=10.0)) as conn:
+            with conn:
+                yield conn
+
+    def _init_db(self):
+        """Create the shared stats table if it does not exist"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS voice_stats ("
+                    "voice TEXT PRIMARY KEY, "
+                    "total_requests INTEGER NOT NULL DEFAULT 0, "
+                    "total_duration REAL NOT NULL DEFAULT 0, "
+                    "error_count INTEGER NOT NULL DEFAULT 0, "
+                    "last_used REAL)"
+                )
+        except Exception as e:
+            logger.error(f"Failed to initialize voice stats database: {e}")
+
+    def seed(self, totals: Dict[str, StatsTotals]):
+        """Import existing totals for voices the shared table does not know yet"""
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO voice_stats "
+                    "(voice, total_requests, total_duration, error_count, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(voice, *values) for voice, values in totals.items()]
+                )
+        except Exception as e:
+            logger.error(f"Failed to seed voice stats database: {e}")
+
+    def record(self, voice_name: str, duration: float, success: bool = True):
+        """Record one request; never blocks on I/O"""
+        self._events.append((voice_name, duration, success, time.time()))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._flush_loop, name="voice-stats-flush", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def _drain(self):
+        """Fold queued events into the pending per-voice deltas"""
+        with self._pending_lock:
+            while True:
+                try:
+                    voice_name, duration, success, timestamp = self._events.popleft()
+                except IndexError:
+                    break
+                delta = self._pending[voice_name]
+                delta[0] += 1
+                delta[1] += duration
+                if not success:
+                    delta[2] += 1
+                if delta[3] is None or timestamp > delta[3]:
+                    delta[3] = timestamp
+
+    def pending_totals(self) -> Dict[str, StatsTotals]:
+        """Deltas recorded by this worker that have not reached the sink yet"""
+        self._drain()
+        with self._pending_lock:
+            return {voice: tuple(delta) for voice, delta in self._pending.items()}
+
+    def flush(self) -> bool:
+        """Write pending deltas to the shared table"""
+        with self._flush_lock:
+            self._drain()
+            with self._pending_lock:
+                batch = {voice: tuple(delta) for voice, delta in self._pending.items()}
+                self._pending.clear()
+
+            if not batch:
+                return True
+
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT INTO voice_stats "
+                        "(voice, total_requests, total_duration, error_count, last_used) "
+                        "VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(voice) DO UPDATE SET "
+                        "total_requests = total_requests + excluded.total_requests, "
+                        "total_duration = total_duration + excluded.total_duration, "
+                        "error_count = error_count + excluded.error_count, "
+                        "last_used = MAX(COALESCE(last_used, 0), excluded.last_used)",
+                        [(voice, *values) for voice, values in batch.items()]
+                    )
+                self.flush_count += 1
+                return True
+
+            except Exception as e:
+                self.flush_errors += 1
+                logger.warning(f"Voice stats flush failed, will retry: {e}")
+                # Put the batch back so nothing is lost
+                with self._pending_lock:
+                    for voice, (requests, duration, errors, last_used) in batch.items():
+                        delta = self._pending[voice]
+                        delta[0] += requests
+                        delta[1] += duration
+                        delta[2] += errors
+                        if delta[3] is None or (last_used and last_used > delta[3]):
+                            delta[3] = last_used
+                return False
+
+    def load_totals(self) -> Dict[str, StatsTotals]:
+        """Read aggregated totals across all workers"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT voice, total_requests, total_duration, error_count, last_used FROM voice_stats"
+                ).fetchall()
+            return {row[0]: tuple(row[1:]) for row in rows}
+        except Exception as e:
+            logger.error(f"Failed to read voice stats database: {e}")
+            return {}
+
+    def forget(self, voice_name: str):
+        """Drop a voice from the pending deltas and the shared table"""
+        self._drain()
+        with self._pending_lock:
+            self._pending.pop(voice_name, None)
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM voice_stats WHERE voice = ?", (voice_name,))
+        except Exception as e:
+            logger.error(f"Failed to remove voice stats for {voice_name}: {e}")
+
+    def close(self):
+        """Stop the flush thread and write whatever is still pending"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 1.0)
+        self.flush()
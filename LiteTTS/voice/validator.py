@@ -3,7 +3,6 @@
 Voice model validator for integrity checking
 """
 
-import torch
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -37,6 +36,8 @@ class VoiceValidator:
     
     def validate_voice(self, voice_name: str, file_path: Path) -> ValidationResult:
         """Validate a single voice model file"""
+        import torch  # Only needed to read .pt voices; kept off the import path
+
         result = ValidationResult(
             is_valid=False,
             voice_name=voice_name,
@@ -109,6 +110,8 @@ class VoiceValidator:
     
     def _validate_model_structure(self, model_data: Any, result: ValidationResult):
         """Validate the structure of the loaded model"""
+        import torch
+
         if isinstance(model_data, dict):
             result.metadata['model_type'] = 'dictionary'
             result.metadata['keys'] = list(model_data.keys())
@@ -133,6 +136,8 @@ class VoiceValidator:
     
     def _validate_embedding_data(self, model_data: Any, result: ValidationResult):
         """Validate embedding data within the model"""
+        import torch
+
         embedding_tensor = None
         
         if isinstance(model_data, dict):
@@ -176,6 +181,8 @@ class VoiceValidator:
     
     def _perform_additional_checks(self, model_data: Any, result: ValidationResult):
         """Perform additional validation checks"""
+        import torch
+
         # Check for metadata
         if isinstance(model_data, dict) and 'metadata' in model_data:
             metadata = model_data['metadata']
@@ -259,6 +266,8 @@ class VoiceValidator:
     
     def repair_voice_file(self, voice_name: str, file_path: Path) -> bool:
         """Attempt to repair a corrupted voice file"""
+        import torch
+
         logger.info(f"Attempting to repair voice file: {voice_name}")
         
         try:
@@ -307,6 +316,8 @@ class VoiceValidator:
     def check_compatibility(self, voice_name: str, file_path: Path, 
                           target_device: str = 'cpu') -> Dict[str, Any]:
         """Check compatibility with target device and system"""
+        import torch
+
         compatibility = {
             'compatible': False,
             'device_compatible': False,
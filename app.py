@@ -5,14 +5,14 @@ import socket
 import asyncio
 import json
 import math
+import uuid
 import numpy as np
-import soundfile as sf
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, APIRouter, WebSocket
+from fastapi import FastAPI, HTTPException, APIRouter, WebSocket, Request
 from fastapi.responses import StreamingResponse, Response
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import logging
 from typing import Optional, List, Any, Union
 
@@ -38,9 +38,14 @@ except ImportError:
 from LiteTTS.downloader import ensure_model_files
 from LiteTTS.config import config
 from LiteTTS.exceptions import ModelError
-from LiteTTS.logging_config import setup_logging
+from LiteTTS.logging_config import (
+    setup_logging, begin_request_logging, annotate_request, log_request_summary, get_logging_stats
+)
+from LiteTTS.metrics.tracing import (
+    configure_tracing, trace_span, REQUEST_ID_HEADER, TRACEPARENT_HEADER
+)
 from LiteTTS.cache import cache_manager
-from LiteTTS.websocket import setup_websocket_endpoints
+from LiteTTS.audio.format_converter import encode_audio
 
 # Import environment configuration bridge for Docker deployments
 try:
@@ -106,6 +111,11 @@ class TTSRequest(BaseModel):
     response_format: Optional[Union[str, int, bool]] = None  # Accept any type for OpenWebUI compatibility
     speed: Optional[Union[float, str]] = None  # Accept string numbers for OpenWebUI compatibility
     model: Optional[str] = None  # OpenWebUI compatibility - ignored but accepted
+    backend: Optional[str] = None  # Synthesis backend override ("onnx", "ttscpp"), default from config
+    # Generate faster and stretch back to the requested speed (beta); streamed requests stretch chunk by chunk
+    time_stretching_enabled: Optional[bool] = None
+    time_stretching_rate: Optional[int] = Field(default=None, ge=10, le=100)
+    time_stretching_quality: Optional[str] = None
 
 
 class LiteTTSApplication:
@@ -117,8 +127,15 @@ class LiteTTSApplication:
     def __init__(self):
         """Initialize the application with configuration and logging."""
         # Set up logging
-        setup_logging(level=config.logging.level, file_path=config.logging.file_path)
+        setup_logging(
+            level=config.logging.level,
+            file_path=config.logging.file_path,
+            queue_size=config.logging.queue_size,
+            info_sample_rates=config.logging.info_sample_rates,
+            default_info_sample_rate=config.logging.default_info_sample_rate
+        )
         self.logger = logging.getLogger(__name__)
+        self.tracer = configure_tracing(config.tracing)
 
         # Configuration - use new enhanced config
         self.config = config
@@ -131,6 +148,15 @@ class LiteTTSApplication:
 
         # Model state
         self.model: Optional[Any] = None
+        self.backends: Optional[Any] = None  # BackendRouter, set once the model is loaded
+        self.progressive_generator: Optional[Any] = None  # ProgressiveAudioGenerator for chunked streaming
+        self.synthesis_pipeline: Optional[Any] = None  # StagedPipeline, when config.pipeline.enabled
+        self.nlp_pool: Optional[Any] = None  # NLPProcessPool, when config.nlp_pool.enabled
+        self.batch_jobs: Optional[Any] = None  # BatchJobManager, when config.batch_jobs.enabled
+        self.priority_gate: Optional[Any] = None  # PriorityGate batch jobs yield to speech requests through
+        self.degradation: Optional[Any] = None  # DegradationController, when config.degradation.enabled
+        self._time_stretcher: Optional[Any] = None  # TimeStretcher from config.time_stretching, built on first use
+        self.voices_file: Optional[str] = None  # Voices file the model was loaded with
         self.available_voices: List[str] = []
 
         # Performance monitoring and optimization
@@ -201,6 +227,12 @@ class LiteTTSApplication:
         self.performance_monitor.start_monitoring()
         self.logger.info("📊 Performance monitoring started")
 
+        # Continuous sampling profiler, read through /debug/profile
+        if self.config.profiling.enabled:
+            from LiteTTS.performance.profiler import get_sampling_profiler
+            get_sampling_profiler().start()
+            self.logger.info(f"🔬 Sampling profiler started at {self.config.profiling.sample_hz:g} Hz")
+
         # Initialize and start preloader
         if self.model:
             from LiteTTS.cache.preloader import IntelligentPreloader, CacheWarmingConfig
@@ -397,9 +429,33 @@ class LiteTTSApplication:
         self.performance_monitor.stop_monitoring()
         self.logger.info("📊 Performance monitoring stopped")
 
-        # Cleanup model
-        if hasattr(self.model, "cleanup"):
+        if self.config.profiling.enabled:
+            from LiteTTS.performance.profiler import get_sampling_profiler
+            get_sampling_profiler().stop()
+
+        if self.degradation is not None:
+            self.degradation.stop(restore=False)
+
+        # Batch items in flight finish, the rest resume on the next start
+        if self.batch_jobs is not None:
+            self.batch_jobs.shutdown()
+            self.logger.info("📦 Batch jobs stopped")
+
+        # Drain the staged pipeline before its backends go away
+        if self.synthesis_pipeline is not None:
+            self.synthesis_pipeline.shutdown(timeout=30.0)
+            self.logger.info("🏭 Staged pipeline stopped")
+
+        if self.nlp_pool is not None:
+            self.nlp_pool.shutdown()
+            self.logger.info("🧵 NLP process pool stopped")
+
+        # Cleanup model and native backends
+        if self.backends is not None:
+            self.backends.close()
+        elif hasattr(self.model, "cleanup"):
             self.model.cleanup()
+        self.tracer.shutdown()
         self.logger.info("🔄 Service shutdown complete")
 
     def create_app(self) -> FastAPI:
@@ -441,33 +497,33 @@ class LiteTTSApplication:
         from fastapi.staticfiles import StaticFiles
         self.app.mount("/static", StaticFiles(directory="static"), name="static")
 
-        # Import dashboard analytics (avoid circular imports)
-        import sys
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("dashboard", "LiteTTS/api/dashboard.py")
-        dashboard_module = importlib.util.module_from_spec(spec)
-        sys.modules["dashboard"] = dashboard_module
-        spec.loader.exec_module(dashboard_module)
-        dashboard_analytics = dashboard_module.dashboard_analytics
+        # Dashboard analytics are only loaded when the dashboard is enabled
+        dashboard_analytics = self._get_dashboard_analytics()
 
         # Add enhanced request logging middleware with analytics
         @self.app.middleware("http")
         async def log_requests(request, call_next):
             start_time = time.time()
 
-            # Log incoming request with enhanced details for debugging (skip dashboard polling)
             client_ip = request.client.host if request.client else 'unknown'
             user_agent = request.headers.get('user-agent', 'unknown')
+            is_dashboard = request.url.path.startswith('/dashboard')
 
-            # Reduce logging for dashboard endpoints to avoid spam
-            if not request.url.path.startswith('/dashboard'):
-                self.logger.info(f"📥 {request.method} {request.url.path} - Client: {client_ip}")
-            elif request.url.path == '/dashboard' and request.method == 'GET':
-                # Only log initial dashboard access, not data polling
-                self.logger.debug(f"📊 Dashboard access from {client_ip}")
-            else:
-                # Dashboard data/ws requests - use debug level
-                self.logger.debug(f"📊 {request.method} {request.url.path} - Client: {client_ip}")
+            # One summary record per request; handlers annotate it instead of
+            # logging free-text lines
+            request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+            request_fields = begin_request_logging(
+                request.url.path, method=request.method, client=client_ip, request_id=request_id
+            )
+
+            # Root span for the request; stage spans opened by handlers nest under it
+            root_span = None
+            if not is_dashboard:
+                root_span = self.tracer.start_trace(
+                    f"{request.method} {request.url.path}", request_id=request_id,
+                    traceparent=request.headers.get(TRACEPARENT_HEADER),
+                    **{"http.method": request.method, "http.route": request.url.path}
+                )
 
             # Extract TTS-specific information for analytics
             voice = None
@@ -489,27 +545,43 @@ class LiteTTSApplication:
                         from starlette.requests import Request
                         request._body = body
                 except Exception as e:
-                    self.logger.debug(f"Could not extract TTS info from request: {e}")
-
-            # Log headers for debugging external client issues
-            if request.url.path.startswith(self.config.endpoints.tts):
-                self.logger.info(f"🔍 Content-Type: {request.headers.get('content-type', 'not set')}")
-                self.logger.info(f"🔍 User-Agent: {user_agent}")
-                self.logger.info(f"🔍 Origin: {request.headers.get('origin', 'not set')}")
+                    self.logger.debug("Could not extract TTS info from request: %s", e)
+
+            # Header details for debugging external client issues
+            if self.logger.isEnabledFor(logging.DEBUG) and request.url.path.startswith(self.config.endpoints.tts):
+                self.logger.debug(
+                    "Request headers: content-type=%s user-agent=%s origin=%s",
+                    request.headers.get('content-type', 'not set'), user_agent,
+                    request.headers.get('origin', 'not set')
+                )
 
             try:
                 # Process request
                 response = await call_next(request)
 
-                # Log response (reduce verbosity for dashboard endpoints)
+                response.headers[REQUEST_ID_HEADER] = request_id
+                if root_span is not None:
+                    root_span.set_attribute("http.status_code", response.status_code)
+                    response.headers[TRACEPARENT_HEADER] = root_span.traceparent()
+                    # The body is still being produced, the root span ends with it
+                    response.body_iterator = self._trace_response_body(response.body_iterator, root_span)
+
                 process_time = time.time() - start_time
-                if not request.url.path.startswith('/dashboard'):
-                    self.logger.info(f"📤 {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
+                request_fields.update(status=response.status_code, duration=round(process_time, 4))
+                if voice is not None:
+                    request_fields.setdefault("voice", voice)
+                if text_length is not None:
+                    request_fields.setdefault("text_length", text_length)
+
+                # Dashboard polling stays at debug level to avoid spam
+                if not is_dashboard:
+                    log_request_summary(self.logger, request_fields)
                 else:
-                    self.logger.debug(f"📊 {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
+                    self.logger.debug("%s %s %s %.3fs", request.method, request.url.path,
+                                      response.status_code, process_time)
 
                 # Record analytics (skip dashboard endpoints to avoid recursion)
-                if not request.url.path.startswith('/dashboard'):
+                if dashboard_analytics and not is_dashboard:
                     dashboard_analytics.record_request(
                         method=request.method,
                         path=request.url.path,
@@ -525,10 +597,15 @@ class LiteTTSApplication:
                 return response
             except Exception as e:
                 process_time = time.time() - start_time
-                self.logger.error(f"❌ Request failed in {process_time:.3f}s: {e}")
+                if root_span is not None:
+                    root_span.record_error(e)
+                    self.tracer.end_span(root_span)
+                request_fields.update(status=500, duration=round(process_time, 4), error=str(e))
+                self.logger.error(f"❌ Request failed in {process_time:.3f}s: {e}",
+                                  extra={"event": "request_summary", "request": request_fields})
 
                 # Record error in analytics
-                if not request.url.path.startswith('/dashboard'):
+                if dashboard_analytics and not is_dashboard:
                     dashboard_analytics.record_request(
                         method=request.method,
                         path=request.url.path,
@@ -543,6 +620,23 @@ class LiteTTSApplication:
 
                 raise
     
+    async def _trace_response_body(self, body_iterator, root_span):
+        """Pass the response body through, recording time to first byte and ending the root span"""
+        sent_bytes = 0
+        try:
+            async for chunk in body_iterator:
+                if sent_bytes == 0 and chunk:
+                    self.tracer.record_span("send.first_byte", root_span.start_ns, parent=root_span,
+                                            bytes=len(chunk))
+                sent_bytes += len(chunk)
+                yield chunk
+        except BaseException as e:
+            root_span.record_error(e)
+            raise
+        finally:
+            root_span.set_attribute("http.response_bytes", sent_bytes)
+            self.tracer.end_span(root_span)
+
     def setup_routers(self):
         """Create and configure API routers."""
         self.v1_router = APIRouter(prefix="/v1", tags=["v1"])
@@ -580,10 +674,33 @@ class LiteTTSApplication:
         # Note: Utility/Debug endpoints are defined directly on main app
         # and don't require separate router inclusion
 
+    def _get_dashboard_analytics(self):
+        """Load dashboard analytics once, or return None when the dashboard is disabled"""
+        if not self.config.server.enable_dashboard:
+            return None
+
+        if getattr(self, "_dashboard_analytics", None) is None:
+            # Import dashboard analytics directly to avoid circular imports
+            import sys
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("dashboard", "LiteTTS/api/dashboard.py")
+            dashboard_module = importlib.util.module_from_spec(spec)
+            sys.modules["dashboard"] = dashboard_module
+            spec.loader.exec_module(dashboard_module)
+            self._dashboard_analytics = dashboard_module.dashboard_analytics
+
+        return self._dashboard_analytics
+
     def setup_websocket_infrastructure(self):
         """Setup WebSocket infrastructure for real-time communication."""
+        if not self.config.server.enable_websocket:
+            self.logger.info("WebSocket infrastructure disabled by configuration")
+            self.websocket_endpoints = None
+            return
+
         try:
             self.logger.info("Setting up WebSocket infrastructure...")
+            from LiteTTS.websocket import setup_websocket_endpoints
 
             # Setup WebSocket endpoints
             self.websocket_endpoints = setup_websocket_endpoints(self.app, self)
@@ -678,10 +795,13 @@ class LiteTTSApplication:
             self.logger.info(f"🚀 Initializing Kokoro model: {self.config.tts.model_path} | Voices: {voices_file}")
 
             # Initialize the model with voices file
+            self.voices_file = voices_file
             self.model = Kokoro(self.config.tts.model_path, voices_file)
 
             self.logger.info("✅ Model loaded successfully")
 
+            self._setup_backends()
+
             # Initialize advanced text processing
             if ADVANCED_TEXT_PROCESSING_AVAILABLE:
                 try:
@@ -706,6 +826,11 @@ class LiteTTSApplication:
                 self.logger.warning("⚠️ Advanced text processing not available - using basic preprocessing")
                 self.unified_processor = None
 
+            self._setup_nlp_pool()
+            self._setup_pipeline()
+            self._setup_batch_jobs()
+            self._setup_degradation()
+
             # Initialize dynamic CPU allocation
             if DYNAMIC_CPU_ALLOCATION_AVAILABLE:
                 try:
@@ -1060,8 +1185,349 @@ with open("hello.mp3", "wb") as f:
                 raise HTTPException(status_code=404, detail="Favicon not found")
 
 
+    def _setup_backends(self):
+        """Wrap the ONNX model as a synthesis backend and load optional native backends"""
+        from LiteTTS.tts.backend import BackendRouter, OnnxBackend, create_backend
+
+        self.backends = BackendRouter(OnnxBackend(self.model, sample_rate=self.config.audio.sample_rate))
+
+        model_config = self.config.model
+        if model_config.backend == "ttscpp" or model_config.gguf_model_path:
+            try:
+                ttscpp = create_backend(
+                    "ttscpp",
+                    model_path=model_config.gguf_model_path,
+                    library_path=model_config.ttscpp_library_path,
+                    n_threads=model_config.ttscpp_threads,
+                    default_voice=self.config.voice.default_voice
+                )
+                self.backends.add(ttscpp, make_default=model_config.backend == "ttscpp")
+                self.logger.info(f"🧩 TTS.cpp backend loaded: {model_config.gguf_model_path}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ TTS.cpp backend unavailable, using ONNX Runtime: {e}")
+
+        self.logger.info(f"🧩 Synthesis backends: {self.backends.names()} (default: {self.backends.default_name})")
+        self._setup_progressive_generator()
+
+    def _setup_progressive_generator(self):
+        """Chunked streaming generator over the default backend, when chunked generation is enabled"""
+        chunked_config = self.config.audio.chunked_generation
+        if chunked_config is None or not chunked_config.enabled:
+            return
+        try:
+            from LiteTTS.audio.progressive_generator import (
+                BackendChunkEngine, ProgressiveAudioGenerator, config_from_chunked_generation
+            )
+
+            engine = BackendChunkEngine(self.backends.default, self.config.tts.model_path,
+                                        lang=config.audio.default_language)
+            progressive_config = config_from_chunked_generation(chunked_config, self.config.paths.cache_dir)
+            self.progressive_generator = ProgressiveAudioGenerator(engine, progressive_config)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Chunked streaming unavailable: {e}")
+            self.progressive_generator = None
+
+    def _should_stream_chunked(self, text: str) -> bool:
+        """Whether a streaming request goes through the progressive generator"""
+        chunked_config = self.config.audio.chunked_generation
+        return (self.progressive_generator is not None and chunked_config.enable_for_streaming
+                and len(text) >= chunked_config.min_text_length_for_chunking)
+
+    def _setup_nlp_pool(self):
+        """Start the text normalization worker processes when enabled"""
+        pool_config = self.config.nlp_pool
+        if not pool_config.enabled:
+            return
+        try:
+            from LiteTTS.nlp.frontend_pool import NLPProcessPool
+
+            options = self.processing_options if self.unified_processor is not None else None
+            self.nlp_pool = NLPProcessPool(pool_config.workers, options, slots=pool_config.slots,
+                                           slot_bytes=pool_config.slot_bytes)
+            self.nlp_pool.warm(timeout=60.0)
+            self.logger.info(f"🧵 NLP process pool: {self.nlp_pool.workers} workers, {self.nlp_pool.arena.slots} result slots")
+        except Exception as e:
+            self.logger.warning(f"⚠️ NLP process pool unavailable, normalizing in-process: {e}")
+            if self.nlp_pool is not None:
+                self.nlp_pool.shutdown()
+            self.nlp_pool = None
+
+    async def _normalize_with_pool(self, text: str) -> Optional[str]:
+        """First-attempt text processing in the NLP process pool, None to process inline"""
+        from starlette.concurrency import run_in_threadpool
+
+        pool_timeout = self.config.nlp_pool.timeout
+        try:
+            with trace_span("preprocess", text_length=len(text), pooled=True):
+                future = await run_in_threadpool(self.nlp_pool.submit, text, pool_timeout)
+                result = await asyncio.wait_for(asyncio.wrap_future(future), pool_timeout)
+            return result.text
+        except Exception as e:
+            self.logger.warning(f"⚠️ NLP process pool failed, processing inline: {e}")
+            return None
+
+    def _setup_pipeline(self):
+        """Start the cross-request NLP -> inference -> encode pipeline when enabled"""
+        pipeline_config = self.config.pipeline
+        if not pipeline_config.enabled:
+            return
+        try:
+            from LiteTTS.tts.pipeline import build_synthesis_pipeline
+
+            options = self.processing_options if self.unified_processor is not None else None
+            self.synthesis_pipeline = build_synthesis_pipeline(pipeline_config, options, nlp_pool=self.nlp_pool)
+            self.logger.info(
+                f"🏭 Staged pipeline: {pipeline_config.nlp_workers} NLP ({pipeline_config.nlp_executor}), "
+                f"{pipeline_config.inference_workers} inference, {pipeline_config.encode_workers} encode workers"
+            )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Staged pipeline unavailable, synthesizing inline: {e}")
+            self.synthesis_pipeline = None
+
+    def _setup_batch_jobs(self):
+        """Start the /v1/audio/batch job runner and resume interrupted jobs"""
+        batch_config = self.config.batch_jobs
+        if not batch_config.enabled:
+            return
+        try:
+            from LiteTTS.tts.batch_jobs import BatchJobManager, PriorityGate, make_synthesizer
+
+            options = self.processing_options if self.unified_processor is not None else None
+            synthesize = make_synthesizer(
+                self.backends.default, lang=config.audio.default_language, processing_options=options,
+                nlp_pool=self.nlp_pool, pipeline=self.synthesis_pipeline
+            )
+            # Cache entries are keyed by voice alone for the ONNX backend only
+            cache = cache_manager.audio_cache if cache_manager.is_enabled() and self.backends.default_name == "onnx" else None
+            self.priority_gate = PriorityGate(batch_config.yield_threshold)
+            self.batch_jobs = BatchJobManager(batch_config.output_dir, synthesize, cache=cache,
+                                              window=batch_config.window, gate=self.priority_gate)
+            resumed = self.batch_jobs.recover() if batch_config.resume_on_startup else []
+            self.logger.info(f"📦 Batch jobs: {batch_config.output_dir}, window {batch_config.window}, "
+                             f"{len(resumed)} resumed")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Batch jobs unavailable: {e}")
+            self.batch_jobs = None
+
+    def _setup_degradation(self):
+        """Watch memory pressure and degrade service step by step instead of running out of memory"""
+        degradation_config = self.config.degradation
+        if not degradation_config.enabled:
+            return
+        try:
+            from LiteTTS.performance.degradation import (
+                DegradationController, default_memory_limit_bytes, process_rss_bytes
+            )
+            from LiteTTS.tts.batch_jobs import PriorityGate
+
+            controller = DegradationController(
+                degradation_config.thresholds, degradation_config.hysteresis,
+                degradation_config.recovery_seconds, degradation_config.interval
+            )
+            memory_limit = (degradation_config.memory_limit_mb * 1024 * 1024
+                            or default_memory_limit_bytes(self.config.server.workers))
+            controller.add_signal("rss", process_rss_bytes, memory_limit)
+            arena_bytes = getattr(self.backends.default, "arena_bytes", None)
+            if callable(arena_bytes):
+                # The ONNX backend estimates its arena from the length-bucketed session (None if untracked);
+                # the arena is part of RSS, so half the budget in inference buffers alone is already pressure
+                controller.add_signal("ort_arena", arena_bytes, memory_limit / 2)
+            # Active speech requests count toward queue depth through the gate
+            if self.priority_gate is None:
+                self.priority_gate = PriorityGate()
+            controller.add_signal("queue_depth", self._queue_depth, degradation_config.queue_limit)
+            self._register_degradation_actions(controller)
+            controller.start()
+            self.degradation = controller
+            self.logger.info(f"🧯 Degradation controller: {memory_limit >> 20} MB memory limit, "
+                             f"signals {sorted(controller.signals)}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Degradation controller unavailable: {e}")
+            self.degradation = None
+
+    def _queue_depth(self) -> float:
+        """Speech requests being served, or jobs in the staged pipeline if more"""
+        depth = self.priority_gate.active if self.priority_gate is not None else 0
+        if self.synthesis_pipeline is not None:
+            depth = max(depth, self.synthesis_pipeline.stats()["in_flight"])
+        return float(depth)
+
+    def _register_degradation_actions(self, controller: Any):
+        """What each degradation level gives up, and how it is restored"""
+        from LiteTTS.performance.degradation import release_free_memory
+
+        degradation_config = self.config.degradation
+        saved = {}
+
+        def shrink_caches():
+            factor = degradation_config.cache_shrink_factor
+            audio_cache = cache_manager.audio_cache
+            if hasattr(audio_cache, "resize_encoded"):
+                audio_cache.resize_encoded(int(audio_cache.encoded_cache_bytes * factor))
+            chunk_cache = getattr(self.progressive_generator, "chunk_cache", None)
+            if hasattr(chunk_cache, "resize_memory"):
+                saved["chunk_cache"] = chunk_cache.resize_memory(int(chunk_cache.max_memory_size * factor))
+            release_free_memory()
+
+        def restore_caches():
+            audio_cache = cache_manager.audio_cache
+            if hasattr(audio_cache, "resize_encoded"):
+                audio_cache.resize_encoded(audio_cache.encoded_cache_bytes)
+            chunk_cache = getattr(self.progressive_generator, "chunk_cache", None)
+            if "chunk_cache" in saved and hasattr(chunk_cache, "resize_memory"):
+                chunk_cache.resize_memory(saved.pop("chunk_cache"))
+
+        def cap_lookahead():
+            generator = self.progressive_generator
+            if generator is not None:
+                saved["lookahead"] = generator.config.max_lookahead_chunks
+                generator.config.max_lookahead_chunks = min(saved["lookahead"], degradation_config.lookahead_chunks)
+
+        def restore_lookahead():
+            generator = self.progressive_generator
+            if generator is not None and "lookahead" in saved:
+                generator.config.max_lookahead_chunks = saved.pop("lookahead")
+
+        def reduce_batch():
+            if self.batch_jobs is not None:
+                self.batch_jobs.set_window(min(self.config.batch_jobs.window, degradation_config.batch_window))
+
+        def restore_batch():
+            if self.batch_jobs is not None:
+                self.batch_jobs.set_window(self.config.batch_jobs.window)
+
+        def load_onnx_model(model_path: str):
+            """Drain the ONNX backend, drop its model, then load model_path in its place"""
+            from kokoro_onnx import Kokoro
+
+            backend = self.backends.get("onnx")
+            # Requests that reach the model directly wait on the backend during the reload
+            self.model = backend
+            try:
+                backend.reload_model(lambda: Kokoro(model_path, self.voices_file))
+            except Exception as e:
+                self.logger.error(f"❌ Failed to load {Path(model_path).name}, reloading the configured model: {e}")
+                backend.reload_model(lambda: Kokoro(self.config.tts.model_path, self.voices_file))
+                raise
+            finally:
+                self.model = backend.model
+                release_free_memory()
+
+        def use_small_model():
+            variant = degradation_config.small_model_variant
+            if not variant or "onnx" not in self.backends.names():
+                return
+            small_path = Path(self.config.tts.model_path).with_name(variant)
+            if small_path == Path(self.config.tts.model_path) or not small_path.exists():
+                self.logger.warning(f"⚠️ Small model variant not available locally: {small_path}")
+                return
+            load_onnx_model(str(small_path))
+            saved["small_model"] = True
+            self.logger.warning(f"🧯 Serving from {variant} under memory pressure")
+
+        def restore_model():
+            if saved.pop("small_model", False):
+                load_onnx_model(self.config.tts.model_path)
+                self.logger.info(f"🧯 Restored {Path(self.config.tts.model_path).name}")
+
+        def shed_low_priority():
+            self.priority_gate.set_shedding(True)
+            if self.preloader is not None:
+                self.preloader.paused = True
+
+        def resume_low_priority():
+            self.priority_gate.set_shedding(False)
+            if self.preloader is not None:
+                self.preloader.paused = False
+
+        controller.set_action("shrink_caches", shrink_caches, restore_caches)
+        controller.set_action("cap_lookahead", cap_lookahead, restore_lookahead)
+        controller.set_action("reduce_batch", reduce_batch, restore_batch)
+        controller.set_action("small_model", use_small_model, restore_model)
+        controller.set_action("shed_low_priority", shed_low_priority, resume_low_priority)
+
+    def _resolve_batch_voice(self, voice: str) -> str:
+        """get_voice_name for manifest parsing, which reports unknown voices as ValueError"""
+        try:
+            return self.get_voice_name(voice)
+        except HTTPException as e:
+            raise ValueError(e.detail)
+
+    async def _synthesize_with_pipeline(self, request: TTSRequest, voice_name: str, backend: Any,
+                                        speed: float, response_format: str):
+        """
+        First synthesis attempt through the staged pipeline
+
+        Returns the finished SynthesisJob, or None when the attempt failed and
+        the inline retry path should take over. A pipeline that stays full
+        for submit_timeout answers 503 instead of queueing without bound.
+        """
+        from starlette.concurrency import run_in_threadpool
+        from LiteTTS.tts.pipeline import PipelineFull, SynthesisJob
+
+        job = SynthesisJob(
+            text=request.input, voice=voice_name, backend=backend, speed=speed,
+            lang=config.audio.default_language, response_format=response_format
+        )
+        try:
+            future = await run_in_threadpool(self.synthesis_pipeline.submit, job, self.config.pipeline.submit_timeout)
+        except PipelineFull:
+            self.logger.warning("⚠️ Synthesis pipeline is full, rejecting request")
+            raise HTTPException(503, detail="Server is at capacity, retry shortly",
+                                headers={"Retry-After": "1"})
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Pipeline synthesis failed, retrying inline: {e}")
+            return None
+
+    def _text_variant(self, text: str, attempt: int) -> str:
+        """
+        Text for a synthesis attempt, built only when that attempt runs
+
+        Starts with conservative approaches to preserve word count, then gets more aggressive.
+        """
+        if attempt == 0:
+            # Enhanced text preprocessing to prevent phonemizer issues (CONSERVATIVE MODE)
+            with trace_span("preprocess", text_length=len(text)):
+                preprocessing_result = phonemizer_preprocessor.preprocess_text(
+                    text,
+                    aggressive=False,
+                    preserve_word_count=True
+                )
+
+            if preprocessing_result.warnings:
+                for warning in preprocessing_result.warnings:
+                    self.logger.warning(f"⚠️ Text preprocessing warning: {warning}")
+
+            if preprocessing_result.confidence_score < 0.7:
+                self.logger.warning(f"⚠️ Low confidence score ({preprocessing_result.confidence_score:.2f}) for phonemizer success")
+            return preprocessing_result.processed_text
+        if attempt == 1:
+            return text.strip() + '.'  # Minimal processing (original text)
+        # Standard preprocessing, then aggressive for every later attempt
+        return phonemizer_preprocessor.preprocess_text(text, aggressive=attempt > 2, preserve_word_count=False).processed_text
+
+    def _select_backend(self, request: TTSRequest, speed: Any):
+        """Backend for a request, honoring its override and backend capabilities"""
+        try:
+            speed_value = float(speed)
+        except (TypeError, ValueError):
+            speed_value = 1.0
+        try:
+            return self.backends.select(request.backend, speed=speed_value)
+        except ValueError as e:
+            raise HTTPException(400, detail=str(e))
+
     async def _generate_speech_internal(self, request: TTSRequest):
         """Internal speech generation logic shared by all endpoints"""
+        if self.priority_gate is None:
+            return await self._generate_speech(request)
+        # Batch jobs hold back new items while this request is served
+        with self.priority_gate.interactive():
+            return await self._generate_speech(request)
+
+    async def _generate_speech(self, request: TTSRequest):
         try:
             # Apply configuration defaults if not specified in request
             voice_name = request.voice or self.config.voice.default_voice
@@ -1075,15 +1541,26 @@ with open("hello.mp3", "wb") as f:
             # Get the correct voice name
             voice_name = self.get_voice_name(voice_name)
 
+            backend = self._select_backend(request, speed)
+            # Audio differs per backend, keep non-default engines out of ONNX cache entries
+            cache_voice = voice_name if backend.name == "onnx" else f"{voice_name}@{backend.name}"
+
             # Notify preloader of request
             if self.preloader:
                 self.preloader.on_request_received(request.input, voice_name)
 
+            # Time-stretched audio differs from a plain synthesis, so it bypasses the cache
+            stretcher = self._time_stretcher_for(request)
+
             # Check cache first
-            if cache_manager.is_enabled():
-                cached_audio = cache_manager.audio_cache.get_audio(request.input, voice_name, speed, response_format)
+            if cache_manager.is_enabled() and stretcher is None:
+                with trace_span("cache.lookup", voice=voice_name, format=response_format) as cache_span:
+                    cached_audio = cache_manager.audio_cache.get_audio(request.input, cache_voice, speed, response_format)
+                    if cache_span is not None:
+                        cache_span.set_attribute("cache.hit", bool(cached_audio))
                 if cached_audio:
-                    self.logger.info("🎯 Cache hit! Returning cached audio")
+                    annotate_request(voice=voice_name, format=response_format, cache_hit=True)
+                    self.logger.debug("Cache hit, returning cached audio")
 
                     # Record cache hit performance
                     from LiteTTS.performance import TTSPerformanceData
@@ -1104,22 +1581,7 @@ with open("hello.mp3", "wb") as f:
                         media_type=f"audio/{response_format}",
                         headers={"Content-Disposition": f"attachment; filename=speech.{response_format}"}
                     )
-            self.logger.info(f"🎵 Generating speech: '{request.input[:50]}...' with voice '{voice_name}'")
-
-            # Enhanced text preprocessing to prevent phonemizer issues (CONSERVATIVE MODE)
-            # Use conservative mode by default to preserve word count and avoid phonemizer mismatches
-            preprocessing_result = phonemizer_preprocessor.preprocess_text(
-                request.input,
-                aggressive=False,
-                preserve_word_count=True
-            )
-
-            if preprocessing_result.warnings:
-                for warning in preprocessing_result.warnings:
-                    self.logger.warning(f"⚠️ Text preprocessing warning: {warning}")
-
-            if preprocessing_result.confidence_score < 0.7:
-                self.logger.warning(f"⚠️ Low confidence score ({preprocessing_result.confidence_score:.2f}) for phonemizer success")
+            self.logger.debug("Generating speech: %r with voice %s", request.input[:50], voice_name)
 
             # Generate audio with enhanced retry mechanism for empty audio issue
             import re
@@ -1127,110 +1589,136 @@ with open("hello.mp3", "wb") as f:
             retry_delay = config.performance.retry_delay_seconds
             audio = None
             sample_rate = None
+            audio_data = None
             generation_time = 0
 
-            # Try different text preprocessing strategies if initial attempts fail
-            # Start with conservative approaches to preserve word count, then get more aggressive
-            text_variants = [
-                preprocessing_result.processed_text,  # Conservative preprocessed text (preserve word count)
-                request.input.strip() + '.',  # Minimal processing (original text)
-                phonemizer_preprocessor.preprocess_text(request.input, aggressive=False, preserve_word_count=False).processed_text,  # Standard preprocessing
-                phonemizer_preprocessor.preprocess_text(request.input, aggressive=True, preserve_word_count=False).processed_text  # Aggressive preprocessing
-            ]
-
-            for attempt in range(max_retries):
-                try:
-                    # Use different text variant for each retry
-                    current_text = text_variants[min(attempt, len(text_variants) - 1)]
+            if stretcher is not None:
+                current_text = request.input
+                start_time = time.time()
+                audio, sample_rate = self._synthesize_time_stretched(request, voice_name, speed, backend, stretcher)
+                generation_time = time.time() - start_time
+                annotate_request(attempts=1, time_stretched=True)
+
+            # Staged pipeline: the first attempt overlaps with other requests' stages
+            elif self.synthesis_pipeline is not None:
+                job = await self._synthesize_with_pipeline(request, voice_name, backend, speed, response_format)
+                if job is not None:
+                    audio, sample_rate, audio_data = job.audio, job.sample_rate, job.audio_data
+                    generation_time = job.generation_time
+                    annotate_request(attempts=1, pipeline=True)
+
+            # Inline path: no pipeline, or its attempt failed
+            if audio is None:
+                # The NLP process pool runs the first attempt's processing off the GIL
+                pooled_text = None
+                if self.nlp_pool is not None:
+                    pooled_text = await self._normalize_with_pool(request.input)
+
+                current_text = request.input
+                for attempt in range(max_retries):
+                    try:
+                        start_time = time.time()
 
-                    start_time = time.time()
+                        if attempt == 0 and pooled_text is not None:
+                            # Already preprocessed and advanced-processed by the pool
+                            current_text = processed_text = pooled_text
+                        else:
+                            # Use different text variant for each retry
+                            current_text = self._text_variant(request.input, attempt)
 
-                    # Apply advanced text processing if available
-                    processed_text = current_text
-                    if self.unified_processor:
-                        try:
-                            processing_result = self.unified_processor.process_text(current_text, self.processing_options)
-                            processed_text = processing_result.processed_text
-
-                            # Log processing details for debugging
-                            if processing_result.changes_made:
-                                self.logger.info(f"🔧 Advanced text processing applied: {', '.join(processing_result.changes_made[:3])}")
-                            if processing_result.currency_enhancements > 0:
-                                self.logger.debug(f"💰 Currency processing: {processing_result.currency_enhancements} enhancements")
-
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ Advanced text processing failed, using original text: {e}")
+                            # Apply advanced text processing if available
                             processed_text = current_text
-
-                    # Generate audio with processed text
-                    audio, sample_rate = self.model.create(
-                        processed_text,
-                        voice=voice_name,
-                        speed=speed,
-                        lang=config.audio.default_language
-                    )
-
-                    generation_time = time.time() - start_time
-
-                    self.logger.info(f"✅ Generated {len(audio)} samples in {generation_time:.2f}s (attempt {attempt + 1})")
-
-                    # Check if audio generation was successful
-                    if len(audio) > 0:
-                        if attempt > 0:
-                            self.logger.info(f"🔄 Success with text variant {attempt + 1}: '{current_text[:50]}...'")
-                        break
-                    else:
-                        self.logger.warning(f"⚠️ Empty audio generated on attempt {attempt + 1} with text: '{current_text[:50]}...'")
+                            if self.unified_processor:
+                                try:
+                                    processing_result = self.unified_processor.process_text(current_text, self.processing_options)
+                                    processed_text = processing_result.processed_text
+
+                                    # Log processing details for debugging
+                                    if processing_result.changes_made:
+                                        self.logger.debug("Advanced text processing applied: %s",
+                                                          ', '.join(processing_result.changes_made[:3]))
+                                    if processing_result.currency_enhancements > 0:
+                                        self.logger.debug("Currency processing: %d enhancements",
+                                                          processing_result.currency_enhancements)
+
+                                except Exception as e:
+                                    self.logger.warning(f"⚠️ Advanced text processing failed, using original text: {e}")
+                                    processed_text = current_text
+
+                        # Generate audio with processed text
+                        with trace_span("synthesis", backend=backend.name, voice=voice_name, attempt=attempt + 1):
+                            audio, sample_rate = backend.create(
+                                processed_text,
+                                voice=voice_name,
+                                speed=speed,
+                                lang=config.audio.default_language
+                            )
+
+                        generation_time = time.time() - start_time
+
+                        self.logger.debug("Generated %d samples in %.2fs (attempt %d)",
+                                          len(audio), generation_time, attempt + 1)
+
+                        # Check if audio generation was successful
+                        if len(audio) > 0:
+                            if attempt > 0:
+                                self.logger.info(f"🔄 Success with text variant {attempt + 1}: '{current_text[:50]}...'")
+                            annotate_request(attempts=attempt + 1)
+                            break
+                        else:
+                            self.logger.warning(f"⚠️ Empty audio generated on attempt {attempt + 1} with text: '{current_text[:50]}...'")
+                            if attempt < max_retries - 1:
+                                # Brief pause before retry with different text variant
+                                time.sleep(retry_delay)
+                                continue
+
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ Audio generation failed on attempt {attempt + 1}: {e}")
+                        self.logger.warning(f"📝 Failed text variant: '{current_text[:50]}...'")
                         if attempt < max_retries - 1:
-                            # Brief pause before retry with different text variant
-                            time.sleep(retry_delay)
+                            time.sleep(0.1)
                             continue
-
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Audio generation failed on attempt {attempt + 1}: {e}")
-                    self.logger.warning(f"📝 Failed text variant: '{text_variants[min(attempt, len(text_variants) - 1)][:50]}...'")
-                    if attempt < max_retries - 1:
-                        time.sleep(0.1)
-                        continue
-                    raise
+                        raise
 
             # Validate final audio data
             if audio is None or len(audio) == 0:
                 self.logger.error(f"❌ Failed to generate audio after {max_retries} attempts")
                 self.logger.error(f"📋 Input text: '{request.input}'")
-                self.logger.error(f"📋 Processed text: '{preprocessing_result.processed_text}'")
+                self.logger.error(f"📋 Last text variant: '{current_text}'")
                 self.logger.error(f"📋 Voice: {voice_name}, Speed: {request.speed}")
-                self.logger.error(f"📋 Preprocessing changes: {preprocessing_result.changes_made}")
                 raise ValueError(f"Generated audio is empty after {max_retries} attempts")
 
             # Calculate audio duration and performance metrics
             audio_duration = len(audio) / sample_rate
             rtf = generation_time / audio_duration if audio_duration > 0 else 0
-            self.logger.info(f"🎵 Audio duration: {audio_duration:.2f}s, RTF: {rtf:.2f}")
-
-            if not np.isfinite(audio).all():
-                raise ValueError("Generated audio contains invalid values (NaN or Inf)")
-
-            # Convert to the requested format
-            format_upper = response_format.upper()
-            buffer = io.BytesIO()
-
-            # Ensure audio is in the correct format for soundfile
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
 
-            # Ensure audio is 1D
-            if audio.ndim > 1:
-                audio = audio.flatten()
-
-            sf.write(buffer, audio, sample_rate, format=format_upper)
-            buffer.seek(0)
-            audio_data = buffer.read()
-
-            # Cache the result
-            if cache_manager.is_enabled():
-                cache_manager.audio_cache.put_audio(request.input, voice_name, audio_data, speed, response_format)
-                self.logger.info("💾 Audio cached for future requests")
+            # The pipeline's encode stage has already validated and encoded the audio
+            if audio_data is None:
+                with trace_span("postprocess", samples=len(audio)):
+                    if not np.isfinite(audio).all():
+                        raise ValueError("Generated audio contains invalid values (NaN or Inf)")
+
+                    # Ensure audio is in the correct format for soundfile
+                    if audio.dtype != np.float32:
+                        audio = audio.astype(np.float32)
+
+                    # Ensure audio is 1D
+                    if audio.ndim > 1:
+                        audio = audio.flatten()
+
+                # Convert to the requested format
+                with trace_span("encode", format=response_format) as encode_span:
+                    audio_data = encode_audio(audio, sample_rate, response_format)
+                    if encode_span is not None:
+                        encode_span.set_attribute("bytes", len(audio_data))
+
+            # Cache the PCM so requests for any other format reuse this inference
+            if cache_manager.is_enabled() and stretcher is None:
+                with trace_span("cache.store"):
+                    cache_manager.audio_cache.put_pcm(
+                        request.input, cache_voice, audio, sample_rate, speed,
+                        encoded={response_format: audio_data}
+                    )
 
             # Record performance metrics
             from LiteTTS.performance import TTSPerformanceData
@@ -1246,10 +1734,12 @@ with open("hello.mp3", "wb") as f:
             )
             self.performance_monitor.record_tts_performance(perf_data)
 
-            # Log performance
-            duration = len(audio) / sample_rate
-            processing_time = generation_time
-            self.logger.info(f"⚡ Performance: {duration:.2f}s audio in {processing_time:.2f}s (RTF: {processing_time/duration:.2f})")
+            # Performance goes into the request summary record
+            annotate_request(
+                voice=voice_name, format=response_format, cache_hit=False,
+                text_length=len(request.input), audio_duration=round(audio_duration, 3),
+                generation_time=round(generation_time, 3), rtf=round(rtf, 3)
+            )
 
             # Return proper Response with Content-Length for better OpenWebUI compatibility
             from fastapi import Response
@@ -1344,7 +1834,7 @@ with open("hello.mp3", "wb") as f:
 
         return text.strip()
 
-    async def _stream_speech_internal(self, request: TTSRequest):
+    async def _stream_speech_internal(self, request: TTSRequest, http_request: Optional[Request] = None):
         """Internal streaming speech generation logic"""
         try:
             # Validate model is loaded
@@ -1358,16 +1848,21 @@ with open("hello.mp3", "wb") as f:
 
             # Get the correct voice name
             voice_name = self.get_voice_name(voice_name)
+            backend = self._select_backend(request, speed)
 
             self.logger.info(f"🎵 Streaming speech: '{request.input[:100]}...' with voice '{voice_name}'")
             self.logger.info(f"🔧 Stream parameters: format={response_format}, speed={speed}")
 
-            # Check if chunked generation should be used
-            use_chunked = hasattr(self.model, 'should_use_chunked_generation') and self.model.should_use_chunked_generation(request.input, streaming=True)
+            stretcher = self._time_stretcher_for(request)
+            if stretcher is not None:
+                self.logger.info("⏩ Using time-stretched chunk streaming")
+                return self._stream_time_stretched_audio(request, voice_name, response_format, speed,
+                                                         stretcher, http_request)
 
-            if use_chunked:
+            # Long text on the default backend streams chunk by chunk through the progressive generator
+            if backend is self.backends.default and self._should_stream_chunked(request.input):
                 self.logger.info("🧩 Using chunked generation for streaming")
-                return await self._stream_chunked_audio(request, voice_name, response_format, speed)
+                return await self._stream_chunked_audio(request, voice_name, response_format, speed, http_request)
 
             # For streaming, generate the complete audio and stream it in chunks
             # This ensures consistent audio quality and proper streaming behavior
@@ -1375,23 +1870,29 @@ with open("hello.mp3", "wb") as f:
                 try:
                     start_time = time.time()
 
+                    # Skip inference entirely if the client left while queued
+                    if http_request is not None and await http_request.is_disconnected():
+                        from LiteTTS.audio.cancellation import get_cancellation_metrics
+                        get_cancellation_metrics().record_cancellation("client_disconnected")
+                        self.logger.info("🔌 Client disconnected before synthesis, skipping stream")
+                        return
+
                     # Generate complete audio first for better quality
                     self.logger.info(f"🎯 Generating complete audio for streaming...")
-                    audio, sample_rate = self.model.create(
-                        request.input,
-                        voice=voice_name,
-                        speed=speed,
-                        lang="en-us"
-                    )
+                    with trace_span("synthesis", backend=backend.name, voice=voice_name):
+                        audio, sample_rate = backend.create(
+                            request.input,
+                            voice=voice_name,
+                            speed=speed,
+                            lang="en-us"
+                        )
 
                     generation_time = time.time() - start_time
                     self.logger.info(f"✅ Audio generated: {len(audio)} samples at {sample_rate}Hz in {generation_time:.2f}s")
 
                     # Convert to requested format
-                    buffer = io.BytesIO()
-                    sf.write(buffer, audio, sample_rate, format=response_format.upper())
-                    buffer.seek(0)
-                    audio_data = buffer.read()
+                    with trace_span("encode", format=response_format):
+                        audio_data = encode_audio(audio, sample_rate, response_format)
 
                     self.logger.info(f"📦 Audio converted to {response_format}: {len(audio_data)} bytes")
 
@@ -1442,13 +1943,62 @@ with open("hello.mp3", "wb") as f:
             self.logger.error(f"Full traceback: {traceback.format_exc()}")
             raise HTTPException(500, detail=f"Streaming generation failed: {str(e)}")
 
-    async def _stream_chunked_audio(self, request: TTSRequest, voice_name: str, response_format: str, speed: float):
+    def _time_stretcher_for(self, request: TTSRequest) -> Optional[Any]:
+        """Time-stretcher for a request, None unless it opts in or the configuration enables it"""
+        if request.time_stretching_enabled is False:
+            return None
+        if self._time_stretcher is None:
+            from LiteTTS.audio.time_stretcher import TimeStretcher, config_from_settings
+            self._time_stretcher = TimeStretcher(config_from_settings(self.config.time_stretching))
+        try:
+            return self._time_stretcher.for_request(request.time_stretching_enabled, request.time_stretching_rate,
+                                                    request.time_stretching_quality, len(request.input))
+        except ValueError as e:
+            raise HTTPException(400, detail=f"Invalid time-stretching parameters: {e}")
+
+    def _synthesize_time_stretched(self, request: TTSRequest, voice_name: str, speed: float,
+                                   backend: Any, stretcher: Any):
+        """Non-streaming counterpart of the time-stretched stream: (audio, sample_rate)"""
+        from LiteTTS.audio.stretched_stream import synthesize_time_stretched
+
+        def synthesize(text: str, chunk_speed: float):
+            with trace_span("synthesis", backend=backend.name, voice=voice_name, speed=float(chunk_speed)):
+                return backend.create(text, voice=voice_name, speed=chunk_speed, lang=config.audio.default_language)
+
+        return synthesize_time_stretched(synthesize, request.input, speed, stretcher)
+
+    def _stream_time_stretched_audio(self, request: TTSRequest, voice_name: str, response_format: str,
+                                     speed: float, stretcher: Any, http_request: Optional[Request] = None):
+        """Stream chunks synthesized at compressed speed and stretched back as they arrive"""
+        from LiteTTS.audio.stretched_stream import stream_time_stretched
+
+        backend = self._select_backend(request, speed)
+
+        def synthesize(text: str, chunk_speed: float):
+            with trace_span("synthesis", backend=backend.name, voice=voice_name, speed=float(chunk_speed)):
+                return backend.create(text, voice=voice_name, speed=chunk_speed, lang="en-us")
+
+        return StreamingResponse(
+            stream_time_stretched(synthesize, request.input, speed, response_format, stretcher, http_request),
+            media_type=f"audio/{response_format}",
+            headers={
+                "Content-Disposition": f"attachment; filename=stream.{response_format}",
+                "Cache-Control": "no-cache",
+                "X-Generation-Mode": "time-stretched",
+                "Access-Control-Allow-Origin": "*",
+                "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+                "Access-Control-Allow-Headers": "*"
+            }
+        )
+
+    async def _stream_chunked_audio(self, request: TTSRequest, voice_name: str, response_format: str, speed: float,
+                                    http_request: Optional[Request] = None):
         """Stream audio using chunked generation"""
         try:
             from LiteTTS.api.progressive_response import ProgressiveResponseHandler
 
             # Create progressive response handler
-            progressive_handler = ProgressiveResponseHandler(self.model.progressive_generator)
+            progressive_handler = ProgressiveResponseHandler(self.progressive_generator)
 
             # Generate progressive response
             return await progressive_handler.create_progressive_response(
@@ -1456,7 +2006,8 @@ with open("hello.mp3", "wb") as f:
                 voice=voice_name,
                 response_format=response_format,
                 speed=speed,
-                streaming=True
+                streaming=True,
+                http_request=http_request
             )
 
         except Exception as e:
@@ -1467,6 +2018,7 @@ with open("hello.mp3", "wb") as f:
 
     async def _stream_standard_audio(self, request: TTSRequest, voice_name: str, response_format: str, speed: float):
         """Stream audio using standard generation (fallback)"""
+        backend = self._select_backend(request, speed)
 
         async def generate_audio_stream():
             try:
@@ -1474,21 +2026,20 @@ with open("hello.mp3", "wb") as f:
 
                 # Generate complete audio first for better quality
                 self.logger.info(f"🎯 Generating complete audio for streaming...")
-                audio, sample_rate = self.model.create(
-                    request.input,
-                    voice=voice_name,
-                    speed=speed,
-                    lang="en-us"
-                )
+                with trace_span("synthesis", backend=backend.name, voice=voice_name):
+                    audio, sample_rate = backend.create(
+                        request.input,
+                        voice=voice_name,
+                        speed=speed,
+                        lang="en-us"
+                    )
 
                 generation_time = time.time() - start_time
                 self.logger.info(f"✅ Audio generated: {len(audio)} samples at {sample_rate}Hz in {generation_time:.2f}s")
 
                 # Convert to requested format
-                buffer = io.BytesIO()
-                sf.write(buffer, audio, sample_rate, format=response_format.upper())
-                buffer.seek(0)
-                audio_data = buffer.read()
+                with trace_span("encode", format=response_format):
+                    audio_data = encode_audio(audio, sample_rate, response_format)
 
                 self.logger.info(f"📦 Audio converted to {response_format}: {len(audio_data)} bytes")
 
@@ -1574,7 +2125,7 @@ with open("hello.mp3", "wb") as f:
                 raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
         @self.v1_router.post("/audio/stream")
-        async def stream_speech_v1(request: TTSRequest):
+        async def stream_speech_v1(request: TTSRequest, http_request: Request):
             """Streaming TTS endpoint for real-time audio generation"""
             try:
                 # Import validation here to avoid circular imports
@@ -1603,7 +2154,7 @@ with open("hello.mp3", "wb") as f:
                 sanitized_request = TTSRequest(**sanitized_data)
 
                 self.logger.info(f"🌊 Streaming TTS request: '{sanitized_request.input[:50]}...' voice='{sanitized_request.voice}' format='{sanitized_request.response_format}'")
-                return await self._stream_speech_internal(sanitized_request)
+                return await self._stream_speech_internal(sanitized_request, http_request)
             except HTTPException:
                 raise
             except Exception as e:
@@ -1615,7 +2166,7 @@ with open("hello.mp3", "wb") as f:
         # OpenWebUI appends "/audio/speech" to the configured base URL
         # So if user configures "http://host/v1/audio/stream", OpenWebUI tries "http://host/v1/audio/stream/audio/speech"
         @self.v1_router.post("/audio/stream/audio/speech")
-        async def stream_speech_openwebui_compat(request: TTSRequest):
+        async def stream_speech_openwebui_compat(request: TTSRequest, http_request: Request):
             """OpenWebUI compatibility route - handles malformed URL construction"""
             self.logger.info(f"🔧 OpenWebUI compatibility route called: {self.config.endpoints.stream}/audio/speech")
             self.logger.info("💡 Tip: Configure OpenWebUI with base URL 'http://host:port/v1' instead of full endpoint")
@@ -1640,7 +2191,7 @@ with open("hello.mp3", "wb") as f:
                 sanitized_data = data_or_error
                 sanitized_request = TTSRequest(**sanitized_data)
 
-                return await self._stream_speech_internal(sanitized_request)
+                return await self._stream_speech_internal(sanitized_request, http_request)
             except HTTPException:
                 raise
             except Exception as e:
@@ -2022,6 +2573,82 @@ with open("hello.mp3", "wb") as f:
                 self.logger.error(f"Failed to list blend presets: {e}")
                 return {"presets": [], "error": str(e)}
 
+        @self.v1_router.post("/audio/batch", status_code=202)
+        async def create_batch_job(http_request: Request, voice: Optional[str] = None,
+                                   response_format: Optional[str] = None, speed: float = 1.0):
+            """
+            Queue a bulk synthesis job from a JSONL manifest
+
+            The request body holds one JSON object per line with ``input`` and
+            optional ``voice``, ``speed``, ``response_format`` and ``id``; the
+            query parameters are the defaults for lines that leave them out.
+            """
+            if self.batch_jobs is None:
+                raise HTTPException(503, detail="Batch jobs are not enabled")
+            from starlette.concurrency import run_in_threadpool
+            from LiteTTS.tts.batch_jobs import parse_manifest
+
+            manifest = await http_request.body()
+            try:
+                items = await run_in_threadpool(
+                    parse_manifest, manifest, voice or self.config.voice.default_voice, speed,
+                    response_format or self.config.audio.default_format, self.config.batch_jobs.max_items,
+                    self._resolve_batch_voice
+                )
+            except UnicodeDecodeError:
+                raise HTTPException(400, detail="Manifest must be UTF-8 encoded JSONL")
+            except ValueError as e:
+                raise HTTPException(400, detail=str(e))
+
+            job = await run_in_threadpool(self.batch_jobs.submit, items)
+            self.logger.info(f"📦 Batch job {job.job_id}: {job.total} items queued")
+            return job.to_dict()
+
+        @self.v1_router.get("/audio/batch")
+        async def list_batch_jobs():
+            """Batch jobs of this server, newest first"""
+            if self.batch_jobs is None:
+                return {"enabled": False, "jobs": []}
+            return {
+                "enabled": True,
+                **self.batch_jobs.stats(),
+                "jobs": [job.to_dict() for job in self.batch_jobs.list_jobs()],
+            }
+
+        def get_batch_job(job_id: str):
+            job = self.batch_jobs.get(job_id) if self.batch_jobs is not None else None
+            if job is None:
+                raise HTTPException(404, detail=f"Batch job '{job_id}' not found")
+            return job
+
+        @self.v1_router.get("/audio/batch/{job_id}")
+        async def batch_job_status(job_id: str, items: bool = False):
+            """Progress of a batch job, with per-item results when items=true"""
+            status = get_batch_job(job_id).to_dict()
+            if items:
+                status["items"] = self.batch_jobs.results(job_id)
+            return status
+
+        @self.v1_router.get("/audio/batch/{job_id}/archive")
+        async def batch_job_archive(job_id: str):
+            """Stream the finished outputs of a batch job as a tar archive"""
+            get_batch_job(job_id)
+            return StreamingResponse(
+                self.batch_jobs.iter_archive(job_id),
+                media_type="application/x-tar",
+                headers={"Content-Disposition": f"attachment; filename=batch-{job_id}.tar"}
+            )
+
+        @self.v1_router.delete("/audio/batch/{job_id}")
+        async def delete_batch_job(job_id: str):
+            """Cancel an active batch job, or delete a finished one with its outputs"""
+            job = get_batch_job(job_id)
+            if job.finished:
+                self.batch_jobs.delete(job_id)
+                return {"job_id": job_id, "deleted": True}
+            self.batch_jobs.cancel(job_id)
+            return get_batch_job(job_id).to_dict()
+
         @self.v1_router.get("/download/{filename}")
         async def download_audio_file(filename: str):
             """Download audio file endpoint (placeholder)"""
@@ -2171,6 +2798,35 @@ with open("hello.mp3", "wb") as f:
                 return self.preloader.get_stats()
             return {"error": "Preloader not initialized"}
 
+        @self.app.get("/performance/pipeline")
+        async def pipeline_stats():
+            """Per-stage queue depths and utilization of the staged pipeline"""
+            if self.synthesis_pipeline is None:
+                return {"enabled": False}
+            return {"enabled": True, **self.synthesis_pipeline.stats()}
+
+        @self.app.get("/performance/nlp-pool")
+        async def nlp_pool_stats():
+            """Slot usage, overflows and latency of the NLP process pool"""
+            if self.nlp_pool is None:
+                return {"enabled": False}
+            return {"enabled": True, **self.nlp_pool.stats()}
+
+        @self.app.get("/performance/degradation")
+        async def degradation_stats():
+            """Memory pressure signals, the current degradation level and recent transitions"""
+            if self.degradation is None:
+                return {"enabled": False}
+            return {"enabled": True, **self.degradation.stats()}
+
+        @self.app.get("/performance/onnx-memory")
+        async def onnx_memory_stats():
+            """ONNX Runtime arena statistics per input-length bucket"""
+            session = getattr(self.model, "sess", None)
+            if not hasattr(session, "arena_bytes"):
+                return {"enabled": False}
+            return {"enabled": True, **session.stats()}
+
         @self.app.get("/performance/rtf-trend")
         async def rtf_trend(minutes: int = 30):
             """Get RTF trend over specified time period"""
@@ -2212,6 +2868,10 @@ with open("hello.mp3", "wb") as f:
                 # Get CPU usage
                 cpu_percent = psutil.cpu_percent(interval=1)
 
+                # Get cancellation accounting
+                from LiteTTS.audio.cancellation import get_cancellation_metrics
+                cancellation_stats = get_cancellation_metrics().get_stats()
+
                 # Format as Prometheus metrics
                 metrics_lines = [
                     "# HELP kokoro_uptime_seconds Total uptime in seconds",
@@ -2249,8 +2909,125 @@ with open("hello.mp3", "wb") as f:
                     "# HELP kokoro_available_voices Number of available voices",
                     "# TYPE kokoro_available_voices gauge",
                     f"kokoro_available_voices {len(self.available_voices)}",
+                    "",
+                    "# HELP kokoro_cancelled_generations_total Generations cancelled by client disconnect or stream cancel",
+                    "# TYPE kokoro_cancelled_generations_total counter",
+                    f"kokoro_cancelled_generations_total {cancellation_stats['cancelled_generations']}",
+                    "",
+                    "# HELP kokoro_dropped_chunks_total Chunks dropped before inference after cancellation",
+                    "# TYPE kokoro_dropped_chunks_total counter",
+                    f"kokoro_dropped_chunks_total {cancellation_stats['dropped_chunks']}",
+                    "",
+                    "# HELP kokoro_wasted_inference_seconds_total Inference time spent on audio nobody received",
+                    "# TYPE kokoro_wasted_inference_seconds_total counter",
+                    f"kokoro_wasted_inference_seconds_total {cancellation_stats['wasted_inference_seconds']:.3f}",
                 ]
 
+                logging_stats = get_logging_stats()
+                if logging_stats.get("async"):
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_log_queue_depth Log records waiting for the writer thread",
+                        "# TYPE kokoro_log_queue_depth gauge",
+                        f"kokoro_log_queue_depth {logging_stats['queue_size']}",
+                        "",
+                        "# HELP kokoro_log_records_dropped_total Log records dropped because the queue was full",
+                        "# TYPE kokoro_log_records_dropped_total counter",
+                        f"kokoro_log_records_dropped_total {logging_stats['dropped_total']}",
+                        "",
+                        "# HELP kokoro_log_records_sampled_out_total INFO records skipped by per-route sampling",
+                        "# TYPE kokoro_log_records_sampled_out_total counter",
+                        f"kokoro_log_records_sampled_out_total {logging_stats['sampled_out']}",
+                    ])
+
+                if self.synthesis_pipeline is not None:
+                    pipeline_stats = self.synthesis_pipeline.stats()
+                    stage_metrics = [
+                        ("queue_depth", "gauge", "Jobs waiting in the stage queue", "queue_depth"),
+                        ("busy_workers", "gauge", "Stage workers currently processing a job", "busy_workers"),
+                        ("workers", "gauge", "Stage worker pool size", "workers"),
+                        ("utilization", "gauge", "Busy share of stage worker time since startup", "utilization"),
+                        ("busy_seconds_total", "counter", "Worker-seconds spent processing jobs", "busy_seconds"),
+                        ("blocked_seconds_total", "counter", "Worker-seconds waiting for room downstream",
+                         "blocked_seconds"),
+                        ("processed_total", "counter", "Jobs completed by the stage", "processed"),
+                    ]
+                    for metric, metric_type, description, key in stage_metrics:
+                        metrics_lines.extend([
+                            "",
+                            f"# HELP kokoro_pipeline_stage_{metric} {description}",
+                            f"# TYPE kokoro_pipeline_stage_{metric} {metric_type}",
+                        ])
+                        metrics_lines.extend(
+                            f'kokoro_pipeline_stage_{metric}{{stage="{name}"}} {stage[key]:g}'
+                            for name, stage in pipeline_stats["stages"].items()
+                        )
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_pipeline_rejected_total Requests rejected because the pipeline was full",
+                        "# TYPE kokoro_pipeline_rejected_total counter",
+                        f"kokoro_pipeline_rejected_total {pipeline_stats['rejected']}",
+                    ])
+
+                if self.degradation is not None:
+                    degradation_stats = self.degradation.stats()
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_memory_pressure Highest pressure signal as a fraction of its limit",
+                        "# TYPE kokoro_memory_pressure gauge",
+                        f"kokoro_memory_pressure {degradation_stats['pressure']:g}",
+                        "",
+                        "# HELP kokoro_degradation_level Current degradation level (0 = normal)",
+                        "# TYPE kokoro_degradation_level gauge",
+                        f'kokoro_degradation_level{{name="{degradation_stats["level_name"]}"}} {degradation_stats["level"]}',
+                        "",
+                        "# HELP kokoro_degradation_transitions_total Degradation level changes",
+                        "# TYPE kokoro_degradation_transitions_total counter",
+                    ])
+                    metrics_lines.extend(
+                        f'kokoro_degradation_transitions_total{{from="{t["from"]}",to="{t["to"]}"}} {t["count"]}'
+                        for t in degradation_stats["transitions"]
+                    )
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_degradation_seconds_total Time spent at each degradation level",
+                        "# TYPE kokoro_degradation_seconds_total counter",
+                    ])
+                    metrics_lines.extend(
+                        f'kokoro_degradation_seconds_total{{level="{name}"}} {seconds:g}'
+                        for name, seconds in degradation_stats["seconds_in_level"].items()
+                    )
+
+                session = getattr(self.model, "sess", None)
+                if hasattr(session, "arena_bytes"):
+                    buckets = session.stats()["buckets"]
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_onnx_runs_total ONNX inference runs by input-length bucket",
+                        "# TYPE kokoro_onnx_runs_total counter",
+                    ])
+                    metrics_lines.extend(
+                        f'kokoro_onnx_runs_total{{bucket="{b["max_tokens"]}"}} {b["runs"]}' for b in buckets
+                    )
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_onnx_arena_retained_bytes Estimated arena growth kept since the last shrink",
+                        "# TYPE kokoro_onnx_arena_retained_bytes gauge",
+                    ])
+                    metrics_lines.extend(
+                        f'kokoro_onnx_arena_retained_bytes{{bucket="{b["max_tokens"]}"}} {b["retained_bytes"]}'
+                        for b in buckets
+                    )
+                    metrics_lines.extend([
+                        "",
+                        "# HELP kokoro_onnx_arena_shrinks_total Arena shrinks after long inputs",
+                        "# TYPE kokoro_onnx_arena_shrinks_total counter",
+                    ])
+                    metrics_lines.extend(
+                        f'kokoro_onnx_arena_shrinks_total{{bucket="{b["max_tokens"]}"}} {b["shrinks"]}'
+                        for b in buckets if b["shrink"]
+                    )
+
                 # Return as plain text with proper content type
                 from fastapi.responses import PlainTextResponse
                 return PlainTextResponse(
@@ -2284,6 +3061,43 @@ with open("hello.mp3", "wb") as f:
                 "environment": os.getenv("ENVIRONMENT", "development")
             }
 
+        @self.app.get("/debug/profile")
+        async def debug_profile(seconds: float = 10.0, format: str = "speedscope"):
+            """
+            CPU profile of the next N seconds from the sampling profiler
+
+            Returns speedscope JSON (open at https://www.speedscope.app) or
+            folded stacks for flamegraph.pl with format=folded.
+            """
+            if not self.config.profiling.endpoint_enabled:
+                raise HTTPException(404, detail="Profiling endpoint is disabled")
+            if format not in ("speedscope", "folded"):
+                raise HTTPException(400, detail="format must be 'speedscope' or 'folded'")
+
+            from LiteTTS.performance.profiler import get_sampling_profiler
+            profiler = get_sampling_profiler()
+            seconds = min(max(seconds, 0.1), self.config.profiling.max_capture_seconds, profiler.window_seconds)
+
+            from starlette.concurrency import run_in_threadpool
+
+            profiler.acquire()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                # Stopping the sampler joins its thread; keep that off the event loop
+                await run_in_threadpool(profiler.release)
+            profile = profiler.snapshot(seconds)
+
+            if format == "folded":
+                from fastapi.responses import PlainTextResponse
+                return PlainTextResponse(profile.to_folded())
+
+            from fastapi.responses import JSONResponse
+            return JSONResponse(
+                profile.to_speedscope(name=f"LiteTTS pid {os.getpid()} ({seconds:g}s)"),
+                headers={"Content-Disposition": "attachment; filename=profile.speedscope.json"}
+            )
+
         @self.app.post("/diagnostics/text-processing")
         async def test_text_processing(request: dict):
             """Diagnostic endpoint to test advanced text processing components"""
@@ -2631,16 +3445,12 @@ with open("hello.mp3", "wb") as f:
     def setup_dashboard_endpoints(self):
         """Setup dashboard endpoints for real-time monitoring"""
 
-        from fastapi.responses import HTMLResponse, RedirectResponse
+        dashboard_analytics = self._get_dashboard_analytics()
+        if dashboard_analytics is None:
+            self.logger.info("Dashboard disabled by configuration")
+            return
 
-        # Import dashboard analytics directly to avoid circular imports
-        import sys
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("dashboard", "LiteTTS/api/dashboard.py")
-        dashboard_module = importlib.util.module_from_spec(spec)
-        sys.modules["dashboard_endpoints"] = dashboard_module
-        spec.loader.exec_module(dashboard_module)
-        dashboard_analytics = dashboard_module.dashboard_analytics
+        from fastapi.responses import HTMLResponse, RedirectResponse
 
         @self.app.get("/dashboard", response_class=HTMLResponse)
         async def dashboard_page():
@@ -2781,9 +3591,13 @@ try:
 except ImportError:
     pass  # Fallback if startup module not available
 
+# Import profiling (`--import-profile`, or the profiler's child interpreter) measures
+# the import chain only: building the app would load the model before main() runs
+_IMPORT_ONLY = os.environ.get("LITETTS_IMPORT_ONLY") == "1" or "--import-profile" in sys.argv[1:]
+
 # Create application instance
-tts_app = LiteTTSApplication()
-app = tts_app.create_app()
+tts_app = None if _IMPORT_ONLY else LiteTTSApplication()
+app = None if _IMPORT_ONLY else tts_app.create_app()
 
 # Make app instance globally accessible for voice cloning router
 app_instance = tts_app
@@ -3027,6 +3841,7 @@ Examples:
   python app.py --reload --workers 1              # Development with specific workers
   python app.py --config prod.json --host 0.0.0.0 # Custom config with host override
   uv run python app.py --reload                   # Same functionality with uv
+  python app.py --import-profile                  # Report startup import time and exit
         """
     )
 
@@ -3065,9 +3880,19 @@ Examples:
         default="info",
         help="Log level (default: info)"
     )
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="Profile module import time in a fresh interpreter and exit"
+    )
 
     args = parser.parse_args()
 
+    if args.import_profile:
+        from LiteTTS.performance.import_profiler import profile_imports, format_report
+        print(format_report(profile_imports("import app")))
+        return 0
+
     # Handle custom configuration file if specified
     if args.config:
         config_path = Path(args.config)